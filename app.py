@@ -2,18 +2,19 @@
 Koyeb 배포용 웹 서버 앱
 """
 
+import io
 import os
 import sys
 from pathlib import Path
-from flask import Flask, render_template, jsonify, request, send_file, make_response
+from flask import Flask, render_template, jsonify, request, send_file, make_response, stream_with_context
 from flask_cors import CORS
 from datetime import datetime, timedelta, date, timezone
 import pytz
 import json
 import logging
 import logging.handlers
+import time
 from dotenv import load_dotenv
-import psycopg2
 from psycopg2.extras import RealDictCursor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -27,9 +28,18 @@ sys.path.append(str(Path(__file__).parent))
 load_dotenv()
 
 # PostgreSQL 데이터베이스 import
-from src.utils.postgresql_database import PostgreSQLDatabase
+from src.utils.postgresql_database import get_shared_database, releases_connection
 from src.utils.schedule_manager import ScheduleManager
 from src.utils.api_tracker import api_tracker
+from src.utils.response_cache import (cached_response, invalidate_responses,
+                                       response_cache, skip_response_cache)
+from src.utils.log_buffer import LogRingBuffer, tail_lines
+from src.utils.event_stream import ChangeNotifier, PublishStatus, stream_events
+from src.utils.http_client import get_http_metrics
+from src.utils.markdown_renderer import DASHBOARD_THEME
+from src.utils.html_templates import render as render_export_template, inline_stylesheets
+from src.utils.job_queue import (JobQueue, JobWorkerPool, idempotency_key,
+                                 STATE_QUEUED, STATE_SUCCEEDED, STATE_FAILED)
 
 # AI 콘텐츠 생성 import (나중에 초기화)
 
@@ -56,25 +66,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 인메모리 로그 저장소
-_memory_logs = []
+# 발행 상태/로그 변경 알림 (/api/events 스트림 대기자 깨우기)
+_dashboard_events = ChangeNotifier()
+
+# 인메모리 로그 저장소 (최근 200개, seq로 증분 조회)
+_memory_logs = LogRingBuffer(capacity=200, notifier=_dashboard_events)
 
 def add_system_log(level: str, message: str, category: str = 'SYSTEM'):
     """시스템 로그 추가"""
-    global _memory_logs
-    
-    log_entry = {
+    _memory_logs.append({
         'time': datetime.now().strftime('%H:%M:%S'),
         'level': level.lower(),
         'message': f"[{category}] {message}",
         'timestamp': datetime.now().timestamp()
-    }
-    
-    _memory_logs.append(log_entry)
-    
-    # 최근 200개만 유지
-    if len(_memory_logs) > 200:
-        _memory_logs = _memory_logs[-200:]
+    })
     
     # 실제 로그도 기록
     if level.upper() == 'ERROR':
@@ -86,13 +91,12 @@ def add_system_log(level: str, message: str, category: str = 'SYSTEM'):
 
 def get_recent_logs():
     """최근 로그 가져오기"""
-    global _memory_logs
-    return _memory_logs.copy()
+    return _memory_logs.snapshot()
 
 # AI 콘텐츠 생성기 초기화
 try:
-    from src.generators.content_generator import ContentGenerator
-    content_generator = ContentGenerator()
+    from src.generators.content_generator import get_shared_generator
+    content_generator = get_shared_generator()
     logger.info("✅ Claude API 콘텐츠 생성기 초기화 완료 - v2.0")
     add_system_log('INFO', 'Claude API 콘텐츠 생성기 초기화 완료', 'STARTUP')
 except Exception as e:
@@ -108,10 +112,10 @@ db = None
 schedule_manager = None
 
 def get_database():
-    """데이터베이스 인스턴스 반환"""
+    """데이터베이스 인스턴스 반환 (프로세스 전역 커넥션 풀 공유)"""
     global db
     if db is None:
-        db = PostgreSQLDatabase()
+        db = get_shared_database()
     return db
 
 def get_schedule_manager():
@@ -123,21 +127,36 @@ def get_schedule_manager():
 
 # PostgreSQL 연결 함수
 def get_db_connection():
-    """PostgreSQL 데이터베이스 연결"""
+    """PostgreSQL 데이터베이스 연결 (공유 풀에서 대여, close() 시 반납)"""
     try:
-        conn = psycopg2.connect(
-            host=os.getenv('PG_HOST'),
-            port=os.getenv('PG_PORT', 5432),
-            database=os.getenv('PG_DATABASE'),
-            user=os.getenv('PG_USER'),
-            password=os.getenv('PG_PASSWORD'),
-            options=f"-c search_path={os.getenv('PG_SCHEMA', 'unble')}"
-        )
-        return conn
+        return get_database().get_pooled_connection()
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
         return None
 
+@app.before_request
+def _reset_db_request_stats():
+    """요청별 DB 연결 카운터 초기화"""
+    if db is not None:
+        db.reset_request_stats()
+
+@app.after_request
+def _record_db_request_stats(response):
+    """요청 중 새로 연 DB 연결 수를 응답 헤더에 기록"""
+    if db is not None:
+        stats = db.get_request_stats()
+        response.headers['X-DB-Connections-Opened'] = str(stats['opened'])
+        response.headers['X-DB-Pool-Checkouts'] = str(stats['checkouts'])
+        if stats['opened']:
+            logger.debug(f"{request.path}: 새 DB 연결 {stats['opened']}개 생성")
+    return response
+
+@app.teardown_request
+def _release_db_connection(exc):
+    """요청 스레드에 바인딩된 DB 연결을 풀로 반납"""
+    if db is not None:
+        db.release_connection()
+
 def get_mock_data():
     """DB 연결 실패 시 사용할 목업 데이터"""
     now = datetime.now(KST)
@@ -252,6 +271,7 @@ def old_dashboard():
     return response
 
 @app.route('/api/recent_posts')
+@cached_response(ttl=60, tags=['content'])
 def get_recent_posts():
     """최근 포스트 목록 조회"""
     try:
@@ -284,10 +304,12 @@ def get_recent_posts():
             posts.sort(key=lambda x: x.get('created_at', ''), reverse=True)
             return jsonify(posts[:20])
         else:
+            skip_response_cache()
             mock = get_mock_data()
             return jsonify(mock['posts'])
     except Exception as e:
         logger.error(f"최근 포스트 조회 오류: {e}")
+        skip_response_cache()
         mock = get_mock_data()
         return jsonify(mock['posts'])
 
@@ -352,6 +374,7 @@ def get_posts():
         return jsonify({'status': 'success', 'posts': mock['posts']})
 
 @app.route('/api/stats')
+@cached_response(ttl=60, tags=['content'])
 def get_stats():
     """통계 정보 조회"""
     try:
@@ -380,6 +403,7 @@ def get_stats():
                 }
                 return jsonify(stats)
             else:
+                skip_response_cache()
                 mock = get_mock_data()
                 stats = mock['stats']
                 stats['revenue'] = {
@@ -388,6 +412,7 @@ def get_stats():
                 }
                 return jsonify(stats)
         else:
+            skip_response_cache()
             mock = get_mock_data()
             stats = mock['stats']
             stats['revenue'] = {
@@ -398,6 +423,7 @@ def get_stats():
         
     except Exception as e:
         logger.error(f"통계 조회 오류: {e}")
+        skip_response_cache()
         mock = get_mock_data()
         stats = mock['stats']
         stats['revenue'] = {
@@ -664,9 +690,11 @@ class WeeklyTrendingGenerator:
         }
 
 @app.route('/api/chart_data')
+@cached_response(ttl=60, tags=['content'])
 def get_chart_data():
-    """차트 데이터 조회"""
+    """차트 데이터 조회 (days: 최근 N일, 기본 7일 - 기간과 무관하게 쿼리 1회)"""
     now = datetime.now(KST)
+    days = min(max(request.args.get('days', 7, type=int), 1), 366)
     daily_data = []
     site_data = {
         'unpre': 0,
@@ -675,39 +703,14 @@ def get_chart_data():
     }
     
     try:
-        conn = get_db_connection()
-        if conn:
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            
-            for i in range(7):
-                date = (now - timedelta(days=i)).strftime('%Y-%m-%d')
-                
-                cursor.execute("""
-                    SELECT site, COUNT(*) as count
-                    FROM unble.content_files
-                    WHERE DATE(created_at) = %s
-                    GROUP BY site
-                """, (date,))
-                
-                day_results = cursor.fetchall()
-                day_count = sum(r['count'] for r in day_results) if day_results else 0
-                daily_data.append({'date': date, 'count': day_count})
-                
-                for r in day_results:
-                    site_data[r['site']] = site_data.get(r['site'], 0) + r['count']
-            
-            cursor.close()
-            conn.close()
-        else:
-            # 목업 데이터
-            for i in range(7):
-                date = (now - timedelta(days=i)).strftime('%Y-%m-%d')
-                daily_data.append({'date': date, 'count': 3 - i % 2})
-            site_data = {'unpre': 7, 'untab': 5, 'skewese': 3}
+        aggregates = get_database().get_content_aggregates(days=days, include_totals=False)
+        daily_data = [{'date': d['date'], 'count': d['count']} for d in aggregates['daily']]
+        site_data.update(aggregates['window_by_site'])
     except Exception as e:
         logger.error(f"차트 데이터 조회 오류: {e}")
+        skip_response_cache()
         # 목업 데이터
-        for i in range(7):
+        for i in range(days):
             date = (now - timedelta(days=i)).strftime('%Y-%m-%d')
             daily_data.append({'date': date, 'count': 3 - i % 2})
         site_data = {'unpre': 7, 'untab': 5, 'skewese': 3}
@@ -840,45 +843,54 @@ def save_schedule():
 
 @app.route('/api/logs')
 def get_logs():
-    """실시간 로그 조회 - 자동발행 모니터링"""
+    """실시간 로그 조회 - 자동발행 모니터링
+
+    ?since=<seq>: 마지막으로 받은 seq 이후 인메모리 로그만 반환 (오래된 순)
+        → {'logs', 'last_seq', 'truncated'} (truncated: 버퍼에서 밀려나 놓친 로그가 있음)
+    since 없이 호출하면 인메모리 로그 + 로그 파일 마지막 50줄 (최신순, 최대 100개)
+    """
+    since = request.args.get('since', type=int)
+    if since is not None:
+        logs, last_seq, truncated = _memory_logs.since(since, limit=request.args.get('limit', 200, type=int))
+        return jsonify({'logs': logs, 'last_seq': last_seq, 'truncated': truncated})
+
     try:
         # 인메모리 로그 가져오기
         logs = get_recent_logs()
         
-        # 로그 파일에서도 가져오기 (백업)
-        import os
+        # 로그 파일에서도 가져오기 (백업) - 파일 끝에서부터 필요한 만큼만 읽음
         log_file = 'blog_automation.log'
         if os.path.exists(log_file):
             try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()[-50:]  # 최근 50줄
-                    for line in lines:
-                        if line.strip():
-                            parts = line.strip().split(' - ', 3)
-                            if len(parts) >= 3:
-                                log_time = parts[0]
-                                log_level = parts[1].lower()
-                                log_message = ' - '.join(parts[2:])
-                                
-                                # 시간 포맷 변환
-                                try:
-                                    parsed_time = datetime.strptime(log_time, '%Y-%m-%d %H:%M:%S,%f')
-                                    formatted_time = parsed_time.strftime('%H:%M:%S')
-                                except:
-                                    formatted_time = log_time
-                                
-                                logs.append({
-                                    'time': formatted_time,
-                                    'level': log_level,
-                                    'message': log_message
-                                })
+                for line in tail_lines(log_file, 50):  # 최근 50줄
+                    if line.strip():
+                        parts = line.strip().split(' - ', 3)
+                        if len(parts) >= 3:
+                            log_time = parts[0]
+                            log_level = parts[1].lower()
+                            log_message = ' - '.join(parts[2:])
+                            
+                            # 시간 포맷 변환
+                            try:
+                                parsed_time = datetime.strptime(log_time, '%Y-%m-%d %H:%M:%S,%f')
+                                formatted_time = parsed_time.strftime('%H:%M:%S')
+                            except:
+                                formatted_time = log_time
+                            
+                            logs.append({
+                                'time': formatted_time,
+                                'level': log_level,
+                                'message': log_message
+                            })
             except Exception as e:
                 print(f"로그 파일 읽기 오류: {e}")
         
         # 시간순 정렬 (최신순)
         logs.sort(key=lambda x: x['time'], reverse=True)
         
-        return jsonify(logs[:100])  # 최근 100개만
+        response = jsonify(logs[:100])  # 최근 100개만
+        response.headers['X-Log-Seq'] = str(_memory_logs.last_seq)
+        return response
         
     except Exception as e:
         logger.error(f"로그 조회 오류: {e}")
@@ -958,6 +970,7 @@ def get_schedule_status():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/schedule/weekly')
+@cached_response(ttl=300, tags=['schedule'])
 def get_weekly_schedule():
     """주간 스케줄 조회 - 간단하고 확실한 동적 생성"""
     try:
@@ -1098,8 +1111,8 @@ def generate_wordpress():
                 if current_generator is None:
                     try:
                         logger.info("ContentGenerator 재초기화 시도...")
-                        from src.generators.content_generator import ContentGenerator
-                        current_generator = ContentGenerator()
+                        from src.generators.content_generator import get_shared_generator
+                        current_generator = get_shared_generator()
                         logger.info("✅ ContentGenerator 재초기화 성공")
                     except Exception as e:
                         logger.error(f"❌ ContentGenerator 재초기화 실패: {e}")
@@ -1137,7 +1150,8 @@ def generate_wordpress():
                         site_config=site_config,
                         topic=topic,
                         category=data.get('category', '프로그래밍'),
-                        content_length='medium'
+                        content_length='medium',
+                        bypass_cache=bool(data.get('force_regenerate', False))
                     )
                     
                     # 이미지 생성 (실패해도 계속 진행)
@@ -1199,7 +1213,6 @@ def generate_wordpress():
                     logger.warning(f"Claude API 미사용, 기본 콘텐츠 생성: {title}")
                 
                 # JSON 메타데이터 파일 생성 (목록 표시용)
-                import time
                 import json
                 json_file_path = file_path.replace('.html', '.json')
                 metadata_content = {
@@ -1250,7 +1263,6 @@ def generate_wordpress():
             logger.error(f"DB 저장 실패, 목업 모드로 전환: {db_error}")
         
         # DB 연결 실패시 목업 응답
-        import time
         current_time = int(time.time())
         
         new_file = {
@@ -1295,8 +1307,8 @@ def generate_tistory():
                 if current_generator is None:
                     try:
                         logger.info("Tistory ContentGenerator 재초기화 시도...")
-                        from src.generators.content_generator import ContentGenerator
-                        current_generator = ContentGenerator()
+                        from src.generators.content_generator import get_shared_generator
+                        current_generator = get_shared_generator()
                         logger.info("✅ Tistory ContentGenerator 재초기화 성공")
                     except Exception as e:
                         logger.error(f"❌ Tistory ContentGenerator 재초기화 실패: {e}")
@@ -1318,7 +1330,8 @@ def generate_tistory():
                         site_config=site_config,
                         topic=topic,
                         category=data.get('category', '일반'),
-                        content_length='medium'
+                        content_length='medium',
+                        bypass_cache=bool(data.get('force_regenerate', False))
                     )
                     
                     # HTML 형태로 변환 - Tistory 깔끔한 디자인
@@ -1336,7 +1349,6 @@ def generate_tistory():
                     logger.warning(f"Claude API 미사용, Tistory 기본 콘텐츠 생성: {title}")
                 
                 # Tistory 파일로 저장 (목록 표시를 위해)
-                import time
                 import json
                 from datetime import datetime
                 
@@ -1401,7 +1413,6 @@ def generate_tistory():
             logger.error(f"DB 저장 실패, 목업 모드로 전환: {db_error}")
         
         # DB 연결 실패시 목업 응답
-        import time
         current_time = int(time.time())
         
         new_file = {
@@ -1433,14 +1444,8 @@ def preview_content(file_id):
         database = get_database()
         
         if database.is_connected:
-            # DB에서 파일 정보 조회
-            files = database.get_content_files(limit=1000)  # 전체 조회
-            target_file = None
-            
-            for f in files:
-                if f.get('id') == file_id:
-                    target_file = f
-                    break
+            # DB에서 파일 정보 조회 (기본 키)
+            target_file = database.get_content_file(file_id)
             
             if target_file:
                 # content 필드에서 직접 콘텐츠 읽기 (수동발행 후 저장된 HTML)
@@ -1506,14 +1511,8 @@ def download_content(file_id):
         database = get_database()
         
         if database.is_connected:
-            # DB에서 파일 정보 조회
-            files = database.get_content_files(limit=1000)  # 전체 조회
-            target_file = None
-            
-            for f in files:
-                if f.get('id') == file_id:
-                    target_file = f
-                    break
+            # DB에서 파일 정보 조회 (기본 키)
+            target_file = database.get_content_file(file_id)
             
             if target_file:
                 # content 필드에서 직접 콘텐츠 읽기 (수동발행 후 저장된 HTML)
@@ -1561,8 +1560,8 @@ def download_content(file_id):
 </body>
 </html>"""
                 
-                # 파일 다운로드 응답
-                response = make_response(content)
+                # 파일 다운로드 응답 (공통 CSS 링크는 단독으로 열리도록 본문에 포함)
+                response = make_response(inline_stylesheets(content))
                 # 한글 파일명 처리 - 제목을 그대로 사용
                 safe_title = target_file.get('title', 'content')[:80]  # 길이 제한
                 import re
@@ -1630,14 +1629,8 @@ def publish_post():
         
         if database.is_connected:
             try:
-                # 포스트 정보 가져오기
-                files = database.get_content_files(limit=1000)
-                target_file = None
-                
-                for f in files:
-                    if f.get('id') == int(post_id):
-                        target_file = f
-                        break
+                # 포스트 정보 가져오기 (기본 키)
+                target_file = database.get_content_file(int(post_id))
                 
                 if not target_file:
                     return jsonify({
@@ -1795,16 +1788,8 @@ def publish_post():
                 
                 # 발행 성공시 데이터베이스 상태 업데이트
                 if success:
-                    conn = get_db_connection()
-                    if conn:
-                        cursor = conn.cursor()
-                        cursor.execute(
-                            "UPDATE unble.content_files SET status = 'published' WHERE id = %s",
-                            (post_id,)
-                        )
-                        conn.commit()
-                        cursor.close()
-                        conn.close()
+                    # 발행 건수 롤업·응답 캐시 무효화까지 함께 처리
+                    get_database().update_file_status(post_id, 'published')
                     
                     return jsonify({
                         'success': True,
@@ -1987,6 +1972,7 @@ def recreate_schedule():
                 cursor.execute('DELETE FROM publishing_schedule WHERE week_start_date = %s', (week_start,))
                 deleted = cursor.rowcount
                 conn.commit()
+                invalidate_responses('schedule')
                 logger.info(f"기존 스케줄 {deleted}개 삭제됨")
         
         # 새 스케줄 생성 (티스토리 포함)
@@ -2265,6 +2251,7 @@ def delete_all_content(site):
 
                     # 변경사항 커밋
                     conn.commit()
+                    invalidate_responses('content')
                     logger.info(f"[DELETE_ALL] 데이터베이스 커밋 완료")
 
             except Exception as db_error:
@@ -2370,6 +2357,7 @@ def get_today_topics():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/schedule/monthly')
+@cached_response(ttl=300, tags=['schedule'])
 def get_monthly_schedule():
     """당월 전체 계획표 조회 - 대시보드 호환 형식"""
     try:
@@ -2479,7 +2467,40 @@ def get_monthly_schedule():
         return jsonify({'error': str(e)}), 500
 
 # 새 대시보드용 API 엔드포인트들
+@app.route('/api/content_files')
+@cached_response(ttl=60, tags=['content'])
+def list_content_files():
+    """콘텐츠 목록 키셋 페이지 조회
+
+    쿼리: site, type, status, from/to (YYYY-MM-DD, 한국 시간), cursor, limit (최대 200)
+    응답: {'items', 'next_cursor', 'total_estimate'} - 다음 페이지는 next_cursor를 cursor로 전달
+    """
+    try:
+        date_from = request.args.get('from')
+        date_to = request.args.get('to')
+        page = get_database().list_content_files(
+            site=request.args.get('site'),
+            file_type=request.args.get('type'),
+            status=request.args.get('status'),
+            date_from=datetime.strptime(date_from, '%Y-%m-%d').date() if date_from else None,
+            date_to=datetime.strptime(date_to, '%Y-%m-%d').date() if date_to else None,
+            cursor=request.args.get('cursor'),
+            limit=request.args.get('limit', 50, type=int),
+        )
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"콘텐츠 목록 페이지 조회 오류: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+    for item in page['items']:
+        for field in ('created_at', 'published_at'):
+            if item.get(field):
+                item[field] = item[field].isoformat()
+    return jsonify({'success': True, **page})
+
 @app.route('/api/content/<site>')
+@cached_response(ttl=60, tags=['content'])
 def get_content_list(site):
     """사이트별 콘텐츠 목록 조회 - DB 기반 안정성 강화"""
     try:
@@ -2500,46 +2521,41 @@ def get_content_list(site):
 
         # 먼저 DB에서 콘텐츠 조회 (우선)
         try:
-            from src.utils.postgresql_database import PostgreSQLDatabase
-            db = PostgreSQLDatabase()
-            conn = db.get_connection()
-
-            if conn:
-                with conn.cursor() as cursor:
-                    cursor.execute('''
-                        SELECT id, site, title, file_path, created_at, status, metadata
-                        FROM blog_automation.content_files
-                        WHERE site = %s
-                        ORDER BY created_at DESC
-                        LIMIT 50
-                    ''', (site,))
-
-                    db_results = cursor.fetchall()
-
-                    for row in db_results:
-                        content_data = {
-                            'id': row[0],
-                            'site': row[1],
-                            'title': row[2],
-                            'file_path': row[3],
-                            'created_at': row[4].isoformat() if row[4] else datetime.now().isoformat(),
-                            'status': row[5],
-                            'metadata': row[6] if row[6] else {}
-                        }
+            database = get_database()
+
+            # 키셋 페이지 (?cursor=, ?limit=) - 다음 페이지 커서는 X-Next-Cursor 헤더로 전달
+            page = database.list_content_files(site=site, cursor=request.args.get('cursor'),
+                                               limit=request.args.get('limit', 50, type=int))
+
+            for row in page['items']:
+                content_data = {
+                    'id': row['id'],
+                    'site': row['site'],
+                    'title': row['title'],
+                    'file_path': row['file_path'],
+                    'created_at': row['created_at'].isoformat() if row['created_at'] else datetime.now().isoformat(),
+                    'status': row['status'],
+                    'metadata': row['metadata'] if row['metadata'] else {}
+                }
 
-                        # 운영 환경에서 경로 정규화
-                        if os.getenv('KOYEB_SERVICE') and content_data.get('file_path'):
-                            content_data['file_path'] = content_data['file_path'].replace('\\', '/')
+                # 운영 환경에서 경로 정규화
+                if os.getenv('KOYEB_SERVICE') and content_data.get('file_path'):
+                    content_data['file_path'] = content_data['file_path'].replace('\\', '/')
 
-                        contents.append(content_data)
+                contents.append(content_data)
 
-                    logger.info(f"{site} DB에서 {len(contents)}개 콘텐츠 조회 완료")
+            logger.info(f"{site} DB에서 {len(contents)}개 콘텐츠 조회 완료")
 
-                    if contents:
-                        return jsonify(contents)
+            if contents:
+                response = jsonify(contents)
+                if page['next_cursor']:
+                    response.headers['X-Next-Cursor'] = page['next_cursor']
+                response.headers['X-Total-Estimate'] = str(page['total_estimate'])
+                return response
 
         except Exception as db_error:
             logger.warning(f"DB 조회 실패, 파일시스템 폴백 사용: {db_error}")
+            skip_response_cache()
             # 시스템 로그에 DB 오류 기록
             try:
                 add_system_log('WARNING', f'콘텐츠 목록 DB 조회 실패: {db_error}', 'DB_ERROR')
@@ -2801,6 +2817,13 @@ def get_content_download(site):
         if not os.path.exists(file_path):
             return "파일이 존재하지 않습니다", 404
             
+        if file_path.endswith('.html'):
+            # 공통 CSS를 링크로 참조하는 내보내기 파일은 CSS를 본문에 넣어 단독으로 열리게 전송
+            with open(file_path, 'r', encoding='utf-8') as f:
+                html_content = inline_stylesheets(f.read())
+            return send_file(io.BytesIO(html_content.encode('utf-8')), mimetype='text/html',
+                             as_attachment=True, download_name=os.path.basename(file_path))
+        
         return send_file(file_path, as_attachment=True, download_name=os.path.basename(file_path))
         
     except Exception as e:
@@ -2816,12 +2839,19 @@ def system_status():
             'scheduler_active': True,
             'database_connected': True,
             'next_run': '내일 새벽 3시',
-            'total_content': 0
+            'total_content': 0,
+            'db_pool': get_database().get_pool_metrics(),
+            'api_usage_queue': api_tracker.get_queue_metrics(),
+            'generation_cache': (content_generator.generation_cache.get_metrics()
+                                 if content_generator and content_generator.generation_cache else None),
+            'response_cache': response_cache.get_metrics(),
+            'http_clients': get_http_metrics()
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/api_usage/today')
+@cached_response(ttl=30, tags=['api_usage'])
 def get_api_usage_today():
     """오늘의 API 사용량 조회"""
     try:
@@ -2832,6 +2862,7 @@ def get_api_usage_today():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/api_usage/monthly')
+@cached_response(ttl=300, tags=['api_usage'])
 def get_api_usage_monthly():
     """이번 달 API 사용량 조회"""
     try:
@@ -2842,6 +2873,7 @@ def get_api_usage_monthly():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/api_usage/recent')
+@cached_response(ttl=30, tags=['api_usage'])
 def get_api_usage_recent():
     """최근 API 호출 내역 조회"""
     try:
@@ -2852,21 +2884,22 @@ def get_api_usage_recent():
         logger.error(f"최근 API 호출 조회 오류: {e}")
         return jsonify({'error': str(e)}), 500
 
-# 발행 상태를 전역으로 추적
-publish_status = {
-    'in_progress': False,
-    'current_site': '',
-    'progress': 0,
-    'total_sites': 0,
-    'results': [],
-    'message': ''
-}
+# 발행 상태를 전역으로 추적 (변경 시 /api/events 스트림으로 전송)
+publish_status = PublishStatus(
+    _dashboard_events,
+    in_progress=False,
+    current_site='',
+    progress=0,
+    total_sites=0,
+    results=[],
+    message=''
+)
 
 @app.route('/api/publish_status')
 def get_publish_status():
-    """발행 진행 상태 조회"""
+    """발행 진행 상태 조회 (워커가 바꾸는 중에도 일관된 사본을 직렬화)"""
     try:
-        return jsonify(publish_status)
+        return jsonify(publish_status.snapshot()[1])
     except Exception as e:
         return jsonify({
             'in_progress': False,
@@ -2880,21 +2913,41 @@ def get_publish_status():
 @app.route('/api/publish_status/reset', methods=['POST'])
 def reset_publish_status():
     """수동 발행 상태 초기화"""
-    global publish_status
-    publish_status = {
-        'in_progress': False,
-        'current_site': '',
-        'progress': 0,
-        'total_sites': 0,
-        'results': [],
-        'message': '상태 초기화됨'
-    }
+    publish_status.reset(
+        in_progress=False,
+        current_site='',
+        progress=0,
+        total_sites=0,
+        results=[],
+        message='상태 초기화됨'
+    )
     add_system_log('INFO', '발행 상태 강제 초기화됨', 'RESET')
     return jsonify({
         'success': True,
         'message': '발행 상태가 초기화되었습니다.'
     })
 
+@app.route('/api/events')
+def dashboard_events():
+    """발행 상태/새 로그 실시간 스트림 (Server-Sent Events)
+
+    ?topics=publish,logs 로 받을 이벤트 선택. 연결은 SSE_MAX_DURATION초 후 닫히며
+    EventSource가 Last-Event-ID를 붙여 재연결하면 놓친 변경부터 이어서 보낸다.
+    """
+    topics = tuple(t for t in request.args.get('topics', 'publish,logs').split(',') if t)
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    stream = stream_events(
+        publish_status, _memory_logs, _dashboard_events,
+        last_event_id=last_event_id,
+        topics=topics,
+        heartbeat=float(os.getenv('SSE_HEARTBEAT', 15)),
+        max_duration=float(os.getenv('SSE_MAX_DURATION', 60)),
+    )
+    return app.response_class(stream_with_context(stream), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',  # 프록시 버퍼링 비활성화
+    })
+
 @app.route('/api/quick-publish/preview', methods=['GET'])
 def quick_publish_preview():
     """수동발행 미리보기: 오늘의 수익 최우선 주제 표시"""
@@ -2928,308 +2981,644 @@ def quick_publish_preview():
         logger.error(f"미리보기 오류: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/quick_publish', methods=['POST'])
-def quick_publish():
-    """수동 발행: 오늘 스케줄 주제로 직접 발행 + WordPress 업로드"""
+# 발행 작업 큐 - 수동/자동 발행을 publish_jobs 테이블에 넣고 워커 풀이 처리
+# (웹 프로세스가 재시작되거나 여러 개여도 같은 발행이 중복 실행되지 않음)
+PUBLISH_WORKERS = int(os.getenv('PUBLISH_WORKERS', '2'))
+PUBLISH_JOB_LEASE = float(os.getenv('PUBLISH_JOB_LEASE', '900'))
+PUBLISH_JOB_MAX_ATTEMPTS = int(os.getenv('PUBLISH_JOB_MAX_ATTEMPTS', '3'))
+
+_publish_job_queue = None
+_publish_workers = None
+_publish_queue_lock = threading.RLock()
+
+def get_publish_job_queue():
+    """발행 작업 큐 인스턴스 반환"""
+    global _publish_job_queue
+    with _publish_queue_lock:
+        if _publish_job_queue is None:
+            _publish_job_queue = JobQueue(get_database(), lease_seconds=PUBLISH_JOB_LEASE)
+        return _publish_job_queue
+
+def _apply_job_progress(status, job_id, site: str, **values):
+    """publish_status.mutate() 안에서 호출 - status['jobs'][job_id]를 갱신하고 current_site를 다시 계산"""
+    jobs = status.setdefault('jobs', {})
+    progress = jobs.setdefault(str(job_id), {'site': site, 'stage': 'running', 'message': ''})
+    progress.update(values)
+    dict.__setitem__(status, 'current_site', ', '.join(
+        job['site'] for job in jobs.values() if job.get('stage') != 'done'))
+
+def _update_job_progress(job_id, site: str, **values):
+    """작업별 진행 상태 갱신 - 워커들이 여러 사이트를 동시에 처리하므로 publish_status['jobs'][job_id]에 따로 보관
+
+    current_site는 아직 끝나지 않은 작업의 사이트 목록으로 다시 계산한다.
+    """
+    publish_status.mutate(lambda status: _apply_job_progress(status, job_id, site, **values))
+
+def _run_quick_publish_site(site: str, today, upload_to_wordpress: bool = True,
+                            force_regenerate: bool = False, job_id=None) -> dict:
+    """수동발행 1개 사이트 처리 (작업 큐 'quick_publish' 처리 함수에서 호출)
+
+    오늘의 수익 최우선 주제로 콘텐츠를 생성/저장하고 WordPress에 업로드한 뒤 결과 dict 반환
+    콘텐츠를 저장하기 전의 실패(주제 조회/생성 오류)는 'retryable': True로 반환해 작업 큐가 백오프 재시도한다.
+    """
+    from datetime import datetime, timedelta
+    from src.utils.schedule_manager import schedule_manager
+    import requests
+    
+    _update_job_progress(job_id, site, stage='running', message=f'{site} 발행 중...')
+    
     try:
-        data = request.json or {}
-        sites = data.get('sites', ['unpre', 'untab', 'skewese', 'tistory'])
-        upload_to_wordpress = data.get('upload_to_wordpress', True)  # 기본값: 업로드 활성화
+        # API에서 주간 스케줄 가져오기
+        weekday = today.weekday()
+        week_start = today - timedelta(days=weekday)
         
-        # 중복 실행 방지
-        global publish_status
-        if publish_status.get('in_progress', False):
-            return jsonify({
-                'success': False,
-                'error': '이미 발행이 진행 중입니다. 잠시만 기다려주세요.'
-            }), 400
+        # 미리보기 API와 동일한 로직으로 주제 가져오기
+        today_str = today.strftime('%Y-%m-%d')
+        database = get_database()
         
-        # 발행 시작
-        publish_status.update({
-            'in_progress': True,
-            'current_site': '',
-            'progress': 0,
-            'total_sites': len(sites),
-            'results': [],
-            'message': '발행 준비 중...'
-        })
+        # 수익 최우선 계획표에서 가져오기
+        from auto_weekly_planner import ProfitWeeklyPlanner
+        planner = ProfitWeeklyPlanner()
         
-        def background_publish():
-            try:
-                from datetime import datetime, timedelta
-                from src.utils.schedule_manager import schedule_manager
-                import requests
+        topic_data = None
+        try:
+            # 오늘의 수익 최우선 주제 가져오기
+            today_topics = planner.get_today_profit_topics()
+            
+            # 사이트별 주제 찾기
+            for topic_info in today_topics:
+                if topic_info['site'] == site:
+                    topic_data = {
+                        'topic': topic_info['title'],
+                        'category': topic_info['category'],
+                        'keywords': topic_info.get('keywords', [])
+                    }
+                    add_system_log('INFO', f'{site} 수익 최우선 계획 사용: {topic_data["topic"]} (카테고리: {topic_data["category"]}, 트렌드점수: {topic_info.get("trend_score", 0)})', 'PROFIT_SCHEDULE')
+                    break
+        except Exception as e:
+            add_system_log('WARNING', f'수익 계획표 조회 실패, DB 폴백: {e}', 'SCHEDULE')
+            
+            # 폴백: DB에서 가져오기
+            with database.connection() as conn, conn.cursor() as cursor:
+                days_since_monday = today.weekday()
+                week_start = today - timedelta(days=days_since_monday)
                 
-                today = datetime.now().date()
-                add_system_log('INFO', f'수동발행 시작: {today} - {len(sites)}개 사이트', 'MANUAL')
+                cursor.execute('''
+                SELECT plan_data FROM blog_automation.weekly_plans 
+                WHERE week_start = %s
+                ORDER BY created_at DESC
+                LIMIT 1
+                ''', (week_start,))
                 
-                for i, site in enumerate(sites):
-                    publish_status.update({
-                        'current_site': site,
-                        'progress': int((i / len(sites)) * 100),
-                        'message': f'{site} 발행 중...'
-                    })
+                result = cursor.fetchone()
+                if result:
+                    plan_data = result[0]
+                    plans = plan_data.get('plans', [])
+                    
+                    # 오늘 날짜, 현재 사이트에 해당하는 계획 찾기
+                    today_plan = next((plan for plan in plans 
+                                     if plan.get('date') == today_str and plan.get('site') == site), None)
                     
+                    if today_plan:
+                        topic_data = {
+                            'topic': today_plan.get('title'),
+                            'category': today_plan.get('category'),
+                            'keywords': today_plan.get('keywords', [site])
+                        }
+                        add_system_log('INFO', f'{site} DB 계획 사용: {topic_data["topic"]}', 'SCHEDULE')
+        
+        if topic_data:
+            topic = topic_data['topic']
+            category = topic_data['category'] 
+            keywords = topic_data.get('keywords', [site])
+            add_system_log('INFO', f'{site}: {topic}', 'SCHEDULE')
+        else:
+            # 미리보기 API와 동일한 대체 주제 사용
+            topic = f'오늘의 {site.upper()} 추천 주제'
+            category = '일반'
+            keywords = ['오늘', '추천', '주제']
+            add_system_log('WARNING', f'{site}: 대체 주제 사용 - {topic}', 'FALLBACK')
+        
+        # 직접 콘텐츠 생성 (HTTP 호출 대신)
+        file_id = None
+        try:
+            # 콘텐츠 생성기 사용
+            generator = get_shared_generator()
+            
+            # 사이트별 설정
+            if site == 'tistory':
+                from src.generators.tistory_content_exporter import TistoryContentExporter
+                exporter = TistoryContentExporter()
+                site_config = {
+                    'name': 'TISTORY',
+                    'categories': [category],
+                    'content_style': '친근하고 읽기 쉬운 톤',
+                    'target_audience': '일반 대중',
+                    'keywords_focus': keywords
+                }
+            else:
+                from src.generators.wordpress_content_exporter import WordPressContentExporter
+                exporter = WordPressContentExporter()
+                site_config = {
+                    'name': site.upper(),
+                    'categories': [category],
+                    'content_style': '전문적이고 신뢰할 수 있는 톤',
+                    'target_audience': '관심 있는 독자들',
+                    'keywords_focus': keywords
+                }
+            
+            # 콘텐츠 생성 (스트리밍 중 완성된 섹션을 작업별 진행 상태에 실시간 반영)
+            generation = {
+                'site': site,
+                'stage': 'generating',
+                'title': '',
+                'sections_done': 0,
+                'sections_total': 0,
+                'sections': [],
+                'chars': 0
+            }
+            _update_job_progress(job_id, site, generation=generation)
+            
+            # generation은 publish_status 안에 들어 있으므로 잠금을 잡은 mutate() 안에서만 바꾼다
+            def apply_generation_event(status, event, generation=generation):
+                generation['chars'] = event.get('chars', generation['chars'])
+                if event['type'] == 'started':
+                    generation['sections_total'] = event['sections_total']
+                elif event['type'] == 'field' and event['key'] == 'title':
+                    generation['title'] = event['value']
+                elif event['type'] == 'section':
+                    generation['sections'].append(event['heading'])
+                    generation['sections_done'] = len(generation['sections'])
+                    _apply_job_progress(status, job_id, site, message=(
+                        f"{site} 생성 중... 섹션 {generation['sections_done']}/{generation['sections_total']}"
+                    ))
+                elif event['type'] in ('aborted', 'retry'):
+                    generation['stage'] = 'retrying'
+                    generation['sections'] = []
+                    generation['sections_done'] = 0
+            
+            def on_generation_progress(event):
+                publish_status.mutate(lambda status: apply_generation_event(status, event))
+            
+            content_data = generator.generate_content(
+                site_config,
+                topic,
+                category,
+                None,  # existing_posts
+                'medium',  # content_length
+                site,  # site_key for API tracking
+                on_progress=on_generation_progress,
+                bypass_cache=force_regenerate
+            )
+            publish_status.mutate(lambda status: generation.update(
+                stage='completed' if content_data else 'failed'))
+            
+            if content_data:
+                # 파일로 내보내기
+                if site == 'tistory':
+                    filepath = exporter.export_content(content_data)
+                else:
+                    filepath = exporter.export_content(site, content_data)
+                
+                # DB에 저장
+                file_id = db.add_content_file(
+                    site=site,
+                    title=content_data['title'],
+                    file_path=filepath,
+                    file_type='tistory' if site == 'tistory' else 'wordpress',
+                    metadata={
+                        'category': category,
+                        'tags': content_data.get('tags', []),
+                        'manual_published': True,
+                        'published_at': datetime.now(timezone(timedelta(hours=9))).isoformat()
+                    }
+                )
+                
+                # 발행 상태 업데이트
+                db.update_file_status(file_id, 'published', datetime.now())
+
+                # WordPress 업로드 (WordPress 사이트만)
+                upload_result = None
+                publish_url = None
+                if upload_to_wordpress and site in ['unpre', 'untab', 'skewese']:
                     try:
-                        # API에서 주간 스케줄 가져오기
-                        weekday = today.weekday()
-                        week_start = today - timedelta(days=weekday)
-                        
-                        # 미리보기 API와 동일한 로직으로 주제 가져오기
-                        today_str = today.strftime('%Y-%m-%d')
-                        database = get_database()
-                        conn = database.get_connection()
-                        
-                        # 수익 최우선 계획표에서 가져오기
-                        from auto_weekly_planner import ProfitWeeklyPlanner
-                        planner = ProfitWeeklyPlanner()
+                        from src.publishers.wordpress_publisher import WordPressPublisher
+                        import json
                         
-                        topic_data = None
-                        try:
-                            # 오늘의 수익 최우선 주제 가져오기
-                            today_topics = planner.get_today_profit_topics()
-                            
-                            # 사이트별 주제 찾기
-                            for topic_info in today_topics:
-                                if topic_info['site'] == site:
-                                    topic_data = {
-                                        'topic': topic_info['title'],
-                                        'category': topic_info['category'],
-                                        'keywords': topic_info.get('keywords', [])
-                                    }
-                                    add_system_log('INFO', f'{site} 수익 최우선 계획 사용: {topic_data["topic"]} (카테고리: {topic_data["category"]}, 트렌드점수: {topic_info.get("trend_score", 0)})', 'PROFIT_SCHEDULE')
-                                    break
-                        except Exception as e:
-                            add_system_log('WARNING', f'수익 계획표 조회 실패, DB 폴백: {e}', 'SCHEDULE')
+                        # WordPress 설정 로드
+                        config_path = 'config/wordpress_sites.json'
+                        if os.path.exists(config_path):
+                            with open(config_path, 'r', encoding='utf-8') as f:
+                                wp_config = json.load(f)
                             
-                            # 폴백: DB에서 가져오기
-                            with conn.cursor() as cursor:
-                                days_since_monday = today.weekday()
-                                week_start = today - timedelta(days=days_since_monday)
+                            if site in wp_config:
+                                publisher = WordPressPublisher(wp_config[site])
                                 
-                                cursor.execute('''
-                                SELECT plan_data FROM blog_automation.weekly_plans 
-                                WHERE week_start = %s
-                                ORDER BY created_at DESC
-                                LIMIT 1
-                                ''', (week_start,))
-                                
-                                result = cursor.fetchone()
-                                if result:
-                                    plan_data = result[0]
-                                    plans = plan_data.get('plans', [])
-                                    
-                                    # 오늘 날짜, 현재 사이트에 해당하는 계획 찾기
-                                    today_plan = next((plan for plan in plans 
-                                                     if plan.get('date') == today_str and plan.get('site') == site), None)
-                                    
-                                    if today_plan:
-                                        topic_data = {
-                                            'topic': today_plan.get('title'),
-                                            'category': today_plan.get('category'),
-                                            'keywords': today_plan.get('keywords', [site])
-                                        }
-                                        add_system_log('INFO', f'{site} DB 계획 사용: {topic_data["topic"]}', 'SCHEDULE')
-                        
-                        if topic_data:
-                            topic = topic_data['topic']
-                            category = topic_data['category'] 
-                            keywords = topic_data.get('keywords', [site])
-                            add_system_log('INFO', f'{site}: {topic}', 'SCHEDULE')
-                        else:
-                            # 미리보기 API와 동일한 대체 주제 사용
-                            topic = f'오늘의 {site.upper()} 추천 주제'
-                            category = '일반'
-                            keywords = ['오늘', '추천', '주제']
-                            add_system_log('WARNING', f'{site}: 대체 주제 사용 - {topic}', 'FALLBACK')
-                        
-                        # 직접 콘텐츠 생성 (HTTP 호출 대신)
-                        try:
-                            # 콘텐츠 생성기 사용
-                            generator = ContentGenerator()
-                            
-                            # 사이트별 설정
-                            if site == 'tistory':
-                                from src.generators.tistory_content_exporter import TistoryContentExporter
-                                exporter = TistoryContentExporter()
-                                site_config = {
-                                    'name': 'TISTORY',
-                                    'categories': [category],
-                                    'content_style': '친근하고 읽기 쉬운 톤',
-                                    'target_audience': '일반 대중',
-                                    'keywords_focus': keywords
+                                wp_content = {
+                                    'title': content_data['title'],
+                                    'content': content_data['content'],
+                                    'excerpt': content_data.get('summary', '')[:100],
+                                    'status': 'publish'
                                 }
-                            else:
-                                from src.generators.wordpress_content_exporter import WordPressContentExporter
-                                exporter = WordPressContentExporter()
-                                site_config = {
-                                    'name': site.upper(),
-                                    'categories': [category],
-                                    'content_style': '전문적이고 신뢰할 수 있는 톤',
-                                    'target_audience': '관심 있는 독자들',
-                                    'keywords_focus': keywords
-                                }
-                            
-                            # 콘텐츠 생성
-                            content_data = generator.generate_content(
-                                site_config,
-                                topic,
-                                category,
-                                None,  # existing_posts
-                                'medium',  # content_length
-                                site  # site_key for API tracking
-                            )
-                            
-                            if content_data:
-                                # 파일로 내보내기
-                                if site == 'tistory':
-                                    filepath = exporter.export_content(content_data)
-                                else:
-                                    filepath = exporter.export_content(site, content_data)
-                                
-                                # DB에 저장
-                                file_id = db.add_content_file(
-                                    site=site,
-                                    title=content_data['title'],
-                                    file_path=filepath,
-                                    file_type='tistory' if site == 'tistory' else 'wordpress',
-                                    metadata={
-                                        'category': category,
-                                        'tags': content_data.get('tags', []),
-                                        'manual_published': True,
-                                        'published_at': datetime.now(timezone(timedelta(hours=9))).isoformat()
-                                    }
-                                )
                                 
-                                # 발행 상태 업데이트
-                                db.update_file_status(file_id, 'published', datetime.now())
+                                upload_result = publisher.publish_post(wp_content)
+                                if upload_result and upload_result.get('success'):
+                                    publish_url = upload_result.get('url')
+                                    add_system_log('INFO', f'{site} WordPress 업로드 성공: {publish_url}', 'SUCCESS')
+                                else:
+                                    add_system_log('ERROR', f'{site} WordPress 업로드 실패: {upload_result.get("error")}', 'ERROR')
+                    except Exception as wp_error:
+                        add_system_log('ERROR', f'{site} WordPress 업로드 오류: {wp_error}', 'ERROR')
 
-                                # WordPress 업로드 (WordPress 사이트만)
-                                upload_result = None
-                                publish_url = None
-                                if upload_to_wordpress and site in ['unpre', 'untab', 'skewese']:
-                                    try:
-                                        from src.publishers.wordpress_publisher import WordPressPublisher
-                                        import json
-                                        
-                                        # WordPress 설정 로드
-                                        config_path = 'config/wordpress_sites.json'
-                                        if os.path.exists(config_path):
-                                            with open(config_path, 'r', encoding='utf-8') as f:
-                                                wp_config = json.load(f)
-                                            
-                                            if site in wp_config:
-                                                publisher = WordPressPublisher(wp_config[site])
-                                                
-                                                wp_content = {
-                                                    'title': content_data['title'],
-                                                    'content': content_data['content'],
-                                                    'excerpt': content_data.get('summary', '')[:100],
-                                                    'status': 'publish'
-                                                }
-                                                
-                                                upload_result = publisher.publish_post(wp_content)
-                                                if upload_result and upload_result.get('success'):
-                                                    publish_url = upload_result.get('url')
-                                                    add_system_log('INFO', f'{site} WordPress 업로드 성공: {publish_url}', 'SUCCESS')
-                                                else:
-                                                    add_system_log('ERROR', f'{site} WordPress 업로드 실패: {upload_result.get("error")}', 'ERROR')
-                                    except Exception as wp_error:
-                                        add_system_log('ERROR', f'{site} WordPress 업로드 오류: {wp_error}', 'ERROR')
-
-                                # 발행 이력 기록 (publish_history 테이블)
+                # 발행 이력 기록 (publish_history 테이블)
+                try:
+                    from datetime import timezone, timedelta
+                    kst = timezone(timedelta(hours=9))
+                    publish_status_val = 'success' if (not upload_to_wordpress or site == 'tistory' or upload_result.get('success')) else 'partial'
+                    error_msg = None if publish_status_val == 'success' else upload_result.get('error') if upload_result else None
+
+                    with db.connection() as conn, conn.cursor() as cursor:
+                        cursor.execute(f'''
+                            INSERT INTO {db.schema}.publish_history
+                            (site, content_file_id, publish_type, publish_status, error_message,
+                             published_at, publish_url, response_data)
+                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s::jsonb)
+                        ''', (
+                            site,
+                            file_id,
+                            'manual',
+                            publish_status_val,
+                            error_msg,
+                            datetime.now(kst),
+                            publish_url,
+                            json.dumps({'manual_publish': True, 'upload_to_wordpress': upload_to_wordpress}, ensure_ascii=False)
+                        ))
+                        conn.commit()
+                except Exception as history_error:
+                    add_system_log('WARNING', f'{site} 발행 이력 기록 실패: {history_error}', 'WARNING')
+
+                # 결과에 WordPress 업로드 정보 포함
+                result_message = f'{site} 발행 성공'
+                if upload_result:
+                    if upload_result.get('success'):
+                        result_message += f' + WordPress 업로드 성공'
+                    else:
+                        result_message += f' (WordPress 업로드 실패)'
+                
+                result = {
+                    'site': site,
+                    'success': True,
+                    'message': result_message,
+                    'topic': topic,
+                    'wordpress_upload': upload_result
+                }
+                add_system_log('INFO', f'{site} 발행 성공: {topic}', 'SUCCESS')
+            else:
+                result = {
+                    'site': site,
+                    'success': False,
+                    'retryable': True,
+                    'message': f'{site} 콘텐츠 생성 실패',
+                    'topic': topic
+                }
+                add_system_log('ERROR', f'{site} 콘텐츠 생성 실패', 'ERROR')
+        
+        except Exception as content_error:
+            result = {
+                'site': site,
+                'success': False,
+                # 콘텐츠를 저장(발행 처리)한 뒤의 오류는 다시 실행하면 중복 발행되므로 재시도하지 않음
+                'retryable': file_id is None,
+                'message': f'{site} 콘텐츠 생성 오류: {str(content_error)}',
+                'topic': topic
+            }
+            add_system_log('ERROR', f'{site} 콘텐츠 생성 오류: {content_error}', 'ERROR')
+            
+    except Exception as site_error:
+        result = {
+            'site': site,
+            'success': False,
+            'retryable': True,
+            'message': f'{site} 오류: {str(site_error)}',
+            'topic': topic if 'topic' in locals() else '알 수 없음'
+        }
+        add_system_log('ERROR', f'{site} 오류: {site_error}', 'ERROR')
+    
+    return result
+
+def _run_scheduled_api_publish_site(site: str, server_url: str, job_id=None) -> dict:
+    """스케줄 주제 발행 1개 사이트 처리 (작업 큐 'api_publish' 처리 함수에서 호출)
+
+    콘텐츠 생성/WordPress 발행 API를 server_url로 호출하고 결과 dict 반환
+    WordPress가 발행을 확인하기 전의 실패(생성 실패, 연결 오류, 5xx)는 'retryable': True로 반환해
+    작업 큐가 백오프 재시도한다. 발행 요청을 보낸 뒤 응답을 못 받은 경우는 글이 이미 올라갔을 수 있으므로 재시도하지 않는다.
+    """
+    retryable = False
+    publish_sent = False
+    try:
+        # 상태 업데이트
+        _update_job_progress(job_id, site, stage='running', message=f'{site} 사이트 발행 중...')
+        
+        # 자동발행계획에서 오늘 날짜에 해당하는 실제 주제 가져오기
+        from src.utils.schedule_manager import ScheduleManager
+        from datetime import datetime, timedelta
+        
+        schedule_manager = ScheduleManager()
+        
+        # 오늘의 계획된 주제 가져오기
+        scheduled_topic = schedule_manager.get_today_scheduled_topic(site)
+        
+        if scheduled_topic:
+            topic = scheduled_topic['topic']
+            keywords = scheduled_topic['keywords']
+            category = scheduled_topic['category']
+            logger.info(f"[SCHEDULE] {site} 스케줄 주제 사용: {topic}")
+        else:
+            # 스케줄에 없으면 기본 주제 사용
+            topic_map = {
+                'unpre': 'Python 기초 프로그래밍 완벽 가이드',
+                'untab': '2025년 부동산 투자 전략 분석',
+                'skewese': '조선왕조 역사 속 숨겨진 이야기'
+            }
+            topic = topic_map.get(site, 'IT 기술 트렌드')
+            keywords = [site, '가이드']
+            category = 'programming' if site == 'unpre' else 'realestate' if site == 'untab' else 'history'
+            logger.info(f"[SCHEDULE] {site} 기본 주제 사용: {topic}")
+        
+        # 직접 콘텐츠 생성 API 호출
+        import requests
+        import json
+        
+        # 1. 콘텐츠 생성
+        generate_payload = {
+            'site': site,
+            'topic': topic,
+            'keywords': keywords,
+            'category': category,
+            'content_length': 'medium'
+        }
+        
+        logger.info(f"[AUTO_PUBLISH] {site} 콘텐츠 생성 시작 - 주제: {topic}")
+        
+        logger.info(f"[AUTO_PUBLISH] {site} API 호출: {server_url}/api/generate_wordpress")
+        generate_response = requests.post(
+            f'{server_url}/api/generate_wordpress',
+            headers={'Content-Type': 'application/json'},
+            json=generate_payload,
+            timeout=300
+        )
+        
+        if generate_response.status_code != 200:
+            logger.error(f"[AUTO_PUBLISH] {site} 콘텐츠 생성 실패: {generate_response.status_code}")
+            success = False
+            retryable = True
+        else:
+            generate_result = generate_response.json()
+            if not generate_result.get('success'):
+                logger.error(f"[AUTO_PUBLISH] {site} 콘텐츠 생성 실패: {generate_result.get('error')}")
+                success = False
+                retryable = True
+            else:
+                # 2. WordPress 발행
+                file_path = generate_result.get('file_path')
+                if not file_path:
+                    logger.error(f"[AUTO_PUBLISH] {site} 파일 경로 없음")
+                    success = False
+                    retryable = True
+                else:
+                    logger.info(f"[AUTO_PUBLISH] {site} WordPress 발행 중...")
+                    publish_payload = {
+                        'file_path': file_path,
+                        'site': site
+                    }
+                    
+                    publish_sent = True
+                    publish_response = requests.post(
+                        f'{server_url}/api/publish_to_wordpress',
+                        headers={'Content-Type': 'application/json'},
+                        json=publish_payload,
+                        timeout=120
+                    )
+                    
+                    if publish_response.status_code != 200:
+                        logger.error(f"[AUTO_PUBLISH] {site} WordPress 발행 실패: {publish_response.status_code}")
+                        success = False
+                        # 5xx는 WordPress가 발행을 확인하지 않은 경우 (publish_to_wordpress 실패 응답)
+                        retryable = publish_response.status_code >= 500
+                    else:
+                        publish_result = publish_response.json()
+                        if not publish_result.get('success'):
+                            logger.error(f"[AUTO_PUBLISH] {site} WordPress 발행 실패: {publish_result.get('error')}")
+                            success = False
+                        else:
+                            published_url = publish_result.get('url', '')
+                            logger.info(f"[AUTO_PUBLISH] {site} 발행 완료: {published_url}")
+                            
+                            # 스케줄 상태를 'published'로 업데이트
+                            if scheduled_topic:
                                 try:
-                                    from datetime import timezone, timedelta
-                                    kst = timezone(timedelta(hours=9))
-                                    publish_status_val = 'success' if (not upload_to_wordpress or site == 'tistory' or upload_result.get('success')) else 'partial'
-                                    error_msg = None if publish_status_val == 'success' else upload_result.get('error') if upload_result else None
-
-                                    conn = db.get_connection()
-                                    with conn.cursor() as cursor:
-                                        cursor.execute(f'''
-                                            INSERT INTO {db.schema}.publish_history
-                                            (site, content_file_id, publish_type, publish_status, error_message,
-                                             published_at, publish_url, response_data)
-                                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s::jsonb)
-                                        ''', (
-                                            site,
-                                            file_id,
-                                            'manual',
-                                            publish_status_val,
-                                            error_msg,
-                                            datetime.now(kst),
-                                            publish_url,
-                                            json.dumps({'manual_publish': True, 'upload_to_wordpress': upload_to_wordpress}, ensure_ascii=False)
-                                        ))
-                                        conn.commit()
-                                except Exception as history_error:
-                                    add_system_log('WARNING', f'{site} 발행 이력 기록 실패: {history_error}', 'WARNING')
-
-                                # 결과에 WordPress 업로드 정보 포함
-                                result_message = f'{site} 발행 성공'
-                                if upload_result:
-                                    if upload_result.get('success'):
-                                        result_message += f' + WordPress 업로드 성공'
-                                    else:
-                                        result_message += f' (WordPress 업로드 실패)'
-                                
-                                publish_status['results'].append({
-                                    'site': site,
-                                    'success': True,
-                                    'message': result_message,
-                                    'topic': topic,
-                                    'wordpress_upload': upload_result
-                                })
-                                add_system_log('INFO', f'{site} 발행 성공: {topic}', 'SUCCESS')
-                            else:
-                                publish_status['results'].append({
-                                    'site': site,
-                                    'success': False,
-                                    'message': f'{site} 콘텐츠 생성 실패',
-                                    'topic': topic
-                                })
-                                add_system_log('ERROR', f'{site} 콘텐츠 생성 실패', 'ERROR')
-                        
-                        except Exception as content_error:
-                            publish_status['results'].append({
-                                'site': site,
-                                'success': False,
-                                'message': f'{site} 콘텐츠 생성 오류: {str(content_error)}',
-                                'topic': topic
-                            })
-                            add_system_log('ERROR', f'{site} 콘텐츠 생성 오류: {content_error}', 'ERROR')
+                                    today = datetime.now().date()
+                                    week_start = today - timedelta(days=today.weekday())
+                                    day_of_week = today.weekday()
+                                    schedule_manager.update_schedule_status(
+                                        week_start, day_of_week, site, 'published', url=published_url
+                                    )
+                                    logger.info(f"[SCHEDULE] {site} 스케줄 상태 업데이트: published")
+                                except Exception as e:
+                                    logger.error(f"[SCHEDULE] {site} 상태 업데이트 실패: {e}")
                             
-                    except Exception as site_error:
-                        publish_status['results'].append({
-                            'site': site,
-                            'success': False,
-                            'message': f'{site} 오류: {str(site_error)}',
-                            'topic': topic if 'topic' in locals() else '알 수 없음'
-                        })
-                        add_system_log('ERROR', f'{site} 오류: {site_error}', 'ERROR')
-                
-                # 완료 처리
-                success_count = sum(1 for r in publish_status['results'] if r['success'])
-                publish_status.update({
-                    'in_progress': False,
-                    'progress': 100,
-                    'message': f'발행 완료: {success_count}/{len(sites)} 성공'
-                })
-                add_system_log('INFO', f'수동발행 완료: {success_count}/{len(sites)} 성공', 'COMPLETE')
-                
-            except Exception as e:
-                publish_status.update({
-                    'in_progress': False,
-                    'message': f'발행 오류: {str(e)}'
-                })
-                add_system_log('ERROR', f'전체 발행 오류: {e}', 'ERROR')
+                            success = True
+        
+        result_message = f'{site} 발행 완료'
+        result_url = None
+        if success and 'published_url' in locals():
+            result_message += f' - URL: {published_url}'
+            result_url = published_url
+        elif not success:
+            result_message = f'{site} 발행 실패'
+        
+        site_result = {
+            'site': site,
+            'success': success,
+            'message': result_message,
+            'topic': topic,
+            'url': result_url
+        }
+        if not success:
+            site_result['retryable'] = retryable
+        return site_result
+        
+    except Exception as e:
+        logger.error(f"사이트 {site} 발행 오류: {e}")
+        import requests
+        return {
+            'site': site,
+            'success': False,
+            # 발행 요청 전 오류, 또는 연결 자체가 안 된 경우만 재시도 (응답 대기 중 타임아웃은 이미 발행됐을 수 있음)
+            'retryable': not publish_sent or isinstance(e, requests.ConnectionError),
+            'message': f'{site} 발행 오류: {str(e)}'
+        }
+
+def _run_scheduled_post(site: str) -> dict:
+    """스케줄러 경로 발행 1개 사이트 처리 (작업 큐 'scheduled_publish' 처리 함수에서 호출)
+
+    재시도는 작업 큐의 백오프에 맡기므로 스케줄러 내부 재시도(대기 후 재귀 호출)는 건너뛰고,
+    발행 확인 전 실패면 'retryable': True로 반환한다.
+    """
+    from src.scheduler import BlogAutomationScheduler
+    blog_scheduler = BlogAutomationScheduler()
+    success = blog_scheduler.create_and_publish_post(site, retry_count=blog_scheduler.max_retries)
+    if success:
+        add_system_log('SUCCESS', f'✅ {site.upper()} 자동 발행 성공', 'SCHEDULER')
+        logger.info(f"✅ {site.upper()} 자동 발행 성공")
+    else:
+        add_system_log('WARNING', f'⚠️ {site.upper()} 자동 발행 실패', 'SCHEDULER')
+        logger.warning(f"⚠️ {site.upper()} 자동 발행 실패")
+    return {
+        'site': site,
+        'success': bool(success),
+        'retryable': not success and blog_scheduler.last_failure_retryable,
+        'message': f'{site} 자동 발행 {"성공" if success else "실패"}'
+    }
+
+PUBLISH_JOB_HANDLERS = {
+    'quick_publish': lambda job: _run_quick_publish_site(
+        job.site, date.fromisoformat(job.payload['date']),
+        job.payload.get('upload_to_wordpress', True),
+        job.payload.get('force_regenerate', False), job.id),
+    'api_publish': lambda job: _run_scheduled_api_publish_site(job.site, job.payload['server_url'], job.id),
+    'scheduled_publish': lambda job: _run_scheduled_post(job.site),
+}
+
+def _planned_quick_publish_categories() -> dict:
+    """수동발행 멱등 키용 사이트별 오늘 계획 카테고리 (조회 실패 시 빈 dict)"""
+    try:
+        from auto_weekly_planner import ProfitWeeklyPlanner
+        return {
+            topic['site']: topic.get('category')
+            for topic in ProfitWeeklyPlanner().get_today_profit_topics()
+        }
+    except Exception as e:
+        logger.warning(f"수동발행 계획 카테고리 조회 실패: {e}")
+        return {}
+
+def _apply_publish_progress(status):
+    """publish_status.mutate() 안에서 호출 - 완료 결과 수로 진행률 갱신, 모두 끝났으면 완료 메시지 반환"""
+    total = status.get('total_sites') or 0
+    done = len(status['results'])
+    if done < total:
+        dict.__setitem__(status, 'progress', int(done / total * 100))
+        return None
+    success_count = sum(1 for r in status['results'] if r.get('success'))
+    message = f'발행 완료: {success_count}/{total} 성공'
+    dict.update(status, {
+        'in_progress': False,
+        'current_site': '',
+        'progress': 100,
+        'message': message
+    })
+    return message
+
+def _refresh_publish_progress():
+    """현재 배치의 완료 결과 수로 진행률 갱신, 모두 끝나면 완료 처리"""
+    message = publish_status.mutate(_apply_publish_progress)
+    if message:
+        add_system_log('INFO', message, 'COMPLETE')
+
+def _on_publish_job_finished(job, state, result):
+    """작업 종료 콜백 - 대시보드가 보고 있는 배치의 작업이면 publish_status에 반영"""
+    if job.kind == 'scheduled_publish':
+        invalidate_responses('dashboard', 'content')
+    if job.id not in publish_status.get('job_ids', ()):
+        return
+    if state == STATE_QUEUED:
+        _update_job_progress(job.id, job.site, stage='retrying',
+                             message=f"{job.site} 재시도 대기 중: {result.get('error') or result.get('message', '')}")
+        return
+
+    def finish(status):
+        _apply_job_progress(status, job.id, job.site, stage='done', message=result.get('message', ''))
+        status['results'].append(dict(result, job_id=job.id, state=state))
+        return _apply_publish_progress(status)
+
+    message = publish_status.mutate(finish)
+    if message:
+        add_system_log('INFO', message, 'COMPLETE')
+
+def _start_publish_batch(submitted, message: str) -> list:
+    """enqueue 결과 [(Job, 새 작업 여부)]로 대시보드 발행 상태를 새 배치로 초기화하고 워커를 깨움
+
+    같은 멱등 키로 이미 끝난 작업은 저장된 결과를 바로 결과 목록에 넣는다.
+    """
+    finished = [job for job, _ in submitted if job.state in (STATE_SUCCEEDED, STATE_FAILED)]
+    publish_status.reset(
+        in_progress=True,
+        current_site='',
+        progress=0,
+        total_sites=len(submitted),
+        results=[dict(job.result or {'site': job.site, 'success': job.state == STATE_SUCCEEDED},
+                      job_id=job.id, state=job.state, duplicate=True)
+                 for job in finished],
+        job_ids=[job.id for job, _ in submitted],
+        message=message,
+        jobs={}
+    )
+    if finished:
+        _refresh_publish_progress()
+    workers = get_publish_workers()
+    if workers:
+        workers.wake()
+    return [dict(job_id=job.id, site=job.site, state=job.state, created=created,
+                 idempotency_key=job.idempotency_key)
+            for job, created in submitted]
+
+def get_publish_workers():
+    """발행 작업 워커 풀 (PUBLISH_WORKERS=0이면 이 프로세스에서는 실행하지 않음)"""
+    global _publish_workers
+    if PUBLISH_WORKERS <= 0:
+        return None
+    with _publish_queue_lock:
+        if _publish_workers is None:
+            _publish_workers = JobWorkerPool(
+                get_publish_job_queue(),
+                PUBLISH_JOB_HANDLERS,
+                concurrency=PUBLISH_WORKERS,
+                on_finish=_on_publish_job_finished
+            )
+        return _publish_workers
+
+@app.route('/api/quick_publish', methods=['POST'])
+def quick_publish():
+    """수동 발행: 오늘 스케줄 주제로 직접 발행 + WordPress 업로드"""
+    try:
+        data = request.json or {}
+        sites = data.get('sites', ['unpre', 'untab', 'skewese', 'tistory'])
+        upload_to_wordpress = data.get('upload_to_wordpress', True)  # 기본값: 업로드 활성화
+        force_regenerate = bool(data.get('force_regenerate', False))  # 생성 캐시 무시
         
-        import threading
-        threading.Thread(target=background_publish, daemon=True).start()
+        today = datetime.now().date()
+        planned = _planned_quick_publish_categories()
+        submitted = []
+        for site in sites:
+            category = planned.get(site)
+            if force_regenerate:
+                # 강제 재생성은 같은 날 다시 발행하려는 의도이므로 요청마다 새 키
+                category = f"{category or '-'}@{datetime.now().strftime('%H%M%S%f')}"
+            submitted.append(get_publish_job_queue().enqueue(
+                'quick_publish', site,
+                idempotency_key('quick_publish', site, today, category),
+                {'date': today.isoformat(), 'upload_to_wordpress': upload_to_wordpress,
+                 'force_regenerate': force_regenerate},
+                max_attempts=PUBLISH_JOB_MAX_ATTEMPTS
+            ))
+        
+        add_system_log('INFO', f'수동발행 시작: {today} - {len(sites)}개 사이트', 'MANUAL')
+        jobs = _start_publish_batch(submitted, '발행 준비 중...')
         
         return jsonify({
             'success': True,
-            'message': f'{len(sites)}개 사이트 발행이 시작되었습니다.'
+            'message': f'{len(sites)}개 사이트 발행이 시작되었습니다.',
+            'jobs': jobs
         })
         
     except Exception as e:
@@ -3251,178 +3640,28 @@ def manual_auto_publish():
         data = request.json
         sites = data.get('sites', ['unpre', 'untab', 'skewese', 'tistory'])
         
-        # 전역 상태 초기화
-        global publish_status
-        publish_status.update({
-            'in_progress': True,
-            'current_site': '',
-            'progress': 0,
-            'total_sites': len(sites),
-            'results': [],
-            'message': '발행을 시작합니다...'
-        })
-        
-        results = []
-        
-        for idx, site in enumerate(sites):
-            try:
-                # 상태 업데이트
-                publish_status.update({
-                    'current_site': site,
-                    'progress': int((idx / len(sites)) * 100),
-                    'message': f'{site} 사이트 발행 중...'
-                })
-                
-                # 자동발행계획에서 오늘 날짜에 해당하는 실제 주제 가져오기
-                from src.utils.schedule_manager import ScheduleManager
-                from datetime import datetime, timedelta
-                
-                schedule_manager = ScheduleManager()
-                
-                # 오늘의 계획된 주제 가져오기
-                scheduled_topic = schedule_manager.get_today_scheduled_topic(site)
-                
-                if scheduled_topic:
-                    topic = scheduled_topic['topic']
-                    keywords = scheduled_topic['keywords']
-                    category = scheduled_topic['category']
-                    logger.info(f"[SCHEDULE] {site} 스케줄 주제 사용: {topic}")
-                else:
-                    # 스케줄에 없으면 기본 주제 사용
-                    topic_map = {
-                        'unpre': 'Python 기초 프로그래밍 완벽 가이드',
-                        'untab': '2025년 부동산 투자 전략 분석',
-                        'skewese': '조선왕조 역사 속 숨겨진 이야기'
-                    }
-                    topic = topic_map.get(site, 'IT 기술 트렌드')
-                    keywords = [site, '가이드']
-                    category = 'programming' if site == 'unpre' else 'realestate' if site == 'untab' else 'history'
-                    logger.info(f"[SCHEDULE] {site} 기본 주제 사용: {topic}")
-                
-                # 직접 콘텐츠 생성 API 호출
-                import requests
-                import json
-                
-                # 1. 콘텐츠 생성
-                generate_payload = {
-                    'site': site,
-                    'topic': topic,
-                    'keywords': keywords,
-                    'category': category,
-                    'content_length': 'medium'
-                }
-                
-                logger.info(f"[AUTO_PUBLISH] {site} 콘텐츠 생성 시작 - 주제: {topic}")
-                
-                # 현재 서버 URL 결정 (운영/개발 환경 자동 감지)
-                server_url = request.url_root.rstrip('/')
-                
-                logger.info(f"[AUTO_PUBLISH] {site} API 호출: {server_url}/api/generate_wordpress")
-                generate_response = requests.post(
-                    f'{server_url}/api/generate_wordpress',
-                    headers={'Content-Type': 'application/json'},
-                    json=generate_payload,
-                    timeout=300
-                )
-                
-                if generate_response.status_code != 200:
-                    logger.error(f"[AUTO_PUBLISH] {site} 콘텐츠 생성 실패: {generate_response.status_code}")
-                    success = False
-                else:
-                    generate_result = generate_response.json()
-                    if not generate_result.get('success'):
-                        logger.error(f"[AUTO_PUBLISH] {site} 콘텐츠 생성 실패: {generate_result.get('error')}")
-                        success = False
-                    else:
-                        # 2. WordPress 발행
-                        file_path = generate_result.get('file_path')
-                        if not file_path:
-                            logger.error(f"[AUTO_PUBLISH] {site} 파일 경로 없음")
-                            success = False
-                        else:
-                            logger.info(f"[AUTO_PUBLISH] {site} WordPress 발행 중...")
-                            publish_payload = {
-                                'file_path': file_path,
-                                'site': site
-                            }
-                            
-                            publish_response = requests.post(
-                                f'{server_url}/api/publish_to_wordpress',
-                                headers={'Content-Type': 'application/json'},
-                                json=publish_payload,
-                                timeout=120
-                            )
-                            
-                            if publish_response.status_code != 200:
-                                logger.error(f"[AUTO_PUBLISH] {site} WordPress 발행 실패: {publish_response.status_code}")
-                                success = False
-                            else:
-                                publish_result = publish_response.json()
-                                if not publish_result.get('success'):
-                                    logger.error(f"[AUTO_PUBLISH] {site} WordPress 발행 실패: {publish_result.get('error')}")
-                                    success = False
-                                else:
-                                    published_url = publish_result.get('url', '')
-                                    logger.info(f"[AUTO_PUBLISH] {site} 발행 완료: {published_url}")
-                                    
-                                    # 스케줄 상태를 'published'로 업데이트
-                                    if scheduled_topic:
-                                        try:
-                                            today = datetime.now().date()
-                                            week_start = today - timedelta(days=today.weekday())
-                                            day_of_week = today.weekday()
-                                            schedule_manager.update_schedule_status(
-                                                week_start, day_of_week, site, 'published', url=published_url
-                                            )
-                                            logger.info(f"[SCHEDULE] {site} 스케줄 상태 업데이트: published")
-                                        except Exception as e:
-                                            logger.error(f"[SCHEDULE] {site} 상태 업데이트 실패: {e}")
-                                    
-                                    success = True
-                
-                result_message = f'{site} 발행 완료'
-                result_url = None
-                if success and 'published_url' in locals():
-                    result_message += f' - URL: {published_url}'
-                    result_url = published_url
-                elif not success:
-                    result_message = f'{site} 발행 실패'
-                
-                site_result = {
-                    'site': site,
-                    'success': success,
-                    'message': result_message,
-                    'topic': topic,
-                    'url': result_url
-                }
-                results.append(site_result)
-                
-                # 실시간 상태 업데이트
-                publish_status['results'].append(site_result)
-                publish_status['progress'] = int(((idx + 1) / len(sites)) * 100)
-                
-            except Exception as e:
-                logger.error(f"사이트 {site} 발행 오류: {e}")
-                results.append({
-                    'site': site,
-                    'success': False,
-                    'message': f'{site} 발행 오류: {str(e)}'
-                })
+        from src.utils.schedule_manager import ScheduleManager
+        schedule_manager = ScheduleManager()
+        today = datetime.now().date()
+        server_url = request.url_root.rstrip('/')
         
-        success_count = sum(1 for r in results if r['success'])
+        submitted = []
+        for site in sites:
+            scheduled_topic = schedule_manager.get_today_scheduled_topic(site)
+            category = scheduled_topic['category'] if scheduled_topic else None
+            submitted.append(get_publish_job_queue().enqueue(
+                'api_publish', site,
+                idempotency_key('api_publish', site, today, category),
+                {'date': today.isoformat(), 'server_url': server_url},
+                max_attempts=PUBLISH_JOB_MAX_ATTEMPTS
+            ))
         
-        # 최종 상태 업데이트
-        publish_status.update({
-            'in_progress': False,
-            'current_site': '',
-            'progress': 100,
-            'message': f'발행 완료! 총 {len(sites)}개 사이트 중 {success_count}개 성공'
-        })
+        jobs = _start_publish_batch(submitted, '발행을 시작합니다...')
         
         return jsonify({
-            'success': success_count > 0,
-            'message': f'총 {len(sites)}개 사이트 중 {success_count}개 성공',
-            'results': results
+            'success': True,
+            'message': f'{len(sites)}개 사이트 발행 작업이 등록되었습니다.',
+            'jobs': jobs
         })
         
     except Exception as e:
@@ -3665,7 +3904,6 @@ def get_mock_tistory_files():
 @app.route('/api/system/time')
 def get_system_time():
     """시스템 시간 조회 (한국 시간과 서버 시간 비교)"""
-    import time
     
     # 서버 UTC 시간
     utc_time = datetime.now(pytz.UTC)
@@ -3775,482 +4013,14 @@ def api_status():
     }), 200
 
 def _create_beautiful_html_template(generated_content, site_config):
-    """아름다운 HTML 템플릿 생성"""
-    return f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{generated_content.get('title', '제목')}</title>
-    <meta name="description" content="{generated_content.get('meta_description', '설명')}"
-    <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Noto Sans KR', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            line-height: 1.8;
-            color: #2c3e50;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 900px;
-            margin: 0 auto;
-            background: #ffffff;
-            border-radius: 20px;
-            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.1);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 60px 40px;
-            text-align: center;
-            position: relative;
-        }}
-        
-        .header::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><defs><pattern id="grain" width="100" height="100" patternUnits="userSpaceOnUse"><circle cx="25" cy="25" r="1" fill="rgba(255,255,255,0.1)"/><circle cx="75" cy="75" r="1" fill="rgba(255,255,255,0.05)"/><circle cx="50" cy="10" r="0.5" fill="rgba(255,255,255,0.1)"/></pattern></defs><rect width="100" height="100" fill="url(%23grain)"/></svg>');
-            opacity: 0.1;
-        }}
-        
-        .header h1 {{
-            font-size: 2.8em;
-            font-weight: 600;
-            margin-bottom: 20px;
-            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .meta-info {{
-            display: inline-flex;
-            align-items: center;
-            background: rgba(255, 255, 255, 0.2);
-            padding: 12px 24px;
-            border-radius: 50px;
-            font-size: 0.9em;
-            backdrop-filter: blur(10px);
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .content {{
-            padding: 50px 40px;
-        }}
-        
-        .introduction {{
-            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-            padding: 30px;
-            border-radius: 15px;
-            margin-bottom: 40px;
-            border-left: 5px solid #667eea;
-            position: relative;
-        }}
-        
-        .introduction::before {{
-            content: '💡';
-            position: absolute;
-            top: -10px;
-            left: 20px;
-            background: #667eea;
-            width: 40px;
-            height: 40px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 1.2em;
-        }}
-        
-        .section {{
-            margin-bottom: 40px;
-            padding: 30px;
-            background: #ffffff;
-            border-radius: 15px;
-            box-shadow: 0 5px 20px rgba(0, 0, 0, 0.05);
-            border: 1px solid #f1f3f4;
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        }}
-        
-        .section:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .section h2 {{
-            color: #667eea;
-            font-size: 1.8em;
-            font-weight: 600;
-            margin-bottom: 20px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #f1f3f4;
-            position: relative;
-        }}
-        
-        .section h2::before {{
-            content: '';
-            position: absolute;
-            bottom: -2px;
-            left: 0;
-            width: 50px;
-            height: 2px;
-            background: #667eea;
-        }}
-        
-        .section-content {{
-            font-size: 1.1em;
-            line-height: 1.8;
-        }}
-        
-        .section-content p {{
-            margin-bottom: 16px;
-        }}
-        
-        .section-content strong {{
-            color: #667eea;
-            font-weight: 600;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }}
-        
-        .section-content em {{
-            color: #555;
-            font-style: italic;
-            background: #f8f9fa;
-            padding: 2px 6px;
-            border-radius: 4px;
-        }}
-        
-        .content-paragraph {{
-            margin-bottom: 18px;
-            text-align: justify;
-            line-height: 1.8;
-        }}
-        
-        .styled-list {{
-            margin: 20px 0;
-            padding-left: 0;
-            list-style: none;
-        }}
-        
-        .styled-list li {{
-            margin-bottom: 12px;
-            padding-left: 30px;
-            position: relative;
-            line-height: 1.6;
-        }}
-        
-        .styled-list li::before {{
-            content: '▸';
-            position: absolute;
-            left: 8px;
-            color: #667eea;
-            font-weight: bold;
-            font-size: 1.1em;
-        }}
-        
-        ol.styled-list li::before {{
-            content: counter(item);
-            counter-increment: item;
-            background: #667eea;
-            color: white;
-            border-radius: 50%;
-            width: 20px;
-            height: 20px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 0.8em;
-            font-weight: 600;
-            left: 0;
-        }}
-        
-        ol.styled-list {{
-            counter-reset: item;
-        }}
-        
-        .inline-code {{
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            color: white;
-            padding: 3px 8px;
-            border-radius: 6px;
-            font-family: 'Courier New', monospace;
-            font-size: 0.9em;
-            font-weight: 500;
-            white-space: nowrap;
-        }}
-        
-        .section-divider {{
-            margin: 30px 0;
-            border: none;
-            height: 2px;
-            background: linear-gradient(135deg, transparent, #667eea, transparent);
-            border-radius: 2px;
-        }}
-        
-        .code-block {{
-            background: #f8f9fa;
-            border: 1px solid #e9ecef;
-            border-radius: 8px;
-            padding: 20px;
-            margin: 20px 0;
-            font-family: 'Courier New', monospace;
-            overflow-x: auto;
-        }}
-        
-        .table-container {{
-            overflow-x: auto;
-            margin: 20px 0;
-        }}
-        
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            background: white;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-        }}
-        
-        th, td {{
-            padding: 15px;
-            text-align: left;
-            border-bottom: 1px solid #f1f3f4;
-        }}
-        
-        th {{
-            background: #667eea;
-            color: white;
-            font-weight: 600;
-        }}
-        
-        tr:hover {{
-            background: #f8f9fa;
-        }}
-        
-        .conclusion {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-            border-radius: 15px;
-            margin: 40px 0;
-            text-align: center;
-        }}
-        
-        .conclusion h2 {{
-            font-size: 1.8em;
-            margin-bottom: 20px;
-            color: white;
-        }}
-        
-        .tags {{
-            background: #f8f9fa;
-            padding: 25px;
-            border-radius: 15px;
-            text-align: center;
-            margin-top: 30px;
-        }}
-        
-        .tag {{
-            display: inline-block;
-            background: #667eea;
-            color: white;
-            padding: 8px 16px;
-            border-radius: 20px;
-            margin: 5px;
-            font-size: 0.9em;
-            font-weight: 500;
-        }}
-        
-        @media (max-width: 768px) {{
-            .container {{
-                margin: 10px;
-                border-radius: 10px;
-            }}
-            
-            .header {{
-                padding: 40px 20px;
-            }}
-            
-            .header h1 {{
-                font-size: 2.2em;
-            }}
-            
-            .content {{
-                padding: 30px 20px;
-            }}
-            
-            .section {{
-                padding: 20px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header class="header">
-            <h1>{generated_content['title']}</h1>
-            <div class="meta-info">
-                <span>📅 {datetime.now(KST).strftime('%Y년 %m월 %d일')}</span>
-                <span style="margin: 0 15px;">•</span>
-                <span>🔖 {site_config.get('name', 'Blog').upper()}</span>
-            </div>
-        </header>
-        
-        <div class="content">
-            <section class="introduction">
-                <p>{generated_content['introduction']}</p>
-            </section>
-            
-            <main>
-{''.join([f'''
-                <section class="section">
-                    <h2>{section.get('heading', '섹션')}</h2>
-                    <div class="section-content">
-                        {_format_section_content(section.get('content', '내용'))}
-                    </div>
-                </section>
-''' for section in generated_content.get('sections', [])])}
-            </main>
-            
-            <footer>
-                <section class="conclusion">
-                    <h2>마무리</h2>
-                    <p>{generated_content.get('conclusion', generated_content.get('additional_content', '이상으로 마무리하겠습니다.'))}</p>
-                </section>
-                
-                <div class="tags">
-                    <strong style="display: block; margin-bottom: 15px; color: #667eea; font-size: 1.1em;">🏷️ 관련 태그</strong>
-                    {''.join([f'<span class="tag">{tag}</span>' for tag in generated_content.get('tags', [])])}
-                </div>
-            </footer>
-        </div>
-    </div>
-</body>
-</html>
-"""
-
-def _format_section_content(content):
-    """섹션 콘텐츠 포맷팅 - 완전 개선"""
-    import re
-    
-    # 1. 마크다운 볼드체 처리 (**text** -> <strong>text</strong>)
-    content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
-    
-    # 2. 이탤릭 처리 (*text* -> <em>text</em>)
-    content = re.sub(r'\*([^*]+?)\*', r'<em>\1</em>', content)
-    
-    # 3. 코드 블록 처리 (```로 감싸진 부분)
-    content = re.sub(r'```(\w+)?\n(.*?)\n```', r'<div class="code-block"><pre><code>\2</code></pre></div>', content, flags=re.DOTALL)
-    content = re.sub(r'```(.*?)```', r'<div class="code-block"><pre><code>\1</code></pre></div>', content, flags=re.DOTALL)
-    
-    # 4. 인라인 코드 처리 (`code` -> <code>code</code>)
-    content = re.sub(r'`([^`]+?)`', r'<code class="inline-code">\1</code>', content)
-    
-    # 5. 테이블 처리 개선
-    if '<table>' in content:
-        content = content.replace('<table>', '<div class="table-container"><table>')
-        content = content.replace('</table>', '</table></div>')
-    
-    # 6. 마크다운 테이블을 HTML로 변환
-    lines = content.split('\n')
-    in_table = False
-    table_html = []
-    processed_lines = []
-    
-    for line in lines:
-        if '|' in line and line.strip():
-            if not in_table:
-                in_table = True
-                table_html = ['<div class="table-container"><table>']
-            
-            # 헤더 구분선 처리 (|---|---|)
-            if re.match(r'^(\s*\|?\s*:?-+:?\s*\|)+\s*$', line):
-                continue
-                
-            cells = [cell.strip() for cell in line.split('|') if cell.strip()]
-            if cells:
-                # 첫 번째 테이블 행인지 확인 (다음 줄이 구분선인지 체크)
-                next_line_idx = lines.index(line) + 1
-                is_header = (next_line_idx < len(lines) and 
-                           re.match(r'^(\s*\|?\s*:?-+:?\s*\|)+\s*$', lines[next_line_idx]))
-                
-                if is_header:
-                    row_html = '<tr>' + ''.join([f'<th>{cell}</th>' for cell in cells]) + '</tr>'
-                else:
-                    row_html = '<tr>' + ''.join([f'<td>{cell}</td>' for cell in cells]) + '</tr>'
-                table_html.append(row_html)
-        else:
-            if in_table:
-                table_html.append('</table></div>')
-                processed_lines.extend(table_html)
-                table_html = []
-                in_table = False
-            processed_lines.append(line)
-    
-    # 테이블이 끝나지 않은 경우 처리
-    if in_table:
-        table_html.append('</table></div>')
-        processed_lines.extend(table_html)
-    
-    content = '\n'.join(processed_lines)
-    
-    # 7. 리스트 처리 개선
-    # 순서 없는 리스트 (- item)
-    content = re.sub(r'^\s*[-*]\s+(.+)$', r'<li>\1</li>', content, flags=re.MULTILINE)
-    # 연속된 li 태그를 ul로 감싸기
-    content = re.sub(r'(<li>.*?</li>\s*)+', lambda m: f'<ul class="styled-list">{m.group(0)}</ul>', content, flags=re.DOTALL)
-    
-    # 순서 있는 리스트 (1. item)
-    content = re.sub(r'^\s*\d+\.\s+(.+)$', r'<li>\1</li>', content, flags=re.MULTILINE)
-    content = re.sub(r'(<li>.*?</li>\s*)+', lambda m: f'<ol class="styled-list">{m.group(0)}</ol>', content, flags=re.DOTALL)
-    
-    # 8. 구분선 처리 (---)
-    content = re.sub(r'^---+\s*$', '<hr class="section-divider">', content, flags=re.MULTILINE)
-    
-    # 9. 문단 구분 개선 - 이중 줄바꿈을 문단으로 처리
-    paragraphs = content.split('\n\n')
-    formatted_paragraphs = []
-    
-    for paragraph in paragraphs:
-        paragraph = paragraph.strip()
-        if not paragraph:
-            continue
-            
-        # HTML 태그로 시작하면 그대로 사용
-        if paragraph.startswith(('<div', '<table', '<ul', '<ol', '<hr', '<h1', '<h2', '<h3', '<h4', '<h5', '<h6')):
-            formatted_paragraphs.append(paragraph)
-        else:
-            # 일반 텍스트는 p 태그로 감싸기
-            # 단일 줄바꿈은 <br>로 변환
-            paragraph_html = paragraph.replace('\n', '<br>')
-            formatted_paragraphs.append(f'<p class="content-paragraph">{paragraph_html}</p>')
-    
-    content = '\n\n'.join(formatted_paragraphs)
-    
-    # 10. 빈 태그 제거
-    content = re.sub(r'<p[^>]*>\s*</p>', '', content)
-    content = re.sub(r'<li>\s*</li>', '', content)
-    
-    return content
+    """아름다운 HTML 템플릿 생성 (templates/export/beautiful_post.html, 공통 CSS는 static/css/post_beautiful.css)"""
+    return render_export_template(
+        'beautiful_post.html',
+        content=generated_content,
+        site_name=site_config.get('name', 'Blog'),
+        published_date=datetime.now(KST).strftime('%Y년 %m월 %d일'),
+        markdown_theme=DASHBOARD_THEME
+    )
 
 # Flask 앱 인스턴스에 메서드 추가
 app._create_beautiful_html_template = _create_beautiful_html_template
@@ -4258,6 +4028,7 @@ app._create_beautiful_html_template = _create_beautiful_html_template
 # 자동 발행 스케줄러 설정
 scheduler = None
 
+@releases_connection
 def auto_publish_task():
     """매일 새벽 3시 자동 발행 작업 - 날짜별 스케줄 기반"""
     try:
@@ -4267,13 +4038,9 @@ def auto_publish_task():
         # 시간 기록
         from datetime import datetime, timedelta
         import pytz
-        from src.scheduler import BlogAutomationScheduler
         kst = pytz.timezone('Asia/Seoul')
         start_time = datetime.now(kst)
         
-        # BlogAutomationScheduler 초기화
-        blog_scheduler = BlogAutomationScheduler()
-        
         # 오늘 날짜 기반 스케줄 계산 (수동 발행과 동일한 로직)
         today = start_time.date()
         day_of_week_raw = today.weekday()  # 0=월요일, 6=일요일
@@ -4397,33 +4164,38 @@ def auto_publish_task():
         
         add_system_log('INFO', f'스케줄 데이터 로드 완료: {len(schedule_data.get("schedule", {}))}일', 'SCHEDULER')
         
-        # 모든 사이트 자동 발행 (WordPress 3개 + tistory)
+        # 모든 사이트 자동 발행 (WordPress 3개 + tistory) - 사이트별 작업을 큐에 넣고 워커 풀이 처리
+        # 멱등 키에 스케줄 카테고리를 넣어 재시작/다중 인스턴스로 작업이 두 번 실행돼도 한 번만 발행
         sites_to_publish = ['unpre', 'untab', 'skewese', 'tistory']
-        success_count = 0
+        today_sites = (schedule_data.get('schedule', {}).get(day_of_week) or {}).get('sites', {})
+        queue = get_publish_job_queue()
+        created_count = 0
         
         for site in sites_to_publish:
             try:
-                add_system_log('INFO', f'{site.upper()} 발행 시작...', 'SCHEDULER')
-                # 스케줄러의 create_and_publish_post는 스케줄 매니저를 통해 오늘 주제를 가져옴
-                success = blog_scheduler.create_and_publish_post(site)
-                if success:
-                    success_count += 1
-                    add_system_log('SUCCESS', f'✅ {site.upper()} 자동 발행 성공', 'SCHEDULER')
-                    logger.info(f"✅ {site.upper()} 자동 발행 성공")
-                else:
-                    add_system_log('WARNING', f'⚠️ {site.upper()} 자동 발행 실패', 'SCHEDULER')
-                    logger.warning(f"⚠️ {site.upper()} 자동 발행 실패")
-                        
+                category = (today_sites.get(site) or {}).get('category')
+                job, created = queue.enqueue(
+                    'scheduled_publish', site,
+                    idempotency_key('scheduled_publish', site, today, category),
+                    {'date': today.isoformat()},
+                    max_attempts=PUBLISH_JOB_MAX_ATTEMPTS
+                )
+                created_count += created
+                add_system_log('INFO', f'{site.upper()} 발행 작업 #{job.id} {"등록" if created else "이미 등록됨"} ({job.state})', 'SCHEDULER')
             except Exception as e:
-                add_system_log('ERROR', f'❌ {site.upper()} 발행 오류: {str(e)}', 'SCHEDULER')
-                logger.error(f"❌ {site.upper()} 자동 발행 오류: {e}")
+                add_system_log('ERROR', f'❌ {site.upper()} 발행 작업 등록 오류: {str(e)}', 'SCHEDULER')
+                logger.error(f"❌ {site.upper()} 자동 발행 작업 등록 오류: {e}")
+        
+        workers = get_publish_workers()
+        if workers:
+            workers.wake()
         
-        # 작업 완료 통계
+        # 작업 등록 통계 (발행 결과는 작업별로 기록됨)
         end_time = datetime.now(kst)
         duration = (end_time - start_time).total_seconds()
         
-        add_system_log('INFO', f'📊 자동 발행 완료: {success_count}/{len(sites_to_publish)} 성공, 소요시간: {duration:.1f}초', 'SCHEDULER')
-        logger.info(f"✅ 새벽 3시 자동 발행 작업 완료 ({success_count}/{len(sites_to_publish)} 성공)")
+        add_system_log('INFO', f'📊 자동 발행 작업 등록 완료: {created_count}/{len(sites_to_publish)} 신규, 소요시간: {duration:.1f}초', 'SCHEDULER')
+        logger.info(f"✅ 새벽 3시 자동 발행 작업 등록 완료 ({created_count}/{len(sites_to_publish)} 신규)")
         
     except Exception as e:
         add_system_log('ERROR', f'❌ 자동 발행 작업 실패: {str(e)}', 'SCHEDULER')
@@ -4496,6 +4268,7 @@ def init_scheduler():
             logger.info(f"⏰ {job.name}: {next_run}")
         
         # 🔥 매주 일요일 밤 11시 30분에 다음주 수익성 최우선 계획 자동 생성
+        @releases_connection
         def auto_generate_next_week_profit_plan():
             """다음주 수익성 최우선 주간계획 자동 생성 - 철저한 에러 방지"""
             try:
@@ -4519,11 +4292,7 @@ def init_scheduler():
                 
                 # 2. 기존 다음주 계획 체크 (중복 방지)
                 try:
-                    from src.utils.postgresql_database import PostgreSQLDatabase
-                    db = PostgreSQLDatabase()
-                    conn = db.get_connection()
-                    
-                    with conn.cursor() as cursor:
+                    with get_database().connection() as conn, conn.cursor() as cursor:
                         cursor.execute('''
                         SELECT id FROM blog_automation.weekly_plans 
                         WHERE week_start = %s
@@ -4555,6 +4324,8 @@ def init_scheduler():
                     )
                     
                     if result.returncode == 0:
+                        from auto_weekly_planner import invalidate_weekly_plan_memo
+                        invalidate_weekly_plan_memo()
                         add_system_log('SUCCESS', '🎉 다음주 수익성 최우선 주간계획 자동 생성 완료!', 'WEEKLY_PLANNER')
                         logger.info("🎉 다음주 수익성 최우선 주간계획 자동 생성 완료!")
                         
@@ -4578,7 +4349,7 @@ def init_scheduler():
                 # 4. 생성 완료 후 검증
                 try:
                     time.sleep(2)  # 잠깐 대기
-                    with conn.cursor() as cursor:
+                    with get_database().connection() as conn, conn.cursor() as cursor:
                         cursor.execute('''
                         SELECT plan_data FROM blog_automation.weekly_plans 
                         WHERE week_start = %s
@@ -4620,8 +4391,26 @@ def init_scheduler():
             coalesce=True     # 누락된 실행을 하나로 합침
         )
         
-        # 테스트용 즉시 실행 (첫 시작 시에만)
         from datetime import timedelta
+
+        # 트렌드 스냅샷 주기 갱신 (조회 API는 스냅샷만 읽음)
+        def refresh_trend_snapshot():
+            from src.utils.trend_snapshot_store import get_trend_store
+            get_trend_store().refresh()
+        
+        scheduler.add_job(
+            func=refresh_trend_snapshot,
+            trigger='interval',
+            seconds=int(os.getenv('TREND_SNAPSHOT_MAX_AGE', 900)),
+            next_run_time=datetime.now(kst) + timedelta(seconds=60),
+            id='trend_snapshot_refresh',
+            name='Trend Snapshot Refresher',
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
+        
+        # 테스트용 즉시 실행 (첫 시작 시에만)
         add_system_log('INFO', '🔧 스케줄러 테스트를 위해 30초 후 테스트 실행 예약', 'SCHEDULER')
         scheduler.add_job(
             func=test_scheduler_health,
@@ -4638,6 +4427,7 @@ def init_scheduler():
         logger.error(f"❌ 스케줄러 초기화 실패: {e}")
         return False
 
+@releases_connection
 def check_and_retry_publish():
     """오전 9시 체크: 새벽 3시에 발행되지 않은 경우 재시도"""
     try:
@@ -4934,13 +4724,29 @@ def get_manual_publish_preview():
 
 @app.route('/api/trends/realtime')
 def get_realtime_trends():
-    """실시간 트렌드"""
+    """실시간 트렌드 - 최신 스냅샷을 즉시 반환하고 오래됐으면 백그라운드에서 갱신"""
     try:
+        from src.utils.trend_snapshot_store import get_trend_store
+        
+        store = get_trend_store()
+        snapshot = store.get(wait_if_empty=False)
+        limit = request.args.get('limit', 30, type=int)
+        velocity = snapshot.velocity if snapshot else {}
+        
         return jsonify({
             'success': True,
             'data': {
-                'trends': [],
-                'last_updated': '2025-09-08 11:19:49'
+                'trends': [{
+                    'title': trend.title,
+                    'source': trend.source,
+                    'category': trend.category,
+                    'score': trend.score,
+                    'url': trend.url,
+                    'velocity': velocity.get(trend.title.lower().strip(), 0.0)
+                } for trend in (snapshot.trends[:limit] if snapshot else [])],
+                'last_updated': (snapshot.collected_at.astimezone(KST).strftime('%Y-%m-%d %H:%M:%S')
+                                 if snapshot else None),
+                'refreshing': store.is_refreshing
             }
         })
     except Exception as e:
@@ -4963,6 +4769,9 @@ def generate_weekly_plan():
         )
         
         if result.returncode == 0:
+            # 다른 프로세스에서 저장했으므로 메모된 계획은 버리고 DB에서 다시 읽음
+            from auto_weekly_planner import invalidate_weekly_plan_memo
+            invalidate_weekly_plan_memo()
             return jsonify({
                 'success': True,
                 'message': '주간계획이 성공적으로 생성되었습니다.',
@@ -4979,8 +4788,49 @@ def generate_weekly_plan():
         logger.error(f"주간계획 생성 오류: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/jobs')
+def list_publish_jobs():
+    """발행 작업 목록 (?state=queued|running|succeeded|failed, ?limit=)"""
+    try:
+        limit = min(request.args.get('limit', 50, type=int), 200)
+        jobs = get_publish_job_queue().list_jobs(request.args.get('state'), limit)
+        workers = get_publish_workers()
+        return jsonify({
+            'jobs': [job.to_dict() for job in jobs],
+            'workers': workers.get_metrics() if workers else None
+        })
+    except Exception as e:
+        logger.error(f"발행 작업 목록 조회 오류: {e}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/jobs/<int:job_id>')
+def get_publish_job(job_id):
+    """발행 작업 1건 조회"""
+    try:
+        job = get_publish_job_queue().get(job_id)
+        if job is None:
+            return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
+        return jsonify(job.to_dict())
+    except Exception as e:
+        logger.error(f"발행 작업 조회 오류: {e}")
+        return jsonify({'error': str(e)}), 500
+
+def start_publish_workers() -> bool:
+    """발행 작업 워커 풀 시작 (앱 시작 시)"""
+    try:
+        workers = get_publish_workers()
+        if workers is None:
+            logger.info("PUBLISH_WORKERS=0 - 이 프로세스는 발행 작업을 실행하지 않음")
+            return False
+        workers.start()
+        return True
+    except Exception as e:
+        logger.error(f"발행 작업 워커 시작 실패: {e}")
+        return False
+
 # 스케줄러 초기화 (앱 시작 시)
 scheduler_initialized = init_scheduler()
+publish_workers_started = start_publish_workers()
 
 if __name__ == "__main__":
     # 시작 로그
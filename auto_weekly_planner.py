@@ -5,11 +5,12 @@
 import os
 import json
 import random
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Union
 from src.utils.trend_collector import TrendCollector
-from src.utils.postgresql_database import PostgreSQLDatabase
-from src.generators.content_generator import ContentGenerator
+from src.utils.postgresql_database import get_shared_database
+from src.generators.content_generator import get_shared_generator
 from src.utils.high_traffic_keyword_manager import HighTrafficKeywordManager
 from src.utils.profit_keyword_manager import ProfitKeywordManager
 import logging
@@ -17,13 +18,33 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 계획 데이터 구조가 바뀌면 올려서 저장된 이전 버전 계획을 다시 생성
+# (plan_version이 없는 저장본은 버전 도입 전 계획으로, 같은 구조이므로 현재 버전으로 취급)
+PLAN_VERSION = "2"
+
+# 주차별 계획 메모 (프로세스 전역): (week_start, PLAN_VERSION) -> {'plan': ..., 'by_date': {날짜: [주제]}}
+_plan_memo: Dict[tuple, Dict] = {}
+_plan_memo_lock = threading.Lock()
+# 같은 주 계획을 동시에 여러 번 생성하지 않도록 직렬화
+_plan_generate_lock = threading.Lock()
+
+
+def invalidate_weekly_plan_memo(week_start: str = None):
+    """메모된 주간계획 무효화 (별도 프로세스에서 계획을 다시 생성한 뒤 호출)"""
+    with _plan_memo_lock:
+        if week_start is None:
+            _plan_memo.clear()
+        else:
+            _plan_memo.pop((week_start, PLAN_VERSION), None)
+
+
 class ProfitWeeklyPlanner:
     """자동 주간계획 생성기"""
     
     def __init__(self):
-        self.trend_collector = TrendCollector()
-        self.db = PostgreSQLDatabase()
-        self.content_generator = ContentGenerator()
+        self._trend_collector = None
+        self.db = get_shared_database()
+        self.content_generator = get_shared_generator()
         self.high_traffic_manager = HighTrafficKeywordManager()
         self.profit_manager = ProfitKeywordManager()
         
@@ -34,6 +55,13 @@ class ProfitWeeklyPlanner:
             'skewese': ['비즈니스', '마케팅', '자기계발', '경제', '트렌드'],
             'tistory': ['일반', '후기', '정보', '팁', '가이드']
         }
+    
+    @property
+    def trend_collector(self) -> TrendCollector:
+        """트렌드 수집기 (생성 시 외부 요청이 있어 실제로 계획을 만들 때만 초기화)"""
+        if self._trend_collector is None:
+            self._trend_collector = TrendCollector()
+        return self._trend_collector
         
     def get_trending_topics(self) -> List[Dict]:
         """🔥 2025년 실시간 검색 트렌드 + SEO 최적화 키워드 수집"""
@@ -222,6 +250,7 @@ class ProfitWeeklyPlanner:
             'week_start': start_date.strftime('%Y-%m-%d'),
             'week_end': (start_date + timedelta(days=6)).strftime('%Y-%m-%d'),
             'generated_at': datetime.now().isoformat(),
+            'plan_version': PLAN_VERSION,
             'plans': []
         }
         
@@ -398,32 +427,97 @@ class ProfitWeeklyPlanner:
             
         return korean_title.strip()
 
+    def get_weekly_plan(self, week_start: Union[date, datetime, str] = None,
+                        regenerate: bool = False) -> Dict:
+        """주간계획 조회 - 메모 → DB 저장본 → 생성 순으로 찾고, regenerate=True면 강제로 다시 생성"""
+        return self._get_plan_entry(week_start, regenerate)['plan']
+    
     def get_today_profit_topics(self):
-        """오늘의 수익 최우선 주제 반환"""
+        """오늘의 수익 최우선 주제 반환 (이번 주 계획의 날짜 인덱스 조회)"""
         today = datetime.now().date()
         
         # 이번 주 계획 가져오기
         weekday = today.weekday()  
         week_start = today - timedelta(days=weekday)
         
-        # 이번 주 계획 찾기 또는 생성
-        weekly_plan = self.generate_weekly_plan(week_start)
+        entry = self._get_plan_entry(week_start)
+        return [dict(topic) for topic in entry['by_date'].get(today.strftime('%Y-%m-%d'), [])]
+    
+    def _get_plan_entry(self, week_start: Union[date, datetime, str] = None,
+                        regenerate: bool = False) -> Dict:
+        if week_start is None:
+            week_start = datetime.now().date()
+        elif isinstance(week_start, str):
+            week_start = datetime.strptime(week_start, '%Y-%m-%d').date()
+        elif isinstance(week_start, datetime):
+            week_start = week_start.date()
+        # 어떤 날짜가 와도 해당 주 월요일 기준으로 메모
+        week_start = week_start - timedelta(days=week_start.weekday())
+        week_start_str = week_start.strftime('%Y-%m-%d')
+        key = (week_start_str, PLAN_VERSION)
+        
+        if not regenerate:
+            with _plan_memo_lock:
+                entry = _plan_memo.get(key)
+            if entry:
+                return entry
         
-        # 오늘 날짜에 해당하는 계획들 필터링
-        today_str = today.strftime('%Y-%m-%d')
-        today_topics = []
+        with _plan_generate_lock:
+            if not regenerate:
+                # 대기하는 동안 다른 스레드가 만들었을 수 있음
+                with _plan_memo_lock:
+                    entry = _plan_memo.get(key)
+                if entry:
+                    return entry
+                
+                weekly_plan = self._load_weekly_plan(week_start_str)
+                if weekly_plan:
+                    logger.info(f"저장된 주간계획 사용: {week_start_str}")
+                    return self._memoize_plan(weekly_plan)
+            
+            logger.info(f"주간계획 {'재생성' if regenerate else '생성'}: {week_start_str}")
+            weekly_plan = self.generate_weekly_plan(datetime.combine(week_start, datetime.min.time()))
+            # 저장에 실패해도 이 프로세스에서는 재사용
+            self.save_weekly_plan(weekly_plan)
+            return self._memoize_plan(weekly_plan)
+    
+    def _load_weekly_plan(self, week_start_str: str) -> Optional[Dict]:
+        """DB에 저장된 현재 버전 계획 조회 (week_start 유니크 인덱스)"""
+        try:
+            with self.db.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                SELECT plan_data FROM blog_automation.weekly_plans 
+                WHERE week_start = %s
+                ''', (week_start_str,))
+                row = cursor.fetchone()
+        except Exception as e:
+            logger.warning(f"저장된 주간계획 조회 실패: {e}")
+            return None
         
+        if not row:
+            return None
+        plan_data = json.loads(row[0]) if isinstance(row[0], str) else row[0]
+        if plan_data.get('plan_version', PLAN_VERSION) != PLAN_VERSION or not plan_data.get('plans'):
+            logger.info(f"저장된 주간계획 버전 불일치, 다시 생성: {week_start_str}")
+            return None
+        return plan_data
+    
+    def _memoize_plan(self, weekly_plan: Dict) -> Dict:
+        """계획을 메모하고 날짜별 오늘 주제 인덱스를 만든다"""
+        by_date: Dict[str, List[Dict]] = {}
         for plan in weekly_plan.get('plans', []):
-            if plan.get('date') == today_str:
-                today_topics.append({
-                    'site': plan.get('site'),
-                    'title': plan.get('title'),
-                    'category': plan.get('category', 'profit_optimized'),
-                    'keywords': plan.get('keywords', []),
-                    'trend_score': plan.get('profit_score', 0)
-                })
+            by_date.setdefault(plan.get('date'), []).append({
+                'site': plan.get('site'),
+                'title': plan.get('title'),
+                'category': plan.get('category', 'profit_optimized'),
+                'keywords': plan.get('keywords', []),
+                'trend_score': plan.get('profit_score', 0)
+            })
         
-        return today_topics
+        entry = {'plan': weekly_plan, 'by_date': by_date}
+        with _plan_memo_lock:
+            _plan_memo[(weekly_plan['week_start'], weekly_plan.get('plan_version', PLAN_VERSION))] = entry
+        return entry
     
     def _adjust_title_for_site(self, original_title: str, site: str) -> str:
         """사이트별 제목 조정"""
@@ -566,6 +660,7 @@ class ProfitWeeklyPlanner:
                                 'week_start': weekly_plan['week_start'],
                                 'week_end': weekly_plan['week_end'],
                                 'generated_at': weekly_plan['generated_at'],
+                                'plan_version': weekly_plan.get('plan_version', PLAN_VERSION),
                                 'plans': weekly_plan['plans'][:28]  # 최대 28개 계획만
                             }
                             plan_json = json.dumps(compressed_plan, ensure_ascii=False)
@@ -589,6 +684,7 @@ class ProfitWeeklyPlanner:
                         ''', (weekly_plan['week_start'], weekly_plan['week_end'], plan_json))
                     
                     conn.commit()
+                    self._memoize_plan(weekly_plan)
                     logger.info(f"✅ 주간계획 데이터베이스 저장 완료 ({len(weekly_plan['plans'])}개 항목)")
                     return True
                     
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+일별 지표 롤업(daily_metrics) 백필 스크립트
+- content_files / api_usage 원본으로 (날짜, 사이트, 종류)별 집계를 다시 계산 (테이블이 없으면 생성)
+- 사용법: python backfill_daily_metrics.py [--since YYYY-MM-DD]
+"""
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 경로 추가
+sys.path.append(str(Path(__file__).parent))
+
+from dotenv import load_dotenv
+
+# 환경변수 로드
+load_dotenv()
+
+from src.utils.postgresql_database import get_shared_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description='daily_metrics 롤업 재계산')
+    parser.add_argument('--since', help='이 날짜(YYYY-MM-DD) 이후만 재계산 (기본: 전체)')
+    args = parser.parse_args()
+
+    since = datetime.strptime(args.since, '%Y-%m-%d').date() if args.since else None
+
+    db = get_shared_database()
+    if not db.is_connected:
+        print("❌ 데이터베이스 연결 실패")
+        return False
+
+    count = db.backfill_daily_metrics(since=since)
+    print(f"✅ daily_metrics 재계산 완료: {count}개 행 ({args.since or '전체 기간'})")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
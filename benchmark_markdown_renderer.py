@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Markdown 렌더러 벤치마크
+- 생성된 글(JSON, sections[].content) 코퍼스를 테마별로 렌더링해 글당 시간 측정
+- 같은 글을 1/4/16배로 늘려 렌더링 시간이 길이에 선형인지 확인
+- 사용법: python benchmark_markdown_renderer.py [코퍼스 디렉토리 ...] [--repeat N]
+  (기본 코퍼스: data/generation_cache, 없으면 내장 예시 글)
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 경로 추가
+sys.path.append(str(Path(__file__).parent))
+
+from src.utils.markdown_renderer import (render_markdown, DASHBOARD_THEME, PREVIEW_THEME,
+                                         TISTORY_THEME, WORDPRESS_THEME)
+
+THEMES = [DASHBOARD_THEME, WORDPRESS_THEME, PREVIEW_THEME, TISTORY_THEME]
+
+SAMPLE_SECTION = """Python은 **가독성**이 뛰어난 언어로 *초보자*에게 적합합니다.
+`pip install requests`로 패키지를 설치합니다.
+
+| 구분 | 설명 | 난이도 |
+|------|------|--------|
+| 기초 | 변수와 자료형 | 쉬움 |
+| 중급 | 클래스와 모듈 | 보통 |
+
+- 공식 문서 읽기
+- **매일** 30분 코딩
+1. 환경 설정
+2. 예제 실행
+
+```python
+def hello(name):
+    return f"Hello, {name}"
+```
+
+> 꾸준함이 실력을 만든다.
+💡 처음에는 작은 프로젝트부터 시작하세요.
+---"""
+
+
+def load_corpus(directories):
+    """디렉토리 아래 JSON 중 sections가 있는 글의 섹션 본문 목록"""
+    posts = []
+    for directory in directories:
+        for path in Path(directory).rglob('*.json'):
+            try:
+                data = json.loads(path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                continue
+            if isinstance(data, dict) and isinstance(data.get('value'), dict):
+                data = data['value']  # 생성 캐시 항목
+            if isinstance(data, dict) and data.get('sections'):
+                posts.append([s.get('content', '') for s in data['sections'] if isinstance(s, dict)])
+    return posts
+
+
+def time_render(sections, theme, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for content in sections:
+            render_markdown(content, theme, highlight=['Python', '코딩'])
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Markdown 렌더러 벤치마크')
+    parser.add_argument('dirs', nargs='*', default=['data/generation_cache'])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    posts = load_corpus(args.dirs)
+    source = f"{len(posts)}개 글 ({', '.join(args.dirs)})"
+    if not posts:
+        posts = [[SAMPLE_SECTION] * 5]
+        source = '내장 예시 글 1개 (코퍼스 없음)'
+    chars = sum(len(c) for post in posts for c in post)
+    print(f"코퍼스: {source}, 총 {chars:,}자")
+
+    for theme in THEMES:
+        elapsed = sum(time_render(post, theme, args.repeat) for post in posts)
+        print(f"  {theme.name:<10} 글당 {elapsed / len(posts) * 1000:8.3f}ms  "
+              f"({chars / elapsed / 1e6:6.2f}M자/초)")
+
+    print("길이 배율별 (선형이면 1배 대비 시간 비율 ≈ 배율)")
+    longest = max(posts, key=lambda post: sum(len(c) for c in post))
+    base_text = '\n\n'.join(longest)
+    base = None
+    for factor in (1, 4, 16):
+        elapsed = time_render(['\n\n'.join([base_text] * factor)], WORDPRESS_THEME, args.repeat)
+        base = base or elapsed
+        print(f"  x{factor:<3} {elapsed * 1000:8.3f}ms  (x{elapsed / base:.1f})")
+
+
+if __name__ == '__main__':
+    main()
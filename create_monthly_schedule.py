@@ -12,6 +12,8 @@ import os
 from dotenv import load_dotenv
 import json
 
+from src.utils.bulk_write import bulk_upsert
+
 # 환경변수 로드
 load_dotenv('.env.example')
 
@@ -424,20 +426,12 @@ def save_to_database(schedule_data):
             )
         """)
         
-        # 데이터 삽입
-        for item in schedule_data:
-            cursor.execute("""
-                INSERT INTO unble.publishing_schedule 
-                (week_start_date, day_of_week, site, topic_category, specific_topic, 
-                 keywords, target_length, status, scheduled_date)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (week_start_date, day_of_week, site, topic_category) 
-                DO UPDATE SET 
-                    specific_topic = EXCLUDED.specific_topic,
-                    keywords = EXCLUDED.keywords,
-                    scheduled_date = EXCLUDED.scheduled_date,
-                    updated_at = CURRENT_TIMESTAMP
-            """, (
+        # 데이터 삽입 (한 문장으로 일괄 UPSERT)
+        bulk_upsert(
+            cursor, 'unble.publishing_schedule',
+            ('week_start_date', 'day_of_week', 'site', 'topic_category', 'specific_topic',
+             'keywords', 'target_length', 'status', 'scheduled_date'),
+            [(
                 item["week_start_date"],
                 item["day_of_week"],
                 item["site"],
@@ -447,7 +441,10 @@ def save_to_database(schedule_data):
                 item["target_length"],
                 item["status"],
                 item["scheduled_date"]
-            ))
+            ) for item in schedule_data],
+            conflict=('week_start_date', 'day_of_week', 'site', 'topic_category'),
+            update=('specific_topic', 'keywords', 'scheduled_date')
+        )
         
         conn.commit()
         print(f"성공: {len(schedule_data)}개 계획이 데이터베이스에 저장되었습니다.")
@@ -18,7 +18,7 @@ from dotenv import load_dotenv
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from src.utils.postgresql_database import PostgreSQLDatabase
+from src.utils.postgresql_database import PostgreSQLDatabase, releases_connection
 from src.generators.content_generator import ContentGenerator
 # from src.generators.image_generator import ImageGenerator
 from src.publishers.wordpress_publisher import WordPressPublisher
@@ -109,6 +109,7 @@ class DailyAutoPublisher:
         except Exception as e:
             logger.error(f"시스템 로그 기록 실패: {e}")
     
+    @releases_connection
     def auto_publish_all_sites(self):
         """모든 사이트 순차 자동발행"""
         logger.info("[AUTO_PUBLISH] 새벽 3시 전체 사이트 자동발행 시작")
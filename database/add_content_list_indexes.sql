@@ -0,0 +1,11 @@
+-- 콘텐츠 목록 키셋 페이지 정렬용 인덱스 (기존 운영 DB용 마이그레이션)
+-- 새로 만드는 DB는 스키마 파일(create_blog_automation_schema_fixed.sql 등)에 이미 포함되어 있음
+-- CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 psql로 직접 실행:
+--   psql -h "$PG_HOST" -p "$PG_PORT" -U "$PG_USER" -d "$PG_DATABASE" -f database/add_content_list_indexes.sql
+-- 쓰기를 막지 않고 만들며, 이미 있으면 건너뜀
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_content_files_created_id
+    ON blog_automation.content_files (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_content_files_site_created_id
+    ON blog_automation.content_files (site, created_at DESC, id DESC);
@@ -169,6 +169,8 @@ CREATE INDEX IF NOT EXISTS idx_schedule_status ON blog_automation.monthly_publis
 CREATE INDEX IF NOT EXISTS idx_content_site_status ON blog_automation.content_files (site, status);
 CREATE INDEX IF NOT EXISTS idx_content_created ON blog_automation.content_files (created_at);
 CREATE INDEX IF NOT EXISTS idx_content_published ON blog_automation.content_files (published_at);
+CREATE INDEX IF NOT EXISTS idx_content_files_created_id ON blog_automation.content_files (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_content_files_site_created_id ON blog_automation.content_files (site, created_at DESC, id DESC);
 
 CREATE INDEX IF NOT EXISTS idx_trending_week_site ON blog_automation.trending_topics (week_start_date, site);
 CREATE INDEX IF NOT EXISTS idx_trending_category ON blog_automation.trending_topics (category);
@@ -153,6 +153,9 @@ CREATE TABLE IF NOT EXISTS unble.content_files (
 
 CREATE INDEX IF NOT EXISTS idx_content_files_site_type ON unble.content_files(site, file_type);
 CREATE INDEX IF NOT EXISTS idx_content_files_created_at ON unble.content_files(created_at);
+-- 콘텐츠 목록 키셋 페이지 정렬 (created_at DESC, id DESC)
+CREATE INDEX IF NOT EXISTS idx_content_files_created_id ON unble.content_files(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_content_files_site_created_id ON unble.content_files(site, created_at DESC, id DESC);
 
 -- ============================================================================
 -- 6. 시스템 로그 테이블 - 시스템 활동 추적
@@ -6,6 +6,7 @@
 """
 
 from src.utils.postgresql_database import PostgreSQLDatabase
+from src.utils.bulk_write import bulk_upsert
 from datetime import date, timedelta
 import calendar
 
@@ -678,14 +679,14 @@ def main():
         
         # 데이터베이스에 삽입
         print("데이터베이스 삽입 중...")
-        inserted = 0
-        for item in schedule:
-            cursor.execute(f'''
-                INSERT INTO {db.schema}.monthly_publishing_schedule 
-                (year, month, day, site, topic_category, specific_topic, keywords, status, created_at, updated_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-            ''', (item['year'], item['month'], item['day'], item['site'], item['category'], item['topic'], [], 'pending'))
-            inserted += 1
+        inserted = bulk_upsert(
+            cursor, f'{db.schema}.monthly_publishing_schedule',
+            ('year', 'month', 'day', 'site', 'topic_category', 'specific_topic', 'keywords', 'status'),
+            [(item['year'], item['month'], item['day'], item['site'], item['category'], item['topic'], [], 'pending')
+             for item in schedule],
+            conflict=('year', 'month', 'day', 'site', 'topic_category'),
+            update=('specific_topic', 'keywords', 'status')
+        )
         
         conn.commit()
         print(f'[완료] 8-9월 고유 주제 스케줄 생성 완료: {inserted}개 항목')
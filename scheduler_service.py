@@ -21,7 +21,7 @@ from dotenv import load_dotenv
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from src.utils.postgresql_database import PostgreSQLDatabase
+from src.utils.postgresql_database import PostgreSQLDatabase, releases_connection
 from src.utils.monthly_schedule_manager import MonthlyScheduleManager
 from src.generators.content_generator import ContentGenerator
 from src.publishers.wordpress_publisher import WordPressPublisher
@@ -65,6 +65,7 @@ class BlogAutoPublisher:
         
         self.sites = ['unpre', 'untab', 'skewese', 'tistory']
         
+    @releases_connection
     def auto_publish_all_sites(self):
         """모든 사이트 자동발행 실행"""
         logger.info("🚀 전체 사이트 자동발행 시작")
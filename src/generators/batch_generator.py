@@ -0,0 +1,398 @@
+"""
+배치 사전 생성 파이프라인
+- 다음 주 월간 계획표 주제를 Message Batches 요청 하나로 제출
+- 주기적으로 배치 상태를 확인하고, 완료된 결과를 파싱해 초안(draft)으로 저장
+  (결과 1건을 저장할 때마다 상태 파일에서 빼므로 중간에 실패해도 다시 저장·과금 집계하지 않음)
+- 발행 작업은 준비된 초안이 있으면 생성 없이 바로 발행
+- 날짜가 지나도록 쓰이지 않은 초안은 cleanup_stale_drafts()로 파일과 DB 행을 함께 정리
+"""
+
+import json
+import os
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import logging
+
+from src.utils.api_tracker import api_tracker
+from src.generators.content_generator import CLAUDE_MODEL, get_shared_generator
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent.parent / 'data'
+
+# 배치 결과 보관 기간 - 상태 조회가 계속 실패해도 이 기간 안에는 목록에 남겨 다시 시도
+BATCH_RESULT_RETENTION = timedelta(days=29)
+
+
+@dataclass
+class BatchResult:
+    """배치 요청 1건의 결과 (백엔드 공통 형태)"""
+    custom_id: str
+    succeeded: bool
+    text: Optional[str] = None
+    usage: Any = None
+    error: Optional[str] = None
+
+
+class AnthropicBatchBackend:
+    """Anthropic Message Batches API 백엔드"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def submit(self, requests: List[Dict]) -> str:
+        batch = self.client.messages.batches.create(requests=requests)
+        return batch.id
+
+    def status(self, batch_id: str) -> str:
+        """'in_progress' | 'canceling' | 'ended'"""
+        return self.client.messages.batches.retrieve(batch_id).processing_status
+
+    def results(self, batch_id: str) -> Iterator[BatchResult]:
+        for entry in self.client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == 'succeeded':
+                yield BatchResult(entry.custom_id, True, result.message.content[0].text, result.message.usage)
+            else:
+                error = getattr(result, 'error', None)
+                yield BatchResult(entry.custom_id, False, error=str(error) if error else result.type)
+
+
+class LocalBatchBackend:
+    """Message Batches와 같은 인터페이스의 로컬 구현 (개발/테스트용)
+
+    제출 시 messages.create로 요청을 하나씩 실행하고 결과를 메모리에 보관한다.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._results: Dict[str, List[BatchResult]] = {}
+
+    def submit(self, requests: List[Dict]) -> str:
+        batch_id = f"local_{uuid.uuid4().hex[:12]}"
+        results = []
+        for request in requests:
+            try:
+                response = self.client.messages.create(**request['params'])
+                results.append(BatchResult(request['custom_id'], True, response.content[0].text, response.usage))
+            except Exception as e:
+                results.append(BatchResult(request['custom_id'], False, error=str(e)))
+        self._results[batch_id] = results
+        return batch_id
+
+    def status(self, batch_id: str) -> str:
+        if batch_id not in self._results:
+            raise KeyError(f"알 수 없는 로컬 배치: {batch_id}")
+        return 'ended'
+
+    def results(self, batch_id: str) -> Iterator[BatchResult]:
+        return iter(self._results.pop(batch_id, []))
+
+
+class BatchPreGenerator:
+    """주간 주제 배치 생성 + 초안 저장/조회"""
+
+    def __init__(self, site_config_factory: Callable[[str, Dict, str], Dict],
+                 db=None, generator=None, backend=None,
+                 drafts_dir: str = None, state_path: str = None):
+        """
+        Args:
+            site_config_factory: (site, topic_info, category_type) -> site_config
+                                 발행 시 생성과 같은 설정을 쓰도록 발행기에서 전달
+            db: content_files 기록용 PostgreSQLDatabase (None이면 파일만 저장)
+            generator: ContentGenerator (기본: 공용 생성기)
+            backend: 배치 백엔드 (기본: CLAUDE_BATCH_BACKEND 환경변수 - anthropic/local)
+            drafts_dir: 초안 JSON 저장 디렉터리
+            state_path: 제출한 배치 목록을 보관하는 파일 (재시작 후 이어서 수집)
+        """
+        self.site_config_factory = site_config_factory
+        self.db = db
+        self.generator = generator or get_shared_generator()
+        if backend is None:
+            if os.getenv('CLAUDE_BATCH_BACKEND', 'anthropic').lower() == 'local':
+                backend = LocalBatchBackend(self.generator.anthropic_client)
+            else:
+                backend = AnthropicBatchBackend(self.generator.anthropic_client)
+        self.backend = backend
+        self.drafts_dir = Path(drafts_dir or os.getenv('DRAFTS_DIR', str(DATA_DIR / 'drafts')))
+        self.state_path = Path(state_path or os.getenv('BATCH_STATE_PATH', str(DATA_DIR / 'batch_jobs.json')))
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 제출
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _custom_id(site: str, target_date: date, category_type: str) -> str:
+        return f"{site}_{target_date.strftime('%Y%m%d')}_{category_type}"
+
+    def draft_path(self, site: str, target_date: date, category_type: str) -> Path:
+        return self.drafts_dir / site / f"{target_date.isoformat()}_{category_type}.json"
+
+    def collect_week_topics(self, start_date: date, days: int = 7) -> List[Dict]:
+        """월간 계획표에서 기간 내 (사이트, 날짜, primary/secondary) 주제 목록 생성"""
+        from src.utils.monthly_schedule_manager import monthly_schedule_manager
+
+        topics = []
+        for offset in range(days):
+            target_date = start_date + timedelta(days=offset)
+            by_site: Dict[str, List[Dict]] = {}
+            # get_today_dual_topics와 같은 순서(topic_category 정렬)로 primary/secondary 결정
+            for topic in monthly_schedule_manager.get_topics_by_date(target_date):
+                by_site.setdefault(topic['site'], []).append(topic)
+            for site, site_topics in by_site.items():
+                for category_type, topic in zip(('primary', 'secondary'), site_topics):
+                    topics.append({**topic, 'date': target_date, 'category_type': category_type})
+        return topics
+
+    def submit(self, topics: List[Dict]) -> Optional[str]:
+        """초안이 없는 주제만 배치로 제출 - 제출한 batch_id 반환 (제출할 것이 없으면 None)"""
+        requests, jobs = [], {}
+        for topic_info in topics:
+            site, target_date, category_type = topic_info['site'], topic_info['date'], topic_info['category_type']
+            if self.draft_path(site, target_date, category_type).exists():
+                continue
+            site_config = self.site_config_factory(site, topic_info, category_type)
+            custom_id = self._custom_id(site, target_date, category_type)
+            requests.append({
+                'custom_id': custom_id,
+                'params': self.generator.build_message_request(
+                    site_config, topic_info['topic'], topic_info.get('category', 'general'),
+                    content_length=topic_info.get('length', 'medium')
+                )
+            })
+            jobs[custom_id] = {
+                'site': site,
+                'date': target_date.isoformat(),
+                'category_type': category_type,
+                'topic': topic_info['topic'],
+                'category': topic_info.get('category', 'general'),
+                'keywords': topic_info.get('keywords', []),
+                'site_config': site_config,
+            }
+
+        if not requests:
+            logger.info("[BATCH] 제출할 주제 없음 (모두 초안 준비됨)")
+            return None
+
+        batch_id = self.backend.submit(requests)
+        with self._lock:
+            state = self._load_state()
+            state[batch_id] = {'submitted_at': datetime.now().isoformat(), 'requests': jobs}
+            self._save_state(state)
+        logger.info(f"[BATCH] 배치 제출 완료: {batch_id} ({len(requests)}건)")
+        return batch_id
+
+    def submit_next_week(self, today: date = None) -> Optional[str]:
+        """다음 주(월~일) 주제를 한 번에 제출"""
+        today = today or date.today()
+        next_monday = today + timedelta(days=7 - today.weekday())
+        return self.submit(self.collect_week_topics(next_monday))
+
+    # ------------------------------------------------------------------
+    # 수집
+    # ------------------------------------------------------------------
+
+    def collect_ready_batches(self) -> Dict[str, int]:
+        """완료된 배치 결과를 초안으로 저장 - {'saved': n, 'failed': n, 'pending_batches': n}"""
+        summary = {'saved': 0, 'failed': 0, 'pending_batches': 0}
+        with self._lock:
+            state = self._load_state()
+            for batch_id in list(state):
+                entry = state[batch_id]
+                try:
+                    status = self.backend.status(batch_id)
+                except Exception as e:
+                    # 일시적인 오류일 수 있으므로 결과 보관 기간 동안은 다음 수집에서 다시 확인
+                    entry['status_errors'] = entry.get('status_errors', 0) + 1
+                    submitted_at = datetime.fromisoformat(entry['submitted_at'])
+                    if datetime.now() - submitted_at > BATCH_RESULT_RETENTION:
+                        logger.error(f"[BATCH] 보관 기간이 지난 배치 상태 조회 실패 - 목록에서 제거: {batch_id}: {e}")
+                        del state[batch_id]
+                    else:
+                        logger.warning(f"[BATCH] 배치 상태 조회 실패 ({entry['status_errors']}회) - 다음 수집에서 재시도: "
+                                       f"{batch_id}: {e}")
+                        summary['pending_batches'] += 1
+                    self._save_state(state)
+                    continue
+                if status != 'ended':
+                    summary['pending_batches'] += 1
+                    continue
+
+                jobs = entry['requests']
+                try:
+                    for result in self.backend.results(batch_id):
+                        job = jobs.get(result.custom_id)
+                        if job is None:
+                            continue
+                        # 초안 파일이 있으면 이전 수집에서 이미 저장됨 (상태 저장 직전에 중단된 경우)
+                        path = self.draft_path(job['site'], date.fromisoformat(job['date']), job['category_type'])
+                        if not path.exists():
+                            if result.succeeded and self._save_draft(batch_id, job, result):
+                                summary['saved'] += 1
+                            else:
+                                summary['failed'] += 1
+                                logger.warning(f"[BATCH] {result.custom_id} 생성 실패: {result.error}")
+                        # 처리한 결과는 바로 목록에서 빼서 저장 (중간에 실패해도 다시 저장·집계하지 않음)
+                        del jobs[result.custom_id]
+                        self._save_state(state)
+                except Exception as e:
+                    logger.error(f"[BATCH] 배치 결과 수집 중단 - 남은 {len(jobs)}건은 다음 수집에서 재시도: "
+                                 f"{batch_id}: {e}")
+                    summary['pending_batches'] += 1
+                    continue
+                del state[batch_id]
+                self._save_state(state)
+
+        if summary['saved'] or summary['failed']:
+            logger.info(f"[BATCH] 초안 수집: 저장 {summary['saved']}건, 실패 {summary['failed']}건")
+        return summary
+
+    def _save_draft(self, batch_id: str, job: Dict, result: BatchResult) -> bool:
+        try:
+            content = self.generator.parse_generated_content(result.text, job['site_config'])
+        except Exception as e:
+            result.error = f"파싱 실패: {e}"
+            return False
+
+        usage = result.usage
+        api_tracker.track_usage(
+            service="claude",
+            model=CLAUDE_MODEL,
+            input_tokens=getattr(usage, 'input_tokens', 0) or 0,
+            output_tokens=getattr(usage, 'output_tokens', 0) or 0,
+            site=job['site'],
+            purpose="batch_generation",
+            success=True,
+            endpoint="messages/batches",
+            metadata={'batch_id': batch_id, 'custom_id': result.custom_id},
+            cache_creation_input_tokens=getattr(usage, 'cache_creation_input_tokens', 0) or 0,
+            cache_read_input_tokens=getattr(usage, 'cache_read_input_tokens', 0) or 0,
+            batch=True
+        )
+
+        target_date = date.fromisoformat(job['date'])
+        path = self.draft_path(job['site'], target_date, job['category_type'])
+        draft = {
+            'topic': job['topic'],
+            'category': job['category'],
+            'keywords': job['keywords'],
+            'batch_id': batch_id,
+            'generated_at': datetime.now().isoformat(),
+            'content': content,
+            'file_id': None,
+        }
+
+        if self.db:
+            try:
+                draft['file_id'] = self.db.add_content_file(
+                    site=job['site'],
+                    title=content.get('title', job['topic']),
+                    file_path=str(path),
+                    file_type='json',
+                    metadata={
+                        'tags': content.get('tags', []),
+                        'categories': [job['category']],
+                        'status': 'draft',
+                    }
+                )
+            except Exception as e:
+                logger.warning(f"[BATCH] 초안 DB 기록 실패 (파일은 저장): {e}")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(draft, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+        return True
+
+    # ------------------------------------------------------------------
+    # 발행 시 초안 사용
+    # ------------------------------------------------------------------
+
+    def get_ready_draft(self, site: str, target_date: date, category_type: str,
+                        topic: str = None) -> Optional[Dict]:
+        """준비된 초안 반환 - 계획표 주제가 바뀌었으면 None"""
+        path = self.draft_path(site, target_date, category_type)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                draft = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"[BATCH] 초안 읽기 실패: {path}: {e}")
+            return None
+        if topic and draft.get('topic') != topic:
+            return None
+        draft['path'] = str(path)
+        return draft
+
+    def mark_draft_published(self, draft: Dict):
+        """발행에 사용한 초안 정리 (초안 DB 행 + 파일 삭제)
+
+        발행 경로가 같은 글을 별도 행으로 기록·발행하므로, 초안 행을 발행 처리하면
+        대시보드 통계와 일별 롤업에 두 번 집계된다. 삭제 시 롤업의 생성 건수도 함께 차감된다.
+        """
+        if self.db and draft.get('file_id'):
+            try:
+                self.db.delete_content_file(draft['file_id'])
+            except Exception as e:
+                logger.warning(f"[BATCH] 초안 DB 행 삭제 실패: {e}")
+        Path(draft['path']).unlink(missing_ok=True)
+
+    def cleanup_stale_drafts(self, today: date = None) -> int:
+        """발행 날짜가 지나도록 쓰이지 않은 초안 정리 (파일 + status='draft' DB 행) - 정리한 수 반환
+
+        초안 행은 발행에 쓰일 때만 삭제되므로, 주제가 바뀌었거나 발행이 건너뛰어진 초안은
+        정리하지 않으면 콘텐츠 통계에 계속 남는다.
+        """
+        today = today or date.today()
+        removed = 0
+        for path in self.drafts_dir.glob('*/*.json'):
+            try:
+                draft_date = date.fromisoformat(path.stem.split('_', 1)[0])
+            except ValueError:
+                continue
+            if draft_date >= today:
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    file_id = json.load(f).get('file_id')
+            except (OSError, json.JSONDecodeError):
+                file_id = None
+            if self.db and file_id:
+                try:
+                    self.db.delete_content_file(file_id)
+                except Exception as e:
+                    logger.warning(f"[BATCH] 지난 초안 DB 행 삭제 실패 (다음 정리에서 재시도): {e}")
+                    continue
+            path.unlink(missing_ok=True)
+            removed += 1
+        if removed:
+            logger.info(f"[BATCH] 쓰이지 않은 지난 초안 {removed}건 정리")
+        return removed
+
+    # ------------------------------------------------------------------
+    # 상태 파일
+    # ------------------------------------------------------------------
+
+    def _load_state(self) -> Dict[str, Dict]:
+        if not self.state_path.exists():
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"[BATCH] 배치 상태 파일 읽기 실패: {e}")
+            return {}
+
+    def _save_state(self, state: Dict[str, Dict]):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp_path, self.state_path)
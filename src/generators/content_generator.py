@@ -5,16 +5,164 @@ AI 기반 콘텐츠 생성 모듈
 import os
 import json
 import re
-from typing import Dict, List, Optional
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 import anthropic
 from dotenv import load_dotenv
 from src.utils.api_tracker import api_tracker
+from src.utils.generation_cache import GenerationCache
+from src.generators.incremental_json_parser import IncrementalJSONParser, NonJSONOutputError
 
 load_dotenv()
 
+CLAUDE_MODEL = "claude-3-5-sonnet-20241022"
+
+# 프롬프트/파싱 규칙이 바뀌면 올려서 이전 생성 캐시를 무효화
+PROMPT_VERSION = "3"
+
+# JSON 파싱 실패 시 대체 결과 표시용 (생성 캐시에 저장하지 않음)
+FALLBACK_META_DESCRIPTION = "실용적인 개발 기술과 베스트 프랙티스를 다루는 가이드입니다."
+
+# 시스템 메시지 - 고품질 콘텐츠 생성을 위한 상세 가이드 (모든 요청 공통, 프롬프트 캐시 대상)
+SYSTEM_MESSAGE = """당신은 전문 블로그 콘텐츠 크리에이터입니다.
+
+**핵심 미션**: 독자가 실제로 도움받을 수 있는 고품질, 실용적인 한국어 블로그 콘텐츠 생성
+
+**콘텐츠 품질 기준 (매우 중요!):**
+
+**전문성**: 
+- 해당 분야의 전문가 수준의 깊이 있는 내용
+- 최신 트렌드와 실무 경험이 반영된 인사이트
+- 단순한 정보 나열이 아닌 실용적 가이드
+
+[중요] **실용성**:
+- 독자가 바로 적용할 수 있는 구체적인 방법론
+- 단계별 실행 가이드 제공
+- 실제 사례와 예시를 풍부하게 포함
+
+[핵심] **가독성**:
+- 명확한 구조와 논리적 흐름
+- 적절한 소제목과 문단 구분
+- 핵심 포인트는 굵게 강조
+
+**절대적 요구사항:**
+[필수] 오직 유효한 JSON 형식으로만 응답
+[필수] 모든 내용은 한국어로 작성
+[필수] 각 섹션당 최소 300-500자의 상세한 내용
+[필수] 실제 도움이 되는 구체적 정보 포함
+[필수] 전문적이면서도 이해하기 쉬운 설명
+[필수] 목록 작성 시 각 항목은 반드시 새 줄에 작성 (- 항목은 각각 \\n으로 구분)
+[필수] 절대 "- 항목1 - 항목2" 형태로 한 줄에 이어쓰지 않기
+[필수] 절대 이모지나 유니코드 특수문자 사용하지 말 것
+
+[금지] 절대 하지 말 것:
+[금지] JSON 외의 다른 텍스트 출력 금지
+[금지] 피상적이거나 일반적인 내용 금지
+[금지] 단순 번역체나 어색한 문장 금지
+[금지] 빈약한 내용이나 짧은 설명 금지
+[금지] 목록을 한 줄에 나열하는 것 절대 금지 (- 항목1 - 항목2 형태 금지)
+[금지] 이모지, 특수문자, 유니코드 기호 사용 절대 금지"""
+
+# 주제/사이트와 무관한 작성 규칙 - 시스템 메시지 뒤에 붙여 함께 캐시
+CONTENT_GUIDELINES = """🔥 **품질 요구사항 (매우 중요!)** 🔥
+
+**0. 사실성과 정확성 (절대 준수)**:
+- 실제로 존재하는 정보만 사용 (가상의 기관, 은행, 서비스 절대 금지)
+- 검증 가능한 사실과 데이터만 포함
+- 예시를 들 때는 실제 존재하는 기관/서비스만 언급
+- 불확실한 정보는 언급하지 말고, 일반론으로 설명
+
+**1. 전문성과 깊이**:
+- 해당 분야 전문가 수준의 인사이트 제공
+- 최신 트렌드와 실제 경험이 반영된 내용
+- 표면적 설명이 아닌 심층적 분석과 가이드
+
+**2. 실용성과 가치**:
+- 독자가 즉시 활용할 수 있는 구체적 방법론
+- 단계별 실행 가이드와 체크리스트
+- 실제 사례, 예시, 데이터가 풍부하게 포함
+- 문제 해결에 직접적으로 도움되는 내용
+
+**3. 콘텐츠 구성과 가독성**:
+- 논리적이고 체계적인 정보 구조
+- 각 섹션은 요청된 분량으로 상세하고 알찬 내용
+- **굵은 글씨**로 핵심 키워드 강조
+- 비교표, 체크리스트, 코드 예제 적극 활용
+
+**4. SEO와 검색 최적화**:
+- 자연스러우면서도 검색에 최적화된 제목
+- 독자가 클릭하고 싶어하는 매력적인 제목 구성
+- 핵심 키워드가 자연스럽게 포함된 내용
+
+**컨텐츠 포맷팅 규칙**:
+1. **문단 구분**: 2-3문장마다 \\n\\n로 줄바꿈
+2. **섹션 구분**: 하위 주제 사이에 --- 구분선 사용  
+3. **표 활용**: 비교/정리 필요시 HTML 테이블 사용
+   예: <table><tr><th>항목</th><th>설명</th></tr><tr><td>내용1</td><td>설명1</td></tr></table>
+4. **목록화**: 중요 포인트는 목록 형태로 작성 (각 항목마다 반드시 새 줄에 작성)
+   - 각 항목은 반드시 새 줄에 작성: 
+     - 첫 번째 항목\\n
+     - 두 번째 항목\\n
+     - 세 번째 항목\\n
+   - 절대 "- 항목1 - 항목2 - 항목3" 형태로 한 줄에 이어쓰지 않기
+5. **강조**: 핵심 키워드는 **굵은글씨**로 자연스럽게 강조
+6. **코드**: 필요시 ```언어\\n코드\\n``` 형태로 작성
+7. **아이콘**: 핵심 정보에 [핀], [팁], [주의], [타겟] 등 대괄호 텍스트 사용
+8. **숫자와 데이터**: 퍼센트, 금액, 날짜 등은 명확하게 표기
+9. **박스 강조**: 중요한 정보는 박스 형태나 인용문으로 강조
+"""
+
+_shared_generator = None
+_shared_generator_lock = threading.Lock()
+
+
+def get_shared_generator() -> 'ContentGenerator':
+    """프로세스 공용 ContentGenerator 반환 (Anthropic 클라이언트/HTTP 연결 재사용)
+
+    초기화에 실패하면 예외를 그대로 올리고, 다음 호출에서 다시 시도한다.
+    """
+    global _shared_generator
+    if _shared_generator is None:
+        with _shared_generator_lock:
+            if _shared_generator is None:
+                _shared_generator = ContentGenerator()
+    return _shared_generator
+
 
 class ContentGenerator:
+    # 콘텐츠 길이별 설정
+    LENGTH_SETTINGS = {
+        'short': {
+            'sections': 2,
+            'section_length': '200-300자',
+            'introduction_length': '150자 정도',
+            'conclusion_length': '150자',
+            'total_guide': '1,500-2,000자 분량'
+        },
+        'medium': {
+            'sections': 3,
+            'section_length': '300-500자',
+            'introduction_length': '200자 정도',
+            'conclusion_length': '200자',
+            'total_guide': '2,500-3,500자 분량'
+        },
+        'long': {
+            'sections': 4,
+            'section_length': '400-600자',
+            'introduction_length': '250자 정도',
+            'conclusion_length': '250자',
+            'total_guide': '4,000-5,500자 분량'
+        },
+        'very_long': {
+            'sections': 5,
+            'section_length': '500-700자',
+            'introduction_length': '300자 정도',
+            'conclusion_length': '300자',
+            'total_guide': '6,000-8,000자 분량'
+        }
+    }
+    
     def __init__(self):
         api_key = os.getenv("ANTHROPIC_API_KEY")
         print(f"API Key loaded: {api_key[:20] if api_key else 'None'}...")  # 디버그용
@@ -51,16 +199,59 @@ class ContentGenerator:
             # 환경변수 복원
             for var, value in old_proxy_values.items():
                 os.environ[var] = value
+        
+        # 공통 시스템 지침/사이트 정보를 프롬프트 캐시로 재사용 (CLAUDE_PROMPT_CACHE=false로 끔)
+        self.prompt_cache_enabled = os.getenv('CLAUDE_PROMPT_CACHE', 'true').lower() != 'false'
+        # 본문 생성은 스트리밍으로 받아 섹션 단위 진행 상황 보고 + 비JSON 응답 조기 중단
+        self.streaming_enabled = os.getenv('CLAUDE_STREAMING', 'true').lower() != 'false'
+        
+        # 같은 프롬프트 재생성 방지용 디스크 캐시 (GENERATION_CACHE=false로 끔)
+        self.generation_cache = None
+        if os.getenv('GENERATION_CACHE', 'true').lower() != 'false':
+            default_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'generation_cache')
+            self.generation_cache = GenerationCache(
+                os.getenv('GENERATION_CACHE_DIR', default_dir),
+                ttl=float(os.getenv('GENERATION_CACHE_TTL', 21600)),
+                max_entries=int(os.getenv('GENERATION_CACHE_MAX_ENTRIES', 500))
+            )
     
     def generate_content(self, site_config: Dict, topic: str, 
-                        category: str, existing_posts: List[str] = None, content_length: str = 'medium', site_key: str = None) -> Dict:
-        """메인 콘텐츠 생성 함수"""
+                        category: str, existing_posts: List[str] = None, content_length: str = 'medium', site_key: str = None,
+                        on_progress: Callable[[Dict], None] = None, bypass_cache: bool = False) -> Dict:
+        """메인 콘텐츠 생성 함수
+        
+        on_progress가 주어지면 생성 중 완성된 필드/섹션을 이벤트 dict로 전달한다.
+        같은 프롬프트의 최근 결과가 생성 캐시에 있으면 API 호출 없이 반환하며,
+        bypass_cache=True면 캐시를 무시하고 새로 생성해 캐시를 갱신한다.
+        """
         
         # 프롬프트 생성
         prompt = self._create_prompt(site_config, topic, category, existing_posts, content_length)
         
+        settings = self.LENGTH_SETTINGS.get(content_length, self.LENGTH_SETTINGS['medium'])
+        
+        cache_key = None
+        if self.generation_cache is not None:
+            cache_key = GenerationCache.make_key(
+                self._message_params(self._build_system(site_config), prompt, max_tokens=8000, temperature=0.8),
+                version=PROMPT_VERSION
+            )
+            if bypass_cache:
+                self.generation_cache.record_bypass()
+            else:
+                cached = self.generation_cache.get(cache_key)
+                if cached is not None:
+                    print(f"생성 캐시 적중: {topic}")
+                    if isinstance(cached.get('structured_data'), dict):
+                        cached['structured_data']['datePublished'] = datetime.now().isoformat()
+                    self._notify(on_progress, {'type': 'cache_hit', 'title': cached.get('title', '')})
+                    return cached
+        
+        self._notify(on_progress, {'type': 'started', 'sections_total': settings['sections']})
+        
         # Claude API로 콘텐츠 생성 (사이트 정보 전달)
-        content = self._generate_with_claude(prompt, site_key)
+        content = self._generate_with_claude(prompt, site_key, site_config=site_config,
+                                             stream=self.streaming_enabled, on_progress=on_progress)
         
         # 콘텐츠 파싱 및 구조화
         structured_content = self._parse_content(content)
@@ -72,45 +263,27 @@ class ContentGenerator:
         # UTF-8 사용으로 변경 - cp949 호환성 체크 제거
         # optimized_content = self._ensure_cp949_compatibility(optimized_content)
         
+        # 정상 파싱된 결과만 캐시 (대체 파싱 결과는 다음 요청에서 다시 생성)
+        if cache_key and structured_content.get('meta_description') != FALLBACK_META_DESCRIPTION:
+            self.generation_cache.set(cache_key, optimized_content)
+        
         return optimized_content
     
+    def build_message_request(self, site_config: Dict, topic: str, category: str,
+                              existing_posts: List[str] = None, content_length: str = 'medium') -> Dict:
+        """generate_content와 동일한 Claude 요청 파라미터 (배치 제출용)"""
+        prompt = self._create_prompt(site_config, topic, category, existing_posts, content_length)
+        return self._message_params(self._build_system(site_config), prompt, max_tokens=8000, temperature=0.8)
+    
+    def parse_generated_content(self, text: str, site_config: Dict) -> Dict:
+        """모델 응답 텍스트를 generate_content 결과와 같은 구조로 변환"""
+        return self._optimize_for_seo(self._parse_content(text), site_config)
+    
     def _create_prompt(self, site_config: Dict, topic: str, 
                        category: str, existing_posts: List[str] = None, content_length: str = 'medium') -> str:
         """AI 프롬프트 생성"""
         
-        # 콘텐츠 길이별 설정
-        length_settings = {
-            'short': {
-                'sections': 2,
-                'section_length': '200-300자',
-                'introduction_length': '150자 정도',
-                'conclusion_length': '150자',
-                'total_guide': '1,500-2,000자 분량'
-            },
-            'medium': {
-                'sections': 3,
-                'section_length': '300-500자',
-                'introduction_length': '200자 정도',
-                'conclusion_length': '200자',
-                'total_guide': '2,500-3,500자 분량'
-            },
-            'long': {
-                'sections': 4,
-                'section_length': '400-600자',
-                'introduction_length': '250자 정도',
-                'conclusion_length': '250자',
-                'total_guide': '4,000-5,500자 분량'
-            },
-            'very_long': {
-                'sections': 5,
-                'section_length': '500-700자',
-                'introduction_length': '300자 정도',
-                'conclusion_length': '300자',
-                'total_guide': '6,000-8,000자 분량'
-            }
-        }
-        
-        settings = length_settings.get(content_length, length_settings['medium'])
+        settings = self.LENGTH_SETTINGS.get(content_length, self.LENGTH_SETTINGS['medium'])
         
         # 섹션 템플릿 생성 - 주제별 맞춤 구조
         section_topics = [
@@ -139,48 +312,14 @@ Title must be about: {topic}
 Content must be about: {topic}
 Do not write about general topics or other subjects.
 
-Blog: {site_config['name']}
-Audience: {site_config['target_audience']}
 Category: {category}
 📏 **분량**: {settings['total_guide']}
 
-🔥 **품질 요구사항 (매우 중요!)** 🔥
-
-**0. 사실성과 정확성 (절대 준수)**:
-- 실제로 존재하는 정보만 사용 (가상의 기관, 은행, 서비스 절대 금지)
-- 검증 가능한 사실과 데이터만 포함
-- 예시를 들 때는 실제 존재하는 기관/서비스만 언급
-- 불확실한 정보는 언급하지 말고, 일반론으로 설명
-
-**1. 전문성과 깊이**:
-- 해당 분야 전문가 수준의 인사이트 제공
-- 최신 트렌드와 실제 경험이 반영된 내용
-- 표면적 설명이 아닌 심층적 분석과 가이드
-
-**2. 실용성과 가치**:
-- 독자가 즉시 활용할 수 있는 구체적 방법론
-- 단계별 실행 가이드와 체크리스트
-- 실제 사례, 예시, 데이터가 풍부하게 포함
-- 문제 해결에 직접적으로 도움되는 내용
-
-**3. 콘텐츠 구성과 가독성**:
-- 논리적이고 체계적인 정보 구조
-- 각 섹션은 {settings['section_length']}로 상세하고 알찬 내용
-- **굵은 글씨**로 핵심 키워드 강조
-- 비교표, 체크리스트, 코드 예제 적극 활용
-
-**4. SEO와 검색 최적화**:
-- 자연스러우면서도 검색에 최적화된 제목
-- 독자가 클릭하고 싶어하는 매력적인 제목 구성
-- 핵심 키워드가 자연스럽게 포함된 내용
-
 [핵심 작성 주제]
 {topic}
 
-[블로그 정보]
+[요청 정보]
 - 카테고리: {category}
-- 타겟 독자: {site_config['target_audience']}
-- 작성 스타일: {site_config['content_style']}
 - 콘텐츠 길이: {settings['total_guide']}
 
 [작성 요구사항]
@@ -204,23 +343,6 @@ Category: {category}
 - 각 섹션은 {settings['section_length']}로 충분히 상세하게 작성하세요
 - 절대 이모지나 유니코드 특수문자를 사용하지 마세요
 - **목록 작성 시 절대 준수사항**: 각 항목마다 반드시 새 줄에 작성 (- 항목은 각각 \\n으로 구분)
-
-**컨텐츠 포맷팅 규칙**:
-1. **문단 구분**: 2-3문장마다 \\n\\n로 줄바꿈
-2. **섹션 구분**: 하위 주제 사이에 --- 구분선 사용  
-3. **표 활용**: 비교/정리 필요시 HTML 테이블 사용
-   예: <table><tr><th>항목</th><th>설명</th></tr><tr><td>내용1</td><td>설명1</td></tr></table>
-4. **목록화**: 중요 포인트는 목록 형태로 작성 (각 항목마다 반드시 새 줄에 작성)
-   - 각 항목은 반드시 새 줄에 작성: 
-     - 첫 번째 항목\\n
-     - 두 번째 항목\\n
-     - 세 번째 항목\\n
-   - 절대 "- 항목1 - 항목2 - 항목3" 형태로 한 줄에 이어쓰지 않기
-5. **강조**: 핵심 키워드는 **굵은글씨**로 자연스럽게 강조
-6. **코드**: 필요시 ```언어\\n코드\\n``` 형태로 작성
-7. **아이콘**: 핵심 정보에 [핀], [팁], [주의], [타겟] 등 대괄호 텍스트 사용
-8. **숫자와 데이터**: 퍼센트, 금액, 날짜 등은 명확하게 표기
-9. **박스 강조**: 중요한 정보는 박스 형태나 인용문으로 강조
 """
         
         if existing_posts:
@@ -230,65 +352,117 @@ Category: {category}
         
         return prompt
     
-    def _generate_with_claude(self, prompt: str, site_key: str = None) -> str:
-        """Claude API로 콘텐츠 생성"""
+    def _create_site_profile(self, site_config: Dict) -> str:
+        """사이트별 고정 정보 - 같은 사이트 요청끼리 캐시를 공유하도록 주제와 분리"""
+        return f"""[블로그 정보]
+- 블로그: {site_config.get('name', '')}
+- 타겟 독자: {site_config.get('target_audience', '')}
+- 작성 스타일: {site_config.get('content_style', '')}"""
+    
+    def _build_system(self, site_config: Dict = None) -> List[Dict]:
+        """시스템 프롬프트 블록 구성
+        
+        공통 지침 블록과 사이트 정보 블록 끝에 각각 캐시 지점을 두어
+        사이트가 달라도 공통 부분은 캐시를 재사용한다.
+        """
+        blocks = [{"type": "text", "text": SYSTEM_MESSAGE + "\n\n" + CONTENT_GUIDELINES}]
+        if site_config:
+            blocks.append({"type": "text", "text": self._create_site_profile(site_config)})
+        
+        if self.prompt_cache_enabled:
+            for block in blocks:
+                block["cache_control"] = {"type": "ephemeral"}
+        return blocks
+    
+    @staticmethod
+    def _cache_usage(usage) -> Dict:
+        """응답 usage에서 캐시 토큰 수 추출 (캐시 미지원 응답은 0)"""
+        return {
+            'cache_creation_input_tokens': getattr(usage, 'cache_creation_input_tokens', 0) or 0,
+            'cache_read_input_tokens': getattr(usage, 'cache_read_input_tokens', 0) or 0,
+        }
+    
+    @staticmethod
+    def _notify(on_progress: Optional[Callable[[Dict], None]], event: Dict):
+        """진행 상황 콜백 호출 - 콜백 오류가 생성 자체를 중단시키지 않도록 보호"""
+        if on_progress is None:
+            return
         try:
-            # 시스템 메시지 - 고품질 콘텐츠 생성을 위한 상세 가이드
-            system_message = """당신은 전문 블로그 콘텐츠 크리에이터입니다.
-
-**핵심 미션**: 독자가 실제로 도움받을 수 있는 고품질, 실용적인 한국어 블로그 콘텐츠 생성
-
-**콘텐츠 품질 기준 (매우 중요!):**
-
-**전문성**: 
-- 해당 분야의 전문가 수준의 깊이 있는 내용
-- 최신 트렌드와 실무 경험이 반영된 인사이트
-- 단순한 정보 나열이 아닌 실용적 가이드
-
-[중요] **실용성**:
-- 독자가 바로 적용할 수 있는 구체적인 방법론
-- 단계별 실행 가이드 제공
-- 실제 사례와 예시를 풍부하게 포함
-
-[핵심] **가독성**:
-- 명확한 구조와 논리적 흐름
-- 적절한 소제목과 문단 구분
-- 핵심 포인트는 굵게 강조
-
-**절대적 요구사항:**
-[필수] 오직 유효한 JSON 형식으로만 응답
-[필수] 모든 내용은 한국어로 작성
-[필수] 각 섹션당 최소 300-500자의 상세한 내용
-[필수] 실제 도움이 되는 구체적 정보 포함
-[필수] 전문적이면서도 이해하기 쉬운 설명
-[필수] 목록 작성 시 각 항목은 반드시 새 줄에 작성 (- 항목은 각각 \\n으로 구분)
-[필수] 절대 "- 항목1 - 항목2" 형태로 한 줄에 이어쓰지 않기
-[필수] 절대 이모지나 유니코드 특수문자 사용하지 말 것
-
-[금지] 절대 하지 말 것:
-[금지] JSON 외의 다른 텍스트 출력 금지
-[금지] 피상적이거나 일반적인 내용 금지
-[금지] 단순 번역체나 어색한 문장 금지
-[금지] 빈약한 내용이나 짧은 설명 금지
-[금지] 목록을 한 줄에 나열하는 것 절대 금지 (- 항목1 - 항목2 형태 금지)
-[금지] 이모지, 특수문자, 유니코드 기호 사용 절대 금지"""
+            on_progress(event)
+        except Exception as e:
+            print(f"진행 상황 콜백 오류: {e}")
+    
+    @staticmethod
+    def _message_params(system_blocks: List[Dict], prompt: str, max_tokens: int,
+                        temperature: float) -> Dict:
+        """messages.create / Message Batches 공용 요청 파라미터"""
+        return dict(
+            model=CLAUDE_MODEL,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system_blocks,
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        )
+    
+    def _request_claude(self, system_blocks: List[Dict], prompt: str, max_tokens: int,
+                        temperature: float, stream: bool = False,
+                        on_progress: Callable[[Dict], None] = None) -> Tuple[Optional[str], object]:
+        """Claude 메시지 요청 - (응답 텍스트, usage) 반환
+        
+        stream=True이면 증분 JSON 파서로 완성된 필드/섹션을 즉시 알리고,
+        응답 앞부분이 JSON이 아니면 연결을 끊고 (None, 부분 usage)를 반환한다.
+        """
+        request = self._message_params(system_blocks, prompt, max_tokens, temperature)
+        if not stream:
+            response = self.anthropic_client.messages.create(**request)
+            return response.content[0].text, response.usage
+        
+        parser = IncrementalJSONParser()
+        sections_done = 0
+        with self.anthropic_client.messages.stream(**request) as message_stream:
+            try:
+                for text in message_stream.text_stream:
+                    for kind, key, value in parser.feed(text):
+                        if kind == 'item':
+                            sections_done += 1
+                            heading = value.get('heading', '') if isinstance(value, dict) else ''
+                            self._notify(on_progress, {'type': 'section', 'index': sections_done - 1,
+                                                       'heading': heading, 'chars': len(parser.buffer)})
+                        elif key != 'sections':
+                            self._notify(on_progress, {'type': 'field', 'key': key,
+                                                       'value': value if key == 'title' else None,
+                                                       'chars': len(parser.buffer)})
+            except NonJSONOutputError as e:
+                # with 블록을 빠져나가며 스트림이 닫혀 남은 토큰 생성이 중단됨
+                print(f"Warning: 스트리밍 응답이 JSON이 아님 - 조기 중단 ({len(parser.buffer)}자): {e}")
+                self._notify(on_progress, {'type': 'aborted', 'reason': str(e), 'chars': len(parser.buffer)})
+                snapshot = getattr(message_stream, 'current_message_snapshot', None)
+                return None, getattr(snapshot, 'usage', None)
+            final_message = message_stream.get_final_message()
+        
+        return final_message.content[0].text, final_message.usage
+    
+    def _generate_with_claude(self, prompt: str, site_key: str = None, site_config: Dict = None,
+                              stream: bool = False, on_progress: Callable[[Dict], None] = None) -> str:
+        """Claude API로 콘텐츠 생성 (stream=True면 스트리밍 + 비JSON 응답 조기 중단)"""
+        try:
+            system_blocks = self._build_system(site_config)
             
             # 입력 토큰 추정 (시스템 메시지 + 사용자 메시지)
-            input_text = system_message + prompt
+            system_text = ''.join(block["text"] for block in system_blocks)
+            input_text = system_text + prompt
             estimated_input_tokens = len(input_text) // 3  # 대략적 추정
             
-            response = self.anthropic_client.messages.create(
-                model="claude-3-5-sonnet-20241022",
+            result, usage = self._request_claude(
+                system_blocks, prompt,
                 max_tokens=8000,  # 더 긴 고품질 콘텐츠를 위해 증가
                 temperature=0.8,  # 창의성 증가
-                system=system_message,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                stream=stream,
+                on_progress=on_progress
             )
             
-            result = response.content[0].text
-            
             # 즉시 CP949 호환성 처리 - API 응답 직후
             # UTF-8 사용으로 변경 - cp949 클리닝 제거
             # result = self._aggressive_cp949_clean(result)
@@ -297,31 +471,35 @@ Category: {category}
             # UTF-8 사용으로 변경 - cp949 호환성 체크 제거
             # result = self._ensure_cp949_compatibility(result)
             
-            # 실제 토큰 사용량 (Claude API 응답에서 가져오기)
-            actual_input_tokens = response.usage.input_tokens
-            actual_output_tokens = response.usage.output_tokens
+            # 실제 토큰 사용량 (Claude API 응답에서 가져오기, 조기 중단 시 부분 사용량)
+            actual_input_tokens = getattr(usage, 'input_tokens', None) or estimated_input_tokens
+            actual_output_tokens = getattr(usage, 'output_tokens', None) or 0
             
-            # API 사용량 추적
+            # API 사용량 추적 (캐시 생성/적중 토큰 포함)
             api_tracker.track_usage(
                 service="claude",
-                model="claude-3-5-sonnet-20241022",
+                model=CLAUDE_MODEL,
                 input_tokens=actual_input_tokens,
                 output_tokens=actual_output_tokens,
                 site=site_key,
-                purpose="content_generation",
-                success=True,
-                endpoint="messages"
+                purpose="content_generation" if result is not None else "content_generation_aborted",
+                success=result is not None,
+                error_message=None if result is not None else "non-JSON output aborted",
+                endpoint="messages",
+                **self._cache_usage(usage)
             )
             
-            # 디버깅: API 응답 로그
-            print(f"Claude API Response Length: {len(result)}")
-            print(f"Response starts with: {result[:200]}...")
-            print(f"Response ends with: ...{result[-200:]}")
-            print(f"Full response: {result}")
+            if result is not None:
+                # 디버깅: API 응답 로그
+                print(f"Claude API Response Length: {len(result)}")
+                print(f"Response starts with: {result[:200]}...")
+                print(f"Response ends with: ...{result[-200:]}")
+                print(f"Full response: {result}")
             
-            # 응답이 코드로 시작하는 경우 처리
-            if result.strip().startswith(('const', 'function', 'import', 'jsx', 'python', 'async', 'def')):
+            # 응답이 코드로 시작하거나 스트리밍 중 비JSON으로 중단된 경우 처리
+            if result is None or result.strip().startswith(('const', 'function', 'import', 'jsx', 'python', 'async', 'def')):
                 print("Warning: Claude returned code instead of JSON. Regenerating...")
+                self._notify(on_progress, {'type': 'retry'})
                 # 재시도 with stronger prompt
                 retry_prompt = f"""**절대적 요구사항**: 
                 오직 JSON 형식으로만 응답하세요. 코드를 작성하지 마세요.
@@ -330,30 +508,30 @@ Category: {category}
                 다시 한번 요청: {prompt}"""
                 
                 # 재시도 입력 토큰 추정
-                retry_input_text = system_message + retry_prompt
-                retry_estimated_input_tokens = len(retry_input_text) // 3
+                retry_input_text = system_text + retry_prompt
+                estimated_input_tokens = len(retry_input_text) // 3
                 
-                response = self.anthropic_client.messages.create(
-                    model="claude-3-5-sonnet-20241022",
+                result, usage = self._request_claude(
+                    system_blocks, retry_prompt,
                     max_tokens=4000,
                     temperature=0.7,
-                    system=system_message,
-                    messages=[
-                        {"role": "user", "content": retry_prompt}
-                    ]
+                    stream=stream,
+                    on_progress=on_progress
                 )
-                result = response.content[0].text
+                if result is None:
+                    raise ValueError("재시도 응답도 JSON 형식이 아닙니다")
                 
                 # 재시도 API 사용량 추적
                 api_tracker.track_usage(
                     service="claude",
-                    model="claude-3-5-sonnet-20241022",
-                    input_tokens=response.usage.input_tokens,
-                    output_tokens=response.usage.output_tokens,
+                    model=CLAUDE_MODEL,
+                    input_tokens=usage.input_tokens,
+                    output_tokens=usage.output_tokens,
                     site=site_key,
                     purpose="content_generation_retry",
                     success=True,
-                    endpoint="messages"
+                    endpoint="messages",
+                    **self._cache_usage(usage)
                 )
                 
                 print(f"Retry Response starts with: {result[:100]}...")
@@ -363,7 +541,7 @@ Category: {category}
             # 실패한 API 호출 추적
             api_tracker.track_usage(
                 service="claude",
-                model="claude-3-5-sonnet-20241022",
+                model=CLAUDE_MODEL,
                 input_tokens=estimated_input_tokens if 'estimated_input_tokens' in locals() else 0,
                 output_tokens=0,
                 site=site_key,
@@ -551,7 +729,7 @@ Category: {category}
         
         return {
             "title": title,
-            "meta_description": "실용적인 개발 기술과 베스트 프랙티스를 다루는 가이드입니다.",
+            "meta_description": FALLBACK_META_DESCRIPTION,
             "introduction": introduction,
             "sections": sections,
             "additional_content": "관련 기술들과 함께 활용하면 더욱 효과적인 결과를 얻을 수 있습니다. 실무 프로젝트에서 이런 접근 방식들이 어떻게 적용되는지 살펴보세요.",
@@ -0,0 +1,160 @@
+"""
+스트리밍 응답용 증분 JSON 파서
+- 토큰 조각을 받는 즉시 스캔하여 최상위 필드(title, introduction 등)와
+  sections[] 원소가 완성되는 시점에 이벤트로 내보냄
+- 응답 앞부분이 JSON이 아니면(코드 등) 조기에 NonJSONOutputError 발생
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+# 응답이 코드로 시작하는 경우의 접두어 (_generate_with_claude의 재시도 조건과 동일)
+CODE_PREFIXES = ('const', 'function', 'import', 'jsx', 'python', 'async', 'def')
+
+
+class NonJSONOutputError(ValueError):
+    """응답 앞부분에서 JSON 객체가 아닌 출력이 감지됨"""
+
+
+class IncrementalJSONParser:
+    """최상위 JSON 객체를 문자 단위로 스캔하는 증분 파서
+
+    feed()는 새로 완성된 항목을 (kind, key, value) 목록으로 반환한다.
+    - ('field', key, value): 최상위 필드 값 완성 (sections 포함)
+    - ('item', key, value): 최상위 배열 필드(item_keys)의 원소 하나 완성
+    """
+
+    def __init__(self, probe_chars: int = 400, item_keys: Tuple[str, ...] = ('sections',)):
+        """
+        Args:
+            probe_chars: 이 길이 안에 '{'가 나오지 않으면 JSON이 아닌 것으로 판단
+            item_keys: 원소 단위로 이벤트를 낼 최상위 배열 필드
+        """
+        self.probe_chars = probe_chars
+        self.item_keys = item_keys
+
+        self.buffer = ''
+        self.result: Dict[str, Any] = {}
+        self.done = False
+
+        self._pos = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._expect_key = False
+        self._key: Optional[str] = None
+        self._value_start = 0
+        self._item_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, str, Any]]:
+        """응답 조각 추가 후 완성된 항목 반환"""
+        self.buffer += chunk
+        if self.done:
+            return []
+        if not self._started and not self._find_start():
+            return []
+        return self._scan()
+
+    # ------------------------------------------------------------------
+    # 시작 위치 탐색 / 조기 중단 판단
+    # ------------------------------------------------------------------
+
+    def _find_start(self) -> bool:
+        head = self.buffer.lstrip()
+        if head.startswith('```'):
+            # 코드 펜스는 json(또는 언어 표기 없음)만 허용
+            first_line, newline, _ = head.partition('\n')
+            if not newline:
+                return False
+            language = first_line[3:].strip().lower()
+            if language not in ('', 'json'):
+                raise NonJSONOutputError(f"JSON이 아닌 코드 블록 응답: {first_line[:50]}")
+        elif head.startswith(CODE_PREFIXES):
+            raise NonJSONOutputError(f"코드로 시작하는 응답: {head[:50]}")
+
+        start = self.buffer.find('{')
+        if start == -1 or start > self.probe_chars:
+            if len(self.buffer) > self.probe_chars:
+                raise NonJSONOutputError(f"응답 앞 {self.probe_chars}자 안에 JSON 객체가 없음")
+            return False
+
+        self._started = True
+        self._pos = start
+        return True
+
+    # ------------------------------------------------------------------
+    # 문자 스캔
+    # ------------------------------------------------------------------
+
+    def _scan(self) -> List[Tuple[str, str, Any]]:
+        events = []
+        buf = self.buffer
+        while self._pos < len(buf) and not self.done:
+            pos = self._pos
+            ch = buf[pos]
+            self._pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._expect_key:
+                        self._key = json.loads(buf[self._string_start:pos + 1], strict=False)
+                        self._expect_key = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif ch == ':' and self._depth == 1:
+                self._value_start = pos + 1
+            elif ch in '{[':
+                self._depth += 1
+                if self._depth == 1:
+                    self._expect_key = True
+                elif self._depth == 2 and ch == '[' and self._key in self.item_keys:
+                    self._item_start = pos + 1
+            elif ch in '}]':
+                if self._depth == 2 and self._item_start is not None:
+                    events.extend(self._close_item(pos))
+                    self._item_start = None
+                self._depth -= 1
+                if self._depth == 0:
+                    events.extend(self._close_field(pos))
+                    self.done = True
+            elif ch == ',':
+                if self._depth == 1:
+                    events.extend(self._close_field(pos))
+                    self._expect_key = True
+                elif self._depth == 2 and self._item_start is not None:
+                    events.extend(self._close_item(pos))
+                    self._item_start = pos + 1
+        return events
+
+    def _close_field(self, end: int) -> List[Tuple[str, str, Any]]:
+        if self._key is None:
+            return []
+        key, self._key = self._key, None
+        text = self.buffer[self._value_start:end].strip()
+        try:
+            value = json.loads(text, strict=False)
+        except json.JSONDecodeError:
+            # 깨진 값은 최종 파싱(_parse_content)에 맡김
+            return []
+        self.result[key] = value
+        return [('field', key, value)]
+
+    def _close_item(self, end: int) -> List[Tuple[str, str, Any]]:
+        text = self.buffer[self._item_start:end].strip()
+        if not text:
+            return []
+        try:
+            value = json.loads(text, strict=False)
+        except json.JSONDecodeError:
+            return []
+        return [('item', self._key, value)]
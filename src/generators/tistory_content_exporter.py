@@ -3,11 +3,14 @@ Tistory 콘텐츠 파일 생성 모듈 - HTML 파일로 내보내기
 """
 
 import os
-import json
 from datetime import datetime
+from html import escape
 from pathlib import Path
 from typing import Dict, List
 
+from src.utils.batch_export import atomic_write_json, atomic_write_text, map_exports
+from src.utils.markdown_renderer import render_markdown, TISTORY_THEME
+
 
 class TistoryContentExporter:
     def __init__(self, export_dir: str = "./data/tistory_posts"):
@@ -24,19 +27,20 @@ class TistoryContentExporter:
         """
         # 파일명 생성 (날짜_제목)
         date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_title = "".join(c for c in content['title'] if c.isalnum() or c in (' ', '-', '_'))[:50]
-        filename = f"{date_str}_{safe_title}.html"
-        filepath = self.export_dir / filename
+        entry = self._write_export(content, images, f"{date_str}_{_safe_title(content['title'])}")
         
-        # HTML 콘텐츠 생성
-        html_content = self._create_full_html(content, images)
+        print(f"[완료] Tistory 콘텐츠 생성 완료: {entry['file']}")
+        print(f"[메타] 메타데이터: {entry['metadata']}")
         
-        # 파일 저장
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        return entry['file']
+    
+    def _write_export(self, content: Dict, images: List[Dict], stem: str) -> Dict:
+        """HTML·메타데이터 파일을 임시 파일 교체 방식으로 저장하고 목록 항목 반환"""
+        filepath = self.export_dir / f"{stem}.html"
+        atomic_write_text(filepath, self._create_full_html(content, images))
         
         # 메타데이터 JSON 파일도 생성
-        metadata_file = self.export_dir / f"{date_str}_{safe_title}_meta.json"
+        metadata_file = self.export_dir / f"{stem}_meta.json"
         metadata = {
             "title": content['title'],
             "tags": content.get('tags', []),
@@ -44,14 +48,14 @@ class TistoryContentExporter:
             "created_at": datetime.now().isoformat(),
             "file_path": str(filepath)
         }
+        atomic_write_json(metadata_file, metadata)
         
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
-        
-        print(f"[완료] Tistory 콘텐츠 생성 완료: {filepath}")
-        print(f"[메타] 메타데이터: {metadata_file}")
-        
-        return str(filepath)
+        return {
+            "title": content['title'],
+            "file": str(filepath),
+            "metadata": str(metadata_file),
+            "bytes": filepath.stat().st_size
+        }
     
     def _create_full_html(self, content: Dict, images: List[Dict]) -> str:
         """완전한 HTML 문서 생성"""
@@ -168,7 +172,7 @@ class TistoryContentExporter:
         
         # 서론
         if content.get('introduction'):
-            html.append(f'<div class="intro">{content["introduction"]}</div>')
+            html.append(f'<div class="intro">{render_markdown(content["introduction"], TISTORY_THEME)}</div>')
         
         # 이미지 (있는 경우)
         if images and len(images) > 0:
@@ -180,16 +184,9 @@ class TistoryContentExporter:
         for i, section in enumerate(content.get('sections', [])):
             html.append(f"<h2>{section['heading']}</h2>")
             
-            # 단락 처리
-            paragraphs = section['content'].split('\n\n')
-            for para in paragraphs:
-                if para.strip():
-                    # 중요 키워드 강조
-                    para_html = para.strip()
-                    for keyword in content.get('keywords', [])[:3]:
-                        if keyword in para_html:
-                            para_html = para_html.replace(keyword, f'<span class="highlight">{keyword}</span>', 1)
-                    html.append(f"<p>{para_html}</p>")
+            # 본문 렌더링 (문단마다 주요 키워드 첫 등장 강조)
+            html.append(render_markdown(section['content'], TISTORY_THEME,
+                                        highlight=content.get('keywords', [])[:3]))
             
             # 중간 이미지 삽입
             if images and i == 0 and len(images) > 1:
@@ -201,7 +198,7 @@ class TistoryContentExporter:
         if content.get('conclusion'):
             html.append(f'<div class="conclusion">')
             html.append(f"<h2>마무리</h2>")
-            html.append(f"<p>{content['conclusion']}</p>")
+            html.append(render_markdown(content['conclusion'], TISTORY_THEME))
             html.append(f'</div>')
         
         # 태그
@@ -251,22 +248,56 @@ function copyContent() {
         return '\n'.join(html)
     
     def create_batch_export(self, contents: List[Dict]) -> str:
-        """여러 콘텐츠를 한번에 내보내기"""
-        batch_dir = self.export_dir / f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        """여러 콘텐츠를 한번에 내보내기 (배치 디렉토리 경로 반환)"""
+        return self.export_batch(contents)['batch_dir']
+    
+    def export_batch(self, contents: List[Dict], workers: int = None) -> Dict:
+        """
+        여러 콘텐츠를 프로세스 풀에서 병렬 렌더링해 내보내기
+        
+        Returns:
+            목록(manifest) - 배치 디렉토리, 성공 파일(입력 순서), 실패 항목
+        """
+        date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+        batch_dir = self.export_dir / f"batch_{date_str}"
         batch_dir.mkdir(parents=True, exist_ok=True)
         
-        exported_files = []
-        for content in contents:
-            filepath = self.export_content(content)
-            exported_files.append(filepath)
+        tasks = [(str(self.export_dir), content, f"{date_str}_{i:03d}_{_safe_title(content.get('title', ''))}")
+                 for i, content in enumerate(contents)]
+        results = map_exports(_export_batch_item, tasks, workers)
+        
+        files, errors = [], []
+        for i, (content, result) in enumerate(zip(contents, results)):
+            if isinstance(result, Exception):
+                errors.append({"index": i, "title": content.get('title', ''), "error": str(result)})
+            else:
+                files.append({"index": i, **result})
+        
+        manifest = {
+            "created_at": datetime.now().isoformat(),
+            "batch_dir": str(batch_dir),
+            "count": len(files),
+            "failed": len(errors),
+            "files": files,
+            "errors": errors
+        }
         
         # 인덱스 파일 생성
-        index_file = batch_dir / "index.html"
-        with open(index_file, 'w', encoding='utf-8') as f:
-            f.write("<html><body><h1>Tistory 포스트 목록</h1><ul>")
-            for filepath in exported_files:
-                filename = Path(filepath).name
-                f.write(f'<li><a href="../{filename}">{filename}</a></li>')
-            f.write("</ul></body></html>")
+        items = ''.join(f'<li><a href="../{escape(Path(entry["file"]).name)}">{escape(entry["title"])}</a></li>'
+                        for entry in files)
+        atomic_write_text(batch_dir / "index.html",
+                          f"<html><body><h1>Tistory 포스트 목록</h1><ul>{items}</ul></body></html>")
+        atomic_write_json(batch_dir / "manifest.json", manifest)
         
-        return str(batch_dir)
\ No newline at end of file
+        print(f"[완료] Tistory 일괄 생성: {len(files)}개 성공, {len(errors)}개 실패 → {batch_dir}")
+        
+        return manifest
+
+
+def _safe_title(title: str) -> str:
+    return "".join(c for c in title if c.isalnum() or c in (' ', '-', '_'))[:50]
+
+
+def _export_batch_item(export_dir: str, content: Dict, stem: str) -> Dict:
+    """프로세스 풀 작업 단위 - 글 하나를 렌더링해 저장"""
+    return TistoryContentExporter(export_dir)._write_export(content, None, stem)
@@ -1,9 +1,9 @@
 """
 WordPress 자동 발행 모듈
 WordPress REST API를 사용하여 콘텐츠를 직접 업로드
+(사이트별 공유 세션으로 연결 재사용, 429/5xx 재시도 - src.utils.http_client)
 """
 
-import requests
 import base64
 import json
 import os
@@ -11,6 +11,8 @@ from typing import Dict, Optional
 import logging
 from datetime import datetime
 
+from src.utils import http_client
+
 logger = logging.getLogger(__name__)
 
 class WordPressPublisher:
@@ -43,8 +45,8 @@ class WordPressPublisher:
     def test_connection(self) -> bool:
         """WordPress 연결 테스트"""
         try:
-            response = requests.get(
-                f"{self.api_url}/posts?per_page=1",
+            response = http_client.request(
+                'GET', f"{self.api_url}/posts?per_page=1",
                 headers=self.headers,
                 timeout=10
             )
@@ -87,8 +89,8 @@ class WordPressPublisher:
                 post_data['tags'] = content_data['tags']
             
             # 포스트 생성 API 호출
-            response = requests.post(
-                f"{self.api_url}/posts",
+            response = http_client.request(
+                'POST', f"{self.api_url}/posts",
                 headers=self.headers,
                 json=post_data,
                 timeout=30
@@ -120,8 +122,8 @@ class WordPressPublisher:
     def get_categories(self) -> list:
         """카테고리 목록 조회"""
         try:
-            response = requests.get(
-                f"{self.api_url}/categories",
+            response = http_client.request(
+                'GET', f"{self.api_url}/categories",
                 headers=self.headers,
                 timeout=10
             )
@@ -138,8 +140,8 @@ class WordPressPublisher:
             if slug:
                 data['slug'] = slug
                 
-            response = requests.post(
-                f"{self.api_url}/categories",
+            response = http_client.request(
+                'POST', f"{self.api_url}/categories",
                 headers=self.headers,
                 json=data,
                 timeout=10
@@ -63,6 +63,8 @@ class BlogAutomationScheduler:
         # 실패한 작업 재시도 설정
         self.max_retries = 3
         self.retry_delay = 300  # 5분
+        # 마지막 create_and_publish_post 실패가 발행 확인 전(생성/발행 요청 실패)이라 다시 시도해도 되는지
+        self.last_failure_retryable = False
         
         blog_logger.info("Blog Automation Scheduler initialized")
     
@@ -122,6 +124,8 @@ class BlogAutomationScheduler:
     @timing
     def create_and_publish_post(self, site_key: str, retry_count: int = 0):
         """콘텐츠 생성 및 발행"""
+        self.last_failure_retryable = False
+        published = False
         try:
             blog_logger.info(f"Starting content creation for {site_key}")
             
@@ -182,6 +186,7 @@ class BlogAutomationScheduler:
                 success, result = publisher.publish_post(content, images)
             
             if success:
+                published = True
                 # 8. 데이터베이스에 기록
                 content_id = self.database.add_content(
                     site=site_key,
@@ -217,6 +222,11 @@ class BlogAutomationScheduler:
                 error=e
             )
             
+            # 발행 후 기록 단계 오류는 다시 실행하면 같은 글이 두 번 발행되므로 재시도하지 않음
+            if published:
+                return False
+            self.last_failure_retryable = True
+            
             # 재시도 로직
             if retry_count < self.max_retries:
                 blog_logger.info(f"Retrying in {self.retry_delay} seconds (attempt {retry_count + 1})")
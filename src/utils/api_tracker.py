@@ -6,41 +6,57 @@ Claude API 사용량과 비용을 실시간으로 추적하고 기록
 import json
 import psycopg2
 import psycopg2.extras
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, timezone
+from pathlib import Path
 from typing import Dict, List, Optional
 import os
 from dotenv import load_dotenv
 import logging
 
+from src.utils.postgresql_database import get_shared_database
+from src.utils.write_behind_queue import WriteBehindQueue
+from src.utils.response_cache import invalidate_responses
+from src.utils import daily_metrics
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
 class APITracker:
     def __init__(self):
-        """API 추적기 초기화 - PostgreSQL 사용"""
-        # PostgreSQL 연결 정보
-        self.connection_params = {
-            'host': os.getenv('PG_HOST', 'ep-divine-bird-a1f4mly5.ap-southeast-1.pg.koyeb.app'),
-            'port': int(os.getenv('PG_PORT', 5432)),
-            'database': os.getenv('PG_DATABASE', 'unble'),
-            'user': os.getenv('PG_USER', 'unble'),
-            'password': os.getenv('PG_PASSWORD', 'npg_1kjV0mhECxqs'),
-        }
-        self.schema = os.getenv('PG_SCHEMA', 'blog_automation')
+        """API 추적기 초기화 - PostgreSQL 사용 (공유 커넥션 풀)"""
+        self.db = get_shared_database()
+        self.schema = self.db.schema
         self._init_database()
         
+        # 사용량 기록은 백그라운드에서 배치로 INSERT (생성 경로에서 DB 왕복 제거)
+        default_spill = Path(__file__).parent.parent.parent / 'data' / 'api_usage_spill.jsonl'
+        self._write_queue = WriteBehindQueue(
+            self._insert_usage_batch,
+            spill_path=os.getenv('API_USAGE_SPILL_PATH', str(default_spill)),
+            name='api_usage',
+            max_queue_size=int(os.getenv('API_USAGE_QUEUE_SIZE', 1000)),
+            batch_size=int(os.getenv('API_USAGE_BATCH_SIZE', 50)),
+            flush_interval=float(os.getenv('API_USAGE_FLUSH_INTERVAL', 5)),
+        )
+        
         # Claude API 가격 (1M 토큰당)
         self.pricing = {
             "claude-3-opus": {"input": 15.0, "output": 75.0},
             "claude-3-sonnet": {"input": 3.0, "output": 15.0},
             "claude-3-haiku": {"input": 0.25, "output": 1.25},
-            "claude-3.5-sonnet": {"input": 3.0, "output": 15.0}
+            "claude-3.5-sonnet": {"input": 3.0, "output": 15.0},
+            "claude-3-5-sonnet-20241022": {"input": 3.0, "output": 15.0}
         }
+        # 프롬프트 캐시 토큰 단가 배율 (기본 입력 단가 대비)
+        self.cache_write_multiplier = 1.25
+        self.cache_read_multiplier = 0.1
+        # Message Batches 요청은 입력/출력 모두 50% 할인
+        self.batch_multiplier = 0.5
     
     def _init_database(self):
         """PostgreSQL 데이터베이스 초기화"""
         try:
-            with psycopg2.connect(**self.connection_params) as conn:
+            with self.db.connection() as conn:
                 cursor = conn.cursor()
                 
                 # API 사용 내역 테이블
@@ -63,6 +79,13 @@ class APITracker:
                     )
                 """)
                 
+                # 프롬프트 캐시 토큰 컬럼 (기존 테이블 호환)
+                cursor.execute(f"""
+                    ALTER TABLE {self.schema}.api_usage
+                    ADD COLUMN IF NOT EXISTS cache_creation_input_tokens INTEGER DEFAULT 0,
+                    ADD COLUMN IF NOT EXISTS cache_read_input_tokens INTEGER DEFAULT 0
+                """)
+                
                 # 인덱스 생성
                 cursor.execute(f"""
                     CREATE INDEX IF NOT EXISTS idx_api_usage_timestamp 
@@ -74,6 +97,9 @@ class APITracker:
                 """)
                 
                 conn.commit()
+            
+            # 일별 지표 롤업 (없으면 api_usage 생성 후에 만들고 기존 사용량으로 채움 - 별도 트랜잭션)
+            self.db.prepare_daily_metrics()
         except Exception as e:
             logger.error(f"데이터베이스 초기화 오류: {e}")
     
@@ -87,68 +113,122 @@ class APITracker:
                     purpose: str = None,
                     success: bool = True,
                     error_message: str = None,
-                    metadata: Dict = None):
-        """API 사용량 추적"""
+                    metadata: Dict = None,
+                    cache_creation_input_tokens: int = 0,
+                    cache_read_input_tokens: int = 0,
+                    batch: bool = False):
+        """API 사용량 추적 - 큐에 넣고 즉시 반환 (실제 INSERT는 백그라운드 배치)
+        
+        input_tokens는 캐시되지 않은 입력 토큰이며, 캐시 생성/적중 토큰은 별도로 받는다.
+        """
         try:
-            total_tokens = input_tokens + output_tokens
-            cost_usd = self.calculate_cost(model, input_tokens, output_tokens)
+            total_tokens = input_tokens + output_tokens + cache_creation_input_tokens + cache_read_input_tokens
+            cost_usd = self.calculate_cost(model, input_tokens, output_tokens,
+                                           cache_creation_input_tokens, cache_read_input_tokens,
+                                           batch=batch)
             
-            with psycopg2.connect(**self.connection_params) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute(f"""
-                    INSERT INTO {self.schema}.api_usage (
-                        service, model, endpoint, input_tokens, output_tokens, 
-                        total_tokens, cost_usd, site, purpose, success, error_message, metadata
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    service, model, endpoint, input_tokens, output_tokens,
-                    total_tokens, cost_usd, site, purpose, success, error_message,
-                    json.dumps(metadata) if metadata else None
-                ))
-                
-                conn.commit()
-                logger.info(f"API 사용량 기록: {service} {model} - {total_tokens} 토큰, ${cost_usd:.4f}")
+            self._write_queue.put({
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'service': service,
+                'model': model,
+                'endpoint': endpoint,
+                'input_tokens': input_tokens,
+                'output_tokens': output_tokens,
+                'total_tokens': total_tokens,
+                'cost_usd': cost_usd,
+                'site': site,
+                'purpose': purpose,
+                'success': success,
+                'error_message': error_message,
+                'metadata': metadata,
+                'cache_creation_input_tokens': cache_creation_input_tokens,
+                'cache_read_input_tokens': cache_read_input_tokens,
+            })
+            logger.info(f"API 사용량 기록: {service} {model} - {total_tokens} 토큰 "
+                        f"(캐시 적중 {cache_read_input_tokens}), ${cost_usd:.4f}")
                 
         except Exception as e:
             logger.error(f"API 사용량 추적 오류: {e}")
     
-    def calculate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
-        """토큰 사용량을 기반으로 비용 계산"""
+    def _insert_usage_batch(self, rows: List[Dict]):
+        """사용량 행 일괄 INSERT (execute_values로 1회 왕복)"""
+        with self.db.connection() as conn, conn.cursor() as cursor:
+            psycopg2.extras.execute_values(cursor, f"""
+                INSERT INTO {self.schema}.api_usage (
+                    timestamp, service, model, endpoint, input_tokens, output_tokens, 
+                    total_tokens, cost_usd, site, purpose, success, error_message, metadata,
+                    cache_creation_input_tokens, cache_read_input_tokens
+                ) VALUES %s
+            """, [(
+                row['timestamp'], row['service'], row['model'], row.get('endpoint'),
+                row['input_tokens'], row['output_tokens'], row['total_tokens'],
+                row['cost_usd'], row.get('site'), row.get('purpose'), row.get('success', True),
+                row.get('error_message'),
+                json.dumps(row['metadata']) if row.get('metadata') else None,
+                row.get('cache_creation_input_tokens', 0), row.get('cache_read_input_tokens', 0)
+            ) for row in rows], page_size=len(rows))
+            # 같은 트랜잭션에서 일별 롤업 증분 반영
+            self.db.record_daily_metrics(cursor, [{
+                'date': daily_metrics.metric_date(row['timestamp']),
+                'site': row.get('site'),
+                'kind': daily_metrics.KIND_API,
+                'count': 1,
+                'input_tokens': row['input_tokens'],
+                'output_tokens': row['output_tokens'],
+                'total_tokens': row['total_tokens'],
+                'cache_creation_tokens': row.get('cache_creation_input_tokens', 0),
+                'cache_read_tokens': row.get('cache_read_input_tokens', 0),
+                'cost_usd': row['cost_usd'],
+            } for row in rows])
+            conn.commit()
+        invalidate_responses('api_usage')
+    
+    def flush_usage(self, timeout: float = 30.0) -> bool:
+        """대기 중인 사용량 기록을 즉시 DB에 반영"""
+        return self._write_queue.flush(timeout)
+    
+    def get_queue_metrics(self) -> Dict:
+        """사용량 기록 큐 상태 (대기 건수, 배치 수, 보관/재기록 건수)"""
+        return self._write_queue.get_metrics()
+    
+    def calculate_cost(self, model: str, input_tokens: int, output_tokens: int,
+                       cache_creation_input_tokens: int = 0, cache_read_input_tokens: int = 0,
+                       batch: bool = False) -> float:
+        """토큰 사용량을 기반으로 비용 계산 (캐시 생성은 1.25배, 캐시 적중은 0.1배 입력 단가, 배치는 50%)"""
         if model not in self.pricing:
             return 0.0
         
         prices = self.pricing[model]
         input_cost = (input_tokens / 1_000_000) * prices["input"]
         output_cost = (output_tokens / 1_000_000) * prices["output"]
+        cache_cost = (
+            cache_creation_input_tokens * self.cache_write_multiplier +
+            cache_read_input_tokens * self.cache_read_multiplier
+        ) / 1_000_000 * prices["input"]
         
-        return input_cost + output_cost
+        total = input_cost + output_cost + cache_cost
+        return total * self.batch_multiplier if batch else total
+    
+    def _summarize_usage(self, start: date, end: date, site: str = None) -> Dict:
+        """[start, end] 기간 API 사용량 합계 (daily_metrics 롤업에서 일 단위로 합산)"""
+        totals = daily_metrics.sum_metrics(
+            self.db.get_daily_metrics(daily_metrics.KIND_API, start, end, site=site)
+        )
+        return {
+            'total_requests': totals['count'],
+            'total_input_tokens': totals['input_tokens'],
+            'total_output_tokens': totals['output_tokens'],
+            'total_tokens': totals['total_tokens'],
+            'total_cost_usd': totals['cost_usd'],
+            'total_cache_creation_tokens': totals['cache_creation_tokens'],
+            'total_cache_read_tokens': totals['cache_read_tokens']
+        }
     
     def get_today_usage(self) -> Dict:
         """오늘의 API 사용량 조회"""
         try:
-            with psycopg2.connect(**self.connection_params) as conn:
-                cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-                
-                cursor.execute(f"""
-                    SELECT 
-                        COUNT(*) as total_requests,
-                        SUM(input_tokens) as total_input_tokens,
-                        SUM(output_tokens) as total_output_tokens,
-                        SUM(total_tokens) as total_tokens,
-                        SUM(cost_usd) as total_cost_usd
-                    FROM {self.schema}.api_usage 
-                    WHERE DATE(timestamp) = CURRENT_DATE
-                """)
-                
-                result = cursor.fetchone()
-                return {
-                    'total_requests': result['total_requests'] or 0,
-                    'total_input_tokens': result['total_input_tokens'] or 0,
-                    'total_output_tokens': result['total_output_tokens'] or 0,
-                    'total_tokens': result['total_tokens'] or 0,
-                    'total_cost_usd': float(result['total_cost_usd'] or 0)
-                }
+            today = daily_metrics.metric_date()
+            return self._summarize_usage(today, today)
         except Exception as e:
             logger.error(f"오늘 사용량 조회 오류: {e}")
             return {
@@ -156,35 +236,24 @@ class APITracker:
                 'total_input_tokens': 0,
                 'total_output_tokens': 0,
                 'total_tokens': 0,
-                'total_cost_usd': 0.0
+                'total_cost_usd': 0.0,
+                'total_cache_creation_tokens': 0,
+                'total_cache_read_tokens': 0
             }
     
     def get_usage_by_site(self, site: str, days: int = 7) -> Dict:
-        """사이트별 API 사용량 조회"""
+        """사이트별 API 사용량 조회 (days일 전부터 오늘까지)"""
         try:
-            with psycopg2.connect(**self.connection_params) as conn:
-                cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-                
-                cursor.execute(f"""
-                    SELECT 
-                        COUNT(*) as total_requests,
-                        SUM(input_tokens) as total_input_tokens,
-                        SUM(output_tokens) as total_output_tokens,
-                        SUM(total_tokens) as total_tokens,
-                        SUM(cost_usd) as total_cost_usd
-                    FROM {self.schema}.api_usage 
-                    WHERE site = %s AND timestamp >= CURRENT_DATE - INTERVAL '%s days'
-                """, (site, days))
-                
-                result = cursor.fetchone()
-                return {
-                    'site': site,
-                    'total_requests': result['total_requests'] or 0,
-                    'total_input_tokens': result['total_input_tokens'] or 0,
-                    'total_output_tokens': result['total_output_tokens'] or 0,
-                    'total_tokens': result['total_tokens'] or 0,
-                    'total_cost_usd': float(result['total_cost_usd'] or 0)
-                }
+            today = daily_metrics.metric_date()
+            usage = self._summarize_usage(today - timedelta(days=days), today, site=site)
+            return {
+                'site': site,
+                'total_requests': usage['total_requests'],
+                'total_input_tokens': usage['total_input_tokens'],
+                'total_output_tokens': usage['total_output_tokens'],
+                'total_tokens': usage['total_tokens'],
+                'total_cost_usd': usage['total_cost_usd']
+            }
         except Exception as e:
             logger.error(f"사이트별 사용량 조회 오류: {e}")
             return {
@@ -204,31 +273,16 @@ class APITracker:
             month = datetime.now().month
             
         try:
-            with psycopg2.connect(**self.connection_params) as conn:
-                cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-                
-                cursor.execute(f"""
-                    SELECT 
-                        COUNT(*) as total_requests,
-                        SUM(input_tokens) as total_input_tokens,
-                        SUM(output_tokens) as total_output_tokens,
-                        SUM(total_tokens) as total_tokens,
-                        SUM(cost_usd) as total_cost_usd
-                    FROM {self.schema}.api_usage 
-                    WHERE EXTRACT(YEAR FROM timestamp) = %s 
-                    AND EXTRACT(MONTH FROM timestamp) = %s
-                """, (year, month))
-                
-                result = cursor.fetchone()
-                return {
-                    'year': year,
-                    'month': month,
-                    'total_requests': result['total_requests'] or 0,
-                    'total_input_tokens': result['total_input_tokens'] or 0,
-                    'total_output_tokens': result['total_output_tokens'] or 0,
-                    'total_tokens': result['total_tokens'] or 0,
-                    'total_cost_usd': float(result['total_cost_usd'] or 0)
-                }
+            usage = self._summarize_usage(*daily_metrics.month_range(year, month))
+            return {
+                'year': year,
+                'month': month,
+                'total_requests': usage['total_requests'],
+                'total_input_tokens': usage['total_input_tokens'],
+                'total_output_tokens': usage['total_output_tokens'],
+                'total_tokens': usage['total_tokens'],
+                'total_cost_usd': usage['total_cost_usd']
+            }
         except Exception as e:
             logger.error(f"월별 사용량 조회 오류: {e}")
             return {
@@ -244,7 +298,7 @@ class APITracker:
     def get_detailed_usage(self, limit: int = 100) -> List[Dict]:
         """상세 사용 내역 조회"""
         try:
-            with psycopg2.connect(**self.connection_params) as conn:
+            with self.db.connection() as conn:
                 cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
                 
                 cursor.execute(f"""
@@ -9,6 +9,8 @@ import time
 import threading
 from datetime import datetime, timedelta
 from .schedule_manager import schedule_manager
+from .postgresql_database import get_shared_database, release_thread_connections
+from .parallel_publisher import ParallelPublishExecutor, PublishTask, StageTimer
 from typing import Tuple
 import sys
 from pathlib import Path
@@ -18,8 +20,16 @@ class AutoPublisher:
     """자동 발행 스케줄러"""
     
     def __init__(self):
+        import os
+        
         self.running = False
         self.thread = None
+        # 병렬 발행 한도 (전체 동시 작업 수 / 사이트별 동시 작업 수)
+        self.max_workers = int(os.getenv('AUTO_PUBLISH_MAX_WORKERS', 4))
+        self.per_site_limit = int(os.getenv('AUTO_PUBLISH_PER_SITE_LIMIT', 1))
+        # 다음 주 주제 배치 사전 생성 (발행 시 준비된 초안 사용)
+        self.batch_pregeneration = os.getenv('BATCH_PREGENERATION', 'true').lower() != 'false'
+        self._pregenerator = None
         self.setup_schedule()
     
     def setup_schedule(self):
@@ -34,22 +44,27 @@ class AutoPublisher:
         # 매일 새벽 3시에 자동 발행 (월간 계획표 기반) - 한국 시간 기준
         schedule.every().day.at("03:00").do(self.daily_auto_publish)
         
+        if self.batch_pregeneration:
+            # 일요일 밤 다음 주 주제 배치 제출, 30분마다 완료된 배치를 초안으로 수집
+            schedule.every().sunday.at("21:00").do(self.pregenerate_next_week)
+            schedule.every(30).minutes.do(self.collect_pregenerated_drafts)
+        
         print("[AUTO_PUBLISHER] 자동 발행 스케줄 설정 완료 (한국시간 기준)")
         print("- 매일 새벽 3시 (KST): 월간 계획표 기반 자동 콘텐츠 생성 및 발행")
         print("- 월간 계획표: 매월 마지막 날 자동 생성")
+        if self.batch_pregeneration:
+            print("- 매주 일요일 21시 (KST): 다음 주 주제 배치 사전 생성")
         print(f"- 현재 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     def daily_auto_publish(self):
-        """일일 2개 카테고리 자동 발행 실행"""
-        from ..web_dashboard_pg import get_database
-        
+        """일일 2개 카테고리 자동 발행 실행 (사이트별 병렬)"""
         today = datetime.now().date()
         start_time = datetime.now()
         
         # 데이터베이스 로그 시작
         db = None
         try:
-            db = get_database()
+            db = get_shared_database()
             db.add_system_log(
                 level="INFO",
                 component="auto_publisher",
@@ -58,7 +73,9 @@ class AutoPublisher:
                     "date": str(today),
                     "start_time": start_time.isoformat(),
                     "day_of_week": today.weekday(),
-                    "dual_category": True
+                    "dual_category": True,
+                    "max_workers": self.max_workers,
+                    "per_site_limit": self.per_site_limit
                 }
             )
         except Exception as db_error:
@@ -71,134 +88,90 @@ class AutoPublisher:
             total_published = 0
             failed_sites = []
             
-            # 각 사이트별로 2개 카테고리 발행
+            # 1. 사이트별 오늘 주제 조회 (실패한 사이트만 제외)
+            from .monthly_schedule_manager import monthly_schedule_manager
+            tasks = []
+            site_topics = {}
             for site in sites:
-                site_start_time = datetime.now()
-                
                 try:
-                    print(f"\n[DUAL_PUBLISH] {site.upper()} 2개 카테고리 발행 시작")
-                    
-                    # 2개 카테고리 주제 가져오기 (월별 스케줄러 사용)
-                    from .monthly_schedule_manager import MonthlyScheduleManager
-                    manager = MonthlyScheduleManager()
-                    primary_topic, secondary_topic = manager.get_today_dual_topics(site)
-                    
-                    # Primary 카테고리 발행
-                    print(f"  Primary [{primary_topic['category']}]: {primary_topic['topic'][:50]}...")
-                    success_primary = self._execute_dual_category_publishing(site, primary_topic, "primary", db)
-                    
-                    if success_primary:
-                        total_published += 1
-                        print(f"  ✅ Primary 발행 완료")
-                    else:
-                        print(f"  ❌ Primary 발행 실패")
-                    
-                    # Secondary 카테고리 발행
-                    print(f"  Secondary [{secondary_topic['category']}]: {secondary_topic['topic'][:50]}...")
-                    success_secondary = self._execute_dual_category_publishing(site, secondary_topic, "secondary", db)
-                    
-                    if success_secondary:
-                        total_published += 1
-                        print(f"  ✅ Secondary 발행 완료")
-                    else:
-                        print(f"  ❌ Secondary 발행 실패")
-                    
-                    site_end_time = datetime.now()
-                    site_duration = (site_end_time - site_start_time).total_seconds()
-                    
-                    # 사이트별 결과
-                    if success_primary and success_secondary:
-                        print(f"🎉 {site.upper()} 2개 카테고리 발행 완료 (소요: {site_duration:.1f}초)")
-                        
-                        if db:
-                            db.add_system_log(
-                                level="INFO",
-                                component="auto_publisher",
-                                message=f"{site} 2개 카테고리 발행 완료",
-                                details={
-                                    "site": site,
-                                    "primary_topic": primary_topic['topic'],
-                                    "secondary_topic": secondary_topic['topic'],
-                                    "duration_seconds": site_duration,
-                                    "posts_published": 2
-                                },
-                                site=site,
-                                duration_ms=int(site_duration * 1000)
-                            )
-                    elif success_primary or success_secondary:
-                        print(f"⚠️  {site.upper()} 부분 성공 (1/2) (소요: {site_duration:.1f}초)")
-                        failed_sites.append(f"{site} (부분실패)")
-                        
-                        if db:
-                            db.add_system_log(
-                                level="WARNING",
-                                component="auto_publisher",
-                                message=f"{site} 2개 카테고리 부분 성공",
-                                details={
-                                    "site": site,
-                                    "primary_success": success_primary,
-                                    "secondary_success": success_secondary,
-                                    "duration_seconds": site_duration,
-                                    "posts_published": 1
-                                },
-                                site=site,
-                                duration_ms=int(site_duration * 1000)
-                            )
-                    else:
-                        print(f"💥 {site.upper()} 발행 실패 (소요: {site_duration:.1f}초)")
-                        failed_sites.append(site)
-                        
-                        if db:
-                            db.add_system_log(
-                                level="ERROR",
-                                component="auto_publisher",
-                                message=f"{site} 2개 카테고리 발행 실패",
-                                details={
-                                    "site": site,
-                                    "primary_topic": primary_topic.get('topic', ''),
-                                    "secondary_topic": secondary_topic.get('topic', ''),
-                                    "duration_seconds": site_duration,
-                                    "posts_published": 0
-                                },
-                                site=site,
-                                duration_ms=int(site_duration * 1000)
-                            )
-                    
-                    # 사이트 간 간격 (서버 부하 방지)
-                    time.sleep(60)  # 2개 포스팅이므로 더 긴 간격
-                    
+                    primary_topic, secondary_topic = monthly_schedule_manager.get_today_dual_topics(site)
+                    site_topics[site] = (primary_topic, secondary_topic)
+                    for category_type, topic_info in (("primary", primary_topic), ("secondary", secondary_topic)):
+                        if topic_info:
+                            tasks.append(PublishTask(site=site, topic_info=topic_info, category_type=category_type))
                 except Exception as site_error:
-                    site_end_time = datetime.now()
-                    site_duration = (site_end_time - site_start_time).total_seconds()
-                    
-                    print(f"💥 {site.upper()} 오류: {site_error}")
+                    print(f"💥 {site.upper()} 주제 조회 오류: {site_error}")
                     failed_sites.append(site)
-                    
                     if db:
-                        import traceback
                         db.add_system_log(
                             level="ERROR",
                             component="auto_publisher",
-                            message=f"{site} 2개 카테고리 발행 중 예외",
-                            details={
-                                "site": site,
-                                "error": str(site_error),
-                                "traceback": traceback.format_exc(),
-                                "duration_seconds": site_duration
-                            },
-                            site=site,
-                            duration_ms=int(site_duration * 1000)
+                            message=f"{site} 오늘 주제 조회 실패",
+                            details={"site": site, "error": str(site_error)},
+                            site=site
                         )
             
+            # 2. 사이트 간 병렬 실행 (생성/저장/발행 단계가 사이트 간에 겹쳐서 진행됨)
+            executor = ParallelPublishExecutor(max_workers=self.max_workers, per_site_limit=self.per_site_limit)
+            results = executor.run(
+                tasks,
+                lambda task, timer: self._execute_dual_category_publishing(
+                    task.site, task.topic_info, task.category_type, db, timer
+                )
+            )
+            
+            # 3. 사이트별 결과 집계
+            results_by_site = {}
+            for result in results:
+                results_by_site.setdefault(result.task.site, []).append(result)
+            
+            for site, site_results in results_by_site.items():
+                published = sum(1 for r in site_results if r.success)
+                total_published += published
+                site_duration = sum(r.duration for r in site_results)
+                primary_topic, secondary_topic = site_topics[site]
+                details = {
+                    "site": site,
+                    "primary_topic": primary_topic.get('topic', '') if primary_topic else '',
+                    "secondary_topic": secondary_topic.get('topic', '') if secondary_topic else '',
+                    "duration_seconds": site_duration,
+                    "posts_published": published,
+                    "stage_timings_ms": {r.task.category_type: r.stage_timings for r in site_results},
+                    "errors": [r.error for r in site_results if r.error]
+                }
+                
+                if published == len(site_results):
+                    print(f"🎉 {site.upper()} {published}개 카테고리 발행 완료 (소요: {site_duration:.1f}초)")
+                    level, message = "INFO", f"{site} 2개 카테고리 발행 완료"
+                elif published:
+                    print(f"⚠️  {site.upper()} 부분 성공 ({published}/{len(site_results)}) (소요: {site_duration:.1f}초)")
+                    failed_sites.append(f"{site} (부분실패)")
+                    level, message = "WARNING", f"{site} 2개 카테고리 부분 성공"
+                else:
+                    print(f"💥 {site.upper()} 발행 실패 (소요: {site_duration:.1f}초)")
+                    failed_sites.append(site)
+                    level, message = "ERROR", f"{site} 2개 카테고리 발행 실패"
+                
+                if db:
+                    db.add_system_log(
+                        level=level,
+                        component="auto_publisher",
+                        message=message,
+                        details=details,
+                        site=site,
+                        duration_ms=int(site_duration * 1000)
+                    )
+            
             # 전체 결과 요약
             end_time = datetime.now()
             total_duration = (end_time - start_time).total_seconds()
+            serial_duration = sum(r.duration for r in results)
             
             print(f"\n" + "="*60)
             print(f"📊 2개 카테고리 자동 발행 완료 - {end_time.strftime('%H:%M:%S')}")
             print(f"   • 총 발행: {total_published}/8개")
             print(f"   • 성공률: {total_published/8*100:.1f}%")
-            print(f"   • 소요시간: {total_duration/60:.1f}분")
+            print(f"   • 소요시간: {total_duration/60:.1f}분 (순차 실행 시 {serial_duration/60:.1f}분)")
             
             if failed_sites:
                 print(f"   • 실패 사이트: {', '.join(failed_sites)}")
@@ -221,6 +194,7 @@ class AutoPublisher:
                         "start_time": start_time.isoformat(),
                         "end_time": end_time.isoformat(),
                         "total_duration_minutes": total_duration/60,
+                        "serial_duration_minutes": serial_duration/60,
                         "dual_category": True
                     },
                     duration_ms=int(total_duration * 1000)
@@ -253,11 +227,9 @@ class AutoPublisher:
     
     def _execute_site_publishing(self, site: str, plan: dict) -> bool:
         """실제 사이트 발행 실행"""
-        from ..web_dashboard_pg import get_database
-        
         db = None
         try:
-            db = get_database()
+            db = get_shared_database()
         except:
             pass
             
@@ -313,14 +285,14 @@ class AutoPublisher:
     def _generate_and_publish_wordpress(self, site: str, plan: dict, db) -> bool:
         """WordPress 콘텐츠 생성 및 실제 사이트 발행"""
         try:
-            from ..generators.content_generator import ContentGenerator
+            from ..generators.content_generator import get_shared_generator
             from ..generators.wordpress_content_exporter import WordPressContentExporter
             from ..publishers.wordpress_publisher import WordPressPublisher
             
             # 1. 콘텐츠 생성
             print(f"[WP_PUBLISH] {site} AI 콘텐츠 생성 시작")
             
-            generator = ContentGenerator()
+            generator = get_shared_generator()
             exporter = WordPressContentExporter()
             
             site_config = {
@@ -450,12 +422,12 @@ class AutoPublisher:
     def _generate_tistory_content(self, site: str, plan: dict, db) -> bool:
         """Tistory 콘텐츠 생성"""
         try:
-            from ..generators.content_generator import ContentGenerator
+            from ..generators.content_generator import get_shared_generator
             from ..generators.tistory_content_exporter import TistoryContentExporter
             
             print(f"[TISTORY_PUBLISH] {site} AI 콘텐츠 생성 시작")
             
-            generator = ContentGenerator()
+            generator = get_shared_generator()
             exporter = TistoryContentExporter()
             
             site_config = {
@@ -532,8 +504,87 @@ class AutoPublisher:
                 )
             return False
 
-    def _execute_dual_category_publishing(self, site: str, topic_info: dict, category_type: str, db) -> bool:
+    def _site_config(self, site: str, topic_info: dict, category_type: str) -> dict:
+        """2개 카테고리 발행용 사이트 설정 (즉시 생성과 배치 사전 생성이 같은 설정 사용)"""
+        if site == 'tistory':
+            return {
+                'name': f'Tistory 블로그 - {category_type}',
+                'categories': [topic_info.get('category', 'general')],
+                'content_style': '친근하고 실용적인 톤',
+                'target_audience': '일반인',
+                'keywords_focus': topic_info.get('keywords', [])
+            }
+        return {
+            'name': f"{site} - {category_type}",
+            'categories': [topic_info.get('category', 'general')],
+            'content_style': '전문적이고 신뢰할 수 있는 톤',
+            'target_audience': '전문가 및 일반인',
+            'keywords_focus': topic_info.get('keywords', [])
+        }
+    
+    def _get_pregenerator(self):
+        """배치 사전 생성기 (생성기 초기화 실패 시 None)"""
+        if not self.batch_pregeneration:
+            return None
+        if self._pregenerator is None:
+            try:
+                from ..generators.batch_generator import BatchPreGenerator
+                self._pregenerator = BatchPreGenerator(self._site_config, db=get_shared_database())
+            except Exception as e:
+                print(f"[BATCH] 배치 사전 생성기 초기화 실패: {e}")
+                return None
+        return self._pregenerator
+    
+    def pregenerate_next_week(self):
+        """다음 주 월간 계획표 주제를 배치로 제출"""
+        pregenerator = self._get_pregenerator()
+        if not pregenerator:
+            return
+        try:
+            batch_id = pregenerator.submit_next_week()
+            if batch_id:
+                print(f"[BATCH] 다음 주 주제 배치 제출: {batch_id}")
+        except Exception as e:
+            print(f"[BATCH] 다음 주 배치 제출 오류: {e}")
+    
+    def collect_pregenerated_drafts(self):
+        """완료된 배치 결과를 초안으로 저장하고 날짜가 지난 미사용 초안 정리"""
+        pregenerator = self._get_pregenerator()
+        if not pregenerator:
+            return
+        try:
+            pregenerator.collect_ready_batches()
+            pregenerator.cleanup_stale_drafts()
+        except Exception as e:
+            print(f"[BATCH] 배치 결과 수집 오류: {e}")
+    
+    def _generate_or_load_draft(self, site: str, topic_info: dict, category_type: str,
+                                site_config: dict, timer: StageTimer) -> Tuple[dict, dict]:
+        """준비된 배치 초안이 있으면 사용하고, 없으면 즉시 생성 - (content, draft)"""
+        from ..generators.content_generator import get_shared_generator
+        
+        pregenerator = self._get_pregenerator()
+        if pregenerator:
+            with timer.stage('draft_load'):
+                draft = pregenerator.get_ready_draft(site, datetime.now().date(), category_type,
+                                                     topic_info['topic'])
+            if draft:
+                print(f"    ⚡ {site} [{category_type}] 사전 생성 초안 사용 (batch: {draft.get('batch_id')})")
+                return draft['content'], draft
+        
+        with timer.stage('generate'):
+            content = get_shared_generator().generate_content(
+                site_config=site_config,
+                topic=topic_info['topic'],
+                category=topic_info.get('category', 'general'),
+                content_length=topic_info.get('length', 'medium')
+            )
+        return content, None
+    
+    def _execute_dual_category_publishing(self, site: str, topic_info: dict, category_type: str, db,
+                                          timer: StageTimer = None) -> bool:
         """2개 카테고리 발행을 위한 단일 주제 발행"""
+        timer = timer or StageTimer()
         try:
             content_start_time = datetime.now()
             
@@ -542,11 +593,11 @@ class AutoPublisher:
             # 직접 콘텐츠 생성 함수 호출
             if site in ['unpre', 'untab', 'skewese']:
                 # WordPress 사이트 콘텐츠 생성 및 발행
-                success = self._generate_and_publish_wordpress_dual(site, topic_info, category_type, db)
+                success = self._generate_and_publish_wordpress_dual(site, topic_info, category_type, db, timer)
                 
             elif site == 'tistory':
                 # Tistory 콘텐츠 생성
-                success = self._generate_tistory_content_dual(site, topic_info, category_type, db)
+                success = self._generate_tistory_content_dual(site, topic_info, category_type, db, timer)
             else:
                 print(f"    ❌ {site} 지원하지 않는 사이트")
                 return False
@@ -567,7 +618,8 @@ class AutoPublisher:
                             "category_type": category_type,
                             "topic": topic_info.get('topic', ''),
                             "category": topic_info.get('category', ''),
-                            "duration_seconds": duration
+                            "duration_seconds": duration,
+                            "stage_timings_ms": timer.timings
                         },
                         site=site,
                         duration_ms=int(duration * 1000)
@@ -586,6 +638,7 @@ class AutoPublisher:
                             "topic": topic_info.get('topic', ''),
                             "category": topic_info.get('category', ''),
                             "duration_seconds": duration,
+                            "stage_timings_ms": timer.timings,
                             "error": "콘텐츠 생성 또는 발행 실패"
                         },
                         site=site,
@@ -612,45 +665,34 @@ class AutoPublisher:
                         "topic": topic_info.get('topic', ''),
                         "error": str(e),
                         "traceback": traceback.format_exc(),
-                        "duration_seconds": duration
+                        "duration_seconds": duration,
+                        "stage_timings_ms": timer.timings
                     },
                     site=site,
                     duration_ms=int(duration * 1000)
                 )
             return False
 
-    def _generate_and_publish_wordpress_dual(self, site: str, topic_info: dict, category_type: str, db) -> bool:
+    def _generate_and_publish_wordpress_dual(self, site: str, topic_info: dict, category_type: str, db,
+                                             timer: StageTimer = None) -> bool:
         """2개 카테고리용 WordPress 콘텐츠 생성 및 실제 사이트 발행"""
+        timer = timer or StageTimer()
         try:
-            from ..generators.content_generator import ContentGenerator
             from ..generators.wordpress_content_exporter import WordPressContentExporter
             from ..publishers.wordpress_publisher import WordPressPublisher
             
-            # 1. 콘텐츠 생성
+            # 1. 콘텐츠 생성 (사전 생성 초안 우선)
             print(f"    🎯 {site} [{category_type}] AI 콘텐츠 생성 시작")
             
-            generator = ContentGenerator()
             exporter = WordPressContentExporter()
-            
-            site_config = {
-                'name': f"{site} - {category_type}",
-                'categories': [topic_info.get('category', 'general')],
-                'content_style': '전문적이고 신뢰할 수 있는 톤',
-                'target_audience': '전문가 및 일반인',
-                'keywords_focus': topic_info.get('keywords', [])
-            }
-            
-            content = generator.generate_content(
-                site_config=site_config,
-                topic=topic_info['topic'],
-                category=topic_info.get('category', 'general'),
-                content_length=topic_info.get('length', 'medium')
-            )
+            site_config = self._site_config(site, topic_info, category_type)
+            content, draft = self._generate_or_load_draft(site, topic_info, category_type, site_config, timer)
             
             print(f"    📄 {site} [{category_type}] 콘텐츠 생성 완료: {content.get('title', 'Unknown')}")
             
             # 2. 파일 저장 (카테고리별로 구분)
-            filepath = exporter.export_content(site, content, category_suffix=category_type)
+            with timer.stage('export'):
+                filepath = exporter.export_content(site, content, category_suffix=category_type)
             print(f"    💾 {site} [{category_type}] 파일 저장 완료: {filepath}")
             
             # 3. 데이터베이스에 파일 정보 저장
@@ -661,21 +703,22 @@ class AutoPublisher:
                 content_text = content.get('introduction', '') + ' '.join([s.get('content', '') for s in content.get('sections', [])])
                 word_count = len(content_text.replace(' ', ''))
                 
-                file_id = db.add_content_file(
-                    site=site,
-                    title=f"[{category_type.upper()}] {content['title']}",
-                    file_path=filepath,
-                    file_type="wordpress",
-                    metadata={
-                        'tags': content.get('tags', []),
-                        'categories': [content.get('category', topic_info.get('category', 'general'))],
-                        'word_count': word_count,
-                        'file_size': file_size,
-                        'auto_generated': True,
-                        'dual_category': True,
-                        'category_type': category_type
-                    }
-                )
+                with timer.stage('db_save'):
+                    file_id = db.add_content_file(
+                        site=site,
+                        title=f"[{category_type.upper()}] {content['title']}",
+                        file_path=filepath,
+                        file_type="wordpress",
+                        metadata={
+                            'tags': content.get('tags', []),
+                            'categories': [content.get('category', topic_info.get('category', 'general'))],
+                            'word_count': word_count,
+                            'file_size': file_size,
+                            'auto_generated': True,
+                            'dual_category': True,
+                            'category_type': category_type
+                        }
+                    )
                 print(f"    💿 {site} [{category_type}] 데이터베이스 저장 완료 (ID: {file_id})")
                 
             # 4. WordPress 사이트에 실제 발행
@@ -695,11 +738,15 @@ class AutoPublisher:
             }
             
             # WordPress에 실제 발행
-            wp_success, wp_result = publisher.publish_post(content_data, images=[], draft=False)
+            with timer.stage('publish'):
+                wp_success, wp_result = publisher.publish_post(content_data, images=[], draft=False)
             
             if wp_success:
                 print(f"    🎉 {site} [{category_type}] WordPress 발행 성공: {wp_result}")
                 
+                if draft:
+                    self._pregenerator.mark_draft_published(draft)
+                
                 # 파일 상태 업데이트
                 if db and 'file_id' in locals():
                     db.update_content_file_status(
@@ -761,36 +808,24 @@ class AutoPublisher:
                 )
             return False
 
-    def _generate_tistory_content_dual(self, site: str, topic_info: dict, category_type: str, db) -> bool:
+    def _generate_tistory_content_dual(self, site: str, topic_info: dict, category_type: str, db,
+                                       timer: StageTimer = None) -> bool:
         """2개 카테고리용 Tistory 콘텐츠 생성"""
+        timer = timer or StageTimer()
         try:
-            from ..generators.content_generator import ContentGenerator
             from ..generators.tistory_content_exporter import TistoryContentExporter
             
             print(f"    🎯 {site} [{category_type}] AI 콘텐츠 생성 시작")
             
-            generator = ContentGenerator()
             exporter = TistoryContentExporter()
-            
-            site_config = {
-                'name': f'Tistory 블로그 - {category_type}',
-                'categories': [topic_info.get('category', 'general')],
-                'content_style': '친근하고 실용적인 톤',
-                'target_audience': '일반인',
-                'keywords_focus': topic_info.get('keywords', [])
-            }
-            
-            content = generator.generate_content(
-                site_config=site_config,
-                topic=topic_info['topic'],
-                category=topic_info.get('category', 'general'),
-                content_length=topic_info.get('length', 'medium')
-            )
+            site_config = self._site_config(site, topic_info, category_type)
+            content, draft = self._generate_or_load_draft(site, topic_info, category_type, site_config, timer)
             
             print(f"    📄 {site} [{category_type}] 콘텐츠 생성 완료: {content.get('title', 'Unknown')}")
             
             # 파일 저장 (카테고리별로 구분)
-            filepath = exporter.export_content(content, category_suffix=category_type)
+            with timer.stage('export'):
+                filepath = exporter.export_content(content, category_suffix=category_type)
             print(f"    💾 {site} [{category_type}] 파일 저장 완료: {filepath}")
             
             # 데이터베이스에 파일 정보 저장
@@ -798,20 +833,21 @@ class AutoPublisher:
                 content_text = content.get('introduction', '') + ' '.join([s.get('content', '') for s in content.get('sections', [])])
                 word_count = len(content_text.replace(' ', ''))
                 
-                file_id = db.add_content_file(
-                    site='tistory',
-                    title=f"[{category_type.upper()}] {content['title']}",
-                    file_path=filepath,
-                    file_type="tistory",
-                    metadata={
-                        'tags': content.get('tags', []),
-                        'categories': [content.get('category', topic_info.get('category', 'general'))],
-                        'word_count': word_count,
-                        'auto_generated': True,
-                        'dual_category': True,
-                        'category_type': category_type
-                    }
-                )
+                with timer.stage('db_save'):
+                    file_id = db.add_content_file(
+                        site='tistory',
+                        title=f"[{category_type.upper()}] {content['title']}",
+                        file_path=filepath,
+                        file_type="tistory",
+                        metadata={
+                            'tags': content.get('tags', []),
+                            'categories': [content.get('category', topic_info.get('category', 'general'))],
+                            'word_count': word_count,
+                            'auto_generated': True,
+                            'dual_category': True,
+                            'category_type': category_type
+                        }
+                    )
                 print(f"    💿 {site} [{category_type}] 데이터베이스 저장 완료 (ID: {file_id})")
                 
                 db.add_system_log(
@@ -827,6 +863,9 @@ class AutoPublisher:
                     },
                     site=site
                 )
+            
+            if draft:
+                self._pregenerator.mark_draft_published(draft)
                 
             return True
             
@@ -887,7 +926,11 @@ class AutoPublisher:
     def _run_scheduler(self):
         """스케줄러 실행 루프"""
         while self.running:
-            schedule.run_pending()
+            try:
+                schedule.run_pending()
+            finally:
+                # 이 스레드는 종료되지 않으므로 작업이 바인딩한 연결을 매 주기 반납
+                release_thread_connections()
             time.sleep(60)  # 1분마다 체크
     
     def get_next_run_time(self):
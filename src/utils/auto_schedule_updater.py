@@ -9,7 +9,8 @@ import os
 from datetime import datetime, date, timedelta, time
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
-from src.utils.postgresql_database import PostgreSQLDatabase
+from src.utils.postgresql_database import PostgreSQLDatabase, releases_connection
+from src.utils.response_cache import invalidate_responses
 import logging
 import calendar
 
@@ -385,6 +386,7 @@ class AutoScheduleUpdater:
         
         return schedule
     
+    @releases_connection
     def update_next_month_schedule(self):
         """다음 달 스케줄 자동 업데이트"""
         try:
@@ -432,6 +434,7 @@ class AutoScheduleUpdater:
                 inserted += 1
             
             conn.commit()
+            invalidate_responses('schedule')
             logger.info(f"[AUTO_SCHEDULE] {next_year}년 {next_month}월 스케줄 생성 완료: {inserted}개")
             
             cursor.close()
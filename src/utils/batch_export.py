@@ -0,0 +1,79 @@
+"""
+일괄 내보내기 공용 도구
+- atomic_file / atomic_write_text / atomic_write_json: 임시 파일에 쓴 뒤 os.replace → 중간에 실패해도 반쯤 쓴 파일이 남지 않음
+- map_exports(): 글 단위 렌더링(순수 CPU 작업)을 프로세스 풀에 나눠 실행하고 입력 순서대로 결과 반환
+  (글 하나가 실패해도 나머지는 계속, 실패 항목은 예외 객체로 반환)
+  웹 앱의 스레드/락/DB 연결을 복제하지 않도록 fork 대신 spawn으로 자식 프로세스 생성
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Sequence, TextIO
+
+logger = logging.getLogger(__name__)
+
+# 일괄 내보내기 프로세스 수 (1이면 현재 프로세스에서 순서대로 처리)
+EXPORT_WORKERS = int(os.getenv('EXPORT_WORKERS') or os.cpu_count() or 1)
+
+
+@contextmanager
+def atomic_file(path) -> Iterator[TextIO]:
+    """임시 파일 핸들을 넘겨주고 정상 종료 시 최종 경로로 교체 (예외 시 임시 파일 삭제)"""
+    path = Path(path)
+    # 같은 파일을 여러 스레드/프로세스가 동시에 써도 겹치지 않도록 임시 파일명을 유일하게 생성
+    tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent,
+                                      prefix=f"{path.name}.", suffix='.tmp', delete=False)
+    tmp_path = Path(tmp.name)
+    try:
+        with tmp as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def atomic_write_text(path, text: str) -> Path:
+    with atomic_file(path) as f:
+        f.write(text)
+    return Path(path)
+
+
+def atomic_write_json(path, data: Any, indent: int = 2) -> Path:
+    with atomic_file(path) as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent, default=str)
+    return Path(path)
+
+
+def map_exports(func: Callable, tasks: Sequence[tuple], workers: int = None) -> List[Any]:
+    """tasks의 인자 튜플마다 func(*args) 실행 (프로세스 풀), 입력 순서대로 결과 또는 예외 반환
+
+    func는 프로세스 간에 전달되므로 모듈 최상위 함수여야 한다.
+    """
+    workers = EXPORT_WORKERS if workers is None else workers
+    workers = max(1, min(workers, len(tasks)))
+    results: List[Any] = []
+
+    if workers == 1:
+        for args in tasks:
+            try:
+                results.append(func(*args))
+            except Exception as e:
+                logger.error(f"[BATCH_EXPORT] 내보내기 실패: {e}")
+                results.append(e)
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        futures = [pool.submit(func, *args) for args in tasks]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"[BATCH_EXPORT] 내보내기 실패: {e}")
+                results.append(e)
+    return results
@@ -0,0 +1,71 @@
+"""
+스케줄/주제 일괄 쓰기 도구
+- 원격 DB는 왕복 지연이 크므로 행마다 cursor.execute 하지 않고 execute_values로 한 문장(1회 왕복)에 보냄
+- bulk_upsert(): 자연키 기준 INSERT ... ON CONFLICT (DO UPDATE / DO NOTHING)
+- bulk_update(): id 등 키 컬럼 기준 UPDATE ... FROM (VALUES ...)
+커밋은 호출자가 담당 (호출자의 트랜잭션 안에서 실행)
+"""
+
+from typing import Dict, Iterable, Sequence, Tuple
+
+import psycopg2.extras
+
+
+def _dedupe(rows: Iterable[Sequence], key_index: Sequence[int]) -> list:
+    """같은 키가 여러 번 나오면 마지막 행만 남김 (한 INSERT ... ON CONFLICT 문에서 같은 행을 두 번 갱신할 수 없음)"""
+    unique: Dict[Tuple, Sequence] = {}
+    for row in rows:
+        unique[tuple(row[i] for i in key_index)] = row
+    return list(unique.values())
+
+
+def bulk_upsert(cursor, table: str, columns: Sequence[str], rows: Iterable[Sequence],
+                conflict: Sequence[str] = (), update: Sequence[str] = (),
+                template: str = None, touch_updated_at: bool = True) -> int:
+    """rows를 한 번에 INSERT, 자연키(conflict) 충돌 시 update 컬럼만 갱신 (update가 없으면 무시)
+
+    Returns:
+        전송한 행 수 (키 중복 제거 후)
+    """
+    rows = _dedupe(rows, [columns.index(c) for c in conflict]) if conflict else list(rows)
+    if not rows:
+        return 0
+
+    on_conflict = ''
+    if conflict:
+        target = ', '.join(conflict)
+        if update:
+            assignments = [f'{c} = EXCLUDED.{c}' for c in update]
+            if touch_updated_at:
+                assignments.append('updated_at = CURRENT_TIMESTAMP')
+            on_conflict = f"ON CONFLICT ({target}) DO UPDATE SET {', '.join(assignments)}"
+        else:
+            on_conflict = f"ON CONFLICT ({target}) DO NOTHING"
+
+    psycopg2.extras.execute_values(cursor, f"""
+        INSERT INTO {table} ({', '.join(columns)})
+        VALUES %s
+        {on_conflict}
+    """, rows, template=template, page_size=len(rows))
+    return len(rows)
+
+
+def bulk_update(cursor, table: str, key: str, columns: Sequence[str], rows: Iterable[Sequence],
+                template: str = None, touch_updated_at: bool = True) -> int:
+    """(key, *columns) 행들로 여러 행을 한 문장에 갱신
+
+    VALUES 목록은 타입 추론이 안 되므로 배열 등은 template에서 캐스팅 (예: '(%s, %s, %s::text[])')
+    """
+    rows = _dedupe(rows, [0])
+    if not rows:
+        return 0
+
+    assignments = [f'{c} = v.{c}' for c in columns]
+    if touch_updated_at:
+        assignments.append('updated_at = CURRENT_TIMESTAMP')
+    psycopg2.extras.execute_values(cursor, f"""
+        UPDATE {table} AS t SET {', '.join(assignments)}
+        FROM (VALUES %s) AS v ({key}, {', '.join(columns)})
+        WHERE t.{key} = v.{key}
+    """, rows, template=template, page_size=len(rows))
+    return len(rows)
@@ -0,0 +1,194 @@
+"""
+일별 지표 롤업 (daily_metrics)
+- (날짜, 사이트, 종류) 단위로 콘텐츠 생성/발행 건수와 API 사용량(요청 수, 토큰, 비용)을 누적
+- 원본 테이블에 쓰는 같은 트랜잭션 안에서 증분 UPSERT → 통계 조회는 이벤트 수가 아닌 일수에 비례
+- 기존 데이터는 backfill_daily_metrics()로 원본 테이블에서 재계산 (python backfill_daily_metrics.py)
+
+종류(kind):
+    content   - content_files 생성 건수 (삭제 시 차감)
+    published - 발행 전환 건수 (published_at 날짜 기준)
+    api       - api_usage 요청 수/토큰/비용
+"""
+
+import os
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+import logging
+
+import psycopg2.extras
+import pytz
+
+logger = logging.getLogger(__name__)
+
+# 날짜 버킷 기준 시간대 (대시보드와 동일하게 한국 시간)
+METRICS_TZ = os.getenv('DAILY_METRICS_TZ', 'Asia/Seoul')
+
+KIND_CONTENT = 'content'
+KIND_PUBLISHED = 'published'
+KIND_API = 'api'
+
+# 누적 컬럼 (count 외에는 api 종류에서만 사용)
+METRIC_FIELDS = ('count', 'input_tokens', 'output_tokens', 'total_tokens',
+                 'cache_creation_tokens', 'cache_read_tokens', 'cost_usd')
+
+
+def metric_date(value=None, tz: str = METRICS_TZ) -> date:
+    """이벤트 시각을 롤업 날짜로 변환
+
+    None이면 현재 시각, 문자열은 ISO 형식으로 해석하며
+    시간대 정보가 없는 시각은 tz 기준 현지 시각으로 본다.
+    """
+    zone = pytz.timezone(tz)
+    if value is None:
+        return datetime.now(zone).date()
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return value.date()
+        return value.astimezone(zone).date()
+    return value
+
+
+def aggregate_deltas(deltas: Iterable[Dict]) -> List[Tuple]:
+    """증분 목록을 (날짜, 사이트, 종류)별로 합산
+
+    한 INSERT ... ON CONFLICT 문에서 같은 키를 두 번 갱신할 수 없으므로 먼저 묶는다.
+    각 항목: {'date', 'site', 'kind', 'count', ...METRIC_FIELDS}
+    """
+    merged: Dict[Tuple, List] = {}
+    for delta in deltas:
+        key = (delta['date'], delta.get('site') or '', delta['kind'])
+        totals = merged.setdefault(key, [0] * len(METRIC_FIELDS))
+        for i, field in enumerate(METRIC_FIELDS):
+            totals[i] += delta.get(field) or 0
+    return [key + tuple(totals) for key, totals in merged.items()]
+
+
+def ensure_daily_metrics_table(cursor, schema: str) -> bool:
+    """롤업 테이블 생성 (새로 만든 경우 True - 호출자가 backfill_daily_metrics로 채움)"""
+    cursor.execute("SELECT to_regclass(%s)", (f"{schema}.daily_metrics",))
+    row = cursor.fetchone()
+    if row and row[0]:
+        return False
+
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {schema}.daily_metrics (
+            metric_date DATE NOT NULL,
+            site TEXT NOT NULL DEFAULT '',
+            kind TEXT NOT NULL,
+            count BIGINT NOT NULL DEFAULT 0,
+            input_tokens BIGINT NOT NULL DEFAULT 0,
+            output_tokens BIGINT NOT NULL DEFAULT 0,
+            total_tokens BIGINT NOT NULL DEFAULT 0,
+            cache_creation_tokens BIGINT NOT NULL DEFAULT 0,
+            cache_read_tokens BIGINT NOT NULL DEFAULT 0,
+            cost_usd NUMERIC(14,6) NOT NULL DEFAULT 0,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (metric_date, site, kind)
+        )
+    """)
+    cursor.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_daily_metrics_kind_date
+        ON {schema}.daily_metrics(kind, metric_date)
+    """)
+    logger.info(f"[DAILY_METRICS] {schema}.daily_metrics 테이블 생성")
+    return True
+
+
+def apply_deltas(cursor, schema: str, deltas: Iterable[Dict]) -> int:
+    """증분을 롤업에 더함 (호출자의 트랜잭션 안에서 실행, 커밋은 호출자가 담당)"""
+    rows = aggregate_deltas(deltas)
+    if not rows:
+        return 0
+    psycopg2.extras.execute_values(cursor, f"""
+        INSERT INTO {schema}.daily_metrics
+            (metric_date, site, kind, {', '.join(METRIC_FIELDS)})
+        VALUES %s
+        ON CONFLICT (metric_date, site, kind) DO UPDATE SET
+            {', '.join(f'{f} = daily_metrics.{f} + EXCLUDED.{f}' for f in METRIC_FIELDS)},
+            updated_at = CURRENT_TIMESTAMP
+    """, rows, page_size=len(rows))
+    return len(rows)
+
+
+def backfill_daily_metrics(cursor, schema: str, since: date = None, tz: str = METRICS_TZ) -> int:
+    """원본 테이블에서 롤업 재계산 (since 이후 날짜만, None이면 전체)
+
+    재계산 동안 롤업 테이블을 잠가 동시에 들어오는 증분 UPSERT가 끝날 때까지 기다리게 하므로,
+    원본에 INSERT 후 롤업을 갱신하는 쓰기 경로와 섞여도 중복/누락 없이 맞춰진다.
+    """
+    cursor.execute(f"LOCK TABLE {schema}.daily_metrics IN SHARE ROW EXCLUSIVE MODE")
+    since_filter = "WHERE metric_date >= %(since)s" if since else ""
+    cursor.execute(f"DELETE FROM {schema}.daily_metrics {since_filter}", {'since': since})
+
+    def day(col: str) -> str:
+        return f"({col} AT TIME ZONE %(tz)s)::date"
+
+    def where(col: str) -> str:
+        return f"WHERE {col} IS NOT NULL" + (f" AND {day(col)} >= %(since)s" if since else "")
+
+    params = {'tz': tz, 'since': since}
+    statements = [
+        f"""
+        INSERT INTO {schema}.daily_metrics (metric_date, site, kind, count)
+        SELECT {day('created_at')}, COALESCE(site, ''), '{KIND_CONTENT}', COUNT(*)
+        FROM {schema}.content_files
+        {where('created_at')}
+        GROUP BY 1, 2
+        """,
+        f"""
+        INSERT INTO {schema}.daily_metrics (metric_date, site, kind, count)
+        SELECT {day('published_at')}, COALESCE(site, ''), '{KIND_PUBLISHED}', COUNT(*)
+        FROM {schema}.content_files
+        {where('published_at')} AND status = 'published'
+        GROUP BY 1, 2
+        """,
+        f"""
+        INSERT INTO {schema}.daily_metrics (metric_date, site, kind, {', '.join(METRIC_FIELDS)})
+        SELECT {day('timestamp')}, COALESCE(site, ''), '{KIND_API}', COUNT(*),
+               COALESCE(SUM(input_tokens), 0), COALESCE(SUM(output_tokens), 0),
+               COALESCE(SUM(total_tokens), 0), COALESCE(SUM(cache_creation_input_tokens), 0),
+               COALESCE(SUM(cache_read_input_tokens), 0), COALESCE(SUM(cost_usd), 0)
+        FROM {schema}.api_usage
+        {where('timestamp')}
+        GROUP BY 1, 2
+        """,
+    ]
+    inserted = 0
+    for sql in statements:
+        cursor.execute(sql, params)
+        inserted += max(cursor.rowcount, 0)
+    return inserted
+
+
+def read_daily_metrics(cursor, schema: str, kind: str, start: date, end: date,
+                       site: str = None) -> List[Dict]:
+    """[start, end] 기간의 롤업 행 (날짜 오름차순)"""
+    site_filter = "AND site = %s" if site is not None else ""
+    params = [kind, start, end] + ([site] if site is not None else [])
+    cursor.execute(f"""
+        SELECT metric_date, site, {', '.join(METRIC_FIELDS)}
+        FROM {schema}.daily_metrics
+        WHERE kind = %s AND metric_date BETWEEN %s AND %s {site_filter}
+        ORDER BY metric_date, site
+    """, params)
+    columns = ('date', 'site') + METRIC_FIELDS
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def sum_metrics(rows: Iterable[Dict]) -> Dict:
+    """롤업 행 합계 (비용은 float)"""
+    totals = {field: 0 for field in METRIC_FIELDS}
+    for row in rows:
+        for field in METRIC_FIELDS:
+            totals[field] += row.get(field) or 0
+    totals['cost_usd'] = float(totals['cost_usd'])
+    return totals
+
+
+def month_range(year: int, month: int) -> Tuple[date, date]:
+    """해당 월의 첫날과 마지막 날"""
+    first = date(year, month, 1)
+    next_first = date(year + (month == 12), month % 12 + 1, 1)
+    return first, next_first - timedelta(days=1)
@@ -4,6 +4,7 @@
 
 from datetime import datetime, timedelta
 from src.utils.postgresql_database import PostgreSQLDatabase
+from src.utils.response_cache import invalidate_responses
 
 def import_dashboard_schedules():
     """대시보드에서 보여지는 계획표 데이터를 DB에 입력"""
@@ -101,6 +102,7 @@ def import_dashboard_schedules():
                 print(f"[IMPORT] {week_start} 주 완료")
             
             conn.commit()
+            invalidate_responses('schedule')
             print(f"[IMPORT] 총 {total_inserted}개 스케줄 DB 입력 완료")
             return True
             
@@ -0,0 +1,417 @@
+"""
+PostgreSQL 커넥션 풀 모듈
+- 최대 크기가 정해진 풀에서 연결을 빌려주고(checkout) 반납(checkin)받음
+- 헬스 체크는 일정 시간 이상 유휴 상태였던 연결에만 수행
+- 스레드별로 하나의 연결을 바인딩하여 트랜잭션이 스레드 간에 섞이지 않도록 함
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.pool
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PostgreSQLConnectionPool:
+    """스레드 안전한 PostgreSQL 커넥션 풀"""
+
+    def __init__(self, connection_params: Dict[str, Any], schema: str = None,
+                 min_size: int = 1, max_size: int = 10, max_overflow: int = 10,
+                 timeout: float = 30.0, health_check_after: float = 30.0,
+                 max_idle_time: float = 300.0):
+        """
+        Args:
+            connection_params: psycopg2.connect()에 전달할 연결 정보
+            schema: 연결 생성 시 설정할 search_path 스키마
+            min_size: 유휴 상태로 유지할 최소 연결 수
+            max_size: 반납 후 재사용되는 영구 연결 수
+            max_overflow: 부하 시 추가로 허용되는 임시 연결 수 (반납 시 종료)
+            timeout: 풀이 가득 찼을 때 연결을 기다리는 최대 시간(초)
+            health_check_after: 이 시간(초) 이상 유휴였던 연결만 SELECT 1로 확인
+            max_idle_time: 이 시간(초) 이상 유휴인 연결은 min_size 초과분에 한해 종료
+        """
+        self.connection_params = connection_params
+        self.schema = schema
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size)
+        self.max_overflow = max(0, max_overflow)
+        self.timeout = timeout
+        self.health_check_after = health_check_after
+        self.max_idle_time = max_idle_time
+
+        self._cond = threading.Condition(threading.Lock())
+        self._idle = deque()          # (conn, 반납 시각)
+        self._in_use = {}             # id(conn) -> (conn, owner thread, 오버플로 여부)
+        self._size = 0                # 현재 열려 있는 영구 연결 수
+        self._overflow = 0            # 현재 열려 있는 오버플로 연결 수
+        self._closed = False
+        self._local = threading.local()
+
+        self._metrics = {
+            'checkouts': 0,
+            'waits': 0,
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+            'timeouts': 0,
+            'connections_created': 0,
+            'connections_discarded': 0,
+            'health_checks': 0,
+            'health_check_failures': 0,
+            'reclaimed_from_dead_threads': 0,
+            'overflow_peak': 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 연결 생성/검사
+    # ------------------------------------------------------------------
+
+    def _connect(self):
+        """새 물리 연결 생성"""
+        conn = psycopg2.connect(**self.connection_params)
+        conn.autocommit = False
+        if self.schema:
+            with conn.cursor() as cursor:
+                cursor.execute(f"SET search_path TO {self.schema}, public")
+            conn.commit()
+        with self._cond:
+            self._metrics['connections_created'] += 1
+        self._local.opened = getattr(self._local, 'opened', 0) + 1
+        return conn
+
+    def _is_healthy(self, conn, idle_since: float) -> bool:
+        """유휴 연결 상태 확인 - 오래 쉬었던 연결만 왕복 쿼리로 검사"""
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self.health_check_after:
+            return True
+
+        with self._cond:
+            self._metrics['health_checks'] += 1
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            with self._cond:
+                self._metrics['health_check_failures'] += 1
+            return False
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            if not conn.closed:
+                conn.close()
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------
+    # checkout / checkin
+    # ------------------------------------------------------------------
+
+    def _pop_dead_owners(self) -> list:
+        """종료된 스레드에 남아 있는 연결을 사용 목록에서 꺼냄 (self._cond 보유 상태에서 호출)
+
+        롤백/종료는 네트워크 왕복이므로 호출자가 락을 놓은 뒤 _release_slot()으로 처리한다.
+        """
+        dead = [key for key, (_, owner, _) in self._in_use.items()
+                if owner is not None and not owner.is_alive()]
+        entries = []
+        for key in dead:
+            conn, _, is_overflow = self._in_use.pop(key)
+            self._metrics['reclaimed_from_dead_threads'] += 1
+            entries.append((conn, is_overflow))
+        return entries
+
+    def _release_slot(self, conn, is_overflow: bool):
+        """반납된 연결을 유휴 큐로 돌리거나 종료 (self._cond 없이 호출)
+
+        롤백과 종료는 락 밖에서 수행하고, 큐/카운터 갱신만 락을 다시 잡아 처리한다.
+        """
+        reusable = not conn.closed and not is_overflow and not self._closed
+        if reusable:
+            try:
+                if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                reusable = False
+        if not reusable:
+            self._close_quietly(conn)
+
+        with self._cond:
+            if reusable and self._closed:
+                # 롤백하는 사이 풀이 닫힘
+                reusable = False
+            if reusable:
+                self._idle.append((conn, time.monotonic()))
+                stale = self._trim_idle()
+            else:
+                stale = []
+                self._metrics['connections_discarded'] += 1
+                if is_overflow:
+                    self._overflow -= 1
+                else:
+                    self._size -= 1
+            self._cond.notify()
+
+        for old in stale:
+            self._close_quietly(old)
+
+    def checkout(self, timeout: float = None):
+        """풀에서 연결 하나를 빌림 - 가득 찼으면 timeout까지 대기"""
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        waited = False
+
+        while True:
+            candidate = None
+            open_kind = None
+            dead = []
+
+            with self._cond:
+                if self._closed:
+                    raise psycopg2.pool.PoolError("connection pool is closed")
+
+                while True:
+                    if self._idle:
+                        candidate = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        open_kind = 'persistent'
+                        break
+                    if self._overflow < self.max_overflow:
+                        self._overflow += 1
+                        self._metrics['overflow_peak'] = max(self._metrics['overflow_peak'], self._overflow)
+                        open_kind = 'overflow'
+                        break
+                    dead = self._pop_dead_owners()
+                    if dead:
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._metrics['timeouts'] += 1
+                        raise psycopg2.pool.PoolError(
+                            f"connection pool exhausted (max_size={self.max_size}, "
+                            f"max_overflow={self.max_overflow}, timeout={timeout}s)"
+                        )
+                    waited = True
+                    self._cond.wait(remaining)
+
+            if dead:
+                for conn, is_overflow in dead:
+                    self._release_slot(conn, is_overflow)
+                continue
+
+            if candidate is not None:
+                conn, idle_since = candidate
+                if not self._is_healthy(conn, idle_since):
+                    logger.warning("유휴 연결 헬스 체크 실패 - 연결을 교체합니다.")
+                    self._close_quietly(conn)
+                    with self._cond:
+                        self._metrics['connections_discarded'] += 1
+                        self._size -= 1
+                    continue
+                is_overflow = False
+            else:
+                is_overflow = open_kind == 'overflow'
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        if is_overflow:
+                            self._overflow -= 1
+                        else:
+                            self._size -= 1
+                        self._cond.notify()
+                    raise
+
+            with self._cond:
+                self._in_use[id(conn)] = (conn, threading.current_thread(), is_overflow)
+                self._metrics['checkouts'] += 1
+                if waited:
+                    wait_time = time.monotonic() - started
+                    self._metrics['waits'] += 1
+                    self._metrics['wait_time_total'] += wait_time
+                    self._metrics['wait_time_max'] = max(self._metrics['wait_time_max'], wait_time)
+            self._local.checkouts = getattr(self._local, 'checkouts', 0) + 1
+            return conn
+
+    def checkin(self, conn):
+        """빌린 연결 반납 - 끝나지 않은 트랜잭션은 롤백"""
+        with self._cond:
+            entry = self._in_use.pop(id(conn), None)
+        if entry is None:
+            # 이미 회수되었거나 풀 소유가 아닌 연결
+            self._close_quietly(conn)
+            return
+        self._release_slot(conn, entry[2])
+
+    def _trim_idle(self) -> list:
+        """min_size를 넘는 오래된 유휴 연결을 큐에서 빼서 반환 (self._cond 보유 상태에서 호출, 종료는 호출자가 락 밖에서)"""
+        now = time.monotonic()
+        stale = []
+        while len(self._idle) > self.min_size:
+            conn, idle_since = self._idle[0]
+            if now - idle_since < self.max_idle_time:
+                break
+            self._idle.popleft()
+            stale.append(conn)
+            self._size -= 1
+            self._metrics['connections_discarded'] += 1
+        return stale
+
+    # ------------------------------------------------------------------
+    # 스레드 바인딩
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def connection(self):
+        """스레드 범위 연결 컨텍스트
+
+        같은 스레드에서 중첩 호출되면 바깥의 연결(=같은 트랜잭션)을 그대로 사용한다.
+        가장 바깥 블록이 끝나면 연결이 풀로 반납되고, 예외가 발생하면 롤백된다.
+        """
+        bound = getattr(self._local, 'conn', None)
+        if bound is not None and not bound.closed:
+            try:
+                yield bound
+            except Exception:
+                self._rollback_quietly(bound)
+                raise
+            return
+
+        conn = self.checkout()
+        self._local.conn = conn
+        self._local.scoped = True
+        try:
+            yield conn
+        except Exception:
+            self._rollback_quietly(conn)
+            raise
+        finally:
+            self._local.conn = None
+            self._local.scoped = False
+            self.checkin(conn)
+
+    def bind_thread(self):
+        """현재 스레드에 연결을 고정 바인딩하여 반환 (release_thread 전까지 유지)"""
+        bound = getattr(self._local, 'conn', None)
+        if bound is not None and not bound.closed:
+            return bound
+        if bound is not None:
+            # 호출자가 직접 close()한 연결 - 자리만 반환
+            self.checkin(bound)
+        conn = self.checkout()
+        self._local.conn = conn
+        self._local.scoped = False
+        return conn
+
+    def release_thread(self):
+        """현재 스레드에 고정된 연결을 풀로 반납"""
+        bound = getattr(self._local, 'conn', None)
+        if bound is None or getattr(self._local, 'scoped', False):
+            return
+        self._local.conn = None
+        self.checkin(bound)
+
+    def acquire(self) -> 'PooledConnection':
+        """close() 호출 시 풀로 반납되는 연결 반환 (psycopg2.connect() 대체용)"""
+        return PooledConnection(self, self.checkout())
+
+    @staticmethod
+    def _rollback_quietly(conn):
+        try:
+            if not conn.closed:
+                conn.rollback()
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------
+    # 상태/종료
+    # ------------------------------------------------------------------
+
+    def reset_thread_stats(self):
+        """현재 스레드의 연결 생성/대여 카운터 초기화 (요청 시작 시 호출)"""
+        self._local.opened = 0
+        self._local.checkouts = 0
+
+    def get_thread_stats(self) -> Dict[str, int]:
+        """현재 스레드가 마지막 초기화 이후 새로 연 연결 수와 대여 횟수"""
+        return {
+            'opened': getattr(self._local, 'opened', 0),
+            'checkouts': getattr(self._local, 'checkouts', 0),
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """풀 메트릭 스냅샷"""
+        with self._cond:
+            metrics = dict(self._metrics)
+            metrics.update({
+                'max_size': self.max_size,
+                'max_overflow': self.max_overflow,
+                'open_connections': self._size + self._overflow,
+                'in_use': len(self._in_use),
+                'idle': len(self._idle),
+                'overflow_in_use': self._overflow,
+                'avg_wait_time': (metrics['wait_time_total'] / metrics['waits']) if metrics['waits'] else 0.0,
+            })
+            return metrics
+
+    def closeall(self):
+        """모든 유휴 연결 종료 및 풀 닫기 (사용 중인 연결은 반납 시 종료)"""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.popleft()
+                self._close_quietly(conn)
+                self._size -= 1
+            self._cond.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+
+class PooledConnection:
+    """풀에서 빌린 연결 프록시 - close()는 물리 연결을 닫지 않고 풀로 반납"""
+
+    def __init__(self, pool: PostgreSQLConnectionPool, conn):
+        self._pool = pool
+        self._conn = conn
+        self._returned = False
+
+    def close(self):
+        if not self._returned:
+            self._returned = True
+            self._pool.checkin(self._conn)
+
+    @property
+    def closed(self):
+        return 1 if self._returned else self._conn.closed
+
+    def __enter__(self):
+        self._conn.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # psycopg2와 동일하게 블록 종료 시 커밋/롤백만 수행 (연결은 유지)
+        return self._conn.__exit__(exc_type, exc_value, traceback)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -0,0 +1,149 @@
+"""
+대시보드 실시간 이벤트 스트림 (Server-Sent Events)
+- 발행 상태(publish_status)가 바뀌거나 새 로그가 추가되면 대기 중인 스트림을 즉시 깨움
+- 이벤트 id는 "<발행 상태 버전>:<로그 seq>" → 재연결 시 Last-Event-ID로 놓친 변경만 이어서 전송
+- 연결은 max_duration 후 종료하고 브라우저 EventSource가 자동 재연결 (워커 스레드 장기 점유 방지)
+"""
+
+import copy
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from src.utils.log_buffer import LogRingBuffer
+
+
+class ChangeNotifier:
+    """변경 카운터 + 조건 변수 (여러 스트림이 동시에 대기)"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._counter = 0
+
+    @property
+    def counter(self) -> int:
+        with self._cond:
+            return self._counter
+
+    def notify(self):
+        with self._cond:
+            self._counter += 1
+            self._cond.notify_all()
+
+    def wait(self, seen: int, timeout: float) -> int:
+        """카운터가 seen과 달라질 때까지(또는 timeout까지) 대기 후 현재 카운터 반환"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._counter != seen, timeout)
+            return self._counter
+
+
+class PublishStatus(dict):
+    """값이 바뀔 때마다 version을 올리고 notifier로 알리는 발행 상태 dict
+
+    최상위 키 설정/update/reset은 잠금 안에서 처리된다. results, jobs처럼 안쪽 객체를 바꿀 때는
+    반드시 mutate()를 쓴다 - snapshot()이 잠금을 잡고 deepcopy하는 동안 잠금 밖에서 바꾸면
+    'dictionary changed size during iteration'으로 스트림/조회가 실패한다.
+    """
+
+    def __init__(self, notifier: ChangeNotifier, **initial):
+        super().__init__(**initial)
+        self.notifier = notifier
+        self.version = 0
+        self._lock = threading.RLock()
+
+    def touch(self):
+        """변경 알림만 보냄 (내용 변경은 mutate()로)"""
+        with self._lock:
+            self.version += 1
+        self.notifier.notify()
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+        self.touch()
+
+    def update(self, *args, **kwargs):
+        with self._lock:
+            super().update(*args, **kwargs)
+        self.touch()
+
+    def reset(self, **values):
+        """전체 상태 교체 (변경 알림 1회)"""
+        with self._lock:
+            super().clear()
+            super().update(values)
+        self.touch()
+
+    def mutate(self, fn: Callable[[Dict[str, Any]], Any]) -> Any:
+        """잠금을 잡은 채로 fn(상태)을 실행하고 변경을 알림 - fn의 반환값을 그대로 반환
+
+        results.append(), jobs[...] 갱신처럼 안쪽 객체를 바꾸는 코드는 모두 fn 안에서 실행한다.
+        """
+        with self._lock:
+            result = fn(self)
+        self.touch()
+        return result
+
+    def snapshot(self) -> Tuple[int, Dict[str, Any]]:
+        """(version, 상태 복사본) - 백그라운드 스레드가 바꾸는 중에도 일관된 사본"""
+        with self._lock:
+            return self.version, copy.deepcopy(dict(self))
+
+
+def parse_event_id(event_id: Optional[str]) -> Tuple[int, int]:
+    """Last-Event-ID → (발행 상태 버전, 로그 seq), 없거나 잘못되면 (-1, 0)"""
+    try:
+        status_version, log_seq = (event_id or '').split(':')
+        return int(status_version), int(log_seq)
+    except ValueError:
+        return -1, 0
+
+
+def format_sse(event: str, data: Any, event_id: str = None) -> str:
+    """SSE 메시지 한 건 직렬화"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, default=str)}")
+    return '\n'.join(lines) + '\n\n'
+
+
+def stream_events(status: PublishStatus, logs: LogRingBuffer, notifier: ChangeNotifier,
+                  last_event_id: str = None, topics=('publish', 'logs'),
+                  heartbeat: float = 15.0, max_duration: float = 60.0,
+                  clock: Callable[[], float] = time.monotonic) -> Iterator[str]:
+    """발행 상태/로그 변경을 SSE 문자열로 내보내는 제너레이터
+
+    처음 연결(Last-Event-ID 없음)이면 현재 발행 상태를 먼저 보내고 로그는 지금 이후부터 보낸다.
+    """
+    status_version, log_seq = parse_event_id(last_event_id)
+    if last_event_id is None:
+        log_seq = logs.last_seq
+    elif log_seq > logs.last_seq:
+        # 서버 재시작으로 seq가 초기화된 경우 버퍼 처음부터
+        log_seq = 0
+    deadline = clock() + max_duration
+
+    yield "retry: 1000\n\n"
+    while True:
+        seen = notifier.counter
+
+        if 'publish' in topics and status.version != status_version:
+            status_version, data = status.snapshot()
+            yield format_sse('publish_status', data, f"{status_version}:{log_seq}")
+
+        if 'logs' in topics:
+            entries, last_seq, truncated = logs.since(log_seq)
+            if entries:
+                log_seq = last_seq
+                yield format_sse('logs', {'logs': entries, 'truncated': truncated},
+                                 f"{status_version}:{log_seq}")
+
+        remaining = deadline - clock()
+        if remaining <= 0:
+            return
+        if notifier.wait(seen, min(heartbeat, remaining)) == seen:
+            # 변경 없이 heartbeat 경과 → 프록시가 연결을 끊지 않도록 주석 전송
+            yield ": keepalive\n\n"
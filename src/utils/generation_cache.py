@@ -0,0 +1,114 @@
+"""
+콘텐츠 생성 결과 디스크 캐시
+- 렌더링된 프롬프트와 모델 파라미터의 해시를 키로 파싱된 결과(dict)를 저장
+- TTL이 지난 항목은 무시하고 삭제, 최대 개수를 넘으면 가장 오래 쓰지 않은 항목부터 제거(LRU)
+- 프로세스 재시작 후에도 유지되며 적중/미스 지표 제공
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationCache:
+    """TTL + LRU 디스크 캐시 (항목당 JSON 파일 1개, 파일 mtime을 최근 사용 시각으로 사용)"""
+
+    def __init__(self, cache_dir: str, ttl: float = 21600, max_entries: int = 500):
+        """
+        Args:
+            cache_dir: 캐시 파일 디렉터리
+            ttl: 항목 유효 시간(초)
+            max_entries: 보관할 최대 항목 수
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._metrics = {'hits': 0, 'misses': 0, 'bypassed': 0, 'writes': 0, 'expired': 0, 'evictions': 0}
+
+    @staticmethod
+    def make_key(request: Dict[str, Any], version: str = '') -> str:
+        """요청 파라미터(모델/시스템/메시지 등) + 프롬프트 버전으로 키 생성"""
+        payload = json.dumps({'version': version, 'request': request},
+                             ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """유효한 항목이면 복사본 반환, 없거나 만료되면 None"""
+        path = self._path(key)
+        with self._lock:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except FileNotFoundError:
+                self._metrics['misses'] += 1
+                return None
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"[GEN_CACHE] 손상된 캐시 항목 삭제: {path.name}: {e}")
+                path.unlink(missing_ok=True)
+                self._metrics['misses'] += 1
+                return None
+
+            if time.time() - entry.get('created_at', 0) > self.ttl:
+                path.unlink(missing_ok=True)
+                self._metrics['expired'] += 1
+                self._metrics['misses'] += 1
+                return None
+
+            os.utime(path)  # LRU 순서 갱신
+            self._metrics['hits'] += 1
+        return copy.deepcopy(entry['value'])
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """항목 저장 (임시 파일에 쓴 뒤 교체) 후 초과분 제거"""
+        with self._lock:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                path = self._path(key)
+                tmp_path = path.with_suffix('.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'created_at': time.time(), 'value': value}, f, ensure_ascii=False, default=str)
+                os.replace(tmp_path, path)
+                self._metrics['writes'] += 1
+                self._evict()
+            except OSError as e:
+                logger.warning(f"[GEN_CACHE] 캐시 저장 실패: {e}")
+
+    def record_bypass(self):
+        with self._lock:
+            self._metrics['bypassed'] += 1
+
+    def _evict(self):
+        """최대 개수를 넘으면 최근 사용이 가장 오래된 항목부터 삭제 (_lock 보유 상태)"""
+        entries = list(self.cache_dir.glob('*.json'))
+        overflow = len(entries) - self.max_entries
+        if overflow <= 0:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[:overflow]:
+            path.unlink(missing_ok=True)
+            self._metrics['evictions'] += 1
+
+    def clear(self):
+        with self._lock:
+            for path in self.cache_dir.glob('*.json'):
+                path.unlink(missing_ok=True)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = dict(self._metrics)
+        lookups = metrics['hits'] + metrics['misses']
+        metrics['hit_rate'] = round(metrics['hits'] / lookups, 3) if lookups else 0.0
+        metrics['entries'] = len(list(self.cache_dir.glob('*.json'))) if self.cache_dir.exists() else 0
+        return metrics
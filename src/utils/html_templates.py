@@ -0,0 +1,81 @@
+"""
+내보내기용 HTML 문서 템플릿 (Jinja2)
+- templates/export/*.html을 한 번 컴파일해 프로세스 전역 Environment에 캐시 (글마다 다시 파싱하지 않음)
+- 공통 CSS는 static/css/로 분리해 <link>로 참조 → 글 파일마다 수백 줄 CSS를 반복 저장하지 않음
+  (사이트별 색상만 템플릿에서 CSS 변수로 주입)
+- render_to_file(): 템플릿 출력을 조각 단위로 임시 파일에 기록 후 교체
+- inline_stylesheets(): 다운로드처럼 단독으로 열릴 HTML은 링크된 CSS를 <style>로 되돌려 넣음
+"""
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from markupsafe import Markup
+
+from src.utils.batch_export import atomic_file
+from src.utils.markdown_renderer import render_markdown
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+TEMPLATE_DIR = PROJECT_ROOT / 'templates' / 'export'
+STATIC_DIR = PROJECT_ROOT / 'static'
+
+# CSS 링크 앞에 붙일 주소 (비우면 대시보드 서버 기준 /static/...)
+EXPORT_ASSET_BASE_URL = os.getenv('EXPORT_ASSET_BASE_URL', '').rstrip('/')
+
+# 템플릿이 만드는 CSS 링크 (inline_stylesheets가 찾는 형식)
+_STYLESHEET_LINK = re.compile(r'<link rel="stylesheet" href="[^"]*/static/(css/[\w.-]+\.css)" data-export-css>')
+
+_environment = None
+_environment_lock = threading.Lock()
+
+
+def asset_url(path: str) -> str:
+    return f"{EXPORT_ASSET_BASE_URL}/static/{path}"
+
+
+def get_environment() -> Environment:
+    """컴파일된 템플릿을 캐시하는 공유 Environment"""
+    global _environment
+    with _environment_lock:
+        if _environment is None:
+            env = Environment(
+                loader=FileSystemLoader(str(TEMPLATE_DIR)),
+                autoescape=select_autoescape(['html']),
+                auto_reload=False,
+                trim_blocks=True,
+                lstrip_blocks=True,
+            )
+            env.globals['asset_url'] = asset_url
+            env.filters['markdown'] = lambda text, theme, highlight=(): Markup(
+                render_markdown(text, theme, highlight))
+            _environment = env
+        return _environment
+
+
+def render(template_name: str, **context: Any) -> str:
+    """템플릿을 문자열로 렌더링"""
+    return get_environment().get_template(template_name).render(**context)
+
+
+def render_to_file(template_name: str, path, **context: Any) -> str:
+    """템플릿 출력을 임시 파일에 스트리밍 기록한 뒤 교체하고 경로 반환"""
+    stream = get_environment().get_template(template_name).stream(**context)
+    stream.enable_buffering(64)
+    with atomic_file(path) as f:
+        stream.dump(f)
+    return str(path)
+
+
+def inline_stylesheets(html: str) -> str:
+    """템플릿이 링크한 공통 CSS를 <style> 블록으로 치환 (파일이 없으면 링크 유지)"""
+    def replace(match: 're.Match') -> str:
+        css_path = STATIC_DIR / match.group(1)
+        if not css_path.is_file():
+            return match.group(0)
+        return f"<style>\n{css_path.read_text(encoding='utf-8')}</style>"
+
+    return _STYLESHEET_LINK.sub(replace, html)
@@ -0,0 +1,170 @@
+"""
+외부 HTTP 호출용 공유 세션
+- 호스트별 requests.Session 1개를 프로세스 전체에서 재사용 → keep-alive로 TCP/TLS 연결 재사용
+- 연결 풀 크기 제한 (HTTP_POOL_MAXSIZE) - 동시 발행이 몰려도 사이트당 연결 수가 고정
+- 429/5xx, 연결 오류는 지터를 준 지수 백오프로 재시도하며 Retry-After 헤더를 우선 존중
+- 호스트별 요청 수/오류/재시도/지연 시간 지표 (get_http_metrics)
+
+POST처럼 멱등이 아닌 요청은 서버가 처리하지 않았다고 확실한 경우(429, 503, 연결 타임아웃)만 재시도한다.
+"""
+
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 10))
+HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', 3))
+HTTP_BACKOFF_BASE = float(os.getenv('HTTP_BACKOFF_BASE', 1.0))
+HTTP_BACKOFF_MAX = float(os.getenv('HTTP_BACKOFF_MAX', 30.0))
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# 멱등이 아닌 요청도 재시도해도 되는 상태 (서버가 요청을 처리하지 않음)
+UNPROCESSED_STATUSES = frozenset({429, 503})
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _host_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def get_session(url: str) -> requests.Session:
+    """URL 호스트의 공유 세션 (없으면 연결 풀 크기를 제한한 세션 생성)"""
+    key = _host_key(url)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            # 재시도는 request()에서 직접 처리 (Retry-After/지표 반영)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE,
+                                  max_retries=0, pool_block=True)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _sessions[key] = session
+        return session
+
+
+def close_sessions():
+    """모든 공유 세션 종료 (프로세스 종료/테스트용)"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def retry_after_seconds(value: Optional[str], now: datetime = None) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜) → 대기 초, 해석 불가면 None"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        until = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if until.tzinfo is None:
+        until = until.replace(tzinfo=timezone.utc)
+    return max((until - (now or datetime.now(timezone.utc))).total_seconds(), 0.0)
+
+
+def backoff_delay(attempt: int, base: float = HTTP_BACKOFF_BASE, cap: float = HTTP_BACKOFF_MAX,
+                  rand: Callable[[float, float], float] = random.uniform) -> float:
+    """attempt번째 재시도 전 대기 (full jitter: 0 ~ min(cap, base * 2^attempt))"""
+    return rand(0, min(cap, base * (2 ** attempt)))
+
+
+class HttpMetrics:
+    """호스트별 요청 지표 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, host: str, elapsed: float, status: Optional[int], retried: bool):
+        with self._lock:
+            stats = self._hosts.setdefault(host, {
+                'requests': 0, 'errors': 0, 'retries': 0,
+                'total_ms': 0.0, 'max_ms': 0.0, 'last_status': None
+            })
+            stats['requests'] += 1
+            stats['retries'] += retried
+            stats['errors'] += status is None or status >= 400
+            stats['total_ms'] += elapsed * 1000
+            stats['max_ms'] = max(stats['max_ms'], elapsed * 1000)
+            stats['last_status'] = status
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                host: dict(stats,
+                           total_ms=round(stats['total_ms'], 1),
+                           max_ms=round(stats['max_ms'], 1),
+                           avg_ms=round(stats['total_ms'] / stats['requests'], 1))
+                for host, stats in self._hosts.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._hosts.clear()
+
+
+http_metrics = HttpMetrics()
+
+
+def get_http_metrics() -> Dict[str, Dict[str, Any]]:
+    return http_metrics.snapshot()
+
+
+def request(method: str, url: str, max_retries: int = None,
+            session: requests.Session = None, sleep: Callable[[float], None] = time.sleep,
+            **kwargs) -> requests.Response:
+    """공유 세션으로 HTTP 요청 (재시도 포함)
+
+    재시도를 다 쓰면 마지막 응답을 그대로 반환하고, 연결 오류면 마지막 예외를 다시 던진다.
+    """
+    method = method.upper()
+    max_retries = HTTP_MAX_RETRIES if max_retries is None else max_retries
+    session = session or get_session(url)
+    host = urlsplit(url).netloc
+    idempotent = method in IDEMPOTENT_METHODS
+
+    attempt = 0
+    while True:
+        started = time.monotonic()
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            http_metrics.record(host, time.monotonic() - started, None, attempt > 0)
+            # POST는 연결 수립 전 실패만 재시도 (요청이 서버에 전달됐을 수 있는 경우 제외)
+            retryable = idempotent or isinstance(e, requests.ConnectTimeout)
+            if attempt >= max_retries or not retryable:
+                raise
+            delay = backoff_delay(attempt)
+            logger.warning(f"[HTTP] {method} {host} 연결 오류, {delay:.1f}초 후 재시도: {e}")
+        else:
+            status = response.status_code
+            http_metrics.record(host, time.monotonic() - started, status, attempt > 0)
+            allowed = RETRY_STATUSES if idempotent else UNPROCESSED_STATUSES
+            if attempt >= max_retries or status not in allowed:
+                return response
+            retry_after = retry_after_seconds(response.headers.get('Retry-After'))
+            delay = min(retry_after, HTTP_BACKOFF_MAX) if retry_after is not None else backoff_delay(attempt)
+            logger.warning(f"[HTTP] {method} {host} {status}, {delay:.1f}초 후 재시도")
+            response.close()
+        attempt += 1
+        sleep(delay)
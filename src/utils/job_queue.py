@@ -0,0 +1,377 @@
+"""
+영속 발행 작업 큐 (PostgreSQL publish_jobs 테이블)
+- 작업은 상태(queued → running → succeeded/failed)와 함께 DB에 저장 → 재시작해도 유실되지 않음
+- 멱등 키(종류:사이트:날짜:카테고리) UNIQUE → 여러 워커/스케줄러가 같은 발행을 두 번 넣어도 한 번만 실행
+  (실패로 끝난 작업만 같은 키로 다시 넣으면 재대기)
+- 작업 획득은 FOR UPDATE SKIP LOCKED + 리스(lease): 실행 중에는 주기적으로 리스를 연장하고,
+  프로세스가 죽어 리스가 만료된 작업은 다른 워커가 다시 가져감
+- 처리 함수가 예외를 던지거나 {'success': False, 'retryable': True}를 반환하면 지수 백오프로 재시도,
+  max_attempts를 넘으면 failed ('retryable' 없는 실패 결과는 원격 발행 여부를 알 수 없으므로 바로 failed)
+"""
+
+import json
+import os
+import socket
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+import psycopg2.extras
+
+logger = logging.getLogger(__name__)
+
+STATE_QUEUED = 'queued'
+STATE_RUNNING = 'running'
+STATE_SUCCEEDED = 'succeeded'
+STATE_FAILED = 'failed'
+ACTIVE_STATES = (STATE_QUEUED, STATE_RUNNING)
+
+
+def idempotency_key(kind: str, site: str, day: date, category: str = None) -> str:
+    """발행 작업 멱등 키 (종류, 사이트, 날짜, 카테고리)"""
+    return f"{kind}:{site}:{day.isoformat()}:{category or '-'}"
+
+
+@dataclass
+class Job:
+    """publish_jobs 행"""
+    id: int
+    kind: str
+    site: Optional[str]
+    idempotency_key: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    state: str = STATE_QUEUED
+    attempts: int = 0
+    max_attempts: int = 3
+    result: Optional[Dict[str, Any]] = None
+    last_error: Optional[str] = None
+    run_after: Optional[datetime] = None
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'Job':
+        return cls(**{k: row[k] for k in cls.__dataclass_fields__ if k in row})
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = dict(self.__dict__)
+        for key in ('run_after', 'lease_expires_at', 'created_at', 'updated_at'):
+            if data[key]:
+                data[key] = data[key].isoformat()
+        return data
+
+
+class JobQueue:
+    """publish_jobs 테이블 기반 작업 큐"""
+
+    def __init__(self, db, lease_seconds: float = 900, retry_base: float = 60,
+                 retry_max: float = 3600):
+        """
+        Args:
+            db: PostgreSQLDatabase (connection() 컨텍스트 매니저와 schema 제공)
+            lease_seconds: 작업 획득 후 리스 유지 시간(초) - 워커가 주기적으로 연장
+            retry_base: 첫 재시도 대기(초), 이후 시도마다 2배
+            retry_max: 재시도 대기 상한(초)
+        """
+        self.db = db
+        self.schema = db.schema
+        self.lease_seconds = lease_seconds
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self._table_ready = False
+        self._table_lock = threading.Lock()
+
+    def _ensure_table(self, cursor):
+        if self._table_ready:
+            return
+        with self._table_lock:
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.schema}.publish_jobs (
+                    id BIGSERIAL PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    site TEXT,
+                    idempotency_key TEXT NOT NULL UNIQUE,
+                    payload JSONB NOT NULL DEFAULT '{{}}',
+                    state TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL DEFAULT 3,
+                    result JSONB,
+                    last_error TEXT,
+                    run_after TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    lease_owner TEXT,
+                    lease_expires_at TIMESTAMPTZ,
+                    created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_publish_jobs_ready
+                ON {self.schema}.publish_jobs (run_after, id) WHERE state IN ('queued', 'running')
+            """)
+            self._table_ready = True
+
+    def _execute(self, sql: str, params=(), fetch: str = 'one'):
+        with self.db.connection() as conn, conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            self._ensure_table(cursor)
+            cursor.execute(sql, params)
+            rows = cursor.fetchall() if fetch == 'all' else cursor.fetchone() if fetch == 'one' else None
+            conn.commit()
+        return rows
+
+    # ------------------------------------------------------------------
+    # 생산자 API
+    # ------------------------------------------------------------------
+
+    def enqueue(self, kind: str, site: str, key: str, payload: Dict[str, Any] = None,
+                max_attempts: int = 3) -> tuple:
+        """작업 추가 - 같은 멱등 키가 대기/실행/성공 상태로 있으면 기존 작업 반환
+
+        실패(failed)로 끝난 작업은 같은 키로 다시 요청하면 시도 횟수를 초기화해 다시 대기시킨다
+        (실패한 발행을 버튼으로 다시 실행할 수 있도록).
+
+        반환: (Job, 새로 추가/재대기됐는지 여부)
+        """
+        row = self._execute(f"""
+            INSERT INTO {self.schema}.publish_jobs (kind, site, idempotency_key, payload, max_attempts)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (idempotency_key) DO UPDATE SET
+                state = 'queued', attempts = 0, payload = EXCLUDED.payload,
+                max_attempts = EXCLUDED.max_attempts, result = NULL, last_error = NULL,
+                run_after = CURRENT_TIMESTAMP, lease_owner = NULL, lease_expires_at = NULL,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE publish_jobs.state = 'failed'
+            RETURNING *
+        """, (kind, site, key, json.dumps(payload or {}, ensure_ascii=False, default=str), max_attempts))
+        if row:
+            logger.info(f"[JOB_QUEUE] 작업 추가 #{row['id']} {key}")
+            return Job.from_row(row), True
+        return self.get_by_key(key), False
+
+    def get(self, job_id: int) -> Optional[Job]:
+        row = self._execute(f"SELECT * FROM {self.schema}.publish_jobs WHERE id = %s", (job_id,))
+        return Job.from_row(row) if row else None
+
+    def get_by_key(self, key: str) -> Optional[Job]:
+        row = self._execute(f"SELECT * FROM {self.schema}.publish_jobs WHERE idempotency_key = %s", (key,))
+        return Job.from_row(row) if row else None
+
+    def list_jobs(self, state: str = None, limit: int = 50) -> List[Job]:
+        """최근 작업 목록 (state 지정 시 해당 상태만)"""
+        condition = "WHERE state = %s" if state else ""
+        params = ([state] if state else []) + [limit]
+        rows = self._execute(f"""
+            SELECT * FROM {self.schema}.publish_jobs {condition}
+            ORDER BY id DESC LIMIT %s
+        """, params, fetch='all')
+        return [Job.from_row(row) for row in rows]
+
+    # ------------------------------------------------------------------
+    # 워커 API
+    # ------------------------------------------------------------------
+
+    def claim(self, worker_id: str, kinds: List[str] = None) -> Optional[Job]:
+        """실행할 작업 1건 획득 (대기 중이거나 리스가 만료된 실행 중 작업)
+
+        리스가 만료됐는데 시도 횟수를 다 쓴 작업(실행 중 프로세스가 반복해서 죽은 경우)은
+        다시 실행하지 않고 failed로 정리한다.
+        """
+        self._execute(f"""
+            UPDATE {self.schema}.publish_jobs
+            SET state = 'failed', last_error = COALESCE(last_error, '리스 만료 (워커 중단)'),
+                lease_owner = NULL, lease_expires_at = NULL, updated_at = CURRENT_TIMESTAMP
+            WHERE state = 'running' AND lease_expires_at < CURRENT_TIMESTAMP
+              AND attempts >= max_attempts
+        """, fetch=None)
+
+        kind_filter = "AND kind = ANY(%s)" if kinds else ""
+        params = [worker_id, self.lease_seconds] + ([list(kinds)] if kinds else [])
+        row = self._execute(f"""
+            UPDATE {self.schema}.publish_jobs j
+            SET state = 'running', attempts = j.attempts + 1,
+                lease_owner = %s,
+                lease_expires_at = CURRENT_TIMESTAMP + make_interval(secs => %s),
+                updated_at = CURRENT_TIMESTAMP
+            FROM (
+                SELECT id FROM {self.schema}.publish_jobs
+                WHERE ((state = 'queued' AND run_after <= CURRENT_TIMESTAMP)
+                       OR (state = 'running' AND lease_expires_at < CURRENT_TIMESTAMP))
+                  {kind_filter}
+                ORDER BY run_after, id
+                FOR UPDATE SKIP LOCKED
+                LIMIT 1
+            ) next_job
+            WHERE j.id = next_job.id
+            RETURNING j.*
+        """, params)
+        return Job.from_row(row) if row else None
+
+    def extend_lease(self, job: Job, worker_id: str) -> bool:
+        """실행 중 리스 연장 (다른 워커가 가져갔으면 False)"""
+        row = self._execute(f"""
+            UPDATE {self.schema}.publish_jobs
+            SET lease_expires_at = CURRENT_TIMESTAMP + make_interval(secs => %s),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = %s AND state = 'running' AND lease_owner = %s
+            RETURNING id
+        """, (self.lease_seconds, job.id, worker_id))
+        return row is not None
+
+    def complete(self, job: Job, worker_id: str, result: Dict[str, Any] = None,
+                 success: bool = True) -> bool:
+        """처리 결과 기록 (success=False는 재시도 없이 failed)"""
+        row = self._execute(f"""
+            UPDATE {self.schema}.publish_jobs
+            SET state = %s, result = %s, lease_owner = NULL, lease_expires_at = NULL,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = %s AND lease_owner = %s
+            RETURNING id
+        """, (STATE_SUCCEEDED if success else STATE_FAILED,
+              json.dumps(result or {}, ensure_ascii=False, default=str), job.id, worker_id))
+        return row is not None
+
+    def retry_delay(self, attempts: int) -> float:
+        """attempts번 실패 후 다음 시도까지 대기(초)"""
+        return min(self.retry_base * (2 ** max(attempts - 1, 0)), self.retry_max)
+
+    def fail(self, job: Job, worker_id: str, error: str) -> str:
+        """예외로 끝난 작업 - 시도 횟수가 남았으면 백오프 후 재대기, 아니면 failed
+
+        반환: 변경된 상태
+        """
+        state = STATE_QUEUED if job.attempts < job.max_attempts else STATE_FAILED
+        self._execute(f"""
+            UPDATE {self.schema}.publish_jobs
+            SET state = %s, last_error = %s, lease_owner = NULL, lease_expires_at = NULL,
+                run_after = CURRENT_TIMESTAMP + make_interval(secs => %s),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = %s AND lease_owner = %s
+        """, (state, error[:2000], self.retry_delay(job.attempts), job.id, worker_id), fetch=None)
+        return state
+
+
+class JobWorkerPool:
+    """작업 큐를 폴링하며 종류별 처리 함수를 실행하는 워커 스레드 풀"""
+
+    def __init__(self, queue: JobQueue, handlers: Dict[str, Callable[[Job], Dict[str, Any]]],
+                 concurrency: int = 2, poll_interval: float = 5.0,
+                 on_finish: Callable[[Job, str, Dict[str, Any]], None] = None):
+        """
+        Args:
+            queue: 작업 큐
+            handlers: 종류 → 처리 함수 (결과 dict 반환, 'success': False면 실패 처리 -
+                      'retryable': True가 함께 있으면 백오프 후 재시도, 없으면 재시도 없이 failed)
+            concurrency: 동시에 실행할 작업 수 (워커 스레드 수)
+            poll_interval: 빈 큐일 때 다시 확인하는 주기(초) - wake()로 즉시 깨울 수 있음
+            on_finish: 작업이 끝날 때 (job, 상태, 결과) 콜백 (대시보드 상태 갱신용)
+        """
+        self.queue = queue
+        self.handlers = handlers
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.on_finish = on_finish
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._threads: List[threading.Thread] = []
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._metrics = {'claimed': 0, 'succeeded': 0, 'failed': 0, 'retried': 0}
+        self._metrics_lock = threading.Lock()
+
+    def start(self):
+        if self._threads:
+            return
+        self._stop.clear()
+        for index in range(self.concurrency):
+            worker_id = f"{self.worker_prefix}:{index}"
+            thread = threading.Thread(target=self._run, args=(worker_id,),
+                                      name=f'publish-job-worker-{index}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"[JOB_QUEUE] 워커 {self.concurrency}개 시작 ({self.worker_prefix})")
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def wake(self):
+        """새 작업이 들어왔음을 알려 대기 중인 워커를 즉시 깨움"""
+        self._wakeup.set()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        metrics['concurrency'] = self.concurrency
+        metrics['alive_workers'] = sum(1 for t in self._threads if t.is_alive())
+        return metrics
+
+    def _count(self, key: str):
+        with self._metrics_lock:
+            self._metrics[key] += 1
+
+    def _run(self, worker_id: str):
+        while not self._stop.is_set():
+            try:
+                job = self.queue.claim(worker_id, list(self.handlers))
+            except Exception as e:
+                logger.error(f"[JOB_QUEUE] 작업 획득 실패: {e}")
+                job = None
+            if job is None:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+            self._count('claimed')
+            self.run_job(job, worker_id)
+
+    def run_job(self, job: Job, worker_id: str):
+        """작업 1건 실행 - 실행 중에는 리스를 주기적으로 연장"""
+        done = threading.Event()
+
+        def heartbeat():
+            while not done.wait(self.queue.lease_seconds / 3):
+                try:
+                    if not self.queue.extend_lease(job, worker_id):
+                        logger.warning(f"[JOB_QUEUE] 작업 #{job.id} 리스 상실")
+                        return
+                except Exception as e:
+                    logger.warning(f"[JOB_QUEUE] 작업 #{job.id} 리스 연장 실패: {e}")
+
+        threading.Thread(target=heartbeat, name=f'publish-job-lease-{job.id}', daemon=True).start()
+        logger.info(f"[JOB_QUEUE] 작업 #{job.id} 시작 ({job.idempotency_key}, {job.attempts}/{job.max_attempts}회)")
+        try:
+            result = self.handlers[job.kind](job) or {}
+            success = result.get('success', True)
+            if not success and result.get('retryable'):
+                # 원격 발행 확인 전에 실패 (생성/네트워크/5xx) - 예외와 같이 백오프 재시도
+                error = str(result.get('error') or result.get('message') or '재시도 가능한 실패')
+                state = self.queue.fail(job, worker_id, error)
+                logger.warning(f"[JOB_QUEUE] 작업 #{job.id} 실패 ({state}): {error}")
+            else:
+                self.queue.complete(job, worker_id, result, success=success)
+                state = STATE_SUCCEEDED if success else STATE_FAILED
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+            state = self.queue.fail(job, worker_id, str(e))
+            logger.error(f"[JOB_QUEUE] 작업 #{job.id} 오류 ({state}): {e}")
+        finally:
+            done.set()
+            # 처리 함수가 get_connection()으로 워커 스레드에 묶은 연결 반납 (워커 스레드는 종료되지 않음)
+            release = getattr(self.queue.db, 'release_connection', None)
+            if release:
+                try:
+                    release()
+                except Exception as e:
+                    logger.warning(f"[JOB_QUEUE] 작업 #{job.id} 연결 반납 실패: {e}")
+
+        self._count({STATE_SUCCEEDED: 'succeeded', STATE_FAILED: 'failed'}.get(state, 'retried'))
+        if self.on_finish:
+            try:
+                self.on_finish(job, state, result)
+            except Exception as e:
+                logger.warning(f"[JOB_QUEUE] 완료 콜백 오류: {e}")
@@ -0,0 +1,90 @@
+"""
+대시보드 로그 버퍼
+- 고정 용량 링 버퍼: 여러 스레드가 동시에 추가해도 안전하며, 항목마다 단조 증가하는 seq 부여
+- since(seq)로 마지막으로 받은 seq 이후 항목만 조회 → 폴링 비용이 새 로그 수에 비례
+- tail_lines(): 로그 파일 끝에서부터 블록 단위로 읽어 마지막 N줄만 반환 (파일 크기와 무관)
+"""
+
+import os
+import threading
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+
+class LogRingBuffer:
+    """seq가 붙은 고정 용량 로그 링 버퍼 (스레드 안전)"""
+
+    def __init__(self, capacity: int = 200, notifier=None):
+        """
+        Args:
+            capacity: 보관할 최대 항목 수
+            notifier: 항목 추가 시 notify()를 호출할 객체 (실시간 스트림 대기자 깨우기)
+        """
+        self.capacity = max(1, capacity)
+        self.notifier = notifier
+        self._entries: deque = deque(maxlen=self.capacity)
+        self._last_seq = 0
+        self._lock = threading.Lock()
+
+    def append(self, entry: Dict[str, Any]) -> int:
+        """항목 추가 후 부여된 seq 반환 (용량 초과 시 가장 오래된 항목이 밀려남)"""
+        with self._lock:
+            self._last_seq += 1
+            seq = self._last_seq
+            self._entries.append(dict(entry, seq=seq))
+        if self.notifier is not None:
+            self.notifier.notify()
+        return seq
+
+    @property
+    def last_seq(self) -> int:
+        with self._lock:
+            return self._last_seq
+
+    def since(self, seq: int = 0, limit: int = None) -> Tuple[List[Dict[str, Any]], int, bool]:
+        """seq 이후 항목 (오래된 순)
+
+        반환: (항목 목록, 마지막 seq, 누락 여부)
+        limit이 있으면 가장 오래된 limit개만 반환하고 마지막 seq는 반환한 마지막 항목의 seq가 되므로,
+        그 값으로 다시 조회하면 나머지를 이어 받는다.
+        누락 여부는 요청한 seq 다음 항목이 이미 버퍼에서 밀려난 경우 True.
+        """
+        with self._lock:
+            last_seq = self._last_seq
+            if not self._entries or seq >= last_seq:
+                return [], last_seq, False
+            first_seq = self._entries[0]['seq']
+            # seq는 연속이므로 위치를 바로 계산 (앞에서부터 훑지 않음)
+            start = max(seq + 1 - first_seq, 0)
+            end = len(self._entries) if limit is None else min(start + max(1, limit), len(self._entries))
+            entries = [self._entries[i] for i in range(start, end)]
+            truncated = seq + 1 < first_seq
+        return entries, entries[-1]['seq'], truncated
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """현재 버퍼 전체 복사본 (오래된 순)"""
+        with self._lock:
+            return list(self._entries)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def tail_lines(path: str, count: int = 50, block_size: int = 8192,
+               encoding: str = 'utf-8') -> List[str]:
+    """파일 마지막 count줄 (끝에서부터 블록 단위로 읽어 필요한 만큼만 읽음)"""
+    if count <= 0:
+        return []
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b''
+        # 마지막 줄 뒤 개행까지 고려해 count+1개의 개행을 찾을 때까지 읽음
+        while position > 0 and data.count(b'\n') <= count:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+    lines = data.decode(encoding, errors='replace').splitlines()
+    return lines[-count:]
@@ -0,0 +1,290 @@
+"""
+Markdown → HTML 단일 패스 렌더러
+- 블록(코드 블록, 표, 목록, 인용, 구분선, 제목, HTML, 문단)은 줄을 한 번만 훑으며 판별
+- 인라인 서식(코드, 굵게, 기울임, 키워드 강조)은 미리 컴파일한 정규식 하나로 치환 → 본문 길이에 선형
+- 스타일은 MarkdownTheme(태그별 속성 문자열) 데이터로 주입
+  DASHBOARD_THEME: 대시보드 미리보기 (CSS 클래스)
+  WORDPRESS_THEME: WordPress 에디터용 (인라인 스타일)
+  PREVIEW_THEME:   내보내기 미리보기 페이지 (페이지 CSS + 코드 복사 버튼)
+  TISTORY_THEME:   Tistory 붙여넣기용 (기본 태그 + 키워드 강조)
+- app.py 미리보기, WordPress/Tistory 내보내기가 같은 렌더러를 사용하므로 발행 경로와 무관하게 구조가 같음
+"""
+
+import html
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_FENCE = re.compile(r'^```\s*([\w+#.-]*)\s*$')
+_TABLE_SEPARATOR = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')
+_HR = re.compile(r'^(-{3,}|\*{3,}|_{3,})$')
+_HEADING = re.compile(r'^(#{1,6})\s+(.+?)\s*#*$')
+_UL_ITEM = re.compile(r'^[-*+]\s+(.+)$')
+_OL_ITEM = re.compile(r'^\d+[.)]\s+(.+)$')
+_HTML_BLOCK = re.compile(r'^</?[a-zA-Z][\w-]*[\s/>]')
+_HTML_TABLE_TAGS = re.compile(r'<(table|th|td)>|</table>')
+_CALLOUT = re.compile(r'^(💡|⚠️|🎯|📌|✅|❌)')
+
+# 인라인: ```코드``` | `코드` | **굵게** | *기울임* (키워드 강조는 렌더 호출마다 뒤에 붙여 컴파일)
+_INLINE_BASE = (r'```(?P<code3>.+?)```'
+                r'|`(?P<code>[^`\n]+)`'
+                r'|\*\*(?P<strong>.+?)\*\*'
+                r'|(?<![\w*])\*(?![\s*])(?P<em>[^*\n]+?)(?<!\s)\*(?![\w*])')
+
+
+@dataclass(frozen=True)
+class MarkdownTheme:
+    """태그별 속성 문자열 (예: {'p': 'class="content-paragraph"'})
+
+    키: p, ul, ol, li, strong, em, code, code_block(코드 블록 감싸는 div), pre,
+        table_wrap(표 감싸는 div), table, th, td, hr, blockquote, h1~h6,
+        callout / callout_strong (강조 박스), highlight (키워드 강조 span)
+    """
+    name: str
+    attrs: Dict[str, str] = field(default_factory=dict)
+    callouts: bool = False  # 💡/⚠️ 등으로 시작하는 줄을 강조 박스로
+    code_toolbar: str = ''  # 코드 블록 div 안 맨 앞에 넣을 HTML (복사 버튼 등)
+
+    def open(self, tag: str, key: str = None) -> str:
+        attr = self.attrs.get(key or tag)
+        return f'<{tag} {attr}>' if attr else f'<{tag}>'
+
+
+PLAIN_THEME = MarkdownTheme('plain')
+
+DASHBOARD_THEME = MarkdownTheme('dashboard', {
+    'p': 'class="content-paragraph"',
+    'ul': 'class="styled-list"',
+    'ol': 'class="styled-list"',
+    'code': 'class="inline-code"',
+    'code_block': 'class="code-block"',
+    'table_wrap': 'class="table-container"',
+    'hr': 'class="section-divider"',
+})
+
+WORDPRESS_THEME = MarkdownTheme('wordpress', {
+    'p': 'style="margin: 15px 0; line-height: 1.7;"',
+    'strong': 'style="color: #2c3e50; font-weight: 600;"',
+    'ul': 'style="padding-left: 20px; margin: 15px 0;"',
+    'ol': 'style="padding-left: 20px; margin: 15px 0;"',
+    'li': 'style="margin: 8px 0; line-height: 1.6;"',
+    'hr': 'style="border: none; border-top: 2px solid #ecf0f1; margin: 20px 0;"',
+    'code_block': ('style="background: #2d3748; color: #e2e8f0; padding: 20px; border-radius: 8px; '
+                   'margin: 20px 0; font-family: \'Consolas\', \'Monaco\', monospace; overflow-x: auto; '
+                   'box-shadow: 0 4px 12px rgba(0,0,0,0.15);"'),
+    'pre': 'style="margin: 0; white-space: pre-wrap;"',
+    'table': ('style="width: 100%; border-collapse: collapse; margin: 20px 0; '
+              'box-shadow: 0 2px 8px rgba(0,0,0,0.1); border-radius: 8px; overflow: hidden;"'),
+    'th': ('style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; '
+           'padding: 15px; text-align: left; font-weight: 600;"'),
+    'td': 'style="padding: 12px 15px; border-bottom: 1px solid #ecf0f1; background: #fafafa;"',
+    'blockquote': ('style="border-left: 4px solid #3498db; background: #f8f9fa; padding: 15px 20px; '
+                   'margin: 20px 0; font-style: italic; color: #2c3e50;"'),
+    'callout': ('style="background: linear-gradient(135deg, #ffeaa7 0%, #fab1a0 100%); padding: 15px; '
+                'border-radius: 8px; margin: 15px 0; border-left: 4px solid #e17055; '
+                'box-shadow: 0 2px 8px rgba(0,0,0,0.1);"'),
+    'callout_strong': 'style="color: #2d3436;"',
+}, callouts=True)
+
+# 내보내기 미리보기 페이지 (스타일은 페이지 CSS, 코드 블록 복사 버튼은 copyCode(this))
+PREVIEW_THEME = MarkdownTheme('preview', {
+    'code_block': 'class="code-block"',
+    'highlight': 'class="highlight"',
+}, code_toolbar='<button class="copy-btn" onclick="copyCode(this)"><i class="bi bi-clipboard"></i> 복사</button>')
+
+TISTORY_THEME = MarkdownTheme('tistory', {
+    'highlight': 'class="highlight"',
+})
+
+
+@lru_cache(maxsize=64)
+def _inline_pattern(keywords: Tuple[str, ...]) -> 're.Pattern':
+    if not keywords:
+        return re.compile(_INLINE_BASE)
+    # 긴 키워드 우선 (짧은 키워드가 긴 키워드 일부를 먼저 잡지 않도록)
+    alternation = '|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(f'{_INLINE_BASE}|(?P<keyword>{alternation})')
+
+
+class _InlineRenderer:
+    def __init__(self, theme: MarkdownTheme, highlight: Iterable[str]):
+        self.theme = theme
+        self.pattern = _inline_pattern(tuple(k for k in dict.fromkeys(highlight or ()) if k))
+        self.highlighted = set()
+
+    def new_block(self):
+        """키워드 강조는 블록(문단)마다 키워드별 첫 등장에만"""
+        self.highlighted = set()
+
+    def render(self, text: str) -> str:
+        return self.pattern.sub(self._replace, text)
+
+    def _replace(self, match: 're.Match') -> str:
+        theme = self.theme
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind in ('code', 'code3'):
+            return f"{theme.open('code')}{html.escape(value, quote=False)}</code>"
+        if kind == 'strong':
+            return f"{theme.open('strong')}{self.render(value)}</strong>"
+        if kind == 'em':
+            return f"{theme.open('em')}{self.render(value)}</em>"
+        if value in self.highlighted:
+            return value
+        self.highlighted.add(value)
+        return f"{theme.open('span', 'highlight')}{value}</span>"
+
+
+def _split_row(line: str) -> List[str]:
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|'):
+        line = line[:-1]
+    return [cell.strip() for cell in line.split('|')]
+
+
+def _is_table_start(lines: List[str], i: int) -> bool:
+    """'|'로 시작하는 줄, 또는 '|'가 있고 다음 줄이 구분선(|---|)인 줄"""
+    stripped = lines[i].strip()
+    if stripped.startswith('|'):
+        return True
+    return '|' in stripped and i + 1 < len(lines) and bool(_TABLE_SEPARATOR.match(lines[i + 1]))
+
+
+def render_markdown(text: Optional[str], theme: MarkdownTheme = PLAIN_THEME,
+                    highlight: Iterable[str] = ()) -> str:
+    """Markdown 텍스트 → HTML (원문에 들어 있는 HTML 태그는 그대로 통과)
+
+    Args:
+        theme: 태그별 스타일
+        highlight: 문단마다 첫 등장을 강조할 키워드
+    """
+    if not text:
+        return ''
+    theme = theme or PLAIN_THEME
+    inline = _InlineRenderer(theme, highlight)
+    lines = text.replace('\r\n', '\n').split('\n')
+    count = len(lines)
+    blocks: List[str] = []
+    paragraph: List[str] = []
+
+    def flush_paragraph():
+        if paragraph:
+            inline.new_block()
+            body = '<br>'.join(inline.render(line) for line in paragraph)
+            blocks.append(f"{theme.open('p')}{body}</p>")
+            paragraph.clear()
+
+    def html_table_tag(match: 're.Match') -> str:
+        tag = match.group(1)
+        if tag is None:
+            return '</table></div>' if 'table_wrap' in theme.attrs else '</table>'
+        if tag == 'table' and 'table_wrap' in theme.attrs:
+            return theme.open('div', 'table_wrap') + theme.open('table')
+        return theme.open(tag)
+
+    i = 0
+    while i < count:
+        stripped = lines[i].strip()
+
+        if not stripped:
+            flush_paragraph()
+            i += 1
+            continue
+
+        fence = _FENCE.match(stripped)
+        if fence:
+            flush_paragraph()
+            i += 1
+            code_lines = []
+            while i < count and not _FENCE.match(lines[i].strip()):
+                code_lines.append(lines[i])
+                i += 1
+            i += 1  # 닫는 ``` (없으면 끝까지 코드)
+            code = html.escape('\n'.join(code_lines), quote=False)
+            blocks.append(f"{theme.open('div', 'code_block')}{theme.code_toolbar}"
+                          f"{theme.open('pre')}<code>{code}</code></pre></div>")
+            continue
+
+        if _is_table_start(lines, i):
+            flush_paragraph()
+            rows = []
+            while i < count and '|' in lines[i] and lines[i].strip():
+                if not _TABLE_SEPARATOR.match(lines[i]):
+                    is_header = i + 1 < count and bool(_TABLE_SEPARATOR.match(lines[i + 1]))
+                    tag = 'th' if is_header else 'td'
+                    cells = ''.join(f"{theme.open(tag)}{inline.render(cell)}</{tag}>"
+                                    for cell in _split_row(lines[i]))
+                    rows.append(f'<tr>{cells}</tr>')
+                i += 1
+            table = f"{theme.open('table')}{''.join(rows)}</table>"
+            if 'table_wrap' in theme.attrs:
+                table = f"{theme.open('div', 'table_wrap')}{table}</div>"
+            blocks.append(table)
+            continue
+
+        if _HR.match(stripped):
+            flush_paragraph()
+            blocks.append(theme.open('hr'))
+            i += 1
+            continue
+
+        heading = _HEADING.match(stripped)
+        if heading:
+            flush_paragraph()
+            inline.new_block()
+            tag = f'h{len(heading.group(1))}'
+            blocks.append(f"{theme.open(tag)}{inline.render(heading.group(2))}</{tag}>")
+            i += 1
+            continue
+
+        if stripped.startswith('>'):
+            flush_paragraph()
+            inline.new_block()
+            quoted = []
+            while i < count and lines[i].strip().startswith('>'):
+                quoted.append(inline.render(lines[i].strip()[1:].strip()))
+                i += 1
+            blocks.append(f"{theme.open('blockquote')}{'<br>'.join(quoted)}</blockquote>")
+            continue
+
+        item_pattern = _UL_ITEM if _UL_ITEM.match(stripped) else _OL_ITEM if _OL_ITEM.match(stripped) else None
+        if item_pattern is not None:
+            flush_paragraph()
+            tag = 'ul' if item_pattern is _UL_ITEM else 'ol'
+            items = []
+            while i < count:
+                item = item_pattern.match(lines[i].strip())
+                if not item:
+                    break
+                inline.new_block()
+                items.append(f"{theme.open('li')}{inline.render(item.group(1))}</li>")
+                i += 1
+            blocks.append(f"{theme.open(tag)}{''.join(items)}</{tag}>")
+            continue
+
+        if _HTML_BLOCK.match(stripped):
+            # 원문 HTML 블록은 빈 줄까지 그대로 (표 태그에만 테마 적용)
+            flush_paragraph()
+            raw = []
+            while i < count and lines[i].strip():
+                raw.append(lines[i])
+                i += 1
+            blocks.append(_HTML_TABLE_TAGS.sub(html_table_tag, '\n'.join(raw)))
+            continue
+
+        if theme.callouts and _CALLOUT.match(stripped):
+            flush_paragraph()
+            inline.new_block()
+            blocks.append(f"{theme.open('div', 'callout')}{theme.open('strong', 'callout_strong')}"
+                          f"{inline.render(stripped)}</strong></div>")
+            i += 1
+            continue
+
+        paragraph.append(stripped)
+        i += 1
+
+    flush_paragraph()
+    return '\n'.join(blocks)
@@ -2,31 +2,99 @@
 월별 발행 계획표 관리자
 - 새로운 monthly_publishing_schedule 테이블 사용
 - 날짜별 듀얼 카테고리 주제 관리
+- 조회는 월 단위 캘린더 캐시에서 처리: 한 달치를 쿼리 1번으로 읽어 (일, 사이트, 카테고리)로 색인
+  (쓰기 경로의 invalidate_responses('schedule') 호출 시 다시 로드, 다른 프로세스의 변경은 TTL로 반영)
 """
 
-import psycopg2
+import threading
+import time
 from datetime import datetime, date, timedelta
 import os
+from typing import Callable, Dict, List, Tuple
 from dotenv import load_dotenv
-from src.utils.postgresql_database import PostgreSQLDatabase
+from src.utils.postgresql_database import get_shared_database
+from src.utils.response_cache import invalidate_responses, response_cache
 
 load_dotenv('.env.example')
 
+# 월 캘린더 캐시 유효 시간 (초, 다른 프로세스/스크립트가 바꾼 계획표를 반영하는 주기)
+MONTHLY_SCHEDULE_CACHE_TTL = float(os.getenv('MONTHLY_SCHEDULE_CACHE_TTL', 300))
+
+
+class MonthCalendar:
+    """한 달치 계획표 색인 (행 순서는 DB의 ORDER BY day, site, topic_category를 그대로 유지)"""
+
+    def __init__(self, rows):
+        self.entries: Dict[Tuple[int, str, str], Dict] = {}
+        self._by_day: Dict[int, List[Dict]] = {}
+        self._by_day_site: Dict[Tuple[int, str], List[Dict]] = {}
+        for day, site, category, specific_topic, keywords, status in rows:
+            entry = {
+                'site': site,
+                'category': category,
+                'topic': specific_topic,
+                'keywords': keywords or [],
+                'status': status
+            }
+            self.entries[(day, site, category)] = entry
+            self._by_day.setdefault(day, []).append(entry)
+            self._by_day_site.setdefault((day, site), []).append(entry)
+
+    def topics(self, day: int, site: str = None) -> List[Dict]:
+        """해당 일(사이트)의 주제 복사본 (사이트·카테고리 순)"""
+        entries = self._by_day_site.get((day, site), []) if site else self._by_day.get(day, [])
+        return [{**entry, 'keywords': list(entry['keywords'])} for entry in entries]
+
+    def days(self) -> List[int]:
+        return list(self._by_day)
+
+
+class MonthlyScheduleCalendar:
+    """(연, 월)별 MonthCalendar 캐시 (스레드 안전)
+
+    로드 시점의 'schedule' 태그 버전을 함께 저장해, 쓰기 경로가 무효화하면 다음 조회에서 다시 읽는다.
+    """
+
+    def __init__(self, ttl: float = MONTHLY_SCHEDULE_CACHE_TTL):
+        self.ttl = ttl
+        self._months: Dict[Tuple[int, int], Tuple[Tuple[int, ...], float, MonthCalendar]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, year: int, month: int, loader: Callable[[int, int], list]) -> MonthCalendar:
+        """캐시된 달력 반환, 없거나 무효화/만료됐으면 loader(year, month)로 한 번 읽어 색인"""
+        with self._lock:
+            version = response_cache.tag_versions(('schedule',))
+            cached = self._months.get((year, month))
+            if cached and cached[0] == version and cached[1] > time.time():
+                return cached[2]
+            # 동시에 들어온 조회가 같은 달을 여러 번 읽지 않도록 잠금 안에서 로드
+            calendar = MonthCalendar(loader(year, month))
+            self._months[(year, month)] = (version, time.time() + self.ttl, calendar)
+            return calendar
+
+    def invalidate(self):
+        with self._lock:
+            self._months.clear()
+
+
+# 프로세스 전역 캘린더 캐시 (MonthlyScheduleManager 인스턴스 간 공유)
+schedule_calendar = MonthlyScheduleCalendar()
+
+
 class MonthlyScheduleManager:
     """월별 스케줄 관리자"""
     
     def __init__(self):
-        # PostgreSQLDatabase 인스턴스 사용
-        self.db = PostgreSQLDatabase()
+        # 프로세스 전역 PostgreSQLDatabase 인스턴스 사용 (커넥션 풀 공유)
+        self.db = get_shared_database()
+        self.calendar = schedule_calendar
     
     def get_db_connection(self):
-        """데이터베이스 연결"""
-        return self.db.get_connection()
+        """데이터베이스 연결 (close() 시 풀로 반납)"""
+        return self.db.get_pooled_connection()
     
-    def get_today_dual_topics(self, site):
-        """오늘 날짜의 듀얼 카테고리 주제 가져오기"""
-        
-        today = date.today()
+    def _load_month(self, year, month):
+        """한 달치 계획표 행 조회 (캘린더 캐시 로더)"""
         
         conn = None
         cursor = None
@@ -35,54 +103,17 @@ class MonthlyScheduleManager:
             conn = self.get_db_connection()
             cursor = conn.cursor()
             
-            # monthly_publishing_schedule 테이블에서만 조회 (정확한 계획표)
-            # 스키마 이름 직접 지정
+            # 스키마 이름 직접 지정 (환경변수 문제 해결까지)
             schema_name = 'blog_automation'
             
             cursor.execute(f"""
-                SELECT topic_category, specific_topic, keywords
+                SELECT day, site, topic_category, specific_topic, keywords, status
                 FROM {schema_name}.monthly_publishing_schedule
-                WHERE year = %s AND month = %s AND day = %s AND site = %s
-                ORDER BY topic_category
-            """, (today.year, today.month, today.day, site))
-            
-            topics = cursor.fetchall()
+                WHERE year = %s AND month = %s
+                ORDER BY day, site, topic_category
+            """, (year, month))
             
-            if len(topics) >= 2:
-                # Primary와 Secondary 구분 (알파벳 순)
-                primary = {
-                    'category': topics[0][0],
-                    'topic': topics[0][1],
-                    'keywords': topics[0][2] or []
-                }
-                secondary = {
-                    'category': topics[1][0],
-                    'topic': topics[1][1],
-                    'keywords': topics[1][2] or []
-                }
-                
-                return primary, secondary
-            elif len(topics) == 1:
-                # 1개만 있는 경우
-                single = {
-                    'category': topics[0][0],
-                    'topic': topics[0][1],
-                    'keywords': topics[0][2] or []
-                }
-                return single, None
-            else:
-                # 주제가 없는 경우 기본값 반환
-                default = {
-                    'category': 'general',
-                    'topic': f'{site} 기본 주제',
-                    'keywords': ['기본', '주제']
-                }
-                return default, None
-                
-        except Exception as e:
-            print(f"[MONTHLY_SCHEDULE] 오늘 주제 조회 오류 ({site}): {e}")
-            # DB 연결 실패 시 자동발행 중단 (잘못된 주제로 발행하지 않음)
-            raise Exception(f"DB 연결 실패로 {site} 자동발행 불가: {e}")
+            return cursor.fetchall()
             
         finally:
             if cursor:
@@ -90,116 +121,79 @@ class MonthlyScheduleManager:
             if conn:
                 conn.close()
     
+    def get_month_calendar(self, year, month) -> MonthCalendar:
+        """월 캘린더 (캐시 적중 시 DB 조회 없음)"""
+        return self.calendar.get(year, month, self._load_month)
+    
+    def get_today_dual_topics(self, site):
+        """오늘 날짜의 듀얼 카테고리 주제 가져오기"""
+        
+        today = date.today()
+        
+        try:
+            # monthly_publishing_schedule 테이블에서만 조회 (정확한 계획표)
+            topics = self.get_month_calendar(today.year, today.month).topics(today.day, site)
+        except Exception as e:
+            print(f"[MONTHLY_SCHEDULE] 오늘 주제 조회 오류 ({site}): {e}")
+            # DB 연결 실패 시 자동발행 중단 (잘못된 주제로 발행하지 않음)
+            raise Exception(f"DB 연결 실패로 {site} 자동발행 불가: {e}")
+        
+        if len(topics) >= 2:
+            # Primary와 Secondary 구분 (알파벳 순)
+            primary, secondary = (
+                {'category': t['category'], 'topic': t['topic'], 'keywords': t['keywords']}
+                for t in topics[:2]
+            )
+            return primary, secondary
+        elif len(topics) == 1:
+            # 1개만 있는 경우
+            single = {
+                'category': topics[0]['category'],
+                'topic': topics[0]['topic'],
+                'keywords': topics[0]['keywords']
+            }
+            return single, None
+        else:
+            # 주제가 없는 경우 기본값 반환
+            default = {
+                'category': 'general',
+                'topic': f'{site} 기본 주제',
+                'keywords': ['기본', '주제']
+            }
+            return default, None
+    
     def get_topics_by_date(self, target_date, site=None):
         """특정 날짜의 주제들 가져오기"""
         
-        conn = None
-        cursor = None
-        
         try:
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
-            
-            if site:
-                # 스키마 이름 직접 지정
-                schema_name = 'blog_automation'
-                
-                cursor.execute(f"""
-                    SELECT site, topic_category, specific_topic, keywords, status
-                    FROM {schema_name}.monthly_publishing_schedule
-                    WHERE year = %s AND month = %s AND day = %s AND site = %s
-                    ORDER BY site, topic_category
-                """, (target_date.year, target_date.month, target_date.day, site))
-            else:
-                # 동적 스키마 이름 사용 (이미 위에서 정의됨)
-                cursor.execute(f"""
-                    SELECT site, topic_category, specific_topic, keywords, status
-                    FROM {schema_name}.monthly_publishing_schedule
-                    WHERE year = %s AND month = %s AND day = %s
-                    ORDER BY site, topic_category
-                """, (target_date.year, target_date.month, target_date.day))
-            
-            topics = cursor.fetchall()
-            
-            result = []
-            for topic in topics:
-                site_name, category, specific_topic, keywords, status = topic
-                result.append({
-                    'site': site_name,
-                    'category': category,
-                    'topic': specific_topic,
-                    'keywords': keywords or [],
-                    'status': status
-                })
-            
-            return result
-            
+            return self.get_month_calendar(target_date.year, target_date.month).topics(target_date.day, site)
         except Exception as e:
             print(f"[MONTHLY_SCHEDULE] 날짜별 주제 조회 오류: {e}")
             return []
-            
-        finally:
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
     
     def get_month_schedule(self, year, month):
         """월 전체 스케줄 가져오기"""
         
-        conn = None
-        cursor = None
-        
         try:
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
-            
-            # 먼저 monthly_publishing_schedule 테이블 조회
-            # 스키마 이름 직접 지정 (환경변수 문제 해결까지)
-            schema_name = 'blog_automation'
-            
-            cursor.execute(f"""
-                SELECT day, site, topic_category, specific_topic, keywords, status
-                FROM {schema_name}.monthly_publishing_schedule
-                WHERE year = %s AND month = %s
-                ORDER BY day, site, topic_category
-            """, (year, month))
-            
-            topics = cursor.fetchall()
+            calendar = self.get_month_calendar(year, month)
             
             # 데이터가 없으면 빈 결과 반환 (폴백 제거)
-            if not topics:
+            if not calendar.entries:
                 print(f"[MONTHLY_SCHEDULE] {year}년 {month}월 스케줄이 없습니다.")
-                topics = []
             
             # 날짜별로 그룹핑
             schedule = {}
-            for topic in topics:
-                day, site, category, specific_topic, keywords, status = topic
-                
-                if day not in schedule:
-                    schedule[day] = {}
-                if site not in schedule[day]:
-                    schedule[day][site] = []
-                
-                schedule[day][site].append({
-                    'category': category,
-                    'topic': specific_topic,
-                    'keywords': keywords or [],
-                    'status': status
-                })
+            for day in calendar.days():
+                schedule[day] = {}
+                for topic in calendar.topics(day):
+                    site = topic.pop('site')
+                    schedule[day].setdefault(site, []).append(topic)
             
             return schedule
             
         except Exception as e:
             print(f"[MONTHLY_SCHEDULE] 월별 스케줄 조회 오류: {e}")
             return {}
-            
-        finally:
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
     
     def update_topic_status(self, year, month, day, site, topic_category, status):
         """주제 상태 업데이트"""
@@ -222,6 +216,8 @@ class MonthlyScheduleManager:
             """, (status, year, month, day, site, topic_category))
             
             conn.commit()
+            # 응답 캐시와 월 캘린더 캐시를 함께 무효화 (다음 조회에서 다시 로드)
+            invalidate_responses('schedule')
             
             if cursor.rowcount > 0:
                 print(f"[MONTHLY_SCHEDULE] 상태 업데이트 성공: {year}-{month:02d}-{day:02d} {site} {topic_category} -> {status}")
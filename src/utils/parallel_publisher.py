@@ -0,0 +1,122 @@
+"""
+다중 사이트 병렬 발행 실행기
+- 전역 동시 실행 수와 사이트별 동시 실행 수를 함께 제한
+- 한 사이트의 실패/예외가 다른 사이트 작업에 영향을 주지 않음
+- 작업별 단계(생성/저장/DB/발행) 소요 시간 수집
+"""
+
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+from src.utils.postgresql_database import release_thread_connections
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PublishTask:
+    """발행 작업 단위 (사이트 + 주제 1개)"""
+    site: str
+    topic_info: Dict[str, Any]
+    category_type: str = 'primary'
+    index: int = 0
+
+
+@dataclass
+class PublishResult:
+    """발행 작업 결과"""
+    task: PublishTask
+    success: bool = False
+    error: Optional[str] = None
+    duration: float = 0.0
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+
+
+class StageTimer:
+    """파이프라인 단계별 소요 시간(ms) 기록기"""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.timings[name] = round((time.monotonic() - started) * 1000, 1)
+
+
+class ParallelPublishExecutor:
+    """전역/사이트별 동시성 제한이 있는 발행 실행기"""
+
+    def __init__(self, max_workers: int = 4, per_site_limit: int = 1):
+        """
+        Args:
+            max_workers: 동시에 실행되는 전체 작업 수
+            per_site_limit: 한 사이트에서 동시에 실행되는 작업 수
+        """
+        self.max_workers = max(1, max_workers)
+        self.per_site_limit = max(1, per_site_limit)
+
+    def run(self, tasks: List[PublishTask],
+            func: Callable[[PublishTask, StageTimer], bool]) -> List[PublishResult]:
+        """작업 목록을 병렬 실행하고 입력 순서대로 결과 반환
+
+        func(task, timer)는 성공 여부를 반환하며, timer.stage(...)로 단계 시간을 기록한다.
+        사이트 한도가 찬 작업은 건너뛰고 다른 사이트 작업을 먼저 실행한다.
+        """
+        for i, task in enumerate(tasks):
+            task.index = i
+
+        pending = list(tasks)
+        results: List[Optional[PublishResult]] = [None] * len(tasks)
+        active = defaultdict(int)
+        cond = threading.Condition()
+
+        def next_task() -> Optional[PublishTask]:
+            with cond:
+                while pending:
+                    for i, task in enumerate(pending):
+                        if active[task.site] < self.per_site_limit:
+                            active[task.site] += 1
+                            return pending.pop(i)
+                    cond.wait()
+                return None
+
+        def worker():
+            while True:
+                task = next_task()
+                if task is None:
+                    return
+                timer = StageTimer()
+                result = PublishResult(task=task, stage_timings=timer.timings)
+                started = time.monotonic()
+                try:
+                    result.success = bool(func(task, timer))
+                except Exception as e:
+                    result.error = str(e)
+                    logger.error(f"[PARALLEL_PUBLISH] {task.site} [{task.category_type}] 작업 예외: {e}")
+                finally:
+                    release_thread_connections()
+                    result.duration = time.monotonic() - started
+                    results[task.index] = result
+                    with cond:
+                        active[task.site] -= 1
+                        cond.notify_all()
+
+        threads = [
+            threading.Thread(target=worker, name=f"publish-worker-{n}", daemon=True)
+            for n in range(min(self.max_workers, len(tasks)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return results
@@ -4,22 +4,128 @@ PostgreSQL 데이터베이스 관리 모듈 - Supabase 연동
 
 import os
 import json
+import base64
 import psycopg2
 import psycopg2.extras
-from datetime import datetime, date
+import pytz
+from datetime import datetime, date, time, timedelta
 from typing import List, Dict, Optional, Any
 import hashlib
+import atexit
+import functools
+import threading
 from pathlib import Path
+from time import monotonic
 from dotenv import load_dotenv
 import logging
 
+from src.utils.bulk_write import bulk_upsert
+from src.utils.db_pool import PostgreSQLConnectionPool
+from src.utils.similarity_index import MinHashLSHIndex, SimilarMatch
+from src.utils.response_cache import invalidate_responses
+from src.utils import daily_metrics
+
 # 환경변수 로드
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# 콘텐츠 목록 페이지 크기 상한
+CONTENT_PAGE_MAX = 200
+
+
+def encode_page_cursor(created_at: datetime, file_id: int) -> str:
+    """키셋 페이지네이션 커서 (마지막 행의 created_at, id)"""
+    raw = json.dumps([created_at.isoformat(), file_id]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+def decode_page_cursor(cursor: str) -> tuple:
+    """커서 해석 - 잘못된 값이면 ValueError"""
+    try:
+        created_at, file_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return datetime.fromisoformat(created_at), int(file_id)
+    except Exception as e:
+        raise ValueError(f"잘못된 페이지 커서: {cursor}") from e
+
+
+# 프로세스 전역 커넥션 풀 (연결 정보별로 하나씩 공유)
+_shared_pools: Dict[tuple, PostgreSQLConnectionPool] = {}
+_shared_pools_lock = threading.Lock()
+_shared_database = None
+_shared_database_lock = threading.Lock()
+
+
+def get_shared_pool(connection_params: Dict[str, Any], schema: str) -> PostgreSQLConnectionPool:
+    """연결 정보에 해당하는 프로세스 전역 커넥션 풀 반환"""
+    key = (
+        connection_params.get('host'), connection_params.get('port'),
+        connection_params.get('database'), connection_params.get('user'), schema
+    )
+    with _shared_pools_lock:
+        pool = _shared_pools.get(key)
+        if pool is None or pool.closed:
+            pool = PostgreSQLConnectionPool(
+                connection_params,
+                schema=schema,
+                min_size=int(os.getenv('PG_POOL_MIN_SIZE', 1)),
+                max_size=int(os.getenv('PG_POOL_MAX_SIZE', 10)),
+                max_overflow=int(os.getenv('PG_POOL_MAX_OVERFLOW', 10)),
+                timeout=float(os.getenv('PG_POOL_TIMEOUT', 30)),
+                health_check_after=float(os.getenv('PG_POOL_HEALTH_CHECK_AFTER', 30)),
+            )
+            _shared_pools[key] = pool
+        return pool
+
+
+def close_all_pools():
+    """모든 공유 커넥션 풀 종료 (프로세스 종료 시)"""
+    with _shared_pools_lock:
+        for pool in _shared_pools.values():
+            pool.closeall()
+        _shared_pools.clear()
+
+
+atexit.register(close_all_pools)
+
+
+def release_thread_connections():
+    """현재 스레드가 get_connection()으로 바인딩한 연결을 모든 공유 풀에 반납"""
+    with _shared_pools_lock:
+        pools = list(_shared_pools.values())
+    for pool in pools:
+        pool.release_thread()
+
+
+def releases_connection(func):
+    """작업 단위(스케줄러 잡, 워커 작업)가 끝나면 get_connection()으로 바인딩한 연결을 반납
+
+    APScheduler/워커 스레드는 재사용되며 종료되지 않으므로, 반납하지 않으면
+    바인딩된 연결이 풀 슬롯을 계속 점유한다.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            release_thread_connections()
+    return wrapper
+
+
+def get_shared_database() -> 'PostgreSQLDatabase':
+    """프로세스 전역 PostgreSQLDatabase 인스턴스 반환"""
+    global _shared_database
+    if _shared_database is None:
+        with _shared_database_lock:
+            if _shared_database is None:
+                _shared_database = PostgreSQLDatabase()
+    return _shared_database
+
 
 class PostgreSQLDatabase:
+    # 제목 유사도 인덱스가 다른 프로세스의 새 이력을 반영하는 주기(초)
+    TITLE_INDEX_REFRESH_INTERVAL = 60
+
     def __init__(self):
         """PostgreSQL 데이터베이스 연결 초기화"""
         # 유료 Koyeb DB 연결 정보
@@ -40,9 +146,18 @@ class PostgreSQLDatabase:
             'password': password,
         }
         self.schema = os.getenv('PG_SCHEMA', 'blog_automation')
-        self._connection = None
+        self._pool = get_shared_pool(self.connection_params, self.schema)
         self.is_connected = False
         
+        # 제목 유사도 인덱스 (최초 중복 검사 시 content_history 전체로 구축, add_content와 주기적 max id 조회로 증분 갱신)
+        self._title_index: Optional[MinHashLSHIndex] = None
+        self._title_index_lock = threading.Lock()
+        self._title_index_max_id = 0
+        self._title_index_checked_at = 0.0
+        
+        # 일별 지표 롤업 테이블 준비 여부 (시작 시 생성/백필이 커밋된 뒤, 또는 테이블이 이미 있으면 True)
+        self._daily_metrics_ready = False
+        
         # 연결 테스트 (실패해도 앱은 실행됨)
         try:
             if not user or not password:
@@ -52,6 +167,7 @@ class PostgreSQLDatabase:
             else:
                 self._test_connection()
                 self.is_connected = True
+                self.prepare_daily_metrics()
         except Exception as e:
             logger.warning(f"PostgreSQL 연결 실패 (앱은 계속 실행됨): {e}")
             logger.info("연결 정보를 확인하세요. Supabase 대시보드에서 정확한 연결 정보를 확인할 수 있습니다.")
@@ -59,67 +175,66 @@ class PostgreSQLDatabase:
     
     def _test_connection(self):
         """데이터베이스 연결 테스트"""
-        conn = self.get_connection()
-        with conn.cursor() as cursor:
-            cursor.execute("SELECT 1")
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
         logger.info("PostgreSQL 연결 성공")
     
+    def connection(self):
+        """풀에서 연결을 빌려 쓰는 컨텍스트 매니저
+        
+        블록이 끝나면 연결이 풀로 반납되고, 예외 시 롤백된다.
+        같은 스레드 안에서는 하나의 연결(트랜잭션)을 공유한다.
+        """
+        return self._pool.connection()
+    
     def get_connection(self):
-        """데이터베이스 연결 반환 (풀링 방식)"""
+        """현재 스레드에 바인딩된 연결 반환 (기존 호출부 호환용)
+        
+        반환된 연결은 release_connection()을 호출하거나 스레드가 종료될 때까지
+        해당 스레드 전용으로 유지된다.
+        """
         try:
-            # 트랜잭션 오류 상태인 경우 연결 재설정
-            if self._connection and not self._connection.closed:
-                try:
-                    # 연결 상태 확인
-                    with self._connection.cursor() as cursor:
-                        cursor.execute("SELECT 1")
-                except psycopg2.Error:
-                    # 연결에 문제가 있으면 재연결
-                    logger.warning("기존 연결에 문제가 있어 재연결합니다.")
-                    self._connection.close()
-                    self._connection = None
-            
-            if self._connection is None or self._connection.closed:
-                self._connection = psycopg2.connect(**self.connection_params)
-                self._connection.autocommit = False
-                
-                # 스키마 설정
-                with self._connection.cursor() as cursor:
-                    cursor.execute(f"SET search_path TO {self.schema}, public")
-                    self._connection.commit()
-            
-            return self._connection
+            return self._pool.bind_thread()
         except Exception as e:
             logger.error(f"데이터베이스 연결 오류: {e}")
             raise
     
-    def close_connection(self):
-        """연결 종료"""
-        if self._connection and not self._connection.closed:
-            self._connection.close()
+    def release_connection(self):
+        """get_connection()으로 바인딩된 연결을 풀로 반납"""
+        self._pool.release_thread()
     
-    def _reset_connection_if_needed(self):
-        """트랜잭션 오류 상황에서 연결 재설정"""
-        try:
-            if self._connection and not self._connection.closed:
-                self._connection.close()
-        except:
-            pass
-        self._connection = None
+    def get_pooled_connection(self):
+        """close() 시 풀로 반납되는 독립 연결 반환 (psycopg2.connect() 대체용)"""
+        return self._pool.acquire()
+    
+    def reset_request_stats(self):
+        """현재 스레드(요청)의 연결 생성 카운터 초기화"""
+        self._pool.reset_thread_stats()
+    
+    def get_request_stats(self) -> Dict[str, int]:
+        """현재 스레드(요청)에서 새로 연 연결 수와 풀 대여 횟수"""
+        return self._pool.get_thread_stats()
+    
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """커넥션 풀 메트릭 (대기 시간, 사용 중, 오버플로 등)"""
+        return self._pool.get_metrics()
+    
+    def close_connection(self):
+        """현재 스레드의 연결 반납 (공유 풀 자체는 프로세스 종료 시 정리)"""
+        self._pool.release_thread()
     
     def execute_schema_sql(self, sql_file_path: str):
         """SQL 스키마 파일 실행"""
         with open(sql_file_path, 'r', encoding='utf-8') as f:
             sql_content = f.read()
         
-        conn = self.get_connection()
         try:
-            with conn.cursor() as cursor:
+            with self.connection() as conn, conn.cursor() as cursor:
                 cursor.execute(sql_content)
                 conn.commit()
                 logger.info("✅ 스키마 생성 완료")
         except Exception as e:
-            conn.rollback()
             logger.error(f"스키마 생성 오류: {e}")
             raise
     
@@ -127,53 +242,67 @@ class PostgreSQLDatabase:
     # 콘텐츠 히스토리 관리
     # ========================================================================
     
+    def get_title_index(self) -> MinHashLSHIndex:
+        """content_history 전체 제목의 유사도 인덱스
+
+        최초 호출 시 전체로 구축하고, 이후 TITLE_INDEX_REFRESH_INTERVAL마다 마지막으로 읽은 id 이후의
+        행만 추가한다 (다른 프로세스가 추가한 이력 반영). 갱신 중에는 다른 스레드가 기존 인덱스를 그대로 쓴다.
+        """
+        index = self._title_index
+        if index is not None and monotonic() - self._title_index_checked_at < self.TITLE_INDEX_REFRESH_INTERVAL:
+            return index
+        if not self._title_index_lock.acquire(blocking=index is None):
+            return index
+        try:
+            if self._title_index is not None and \
+                    monotonic() - self._title_index_checked_at < self.TITLE_INDEX_REFRESH_INTERVAL:
+                return self._title_index
+            index = self._title_index or MinHashLSHIndex()
+            max_id = self._title_index_max_id
+            with self.connection() as conn, conn.cursor(name='title_index_load') as cursor:
+                cursor.itersize = 2000
+                cursor.execute("SELECT id, site, title FROM content_history WHERE id > %s ORDER BY id", (max_id,))
+                for post_id, site, title in cursor:
+                    index.add(post_id, title, site=site)
+                    max_id = post_id
+            if self._title_index is None:
+                logger.info(f"제목 유사도 인덱스 구축 완료: {len(index)}건")
+                self._title_index = index
+            self._title_index_max_id = max_id
+            self._title_index_checked_at = monotonic()
+            return index
+        finally:
+            self._title_index_lock.release()
+    
     def check_duplicate_title(self, site: str, title: str, threshold: float = 0.7) -> bool:
-        """제목 중복 체크"""
-        title_hash = hashlib.sha256(title.encode()).hexdigest()
-        
-        conn = self.get_connection()
+        """제목 중복 체크 (전체 이력 대상, 문자 n-gram Jaccard 기준)"""
         try:
-            with conn.cursor() as cursor:
-                # 정확히 같은 제목 체크
-                cursor.execute("""
-                    SELECT COUNT(*) FROM content_history 
-                    WHERE site = %s AND title_hash = %s
-                """, (site, title_hash))
-                
-                if cursor.fetchone()[0] > 0:
-                    return True
-                
-                # 유사 제목 체크
-                cursor.execute("""
-                    SELECT title FROM content_history 
-                    WHERE site = %s AND status = 'published'
-                    ORDER BY published_date DESC LIMIT 100
-                """, (site,))
-                
-                existing_titles = [row[0] for row in cursor.fetchall()]
-                
-                for existing in existing_titles:
-                    similarity = self._calculate_similarity(title, existing)
-                    if similarity > threshold:
-                        return True
-                
-                return False
+            match = self.get_title_index().find_duplicate(title, site=site, threshold=threshold)
+            if match:
+                logger.info(f"유사 제목 발견 ({match.score:.2f}): {title} ↔ {match.title}")
+            return match is not None
         except Exception as e:
             logger.error(f"중복 체크 오류: {e}")
             return False
     
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """두 텍스트의 유사도 계산 (간단한 Jaccard 유사도)"""
-        set1 = set(text1.lower().split())
-        set2 = set(text2.lower().split())
+    def check_duplicate_titles(self, items: List[Dict[str, Any]], threshold: float = 0.7) -> List[Optional[SimilarMatch]]:
+        """여러 제목을 한 번에 중복 체크 (이력 + 목록 내 중복)
         
-        if not set1 or not set2:
-            return 0.0
-        
-        intersection = set1.intersection(set2)
-        union = set1.union(set2)
-        
-        return len(intersection) / len(union)
+        items: [{'site': ..., 'title': ...}, ...] / 반환: 항목별 가장 유사한 기존 제목 또는 None
+        """
+        try:
+            return self.get_title_index().check_batch(items, threshold)
+        except Exception as e:
+            logger.error(f"일괄 중복 체크 오류: {e}")
+            return [None] * len(items)
+    
+    def find_similar_titles(self, title: str, site: str = None, k: int = 5) -> List[SimilarMatch]:
+        """가장 유사한 기존 제목 top-k"""
+        try:
+            return self.get_title_index().query(title, site=site, k=k)
+        except Exception as e:
+            logger.error(f"유사 제목 조회 오류: {e}")
+            return []
     
     def add_content(self, site: str, title: str, category: str, 
                    keywords: List[str], content: str, url: str = None,
@@ -183,9 +312,8 @@ class PostgreSQLDatabase:
         title_hash = hashlib.sha256(title.encode()).hexdigest()
         content_hash = hashlib.sha256(content.encode()).hexdigest()
         
-        conn = self.get_connection()
         try:
-            with conn.cursor() as cursor:
+            with self.connection() as conn, conn.cursor() as cursor:
                 cursor.execute("""
                     INSERT INTO content_history 
                     (site, title, title_hash, category, keywords, content_hash, url,
@@ -202,22 +330,21 @@ class PostgreSQLDatabase:
                 
                 post_id = cursor.fetchone()[0]
                 conn.commit()
-                
-                logger.info(f"✅ 콘텐츠 추가 완료: {title[:30]}...")
-                return post_id
+            
+            if self._title_index is not None:
+                self._title_index.add(post_id, title, site=site)
+            
+            logger.info(f"✅ 콘텐츠 추가 완료: {title[:30]}...")
+            return post_id
                 
         except Exception as e:
-            conn.rollback()
             logger.error(f"콘텐츠 추가 오류: {e}")
             raise
     
     def update_content_metadata(self, file_id: int, metadata: Dict):
         """콘텐츠 메타데이터 업데이트 (자동 발행 시 목록 반영용)"""
         try:
-            self._reset_connection_if_needed()
-            conn = self.get_connection()
-            
-            with conn.cursor() as cursor:
+            with self.connection() as conn, conn.cursor() as cursor:
                 # metadata 컬럼을 JSON 형태로 업데이트
                 cursor.execute(f"""
                     UPDATE {self.schema}.content_files
@@ -229,18 +356,13 @@ class PostgreSQLDatabase:
                 logger.info(f"콘텐츠 메타데이터 업데이트 완료: ID={file_id}")
                 
         except Exception as e:
-            conn.rollback()
             logger.error(f"메타데이터 업데이트 오류: {e}")
             # 에러를 무시하고 계속 진행 (메타데이터 업데이트는 선택사항)
     
     def get_recent_posts(self, site: str, limit: int = 10) -> List[Dict]:
         """최근 발행 포스트 조회"""
         try:
-            # 새로운 연결 사용하여 트랜잭션 오류 방지
-            self._reset_connection_if_needed()
-            conn = self.get_connection()
-            
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with self.connection() as conn, conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
                 # content_history 테이블이 없을 수 있으므로 안전한 쿼리 사용
                 cursor.execute(f"""
                     SELECT EXISTS (
@@ -275,7 +397,6 @@ class PostgreSQLDatabase:
                 
         except Exception as e:
             logger.error(f"최근 포스트 조회 오류: {e}")
-            self._reset_connection_if_needed()
             return []
     
     # ========================================================================
@@ -284,9 +405,8 @@ class PostgreSQLDatabase:
     
     def get_unused_topic(self, site: str) -> Optional[Dict]:
         """사용하지 않은 주제 가져오기"""
-        conn = self.get_connection()
         try:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with self.connection() as conn, conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
                 cursor.execute("""
                     SELECT id, topic, category, target_keywords
                     FROM topic_pool 
@@ -315,32 +435,27 @@ class PostgreSQLDatabase:
                 
         except Exception as e:
             logger.error(f"주제 조회 오류: {e}")
-            conn.rollback()
             return None
     
     def add_topics_bulk(self, site: str, topics: List[Dict]):
-        """대량 주제 추가"""
-        conn = self.get_connection()
+        """대량 주제 추가 (한 문장으로 일괄 INSERT, 이미 있는 주제는 건너뜀)"""
         try:
-            with conn.cursor() as cursor:
-                for topic in topics:
-                    cursor.execute("""
-                        INSERT INTO topic_pool (site, topic, category, priority, target_keywords)
-                        VALUES (%s, %s, %s, %s, %s)
-                        ON CONFLICT (site, topic) DO NOTHING
-                    """, (
-                        site, 
-                        topic['topic'], 
-                        topic.get('category', ''), 
-                        topic.get('priority', 5),
-                        json.dumps(topic.get('target_keywords', []), ensure_ascii=False)
-                    ))
+            with self.connection() as conn, conn.cursor() as cursor:
+                bulk_upsert(cursor, 'topic_pool',
+                            ('site', 'topic', 'category', 'priority', 'target_keywords'),
+                            [(
+                                site, 
+                                topic['topic'], 
+                                topic.get('category', ''), 
+                                topic.get('priority', 5),
+                                json.dumps(topic.get('target_keywords', []), ensure_ascii=False)
+                            ) for topic in topics],
+                            conflict=('site', 'topic'))
                 
                 conn.commit()
                 logger.info(f"✅ 주제 {len(topics)}개 추가 완료")
                 
         except Exception as e:
-            conn.rollback()
             logger.error(f"주제 추가 오류: {e}")
             raise
     
@@ -351,18 +466,16 @@ class PostgreSQLDatabase:
     def add_content_file(self, site: str, title: str, file_path: str, 
                         file_type: str, metadata: Dict[str, Any]) -> int:
         """콘텐츠 파일 정보 추가"""
-        # 새로운 연결을 사용하여 트랜잭션 오류 방지
-        self._reset_connection_if_needed()
-            
-        conn = self.get_connection()
         try:
-            with conn.cursor() as cursor:
+            with self.connection() as conn, conn.cursor() as cursor:
+                status = metadata.get('status', 'processing')  # processing 상태로 설정
                 cursor.execute(f"""
                     INSERT INTO {self.schema}.content_files 
                     (site, title, file_path, file_type, word_count, reading_time, 
-                     tags, categories, file_size, status)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
+                     tags, categories, file_size, status, published_at)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                            CASE WHEN %s = 'published' THEN COALESCE(%s, CURRENT_TIMESTAMP) END)
+                    RETURNING id, published_at
                 """, (
                     site, title, file_path, file_type,
                     metadata.get('word_count', 0),
@@ -370,30 +483,33 @@ class PostgreSQLDatabase:
                     metadata.get('tags', []) or [],  # PostgreSQL 배열 타입으로 전달
                     metadata.get('categories', []) or [],  # PostgreSQL 배열 타입으로 전달
                     metadata.get('file_size', 0),
-                    metadata.get('status', 'processing')  # processing 상태로 설정
+                    status,
+                    status, metadata.get('published_at')
                 ))
                 
-                file_id = cursor.fetchone()[0]
+                file_id, published_at = cursor.fetchone()
+                deltas = [{'date': daily_metrics.metric_date(), 'site': site,
+                           'kind': daily_metrics.KIND_CONTENT, 'count': 1}]
+                # 발행 상태로 바로 저장되는 글도 발행 건수에 포함 (백필과 같은 published_at 기준)
+                if published_at:
+                    deltas.append({'date': daily_metrics.metric_date(published_at), 'site': site,
+                                   'kind': daily_metrics.KIND_PUBLISHED, 'count': 1})
+                self.record_daily_metrics(cursor, deltas)
                 conn.commit()
+                invalidate_responses('content')
                 
                 logger.info(f"✅ 콘텐츠 파일 추가: {title[:30]}...")
                 return file_id
                 
         except Exception as e:
-            try:
-                conn.rollback()
-            except:
-                pass
             logger.error(f"콘텐츠 파일 추가 오류: {e}")
-            self._reset_connection_if_needed()
             raise
     
     def get_content_files(self, site: str = None, file_type: str = None, 
                          limit: int = 50) -> List[Dict]:
         """콘텐츠 파일 목록 조회"""
-        conn = self.get_connection()
         try:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with self.connection() as conn, conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
                 query = f"SELECT * FROM {self.schema}.content_files WHERE 1=1"
                 params = []
                 
@@ -409,28 +525,113 @@ class PostgreSQLDatabase:
                 params.append(limit)
                 
                 cursor.execute(query, params)
-                
-                files = []
-                for row in cursor.fetchall():
-                    file_dict = dict(row)
-                    # JSONB 필드 변환
-                    for field in ['tags', 'categories']:
-                        if file_dict.get(field):
-                            file_dict[field] = json.loads(file_dict[field]) if isinstance(file_dict[field], str) else file_dict[field]
-                    
-                    # DateTime 필드 포맷팅
-                    for field in ['created_at', 'published_at']:
-                        if file_dict.get(field):
-                            file_dict[field] = self._format_datetime_for_display(file_dict[field])
-                    
-                    files.append(file_dict)
-                
-                return files
+                return [self._content_file_from_row(row) for row in cursor.fetchall()]
                 
         except Exception as e:
             logger.error(f"콘텐츠 파일 조회 오류: {e}")
             return []
     
+    def _content_file_from_row(self, row) -> Dict[str, Any]:
+        """content_files 행을 화면용 dict로 변환 (JSONB 디코딩, 한국 시간 포맷)"""
+        file_dict = dict(row)
+        # JSONB 필드 변환
+        for field in ['tags', 'categories']:
+            if file_dict.get(field):
+                file_dict[field] = json.loads(file_dict[field]) if isinstance(file_dict[field], str) else file_dict[field]
+        
+        # DateTime 필드 포맷팅
+        for field in ['created_at', 'published_at']:
+            if file_dict.get(field):
+                file_dict[field] = self._format_datetime_for_display(file_dict[field])
+        return file_dict
+    
+    def get_content_file(self, file_id: int) -> Optional[Dict[str, Any]]:
+        """콘텐츠 파일 1건 조회 (기본 키)"""
+        try:
+            with self.connection() as conn, conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+                cursor.execute(f"SELECT * FROM {self.schema}.content_files WHERE id = %s", (file_id,))
+                row = cursor.fetchone()
+                return self._content_file_from_row(row) if row else None
+        except Exception as e:
+            logger.error(f"콘텐츠 파일 조회 오류 (id={file_id}): {e}")
+            return None
+    
+    def list_content_files(self, site: str = None, file_type: str = None, status: str = None,
+                           date_from: date = None, date_to: date = None, cursor: str = None,
+                           limit: int = 50, tz: str = 'Asia/Seoul') -> Dict[str, Any]:
+        """콘텐츠 목록 키셋 페이지 조회 (최신순)
+        
+        OFFSET 없이 이전 페이지 마지막 행의 (created_at, id) 다음부터 읽으므로
+        (인덱스 idx_content_files_created_id / idx_content_files_site_created_id는 database/*.sql에서 생성)
+        파일 수와 관계없이 페이지당 비용이 같고, 중간에 행이 추가돼도 중복/누락이 없다.
+        date_from/date_to는 tz 기준 날짜(양 끝 포함). 본문(content)은 목록에서 제외한다.
+        
+        반환: {'items': [...], 'next_cursor': str|None, 'total_estimate': int}
+        """
+        limit = max(1, min(int(limit), CONTENT_PAGE_MAX))
+        zone = pytz.timezone(tz)
+        
+        conditions, params = [], []
+        if site:
+            conditions.append("site = %s")
+            params.append(site)
+        if file_type:
+            conditions.append("file_type = %s")
+            params.append(file_type)
+        if status:
+            conditions.append("status = %s")
+            params.append(status)
+        if date_from:
+            conditions.append("created_at >= %s")
+            params.append(zone.localize(datetime.combine(date_from, time.min)))
+        if date_to:
+            conditions.append("created_at < %s")
+            params.append(zone.localize(datetime.combine(date_to + timedelta(days=1), time.min)))
+        filters = " AND ".join(conditions) or "TRUE"
+        
+        page_conditions, page_params = list(conditions), list(params)
+        if cursor:
+            page_conditions.append("(created_at, id) < (%s, %s)")
+            page_params.extend(decode_page_cursor(cursor))
+        
+        with self.connection() as conn, conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as db_cursor:
+            db_cursor.execute(f"""
+                SELECT id, site, title, file_path, file_type, word_count, reading_time,
+                       status, tags, categories, file_size, metadata, created_at, published_at
+                FROM {self.schema}.content_files
+                WHERE {" AND ".join(page_conditions) or "TRUE"}
+                ORDER BY created_at DESC, id DESC
+                LIMIT %s
+            """, page_params + [limit + 1])
+            rows = db_cursor.fetchall()
+            
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            if not cursor and not has_more:
+                total_estimate = len(rows)
+            else:
+                total_estimate = self._estimate_count(db_cursor, filters, params)
+            conn.commit()
+        
+        last = rows[-1] if rows and has_more else None
+        return {
+            'items': [dict(row) for row in rows],
+            'next_cursor': encode_page_cursor(last['created_at'], last['id']) if last else None,
+            'total_estimate': total_estimate,
+        }
+    
+    def _estimate_count(self, cursor, filters: str, params: List[Any]) -> int:
+        """플래너 행 수 추정치 (COUNT(*) 전체 스캔 대신 EXPLAIN 사용)"""
+        cursor.execute(f"""
+            EXPLAIN (FORMAT JSON)
+            SELECT 1 FROM {self.schema}.content_files WHERE {filters}
+        """, params)
+        plan = cursor.fetchone()
+        plan = plan['QUERY PLAN'] if isinstance(plan, dict) else plan[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+    
     # ========================================================================
     # 시스템 로그 관리
     # ========================================================================
@@ -440,10 +641,7 @@ class PostgreSQLDatabase:
                        trace_id: str = None, duration_ms: int = None):
         """시스템 로그 추가"""
         try:
-            self._reset_connection_if_needed()
-            conn = self.get_connection()
-            
-            with conn.cursor() as cursor:
+            with self.connection() as conn, conn.cursor() as cursor:
                 cursor.execute(f"""
                     INSERT INTO {self.schema}.system_logs 
                     (level, component, message, details, site, trace_id, duration_ms)
@@ -458,16 +656,12 @@ class PostgreSQLDatabase:
         except Exception as e:
             # 로그 기록 실패 시에도 메인 프로세스는 계속 진행
             print(f"로그 기록 실패: {e}")
-            self._reset_connection_if_needed()
     
     def get_system_logs(self, level: str = None, component: str = None, 
                        limit: int = 100) -> List[Dict]:
         """시스템 로그 조회"""
         try:
-            self._reset_connection_if_needed()
-            conn = self.get_connection()
-            
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with self.connection() as conn, conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
                 query = f"SELECT * FROM {self.schema}.system_logs WHERE 1=1"
                 params = []
                 
@@ -495,7 +689,6 @@ class PostgreSQLDatabase:
                 
         except Exception as e:
             logger.error(f"시스템 로그 조회 오류: {e}")
-            self._reset_connection_if_needed()
             return []
     
     # ========================================================================
@@ -504,9 +697,8 @@ class PostgreSQLDatabase:
     
     def add_revenue_data(self, site: str, date_str: str, revenue_data: Dict[str, Any]):
         """수익 데이터 추가/업데이트"""
-        conn = self.get_connection()
         try:
-            with conn.cursor() as cursor:
+            with self.connection() as conn, conn.cursor() as cursor:
                 cursor.execute("""
                     INSERT INTO revenue_tracking 
                     (site, date, ad_revenue, affiliate_revenue, page_views,
@@ -537,15 +729,13 @@ class PostgreSQLDatabase:
                 conn.commit()
                 
         except Exception as e:
-            conn.rollback()
             logger.error(f"수익 데이터 추가 오류: {e}")
             raise
     
     def get_revenue_summary(self, site: str = None, days: int = 30) -> Dict[str, Any]:
         """수익 요약 조회"""
-        conn = self.get_connection()
         try:
-            with conn.cursor() as cursor:
+            with self.connection() as conn, conn.cursor() as cursor:
                 query = """
                     SELECT 
                         COALESCE(SUM(ad_revenue + affiliate_revenue + impression_revenue + click_revenue), 0) as total_revenue,
@@ -593,9 +783,8 @@ class PostgreSQLDatabase:
                        site: str = None, request_id: str = None,
                        http_status: int = None):
         """API 사용량 추적"""
-        conn = self.get_connection()
         try:
-            with conn.cursor() as cursor:
+            with self.connection() as conn, conn.cursor() as cursor:
                 cursor.execute("""
                     INSERT INTO api_usage 
                     (api_provider, endpoint, tokens_used, cost, success, 
@@ -613,9 +802,8 @@ class PostgreSQLDatabase:
     
     def get_api_usage_summary(self, days: int = 30) -> Dict[str, Any]:
         """API 사용량 요약"""
-        conn = self.get_connection()
         try:
-            with conn.cursor() as cursor:
+            with self.connection() as conn, conn.cursor() as cursor:
                 cursor.execute("""
                     SELECT 
                         api_provider,
@@ -647,52 +835,226 @@ class PostgreSQLDatabase:
             return {}
     
     # ========================================================================
-    # 대시보드 통계
+    # 일별 지표 롤업
     # ========================================================================
     
-    def get_dashboard_stats(self) -> Dict[str, Any]:
-        """대시보드용 종합 통계"""
-        conn = self.get_connection()
+    def prepare_daily_metrics(self) -> bool:
+        """시작 시 1회 - 롤업 테이블이 없으면 별도 트랜잭션에서 생성/백필하고 커밋한 뒤에만 준비 완료로 표시"""
         try:
-            with conn.cursor() as cursor:
-                # 기본 통계 (content_files 테이블 사용)
-                cursor.execute(f"SELECT COUNT(*) FROM {self.schema}.content_files")
-                total_posts = cursor.fetchone()[0]
-                
-                cursor.execute(f"""
-                    SELECT COUNT(*) FROM {self.schema}.content_files 
-                    WHERE DATE(created_at) = CURRENT_DATE
-                """)
-                today_posts = cursor.fetchone()[0]
-                
-                # 사이트별 통계
+            with self.connection() as conn, conn.cursor() as cursor:
+                if daily_metrics.ensure_daily_metrics_table(cursor, self.schema):
+                    daily_metrics.backfill_daily_metrics(cursor, self.schema)
+                conn.commit()
+        except Exception as e:
+            logger.error(f"일별 지표 롤업 준비 실패 (backfill_daily_metrics.py로 다시 생성): {e}")
+            return False
+        self._daily_metrics_ready = True
+        return True
+    
+    def ensure_daily_metrics(self, cursor) -> bool:
+        """롤업 테이블 사용 가능 여부 - 쓰기/조회 트랜잭션 안에서는 DDL 없이 존재만 확인
+
+        테이블이 없으면 False (증분은 건너뛰고, 나중에 테이블을 만들 때 백필이 원본에서 다시 계산).
+        """
+        if not getattr(self, '_daily_metrics_ready', False):
+            cursor.execute("SELECT to_regclass(%s)", (f"{self.schema}.daily_metrics",))
+            row = cursor.fetchone()
+            if not (row and row[0]):
+                logger.warning("daily_metrics 테이블이 없어 롤업 갱신을 건너뜀 - backfill_daily_metrics.py 실행 필요")
+                return False
+            self._daily_metrics_ready = True
+        return True
+    
+    def record_daily_metrics(self, cursor, deltas: List[Dict[str, Any]]):
+        """원본 쓰기와 같은 트랜잭션에서 롤업 증분 반영 (커밋은 호출자)"""
+        if self.ensure_daily_metrics(cursor):
+            daily_metrics.apply_deltas(cursor, self.schema, deltas)
+    
+    def _update_status(self, cursor, file_id: int, status: str, published_at=None):
+        """상태 변경 + 발행 전환만 롤업에 집계 (커밋은 호출자)
+
+        published로 바뀔 때 published_at이 비어 있으면 현재 시각을 기록해
+        증분 집계와 백필(published_at 기준)이 같은 날짜로 맞춰진다.
+        """
+        cursor.execute(f"""
+            UPDATE {self.schema}.content_files c
+            SET status = %(status)s,
+                published_at = CASE WHEN %(status)s = 'published'
+                                    THEN COALESCE(%(published_at)s, c.published_at, CURRENT_TIMESTAMP)
+                                    ELSE COALESCE(%(published_at)s, c.published_at) END
+            FROM (SELECT id, status FROM {self.schema}.content_files
+                  WHERE id = %(id)s FOR UPDATE) prev
+            WHERE c.id = prev.id
+            RETURNING c.site, prev.status, c.published_at
+        """, {'status': status, 'published_at': published_at, 'id': file_id})
+        row = cursor.fetchone()
+        if row and status == 'published' and row[1] != 'published':
+            self.record_daily_metrics(cursor, [
+                {'date': daily_metrics.metric_date(row[2]), 'site': row[0],
+                 'kind': daily_metrics.KIND_PUBLISHED, 'count': 1}
+            ])
+    
+    def _record_deletions(self, cursor, deleted: List[tuple]):
+        """삭제된 (site, created_at, status, published_at) 행만큼 롤업 차감"""
+        deltas = []
+        for site, created_at, status, published_at in deleted:
+            if created_at:
+                deltas.append({'date': daily_metrics.metric_date(created_at), 'site': site,
+                               'kind': daily_metrics.KIND_CONTENT, 'count': -1})
+            if status == 'published' and published_at:
+                deltas.append({'date': daily_metrics.metric_date(published_at), 'site': site,
+                               'kind': daily_metrics.KIND_PUBLISHED, 'count': -1})
+        if deltas:
+            self.record_daily_metrics(cursor, deltas)
+    
+    def backfill_daily_metrics(self, since: date = None) -> int:
+        """원본 테이블로 롤업 재계산 (since 이후, None이면 전체) - 생성된 롤업 행 수 반환"""
+        with self.connection() as conn, conn.cursor() as cursor:
+            if daily_metrics.ensure_daily_metrics_table(cursor, self.schema):
+                since = None
+            count = daily_metrics.backfill_daily_metrics(cursor, self.schema, since)
+            conn.commit()
+        self._daily_metrics_ready = True
+        invalidate_responses('content', 'api_usage')
+        return count
+    
+    def get_daily_metrics(self, kind: str, start: date, end: date = None,
+                          site: str = None) -> List[Dict[str, Any]]:
+        """롤업 조회 - [start, end] 기간의 (날짜, 사이트)별 행 (end 기본값: 오늘)"""
+        end = end or daily_metrics.metric_date()
+        with self.connection() as conn, conn.cursor() as cursor:
+            if not self.ensure_daily_metrics(cursor):
+                return []
+            rows = daily_metrics.read_daily_metrics(cursor, self.schema, kind, start, end, site)
+            conn.commit()
+        return rows
+    
+    # ========================================================================
+    # 대시보드 통계
+    # ========================================================================
+    
+    def get_content_aggregates(self, days: int = 7, tz: str = 'Asia/Seoul',
+                               include_totals: bool = True) -> Dict[str, Any]:
+        """콘텐츠 집계를 쿼리 1회로 조회 (일별 차트 + 전체 통계)
+        
+        일 단위 버킷은 tz 기준 자정으로 자르며, 창의 시작은 created_at 범위 조건으로 비교하여
+        created_at 인덱스를 그대로 사용한다. include_totals=True면 GROUPING SETS로
+        사이트/파일 종류/상태별 전체 건수까지 같은 스캔에서 함께 계산한다.
+        
+        반환: {'daily': [{'date', 'count', 'by_site'}] (오늘부터 과거순),
+               'window_by_site', 'total', 'by_site', 'by_file_type', 'by_status'}
+        """
+        days = max(1, int(days))
+        today = datetime.now(pytz.timezone(tz)).date()
+        window_dates = [today - timedelta(days=i) for i in range(days)]
+        window_start = pytz.timezone(tz).localize(datetime.combine(window_dates[-1], time.min))
+        
+        with self.connection() as conn, conn.cursor() as cursor:
+            if include_totals:
                 cursor.execute(f"""
-                    SELECT site, COUNT(*) FROM {self.schema}.content_files GROUP BY site
-                """)
-                site_stats = dict(cursor.fetchall())
-                
-                # 파일 통계
+                    SELECT day, site, file_type, status, COUNT(*),
+                           GROUPING(day, site, file_type, status)
+                    FROM (
+                        SELECT site, file_type, status,
+                               CASE WHEN created_at >= %s
+                                    THEN (created_at AT TIME ZONE %s)::date END AS day
+                        FROM {self.schema}.content_files
+                    ) t
+                    GROUP BY GROUPING SETS ((day, site), (site), (file_type), (status), ())
+                """, (window_start, tz))
+            else:
                 cursor.execute(f"""
-                    SELECT file_type, COUNT(*) FROM {self.schema}.content_files GROUP BY file_type
-                """)
-                file_stats = dict(cursor.fetchall())
-                
-                # 최근 7일 수익
-                revenue_summary = self.get_revenue_summary(days=7)
-                
-                # API 사용량
-                api_summary = self.get_api_usage_summary(days=7)
-                
-                return {
-                    'posts': {
-                        'total': total_posts,
-                        'today': today_posts,
-                        'by_site': site_stats
-                    },
-                    'files': file_stats,
-                    'revenue': revenue_summary,
-                    'api_usage': api_summary
-                }
+                    SELECT (created_at AT TIME ZONE %s)::date AS day, site, NULL, NULL, COUNT(*), 3
+                    FROM {self.schema}.content_files
+                    WHERE created_at >= %s
+                    GROUP BY 1, 2
+                """, (tz, window_start))
+            rows = cursor.fetchall()
+        
+        daily = {d: {} for d in window_dates}
+        result = {'total': 0, 'by_site': {}, 'by_file_type': {}, 'by_status': {}}
+        for day, site, file_type, status, count, grouping in rows:
+            if grouping == 3:      # (day, site)
+                if day in daily:
+                    daily[day][site] = daily[day].get(site, 0) + count
+            elif grouping == 11:   # (site)
+                result['by_site'][site] = count
+            elif grouping == 13:   # (file_type)
+                result['by_file_type'][file_type] = count
+            elif grouping == 14:   # (status)
+                result['by_status'][status] = count
+            elif grouping == 15:   # ()
+                result['total'] = count
+        
+        window_by_site: Dict[str, int] = {}
+        for by_site in daily.values():
+            for site, count in by_site.items():
+                window_by_site[site] = window_by_site.get(site, 0) + count
+        
+        result['daily'] = [
+            {'date': d.strftime('%Y-%m-%d'), 'count': sum(daily[d].values()), 'by_site': daily[d]}
+            for d in window_dates
+        ]
+        result['window_by_site'] = window_by_site
+        return result
+    
+    def get_content_breakdown(self) -> Dict[str, Dict[str, int]]:
+        """현재 콘텐츠의 파일 종류별/상태별 건수 (시계열이 아니라 롤업 대상이 아님)"""
+        with self.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(f"""
+                SELECT file_type, status, COUNT(*), GROUPING(file_type, status)
+                FROM {self.schema}.content_files
+                GROUP BY GROUPING SETS ((file_type), (status))
+            """)
+            rows = cursor.fetchall()
+        
+        breakdown = {'by_file_type': {}, 'by_status': {}}
+        for file_type, status, count, grouping in rows:
+            if grouping == 1:
+                breakdown['by_file_type'][file_type] = count
+            else:
+                breakdown['by_status'][status] = count
+        return breakdown
+    
+    def get_dashboard_stats(self, days: int = 7) -> Dict[str, Any]:
+        """대시보드용 종합 통계 (콘텐츠/발행 건수는 daily_metrics 롤업에서 조회)"""
+        try:
+            days = max(1, int(days))
+            today = daily_metrics.metric_date()
+            window_dates = [today - timedelta(days=i) for i in range(days)]
+            
+            daily = {d: {} for d in window_dates}
+            by_site: Dict[str, int] = {}
+            for row in self.get_daily_metrics(daily_metrics.KIND_CONTENT, date(1970, 1, 1), today):
+                by_site[row['site']] = by_site.get(row['site'], 0) + row['count']
+                if row['date'] in daily:
+                    daily[row['date']][row['site']] = row['count']
+            published = self.get_daily_metrics(daily_metrics.KIND_PUBLISHED, window_dates[-1], today)
+            breakdown = self.get_content_breakdown()
+            
+            # 최근 수익
+            revenue_summary = self.get_revenue_summary(days=days)
+            
+            # API 사용량
+            api_summary = self.get_api_usage_summary(days=days)
+            
+            return {
+                'posts': {
+                    'total': sum(by_site.values()),
+                    'today': sum(daily[today].values()),
+                    'by_site': by_site,
+                    'by_status': breakdown['by_status'],
+                    'published_today': sum(r['count'] for r in published if r['date'] == today),
+                    'published_window': sum(r['count'] for r in published)
+                },
+                'files': breakdown['by_file_type'],
+                'daily': [
+                    {'date': d.strftime('%Y-%m-%d'), 'count': sum(daily[d].values()), 'by_site': daily[d]}
+                    for d in window_dates
+                ],
+                'revenue': revenue_summary,
+                'api_usage': api_summary
+            }
                 
         except Exception as e:
             logger.error(f"대시보드 통계 조회 오류: {e}")
@@ -710,52 +1072,32 @@ class PostgreSQLDatabase:
     def update_content_file_status(self, file_id: int, status: str, 
                                    published_at: str = None):
         """콘텐츠 파일 상태 업데이트"""
-        conn = self.get_connection()
         try:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    UPDATE content_files 
-                    SET status = %s, published_at = %s
-                    WHERE id = %s
-                """, (status, published_at, file_id))
+            with self.connection() as conn, conn.cursor() as cursor:
+                self._update_status(cursor, file_id, status, published_at)
                 conn.commit()
+                invalidate_responses('content')
                 
         except Exception as e:
-            conn.rollback()
             logger.error(f"파일 상태 업데이트 오류: {e}")
     
     def update_file_status(self, file_id: int, status: str, published_at: datetime = None):
         """파일 상태 및 발행 시간 업데이트 (web_dashboard용)"""
-        conn = self.get_connection()
         try:
-            with conn.cursor() as cursor:
-                if published_at:
-                    cursor.execute(f"""
-                        UPDATE {self.schema}.content_files 
-                        SET status = %s, published_at = %s
-                        WHERE id = %s
-                    """, (status, published_at, file_id))
-                else:
-                    cursor.execute(f"""
-                        UPDATE {self.schema}.content_files 
-                        SET status = %s
-                        WHERE id = %s
-                    """, (status, file_id))
+            with self.connection() as conn, conn.cursor() as cursor:
+                self._update_status(cursor, file_id, status, published_at)
                 conn.commit()
+                invalidate_responses('content')
                 logger.info(f"파일 상태 업데이트 완료: ID={file_id}, Status={status}")
                 
         except Exception as e:
-            conn.rollback()
             logger.error(f"파일 상태 업데이트 오류: {e}")
             raise
     
     def get_site_configs(self) -> Dict[str, Dict]:
         """사이트 설정 조회"""
         try:
-            self._reset_connection_if_needed()
-            conn = self.get_connection()
-            
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with self.connection() as conn, conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
                 cursor.execute(f"""
                     SELECT site_code, site_name, site_url, site_type,
                            content_config, publishing_schedule
@@ -778,22 +1120,12 @@ class PostgreSQLDatabase:
                 
         except Exception as e:
             logger.error(f"사이트 설정 조회 오류: {e}")
-            self._reset_connection_if_needed()
             return {}
     
     def get_topic_stats(self, site: str = None) -> Dict[str, int]:
         """주제 통계 조회"""
         try:
-            # topic_pool 테이블이 없을 수 있으므로 새로운 연결로 시도
-            if self._connection and not self._connection.closed:
-                try:
-                    self._connection.close()
-                except:
-                    pass
-            self._connection = None
-                
-            conn = self.get_connection()
-            with conn.cursor() as cursor:
+            with self.connection() as conn, conn.cursor() as cursor:
                 # 테이블 존재 확인
                 cursor.execute(f"""
                     SELECT EXISTS (
@@ -833,26 +1165,22 @@ class PostgreSQLDatabase:
                 }
         except Exception as e:
             logger.error(f"주제 통계 조회 오류: {e}")
-            # 오류 발생시에도 연결 재설정
-            try:
-                if self._connection and not self._connection.closed:
-                    self._connection.close()
-                self._connection = None
-            except:
-                pass
             return {'used_count': 0, 'unused_count': 0, 'total_count': 0}
     
     def delete_content_file(self, file_id: int) -> bool:
         """콘텐츠 파일 삭제"""
         try:
-            conn = self.get_connection()
-            with conn.cursor() as cursor:
+            with self.connection() as conn, conn.cursor() as cursor:
                 cursor.execute(f"""
                     DELETE FROM {self.schema}.content_files 
                     WHERE id = %s
+                    RETURNING site, created_at, status, published_at
                 """, (file_id,))
+                deleted = cursor.fetchall()
+                self._record_deletions(cursor, deleted)
                 conn.commit()
-                return cursor.rowcount > 0
+                invalidate_responses('content')
+                return len(deleted) > 0
         except Exception as e:
             logger.error(f"파일 삭제 오류: {e}")
             return False
@@ -860,14 +1188,17 @@ class PostgreSQLDatabase:
     def delete_content_by_path(self, file_path: str) -> bool:
         """파일 경로로 콘텐츠 삭제"""
         try:
-            conn = self.get_connection()
-            with conn.cursor() as cursor:
+            with self.connection() as conn, conn.cursor() as cursor:
                 cursor.execute(f"""
                     DELETE FROM {self.schema}.content_files 
                     WHERE file_path = %s
+                    RETURNING site, created_at, status, published_at
                 """, (file_path,))
+                deleted = cursor.fetchall()
+                self._record_deletions(cursor, deleted)
                 conn.commit()
-                deleted_count = cursor.rowcount
+                invalidate_responses('content')
+                deleted_count = len(deleted)
                 logger.info(f"경로로 DB 삭제: {file_path} (삭제된 행: {deleted_count})")
                 return deleted_count > 0
         except Exception as e:
@@ -877,8 +1208,7 @@ class PostgreSQLDatabase:
     def get_content_files(self, file_type: str = None, limit: int = 50) -> List[Dict]:
         """콘텐츠 파일 목록 조회 (오버로드 버전)"""
         try:
-            conn = self.get_connection()
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with self.connection() as conn, conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
                 
                 query = f"""
                     SELECT id, site, title, file_path, file_type, word_count, 
@@ -945,10 +1275,6 @@ class PostgreSQLDatabase:
         
         # 사용자 친화적 형식으로 반환
         return kst_time.strftime('%Y-%m-%d %H:%M:%S')
-    
-    def __del__(self):
-        """소멸자 - 연결 정리"""
-        self.close_connection()
 
 
 # 백워드 호환성을 위한 별칭
@@ -16,6 +16,9 @@ import time
 import re
 import logging
 
+from src.utils.trend_collector import TrendItem
+from src.utils.trend_snapshot_store import get_trend_store
+
 try:
     from pytrends.request import TrendReq
     PYTRENDS_AVAILABLE = True
@@ -28,8 +31,14 @@ class RealtimeTrends:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        if PYTRENDS_AVAILABLE:
-            self.pytrends = TrendReq(hl='ko-KR', tz=540, timeout=(10,25))  # 한국 시간대
+        self._pytrends = None
+    
+    @property
+    def pytrends(self):
+        """Google Trends 클라이언트 (생성 시 쿠키 요청이 나가므로 처음 사용할 때 초기화)"""
+        if self._pytrends is None:
+            self._pytrends = TrendReq(hl='ko-KR', tz=540, timeout=(10,25))  # 한국 시간대
+        return self._pytrends
         
     def get_google_trends(self, timeframe='now 1-d') -> List[Dict]:
         """구글 트렌드 데이터 수집"""
@@ -266,9 +275,8 @@ class RealtimeTrends:
         ]
         return fallback_data
     
-    def get_combined_trends(self) -> Dict[str, List[str]]:
-        """구글과 네이버 트렌드를 결합하여 블로그 주제 생성"""
-        
+    def collect_trend_items(self) -> List[TrendItem]:
+        """구글 + 네이버 트렌드 수집 (스냅샷 저장소의 수집 함수)"""
         print("🔍 실시간 트렌드 데이터 수집 중...")
         
         # 구글 트렌드 수집
@@ -278,8 +286,24 @@ class RealtimeTrends:
         # 네이버 트렌드 수집
         naver_trends = self.get_naver_realtime_keywords()
         
-        # 트렌드 결합
-        all_trends = google_trends + naver_trends
+        return [
+            TrendItem(title=str(trend['keyword']), source=trend['source'], category=trend['category'],
+                      score=100 - trend['rank'])
+            for trend in google_trends + naver_trends
+        ]
+    
+    def get_combined_trends(self) -> Dict[str, List[str]]:
+        """구글과 네이버 트렌드를 결합하여 블로그 주제 생성 (최신 스냅샷 사용, 오래됐으면 백그라운드 갱신)"""
+        snapshot = get_trend_store('realtime', self.collect_trend_items).get()
+        if snapshot is None:
+            return {}
+        
+        # 트렌드 결합 (스냅샷은 구글 → 네이버 순서로 저장됨)
+        all_trends = [
+            {'keyword': trend.title, 'rank': int(100 - trend.score), 'source': trend.source,
+             'category': trend.category}
+            for trend in snapshot.trends
+        ]
         
         # 블로그 주제로 변환
         blog_topics = self.convert_trends_to_blog_topics(all_trends)
@@ -0,0 +1,174 @@
+"""
+대시보드 조회 API 응답 캐시
+- 엔드포인트별 TTL로 직렬화된 응답 본문을 메모리에 보관 (키: 경로 + 쿼리스트링)
+- ETag/If-None-Match 지원: 내용이 같으면 304로 본문 전송도 생략
+- 태그('content', 'schedule', 'api_usage') 단위 무효화: 쓰기 경로에서 invalidate_responses() 호출
+- 계산 도중 무효화가 일어나면 그 결과는 저장하지 않음 (태그 버전 비교)
+"""
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Dict, Iterable, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """캐시된 응답 (본문은 직렬화된 bytes)"""
+    body: bytes
+    mimetype: str
+    etag: str
+    expires_at: float
+    tags: Tuple[str, ...]
+    headers: Tuple[Tuple[str, str], ...] = ()
+
+
+class ResponseCache:
+    """태그 기반 무효화를 지원하는 TTL 응답 캐시 (스레드 안전)"""
+
+    def __init__(self, enabled: bool = True, max_entries: int = 512):
+        self.enabled = enabled
+        self.max_entries = max(1, max_entries)
+        self._entries: Dict[str, CachedResponse] = {}
+        self._tag_versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._metrics = {'hits': 0, 'misses': 0, 'not_modified': 0, 'invalidations': 0, 'stale_skips': 0}
+
+    def tag_versions(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        """태그별 무효화 버전 (계산 시작 시점 기록용)"""
+        with self._lock:
+            return tuple(self._tag_versions.get(tag, 0) for tag in tags)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.time():
+                self._entries.pop(key, None)
+                self._metrics['misses'] += 1
+                return None
+            self._metrics['hits'] += 1
+            return entry
+
+    def set(self, key: str, body: bytes, mimetype: str, ttl: float, tags: Tuple[str, ...],
+            versions: Tuple[int, ...] = None,
+            headers: Iterable[Tuple[str, str]] = ()) -> Optional[CachedResponse]:
+        """응답 저장 - versions가 현재 태그 버전과 다르면(계산 중 무효화) 저장하지 않음"""
+        entry = CachedResponse(
+            body=body,
+            mimetype=mimetype,
+            etag=hashlib.sha1(body).hexdigest(),
+            expires_at=time.time() + ttl,
+            tags=tuple(tags),
+            headers=tuple(headers),
+        )
+        with self._lock:
+            if versions is not None and versions != tuple(self._tag_versions.get(tag, 0) for tag in tags):
+                self._metrics['stale_skips'] += 1
+                return entry
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                # 만료가 가장 가까운 항목부터 제거
+                oldest = min(self._entries, key=lambda k: self._entries[k].expires_at)
+                del self._entries[oldest]
+            self._entries[key] = entry
+        return entry
+
+    def invalidate(self, *tags: str) -> int:
+        """태그에 속한 항목 삭제, 삭제된 항목 수 반환"""
+        with self._lock:
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+            stale = [key for key, entry in self._entries.items() if set(entry.tags) & set(tags)]
+            for key in stale:
+                del self._entries[key]
+            self._metrics['invalidations'] += 1
+        if stale:
+            logger.debug(f"[RESPONSE_CACHE] {tags} 무효화: {len(stale)}개 항목")
+        return len(stale)
+
+    def record_not_modified(self):
+        with self._lock:
+            self._metrics['not_modified'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['entries'] = len(self._entries)
+        lookups = metrics['hits'] + metrics['misses']
+        metrics['hit_rate'] = round(metrics['hits'] / lookups, 3) if lookups else 0.0
+        metrics['enabled'] = self.enabled
+        return metrics
+
+
+# 프로세스 전역 응답 캐시
+response_cache = ResponseCache(
+    enabled=os.getenv('RESPONSE_CACHE_ENABLED', 'true').lower() == 'true',
+    max_entries=int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', 512)),
+)
+
+
+def invalidate_responses(*tags: str) -> int:
+    """쓰기 경로에서 호출하는 무효화 훅"""
+    return response_cache.invalidate(*tags)
+
+
+def skip_response_cache():
+    """현재 응답을 캐시하지 않도록 표시 (DB 실패 시 목업 데이터 응답 등)"""
+    from flask import g
+    g.skip_response_cache = True
+
+
+def cached_response(ttl: float, tags: Iterable[str]):
+    """Flask 조회 엔드포인트 응답 캐시 데코레이터
+
+    200 응답만 저장하며, 캐시 여부와 관계없이 ETag를 붙이고 If-None-Match가 맞으면 304를 반환한다.
+    Cache-Control: no-cache로 브라우저가 매번 재검증하도록 하여 무효화 직후에도 최신 내용을 받는다.
+    """
+    tags = tuple(tags)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            from flask import Response, g, make_response, request
+
+            if not response_cache.enabled or request.method != 'GET':
+                return view(*args, **kwargs)
+
+            key = request.full_path
+            entry = response_cache.get(key)
+            cache_status = 'HIT'
+            if entry is None:
+                cache_status = 'MISS'
+                versions = response_cache.tag_versions(tags)
+                response = make_response(view(*args, **kwargs))
+                if (response.status_code != 200 or response.direct_passthrough
+                        or g.pop('skip_response_cache', False)):
+                    return response
+                # 페이지 커서 등 뷰가 붙인 X- 헤더도 함께 보관
+                extra_headers = [(name, value) for name, value in response.headers.items()
+                                 if name.startswith('X-') and name != 'X-Response-Cache']
+                entry = response_cache.set(key, response.get_data(), response.mimetype,
+                                           ttl, tags, versions, extra_headers)
+
+            response = Response(entry.body, mimetype=entry.mimetype)
+            response.headers.extend(entry.headers)
+            response.set_etag(entry.etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            response.headers['X-Response-Cache'] = cache_status
+            response = response.make_conditional(request)
+            if response.status_code == 304:
+                response_cache.record_not_modified()
+            return response
+
+        return wrapper
+
+    return decorator
@@ -3,18 +3,28 @@
 """
 
 import json
+import threading
 from datetime import datetime, timedelta
+from time import monotonic
 from typing import Dict, List, Optional, Tuple
 import psycopg2
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
-from src.utils.postgresql_database import PostgreSQLDatabase
+from src.utils.postgresql_database import get_shared_database
 from src.utils.trending_topic_manager import TrendingTopicManager
+from src.utils.similarity_index import MinHashLSHIndex
+from src.utils.response_cache import invalidate_responses
+from src.utils.bulk_write import bulk_update, bulk_upsert
+
+# publishing_schedule 일괄 INSERT 컬럼과 자연키
+SCHEDULE_COLUMNS = ('week_start_date', 'day_of_week', 'site', 'topic_category', 'specific_topic',
+                    'keywords', 'target_length', 'status')
+SCHEDULE_KEY = ('week_start_date', 'day_of_week', 'site', 'topic_category')
 
 def get_database():
-    """PostgreSQL 데이터베이스 인스턴스 반환"""
-    return PostgreSQLDatabase()
+    """PostgreSQL 데이터베이스 인스턴스 반환 (프로세스 전역 커넥션 풀 공유)"""
+    return get_shared_database()
 
 class ScheduleManager:
     """발행 스케줄 관리 클래스"""
@@ -22,6 +32,10 @@ class ScheduleManager:
     def __init__(self):
         self.db = get_database()
         self.trending_manager = TrendingTopicManager()
+        # 발행 완료 주제+키워드 유사도 인덱스 (최초 중복 검사 시 구축, PUBLISHED_INDEX_TTL마다 재구축)
+        self._published_index: Optional[MinHashLSHIndex] = None
+        self._published_index_lock = threading.Lock()
+        self._published_index_built_at = 0.0
         self._ensure_schedule_table()
         self._auto_initialize_schedules()
     
@@ -112,50 +126,26 @@ class ScheduleManager:
             
             sites = ['unpre', 'untab', 'skewese', 'tistory']
             
+            rows = []
+            for day in range(7):  # 월요일(0) ~ 일요일(6)
+                current_date = start_date + timedelta(days=day)
+                
+                for site in sites:
+                    # 트렌딩 매니저에서 2개 카테고리 주제 가져오기 (Primary, Secondary)
+                    for topic in self.trending_manager.get_daily_topics(site, current_date):
+                        rows.append((
+                            start_date, day, site, topic['category'],
+                            topic['topic'], topic['keywords'], topic['length'], 'planned'
+                        ))
+            
             conn = self.db.get_connection()
             with conn.cursor() as cursor:
-                for day in range(7):  # 월요일(0) ~ 일요일(6)
-                    current_date = start_date + timedelta(days=day)
-                    
-                    for site in sites:
-                        # 트렌딩 매니저에서 2개 카테고리 주제 가져오기
-                        primary_topic, secondary_topic = self.trending_manager.get_daily_topics(site, current_date)
-                        
-                        # Primary 주제 삽입
-                        cursor.execute("""
-                            INSERT INTO publishing_schedule 
-                            (week_start_date, day_of_week, site, topic_category, specific_topic, 
-                             keywords, target_length, status)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                            ON CONFLICT (week_start_date, day_of_week, site, topic_category) 
-                            DO UPDATE SET 
-                                specific_topic = EXCLUDED.specific_topic,
-                                keywords = EXCLUDED.keywords,
-                                updated_at = CURRENT_TIMESTAMP
-                        """, (
-                            start_date, day, site, primary_topic['category'],
-                            primary_topic['topic'], primary_topic['keywords'],
-                            primary_topic['length'], 'planned'
-                        ))
-                        
-                        # Secondary 주제 삽입
-                        cursor.execute("""
-                            INSERT INTO publishing_schedule 
-                            (week_start_date, day_of_week, site, topic_category, specific_topic, 
-                             keywords, target_length, status)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                            ON CONFLICT (week_start_date, day_of_week, site, topic_category) 
-                            DO UPDATE SET 
-                                specific_topic = EXCLUDED.specific_topic,
-                                keywords = EXCLUDED.keywords,
-                                updated_at = CURRENT_TIMESTAMP
-                        """, (
-                            start_date, day, site, secondary_topic['category'],
-                            secondary_topic['topic'], secondary_topic['keywords'],
-                            secondary_topic['length'], 'planned'
-                        ))
+                # 한 주 전체를 한 문장으로 UPSERT
+                bulk_upsert(cursor, 'publishing_schedule', SCHEDULE_COLUMNS, rows,
+                            conflict=SCHEDULE_KEY, update=('specific_topic', 'keywords'))
                 
                 conn.commit()
+                invalidate_responses('schedule')
                 print(f"[SCHEDULE] 2개 카테고리 주간 스케줄 생성 완료: {start_date} 주")
                 print(f"[SCHEDULE] 총 {len(sites) * 7 * 2}개 스케줄 (사이트별 2개 카테고리)")
                 return True
@@ -181,8 +171,27 @@ class ScheduleManager:
             # 주제 카테고리와 세부 주제들
             topic_plans = self._generate_topic_plans()
             
+            # 사이트별 주제 풀은 발행 이력과 한 번에 중복 검사
+            duplicate_topics = {}
+            for site in sites:
+                site_topics = self._get_site_topic_plans(site)
+                flags = self.check_duplicate_contents(
+                    [{'site': site, 'topic': plan['topic'], 'keywords': plan['keywords']} for plan in site_topics]
+                )
+                duplicate_topics[site] = {plan['topic'] for plan, dup in zip(site_topics, flags) if dup}
+            
             conn = self.db.get_connection()
             with conn.cursor() as cursor:
+                # 이번 주 기존 계획은 한 번에 조회 (요일·사이트별 첫 행)
+                cursor.execute("""
+                    SELECT DISTINCT ON (day_of_week, site) day_of_week, site, id
+                    FROM publishing_schedule 
+                    WHERE week_start_date = %s
+                    ORDER BY day_of_week, site, id
+                """, (start_date,))
+                existing_schedules = {(day, site): schedule_id for day, site, schedule_id in cursor.fetchall()}
+                updates, inserts = [], []
+                
                 for day in range(7):  # 월요일(0) ~ 일요일(6)
                     current_date = start_date + timedelta(days=day)
                     
@@ -214,38 +223,25 @@ class ScheduleManager:
                         topic_plan = site_topics[topic_idx]
                         
                         # 기존 계획 체크 및 업데이트
-                        cursor.execute("""
-                            SELECT id FROM publishing_schedule 
-                            WHERE week_start_date = %s AND day_of_week = %s AND site = %s
-                        """, (start_date, day, site))
-                        
-                        existing_schedule = cursor.fetchone()
-                        if existing_schedule:
+                        existing_id = existing_schedules.get((day, site))
+                        if existing_id:
                             # 기존 스케줄이 있으면 주제만 업데이트
-                            cursor.execute("""
-                                UPDATE publishing_schedule 
-                                SET specific_topic = %s, keywords = %s, updated_at = CURRENT_TIMESTAMP
-                                WHERE id = %s
-                            """, (topic_plan['topic'], topic_plan['keywords'], existing_schedule[0]))
+                            updates.append((existing_id, topic_plan['topic'], topic_plan['keywords']))
                             continue
                         
                         # 중복 컨텐츠 검사
-                        if self.check_duplicate_content(site, topic_plan['topic'], topic_plan['keywords']):
+                        if topic_plan['topic'] in duplicate_topics[site]:
                             print(f"[SCHEDULE] {site} 중복 주제 제외: {topic_plan['topic']}")
                             # 다른 주제로 대체
                             for alt_idx in range(len(site_topics)):
                                 alt_topic = site_topics[alt_idx]
-                                if not self.check_duplicate_content(site, alt_topic['topic'], alt_topic['keywords']):
+                                if alt_topic['topic'] not in duplicate_topics[site]:
                                     topic_plan = alt_topic
                                     print(f"[SCHEDULE] {site} 대체 주제 선택: {topic_plan['topic']}")
                                     break
                         
                         # 새 계획 추가 (status를 'planned'로 설정)
-                        cursor.execute("""
-                            INSERT INTO publishing_schedule 
-                            (week_start_date, day_of_week, site, topic_category, specific_topic, keywords, target_length, status)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                        """, (
+                        inserts.append((
                             start_date,
                             day,
                             site,
@@ -256,7 +252,13 @@ class ScheduleManager:
                             'planned'  # scheduler.py와 일치하도록 'planned'로 설정
                         ))
                 
+                # 갱신·추가를 각각 한 문장으로 전송
+                bulk_update(cursor, 'publishing_schedule', 'id', ('specific_topic', 'keywords'), updates,
+                            template='(%s, %s, %s::text[])')
+                bulk_upsert(cursor, 'publishing_schedule', SCHEDULE_COLUMNS, inserts)
+                
                 conn.commit()
+                invalidate_responses('schedule')
                 print(f"[SCHEDULE] {start_date} 주 발행 스케줄 생성 완료")
                 return True
                 
@@ -792,6 +794,7 @@ class ScheduleManager:
                     AND specific_topic = %s
                 """, (week_start, weekday, site, topic))
                 conn.commit()
+                invalidate_responses('schedule')
                 print(f"[SCHEDULE] {site} 주제 사용됨으로 표시: {topic}")
                 
         except Exception as e:
@@ -817,7 +820,8 @@ class ScheduleManager:
                     WHERE week_start_date = %s
                 """, (week_start_date,))
                 
-                # 새 스케줄 저장
+                # 새 스케줄 저장 (한 문장으로 일괄 INSERT)
+                rows = []
                 for date_str, day_data in schedule.items():
                     date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
                     day_of_week = date_obj.weekday()  # 0=월요일, 6=일요일
@@ -827,12 +831,7 @@ class ScheduleManager:
                         if isinstance(site_data_list, list) and site_data_list:
                             site_data = site_data_list[0]  # 첫 번째 데이터 사용
                             
-                            cursor.execute("""
-                                INSERT INTO publishing_schedule 
-                                (week_start_date, day_of_week, site, topic_category, specific_topic, 
-                                 keywords, target_length, status, created_at)
-                                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
-                            """, (
+                            rows.append((
                                 week_start_date,
                                 day_of_week,
                                 site,
@@ -842,8 +841,10 @@ class ScheduleManager:
                                 'medium',  # target_length
                                 'planned'  # scheduler.py와 일치하도록 planned로 설정
                             ))
+                bulk_upsert(cursor, 'publishing_schedule', SCHEDULE_COLUMNS, rows)
                 
                 conn.commit()
+                invalidate_responses('schedule')
                 print(f"[SCHEDULE] 클라이언트 스케줄 DB 저장 완료: {week_start}")
                 return True
                 
@@ -902,51 +903,69 @@ class ScheduleManager:
             print(f"[SCHEDULE] 스케줄 조회 오류: {e}")
             return {}
     
+    # 주제+키워드 shingle Jaccard가 이 값 이상이면 중복으로 판단
+    DUPLICATE_THRESHOLD = 0.5
+    # 발행 완료 인덱스 재구축 주기(초) - 다른 프로세스의 발행/상태 변경 반영
+    PUBLISHED_INDEX_TTL = 300
+    
+    def _get_published_index(self) -> MinHashLSHIndex:
+        """발행 완료된 전체 스케줄 주제 인덱스
+
+        상태 변경은 id 증가로 알 수 없으므로 PUBLISHED_INDEX_TTL이 지나면 전체를 다시 구축한다.
+        재구축 중에는 다른 스레드가 기존 인덱스를 그대로 쓴다.
+        """
+        index = self._published_index
+        if index is not None and monotonic() - self._published_index_built_at < self.PUBLISHED_INDEX_TTL:
+            return index
+        if not self._published_index_lock.acquire(blocking=index is None):
+            return index
+        try:
+            if self._published_index is not None and \
+                    monotonic() - self._published_index_built_at < self.PUBLISHED_INDEX_TTL:
+                return self._published_index
+            index = MinHashLSHIndex()
+            with self.db.connection() as conn, conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT id, site, specific_topic, keywords FROM publishing_schedule 
+                    WHERE status = 'published'
+                """)
+                for schedule_id, site, topic, keywords in cursor.fetchall():
+                    index.add(schedule_id, topic, keywords, site=site)
+            self._published_index = index
+            self._published_index_built_at = monotonic()
+            return index
+        finally:
+            self._published_index_lock.release()
+    
     def check_duplicate_content(self, site: str, topic: str, keywords: List[str]) -> bool:
         """발행된 컨텐츠와 중복 여부 확인"""
         try:
-            conn = self.db.get_connection()
-            with conn.cursor() as cursor:
-                # 기존 발행된 컨텐츠에서 유사한 주제 검색
-                cursor.execute("""
-                    SELECT specific_topic, keywords FROM publishing_schedule 
-                    WHERE site = %s AND status = 'published'
-                """, (site,))
-                
-                published_content = cursor.fetchall()
-                
-                for pub_topic, pub_keywords in published_content:
-                    # 주제 유사도 검사 (간단한 키워드 매칭)
-                    if self._is_similar_content(topic, keywords, pub_topic, pub_keywords):
-                        print(f"[DUPLICATE] {site} 중복 컨텐츠 발견: {topic} vs {pub_topic}")
-                        return True
-                
-                return False
+            match = self._get_published_index().find_duplicate(
+                topic, keywords, site=site, threshold=self.DUPLICATE_THRESHOLD
+            )
+            if match:
+                print(f"[DUPLICATE] {site} 중복 컨텐츠 발견: {topic} vs {match.title} ({match.score:.2f})")
+            return match is not None
                 
         except Exception as e:
             print(f"[DUPLICATE] 중복 검사 오류: {e}")
             return False
     
-    def _is_similar_content(self, topic1: str, keywords1: List[str], 
-                           topic2: str, keywords2: List[str]) -> bool:
-        """두 컨텐츠의 유사도 검사"""
+    def check_duplicate_contents(self, plans: List[Dict]) -> List[bool]:
+        """여러 계획을 한 번에 중복 검사 (발행 이력 + 목록 내 중복)
+        
+        plans: [{'site': ..., 'topic': ..., 'keywords': [...]}, ...]
+        """
         try:
-            # 키워드 교집합 확인 (50% 이상 겹치면 중복으로 판단)
-            set1 = set([kw.lower().strip() for kw in keywords1] if keywords1 else [])
-            set2 = set([kw.lower().strip() for kw in keywords2] if keywords2 else [])
-            
-            if len(set1) == 0 or len(set2) == 0:
-                return False
-                
-            intersection = set1.intersection(set2)
-            similarity = len(intersection) / min(len(set1), len(set2))
-            
-            return similarity >= 0.5
-            
+            matches = self._get_published_index().check_batch(
+                [{'site': p['site'], 'title': p['topic'], 'keywords': p.get('keywords')} for p in plans],
+                threshold=self.DUPLICATE_THRESHOLD
+            )
+            return [match is not None for match in matches]
         except Exception as e:
-            print(f"[SIMILARITY] 유사도 검사 오류: {e}")
-            return False
-
+            print(f"[DUPLICATE] 일괄 중복 검사 오류: {e}")
+            return [False] * len(plans)
+    
     def update_schedule_status(self, week_start: datetime, day: int, site: str, 
                               status: str, content_id: int = None, url: str = None) -> bool:
         """스케줄 상태 업데이트"""
@@ -970,10 +989,19 @@ class ScheduleManager:
                     UPDATE publishing_schedule 
                     SET {', '.join(update_fields)}
                     WHERE week_start_date = %s AND day_of_week = %s AND site = %s
+                    RETURNING id, specific_topic, keywords
                 """, params)
+                updated = cursor.fetchall()
                 
                 conn.commit()
-                return cursor.rowcount > 0
+                invalidate_responses('schedule')
+                
+                # 발행 완료 주제는 중복 인덱스에 바로 반영
+                if status == 'published' and self._published_index is not None:
+                    for schedule_id, topic, keywords in updated:
+                        self._published_index.add(schedule_id, topic, keywords, site=site)
+                
+                return len(updated) > 0
                 
         except Exception as e:
             print(f"[SCHEDULE] 상태 업데이트 오류: {e}")
@@ -17,6 +17,7 @@ except ImportError:
     from src.utils.postgresql_database import PostgreSQLDatabase
     def get_database():
         return PostgreSQLDatabase()
+from src.utils.response_cache import invalidate_responses
 
 class ScheduleSync:
     def __init__(self):
@@ -198,6 +199,7 @@ class ScheduleSync:
                         ))
                 
                 conn.commit()
+                invalidate_responses('schedule')
                 print(f"[SCHEDULE_SYNC] {len(schedules)}개 스케줄 DB 업데이트 완료")
                 return True
                 
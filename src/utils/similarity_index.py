@@ -0,0 +1,167 @@
+"""
+MinHash/LSH 기반 유사 제목 인덱스
+- 한국어는 띄어쓰기가 일정하지 않으므로 공백/기호를 제거한 문자 n-gram을 shingle로 사용
+- 키워드는 단어 단위 shingle로 추가
+- LSH 버킷으로 후보만 추린 뒤 실제 Jaccard로 재채점하여 top-k 반환
+- add()로 증분 갱신, check_batch()로 주간 계획 전체를 한 번에 검사
+"""
+
+import hashlib
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_NORMALIZE_RE = re.compile(r'[^0-9a-z가-힣]+')
+
+
+def make_shingles(title: str, keywords: Iterable[str] = None, n: int = 2) -> FrozenSet[str]:
+    """제목 문자 n-gram + 키워드 shingle 집합"""
+    text = _NORMALIZE_RE.sub('', (title or '').lower())
+    shingles = {text[i:i + n] for i in range(max(len(text) - n + 1, 0))}
+    if 0 < len(text) < n:
+        shingles.add(text)
+    for keyword in keywords or []:
+        keyword = _NORMALIZE_RE.sub('', str(keyword).lower())
+        if keyword:
+            shingles.add(f"#{keyword}")
+    return frozenset(shingles)
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class SimilarMatch:
+    """유사 항목 검색 결과"""
+    doc_id: Any
+    site: Optional[str]
+    title: str
+    score: float
+
+
+class MinHashLSHIndex:
+    """MinHash 서명 + 밴드 LSH 인덱스 (스레드 안전)"""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, ngram: int = 2, seed: int = 1):
+        """
+        Args:
+            num_perm: MinHash 해시 함수 수
+            bands: LSH 밴드 수 (rows = num_perm / bands, 후보 임계값 ≈ (1/bands)^(1/rows))
+            ngram: 제목 문자 n-gram 크기
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.ngram = ngram
+
+        seed_bytes = str(seed).encode()
+        self._perms = []
+        for i in range(num_perm):
+            digest = hashlib.blake2b(seed_bytes + i.to_bytes(4, 'big'), digest_size=16).digest()
+            a = int.from_bytes(digest[:8], 'big') % (_MERSENNE_PRIME - 1) + 1
+            b = int.from_bytes(digest[8:], 'big') % _MERSENNE_PRIME
+            self._perms.append((a, b))
+
+        self._docs: Dict[Any, Tuple[Optional[str], str, FrozenSet[str]]] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], set] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._docs)
+
+    # ------------------------------------------------------------------
+    # 서명/밴드
+    # ------------------------------------------------------------------
+
+    def _signature(self, shingles: FrozenSet[str]) -> List[int]:
+        hashes = [int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big')
+                  for s in shingles]
+        if not hashes:
+            return [_MERSENNE_PRIME] * self.num_perm
+        return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._perms]
+
+    def _band_keys(self, signature: List[int]):
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, tuple(signature[start:start + self.rows])
+
+    # ------------------------------------------------------------------
+    # 갱신/검색
+    # ------------------------------------------------------------------
+
+    def add(self, doc_id: Any, title: str, keywords: Iterable[str] = None, site: str = None):
+        """항목 추가 (같은 doc_id가 있으면 교체)"""
+        shingles = make_shingles(title, keywords, self.ngram)
+        signature = self._signature(shingles)
+        with self._lock:
+            if doc_id in self._docs:
+                self.remove(doc_id)
+            self._docs[doc_id] = (site, title, shingles)
+            for key in self._band_keys(signature):
+                self._buckets.setdefault(key, set()).add(doc_id)
+
+    def remove(self, doc_id: Any):
+        with self._lock:
+            entry = self._docs.pop(doc_id, None)
+            if entry is None:
+                return
+            signature = self._signature(entry[2])
+            for key in self._band_keys(signature):
+                bucket = self._buckets.get(key)
+                if bucket:
+                    bucket.discard(doc_id)
+                    if not bucket:
+                        del self._buckets[key]
+
+    def query(self, title: str, keywords: Iterable[str] = None, site: str = None,
+              k: int = 5, threshold: float = 0.0) -> List[SimilarMatch]:
+        """유사도 상위 k개 (LSH 후보를 실제 Jaccard로 재채점)"""
+        shingles = make_shingles(title, keywords, self.ngram)
+        signature = self._signature(shingles)
+        with self._lock:
+            candidates = set()
+            for key in self._band_keys(signature):
+                candidates |= self._buckets.get(key, set())
+
+            matches = []
+            for doc_id in candidates:
+                doc_site, doc_title, doc_shingles = self._docs[doc_id]
+                if site is not None and doc_site != site:
+                    continue
+                score = jaccard(shingles, doc_shingles)
+                if score >= threshold:
+                    matches.append(SimilarMatch(doc_id, doc_site, doc_title, round(score, 4)))
+
+        matches.sort(key=lambda m: m.score, reverse=True)
+        return matches[:k]
+
+    def find_duplicate(self, title: str, keywords: Iterable[str] = None, site: str = None,
+                       threshold: float = 0.7) -> Optional[SimilarMatch]:
+        """임계값 이상인 가장 유사한 항목 (없으면 None)"""
+        matches = self.query(title, keywords, site=site, k=1, threshold=threshold)
+        return matches[0] if matches else None
+
+    def check_batch(self, items: List[Dict[str, Any]], threshold: float = 0.7) -> List[Optional[SimilarMatch]]:
+        """여러 항목을 한 번에 검사 - 인덱스 및 앞선 항목들과의 중복을 함께 확인
+
+        items: [{'site': ..., 'title': ..., 'keywords': [...]}, ...]
+        반환: 항목별 가장 유사한 중복 (없으면 None)
+        """
+        batch_index = MinHashLSHIndex(self.num_perm, self.bands, self.ngram)
+        batch_index._perms = self._perms
+        results = []
+        for i, item in enumerate(items):
+            title, keywords, site = item.get('title', ''), item.get('keywords'), item.get('site')
+            match = self.find_duplicate(title, keywords, site, threshold)
+            if match is None:
+                match = batch_index.find_duplicate(title, keywords, site, threshold)
+            results.append(match)
+            batch_index.add(('batch', i), title, keywords, site)
+        return results
@@ -1,5 +1,7 @@
 """
 실시간 트렌드 수집기 - 다양한 소스에서 트렌드 데이터 수집
+- 소스별 수집을 스레드 풀로 동시에 실행하고 전체 마감 시간/소스별 예산을 넘기면 도착한 결과만 사용
+- 소스별 지연 시간/오류/시간 초과 카운터 제공
 """
 
 import os
@@ -10,6 +12,8 @@ from typing import Dict, List, Optional
 import logging
 from dataclasses import dataclass, asdict
 import time
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import feedparser
 from pytrends.request import TrendReq
 from bs4 import BeautifulSoup
@@ -18,6 +22,19 @@ import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# (소스 이름, 수집 메서드, 소스별 예산(초)) - 결과 병합 순서도 이 순서를 따름
+TREND_SOURCES = [
+    ('Google Trends', 'get_google_trends', 15.0),
+    ('네이버 실시간 검색어', 'get_naver_realtime', 8.0),
+    ('Reddit 트렌드', 'get_reddit_trending', 10.0),
+    ('Hacker News', 'get_hackernews_trending', 12.0),
+    ('GitHub Trending', 'get_github_trending', 10.0),
+    ('뉴스 RSS', 'get_news_trends', 12.0),
+    ('YouTube 트렌드', 'get_youtube_trends', 2.0),
+    ('한국 일반 트렌드', 'get_korea_general_trends', 2.0),
+    ('소셜미디어 트렌드', 'get_social_media_trends', 2.0),
+]
+
 @dataclass
 class TrendItem:
     """트렌드 아이템 데이터 클래스"""
@@ -38,96 +55,116 @@ class TrendItem:
 class TrendCollector:
     """실시간 트렌드 수집기"""
     
-    def __init__(self):
-        self.pytrends = TrendReq(hl='ko-KR', tz=540, timeout=(10,25))  # 한국 시간대
+    def __init__(self, deadline: float = None, request_timeout: float = None):
+        """
+        Args:
+            deadline: collect_all_trends 전체 마감 시간(초)
+            request_timeout: 소스별 HTTP 요청 타임아웃(초)
+        """
+        self._pytrends = None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
-        
-    def collect_all_trends(self) -> List[TrendItem]:
-        """모든 소스에서 트렌드 수집"""
-        all_trends = []
-        
-        try:
-            # Google Trends
-            google_trends = self.get_google_trends()
-            all_trends.extend(google_trends)
-            logger.info(f"Google Trends: {len(google_trends)}개 수집")
-        except Exception as e:
-            logger.error(f"Google Trends 수집 실패: {e}")
-        
-        try:
-            # 네이버 실시간 검색어
-            naver_trends = self.get_naver_realtime()
-            all_trends.extend(naver_trends)
-            logger.info(f"네이버 실시간 검색어: {len(naver_trends)}개 수집")
-        except Exception as e:
-            logger.error(f"네이버 실시간 검색어 수집 실패: {e}")
-        
-        try:
-            # Reddit 화제 토픽
-            reddit_trends = self.get_reddit_trending()
-            all_trends.extend(reddit_trends)
-            logger.info(f"Reddit 트렌드: {len(reddit_trends)}개 수집")
-        except Exception as e:
-            logger.error(f"Reddit 트렌드 수집 실패: {e}")
-        
-        try:
-            # Hacker News
-            hn_trends = self.get_hackernews_trending()
-            all_trends.extend(hn_trends)
-            logger.info(f"Hacker News: {len(hn_trends)}개 수집")
-        except Exception as e:
-            logger.error(f"Hacker News 수집 실패: {e}")
-        
+        self.deadline = deadline if deadline is not None else float(os.getenv('TREND_COLLECT_DEADLINE', 20))
+        self.request_timeout = (request_timeout if request_timeout is not None
+                                else float(os.getenv('TREND_REQUEST_TIMEOUT', 8)))
+        self._metrics_lock = threading.Lock()
+        self._source_metrics: Dict[str, Dict] = {}
+    
+    @property
+    def pytrends(self) -> TrendReq:
+        """Google Trends 클라이언트 (생성 시 쿠키 요청이 나가므로 처음 사용할 때 초기화)"""
+        if self._pytrends is None:
+            self._pytrends = TrendReq(hl='ko-KR', tz=540, timeout=(10,25))  # 한국 시간대
+        return self._pytrends
+        
+    def collect_all_trends(self, deadline: float = None) -> List[TrendItem]:
+        """모든 소스에서 트렌드 동시 수집
+        
+        전체 마감 시간(deadline)이나 소스별 예산을 넘긴 소스는 기다리지 않고,
+        그때까지 도착한 결과에 중복 제거와 점수순 정렬을 적용해 반환한다.
+        """
+        deadline = self.deadline if deadline is None else deadline
+        started = time.monotonic()
+        collected: Dict[str, List[TrendItem]] = {}
+        
+        executor = ThreadPoolExecutor(max_workers=len(TREND_SOURCES), thread_name_prefix='trend-source')
+        futures = {
+            executor.submit(self._run_source, name, method_name): (name, min(budget, deadline))
+            for name, method_name, budget in TREND_SOURCES
+        }
+        pending = set(futures)
         try:
-            # GitHub Trending
-            github_trends = self.get_github_trending()
-            all_trends.extend(github_trends)
-            logger.info(f"GitHub Trending: {len(github_trends)}개 수집")
-        except Exception as e:
-            logger.error(f"GitHub Trending 수집 실패: {e}")
+            while pending:
+                elapsed = time.monotonic() - started
+                for future in [f for f in pending if futures[f][1] <= elapsed and not f.done()]:
+                    pending.discard(future)
+                    name = futures[future][0]
+                    self._record_source(name, timed_out=True)
+                    logger.warning(f"{name} 수집 시간 초과 ({futures[future][1]:.0f}초), 제외")
+                if not pending:
+                    break
+                
+                next_expiry = min(futures[f][1] for f in pending)
+                done, _ = wait(pending, timeout=max(next_expiry - elapsed, 0), return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    collected[futures[future][0]] = future.result()
+        finally:
+            # 늦게 끝나는 소스는 백그라운드에서 마무리되도록 두고 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
         
-        try:
-            # 뉴스 RSS 피드
-            news_trends = self.get_news_trends()
-            all_trends.extend(news_trends)
-            logger.info(f"뉴스 RSS: {len(news_trends)}개 수집")
-        except Exception as e:
-            logger.error(f"뉴스 RSS 수집 실패: {e}")
-            
-        try:
-            # YouTube 트렌드 (한국)
-            youtube_trends = self.get_youtube_trends()
-            all_trends.extend(youtube_trends)
-            logger.info(f"YouTube 트렌드: {len(youtube_trends)}개 수집")
-        except Exception as e:
-            logger.error(f"YouTube 트렌드 수집 실패: {e}")
-            
-        try:
-            # 한국 일반 트렌드 (시뮬레이션)
-            korea_trends = self.get_korea_general_trends()
-            all_trends.extend(korea_trends)
-            logger.info(f"한국 일반 트렌드: {len(korea_trends)}개 수집")
-        except Exception as e:
-            logger.error(f"한국 일반 트렌드 수집 실패: {e}")
-            
-        try:
-            # 소셜미디어 트렌드
-            social_trends = self.get_social_media_trends()
-            all_trends.extend(social_trends)
-            logger.info(f"소셜미디어 트렌드: {len(social_trends)}개 수집")
-        except Exception as e:
-            logger.error(f"소셜미디어 트렌드 수집 실패: {e}")
+        all_trends = []
+        for name, _, _ in TREND_SOURCES:
+            all_trends.extend(collected.get(name, []))
         
         # 중복 제거 및 점수순 정렬
         unique_trends = self._deduplicate_trends(all_trends)
         sorted_trends = sorted(unique_trends, key=lambda x: x.score, reverse=True)
         
-        logger.info(f"총 {len(sorted_trends)}개 트렌드 수집 완료")
+        logger.info(f"총 {len(sorted_trends)}개 트렌드 수집 완료 "
+                    f"({len(collected)}/{len(TREND_SOURCES)}개 소스, {time.monotonic() - started:.1f}초)")
         return sorted_trends
     
+    def _run_source(self, name: str, method_name: str) -> List[TrendItem]:
+        """소스 하나 수집 (예외는 기록 후 빈 목록)"""
+        started = time.monotonic()
+        try:
+            trends = getattr(self, method_name)()
+            self._record_source(name, latency=time.monotonic() - started, items=len(trends))
+            logger.info(f"{name}: {len(trends)}개 수집")
+            return trends
+        except Exception as e:
+            self._record_source(name, latency=time.monotonic() - started, error=str(e))
+            logger.error(f"{name} 수집 실패: {e}")
+            return []
+    
+    def _record_source(self, name: str, latency: float = None, items: int = 0,
+                       error: str = None, timed_out: bool = False):
+        with self._metrics_lock:
+            metrics = self._source_metrics.setdefault(name, {
+                'calls': 0, 'errors': 0, 'timeouts': 0, 'items': 0,
+                'last_latency_ms': None, 'max_latency_ms': 0.0, 'last_error': None
+            })
+            if timed_out:
+                metrics['timeouts'] += 1
+                return
+            metrics['calls'] += 1
+            metrics['items'] += items
+            if latency is not None:
+                latency_ms = round(latency * 1000, 1)
+                metrics['last_latency_ms'] = latency_ms
+                metrics['max_latency_ms'] = max(metrics['max_latency_ms'], latency_ms)
+            if error:
+                metrics['errors'] += 1
+                metrics['last_error'] = error
+    
+    def get_source_metrics(self) -> Dict[str, Dict]:
+        """소스별 호출/오류/시간 초과 횟수와 지연 시간(ms)"""
+        with self._metrics_lock:
+            return {name: dict(metrics) for name, metrics in self._source_metrics.items()}
+    
     def get_google_trends(self) -> List[TrendItem]:
         """Google Trends 실시간 검색어"""
         trends = []
@@ -170,7 +207,7 @@ class TrendCollector:
             # 네이버 데이터랩 트렌드 (공개 데이터)
             url = 'https://datalab.naver.com/keyword/realtimeList.naver'
             
-            response = self.session.get(url)
+            response = self.session.get(url, timeout=self.request_timeout)
             if response.status_code == 200:
                 # 실제로는 네이버 실시간 검색어 서비스 종료로 대체 키워드 사용
                 sample_keywords = [
@@ -202,7 +239,7 @@ class TrendCollector:
             url = 'https://www.reddit.com/r/popular.json?limit=10'
             headers = {'User-Agent': 'trend-collector/1.0'}
             
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers=headers, timeout=self.request_timeout)
             if response.status_code == 200:
                 data = response.json()
                 
@@ -232,14 +269,14 @@ class TrendCollector:
         try:
             # Hacker News Top Stories
             top_stories_url = 'https://hacker-news.firebaseio.com/v0/topstories.json'
-            response = requests.get(top_stories_url)
+            response = self.session.get(top_stories_url, timeout=self.request_timeout)
             
             if response.status_code == 200:
                 story_ids = response.json()[:10]  # 상위 10개
                 
                 for idx, story_id in enumerate(story_ids):
                     story_url = f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json'
-                    story_response = requests.get(story_url)
+                    story_response = self.session.get(story_url, timeout=self.request_timeout)
                     
                     if story_response.status_code == 200:
                         story = story_response.json()
@@ -266,7 +303,7 @@ class TrendCollector:
         try:
             # GitHub API를 사용하지 않고 웹 스크래핑
             url = 'https://github.com/trending'
-            response = self.session.get(url)
+            response = self.session.get(url, timeout=self.request_timeout)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -327,7 +364,9 @@ class TrendCollector:
         
         for source_name, feed_url in rss_feeds:
             try:
-                feed = feedparser.parse(feed_url)
+                # feedparser는 타임아웃을 지원하지 않으므로 직접 받아서 파싱
+                response = self.session.get(feed_url, timeout=self.request_timeout)
+                feed = feedparser.parse(response.content)
                 
                 for idx, entry in enumerate(feed.entries[:5]):  # 각 소스별 5개
                     trend = TrendItem(
@@ -442,9 +481,9 @@ class TrendCollector:
         
         return unique_trends
     
-    def get_categorized_trends(self) -> Dict[str, List[TrendItem]]:
-        """카테고리별 트렌드 분류"""
-        all_trends = self.collect_all_trends()
+    def get_categorized_trends(self, trends: List[TrendItem] = None) -> Dict[str, List[TrendItem]]:
+        """카테고리별 트렌드 분류 (trends를 주면 새로 수집하지 않고 분류만 수행)"""
+        all_trends = self.collect_all_trends() if trends is None else trends
         categorized = {}
         
         # 카테고리 한글 매핑
@@ -9,6 +9,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from src.utils.schedule_manager import ScheduleManager
+from src.utils.response_cache import invalidate_responses
 from src.utils.realtime_trends import RealtimeTrends
 from datetime import date, timedelta
 import logging
@@ -99,6 +100,7 @@ class TrendScheduler:
                     print(f"  🌐 [social] {social_topic}")
             
             conn.commit()
+            invalidate_responses('schedule')
             print(f"\n✅ 실시간 트렌드 기반 티스토리 주제 업데이트 완료!")
             
             return True
@@ -0,0 +1,272 @@
+"""
+트렌드 스냅샷 저장소
+- 수집 결과(TrendItem 목록)를 시각이 붙은 JSON 스냅샷으로 로컬 디렉터리에 저장
+- 조회는 항상 최신 스냅샷을 즉시 반환하고, 기준 나이를 넘었으면 백그라운드 갱신만 시작 (stale-while-revalidate)
+- 갱신은 single-flight: 진행 중인 갱신이 있으면 새로 수집하지 않고 그 결과를 기다림
+- 최근 스냅샷 이력으로 트렌드 상승 속도(velocity)를 저장 시점에 한 번 계산해 스냅샷에 함께 기록
+"""
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import logging
+
+from src.utils.trend_collector import TrendItem
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TrendSnapshot:
+    """특정 시각에 수집한 트렌드 목록"""
+    collected_at: datetime
+    trends: List[TrendItem]
+    velocity: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def age(self) -> float:
+        """수집 후 지난 시간(초)"""
+        return (datetime.now(timezone.utc) - self.collected_at).total_seconds()
+
+    def to_dict(self) -> Dict:
+        return {
+            'collected_at': self.collected_at.isoformat(),
+            'trends': [
+                dict(asdict(trend), timestamp=trend.timestamp.isoformat() if trend.timestamp else None)
+                for trend in self.trends
+            ],
+            'velocity': self.velocity
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'TrendSnapshot':
+        trends = []
+        for item in data.get('trends', []):
+            item = dict(item)
+            if item.get('timestamp'):
+                item['timestamp'] = datetime.fromisoformat(item['timestamp'])
+            trends.append(TrendItem(**item))
+        return cls(collected_at=datetime.fromisoformat(data['collected_at']), trends=trends,
+                   velocity=data.get('velocity') or {})
+
+
+def _normalize_title(title: str) -> str:
+    return title.lower().strip()
+
+
+class _Inflight:
+    """진행 중인 갱신 1건 (대기자들이 결과를 공유)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.snapshot: Optional[TrendSnapshot] = None
+
+
+class TrendSnapshotStore:
+    """스냅샷 파일 저장 + stale-while-revalidate 조회 + single-flight 갱신"""
+
+    def __init__(self, collect: Callable[[], List[TrendItem]], store_dir: str,
+                 max_age: float = 900, history_limit: int = 96, velocity_window: float = 6.0):
+        """
+        Args:
+            collect: 트렌드 수집 함수 (TrendItem 목록 반환)
+            store_dir: 스냅샷 JSON 파일 디렉터리
+            max_age: 이 나이(초)를 넘은 스냅샷은 조회 시 백그라운드 갱신
+            history_limit: 보관할 스냅샷 파일 수
+            velocity_window: 상승 속도 계산에 쓰는 이력 기간(시간)
+        """
+        self.collect = collect
+        self.store_dir = Path(store_dir)
+        self.max_age = max_age
+        self.history_limit = max(1, history_limit)
+        self.velocity_window = velocity_window
+        self._latest: Optional[TrendSnapshot] = None
+        self._lock = threading.Lock()
+        self._inflight: Optional[_Inflight] = None
+        self._refresher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def latest(self) -> Optional[TrendSnapshot]:
+        """가장 최근 스냅샷 (메모리에 없으면 디스크에서 로드)"""
+        with self._lock:
+            if self._latest is None:
+                paths = self._snapshot_paths()
+                if paths:
+                    self._latest = self._load(paths[-1])
+            return self._latest
+
+    def get(self, max_age: float = None, wait_if_empty: bool = True) -> Optional[TrendSnapshot]:
+        """최신 스냅샷 즉시 반환, 오래됐으면 백그라운드 갱신 시작
+
+        스냅샷이 하나도 없을 때 wait_if_empty=False면 갱신만 시작하고 None을 반환한다.
+        """
+        max_age = self.max_age if max_age is None else max_age
+        snapshot = self.latest()
+        if snapshot is None:
+            return self.refresh(wait=wait_if_empty)
+        if snapshot.age > max_age:
+            self.refresh(wait=False)
+        return snapshot
+
+    @property
+    def is_refreshing(self) -> bool:
+        with self._lock:
+            return self._inflight is not None
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def refresh(self, wait: bool = True) -> Optional[TrendSnapshot]:
+        """스냅샷 갱신 (이미 진행 중이면 그 갱신에 합류)
+
+        이번 갱신으로 저장한 스냅샷을 반환하고, 수집에 실패했거나 wait=False면 None을 반환한다
+        (실패했을 때 이전 스냅샷을 새 결과처럼 돌려주지 않음).
+        """
+        with self._lock:
+            inflight = self._inflight
+            if inflight is None:
+                inflight = self._inflight = _Inflight()
+                threading.Thread(target=self._run_refresh, args=(inflight,),
+                                 name='trend-snapshot-refresh', daemon=True).start()
+        if not wait:
+            return None
+        inflight.done.wait()
+        return inflight.snapshot
+
+    def _run_refresh(self, inflight: _Inflight):
+        try:
+            trends = self.collect()
+            inflight.snapshot = self._save(TrendSnapshot(datetime.now(timezone.utc), list(trends)))
+            logger.info(f"[TREND_SNAPSHOT] {len(trends)}개 트렌드 스냅샷 저장")
+        except Exception as e:
+            logger.error(f"[TREND_SNAPSHOT] 트렌드 갱신 실패: {e}")
+        finally:
+            with self._lock:
+                self._inflight = None
+            inflight.done.set()
+
+    def start_refresher(self, interval: float = None):
+        """주기적으로 스냅샷을 갱신하는 백그라운드 스레드 시작 (APScheduler가 없는 서버용)"""
+        interval = self.max_age if interval is None else interval
+        if self._refresher and self._refresher.is_alive():
+            return
+
+        def loop():
+            while not self._stop.is_set():
+                snapshot = self.latest()
+                if snapshot is None or snapshot.age >= interval:
+                    self.refresh(wait=True)
+                    snapshot = self.latest()
+                remaining = interval - snapshot.age if snapshot else interval
+                self._stop.wait(max(remaining, 1.0))
+
+        self._stop.clear()
+        self._refresher = threading.Thread(target=loop, name='trend-snapshot-refresher', daemon=True)
+        self._refresher.start()
+
+    def stop_refresher(self):
+        self._stop.set()
+
+    # ------------------------------------------------------------------
+    # 저장/이력
+    # ------------------------------------------------------------------
+
+    def _snapshot_paths(self) -> List[Path]:
+        if not self.store_dir.exists():
+            return []
+        return sorted(self.store_dir.glob('*.json'))
+
+    def _load(self, path: Path) -> Optional[TrendSnapshot]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return TrendSnapshot.from_dict(json.load(f))
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"[TREND_SNAPSHOT] 스냅샷 로드 실패 {path.name}: {e}")
+            return None
+
+    def _save(self, snapshot: TrendSnapshot) -> TrendSnapshot:
+        """상승 속도를 계산해 함께 기록하고, 임시 파일에 쓴 뒤 교체하고 보관 개수를 넘은 오래된 스냅샷 삭제"""
+        snapshot.velocity = self._compute_velocity(snapshot)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        path = self.store_dir / f"{snapshot.collected_at.strftime('%Y%m%dT%H%M%S%f')}.json"
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._latest = snapshot
+            paths = self._snapshot_paths()
+            for old in paths[:max(len(paths) - self.history_limit, 0)]:
+                old.unlink(missing_ok=True)
+        return snapshot
+
+    def history(self, since: datetime = None) -> List[TrendSnapshot]:
+        """보관 중인 스냅샷 (오래된 순)"""
+        snapshots = [s for s in (self._load(p) for p in self._snapshot_paths()) if s]
+        if since is not None:
+            snapshots = [s for s in snapshots if s.collected_at >= since]
+        return snapshots
+
+    def velocity_scores(self) -> Dict[str, float]:
+        """최신 스냅샷 트렌드별 시간당 점수 변화량 (저장 시 계산해 둔 값, 요청 경로에서는 파일을 읽지 않음)"""
+        snapshot = self.latest()
+        return snapshot.velocity if snapshot else {}
+
+    def _compute_velocity(self, latest: TrendSnapshot) -> Dict[str, float]:
+        """latest 트렌드별 시간당 점수 변화량 (스냅샷 저장 시 한 번만 호출)
+
+        기간 내 처음 등장한 스냅샷 대비 점수 증가분을 경과 시간으로 나누며,
+        기간 중 새로 나타난 트렌드는 현재 점수 전체를 기간 길이로 나눈 값으로 본다.
+        """
+        previous = [s for s in self.history(since=latest.collected_at - timedelta(hours=self.velocity_window))
+                    if s.collected_at < latest.collected_at]
+
+        first_seen: Dict[str, tuple] = {}
+        for snapshot in previous:
+            for trend in snapshot.trends:
+                first_seen.setdefault(_normalize_title(trend.title), (snapshot.collected_at, trend.score))
+
+        velocities = {}
+        for trend in latest.trends:
+            key = _normalize_title(trend.title)
+            if key in first_seen:
+                seen_at, score = first_seen[key]
+                hours = max((latest.collected_at - seen_at).total_seconds() / 3600, 1 / 60)
+                velocities[key] = round((trend.score - score) / hours, 3)
+            else:
+                velocities[key] = round(trend.score / self.velocity_window, 3)
+        return velocities
+
+
+# 이름별 공용 저장소 (프로세스 전역)
+_stores: Dict[str, TrendSnapshotStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_trend_store(name: str = 'collector',
+                    collect: Callable[[], List[TrendItem]] = None) -> TrendSnapshotStore:
+    """이름별 공용 스냅샷 저장소 반환 (기본: TrendCollector 전체 소스)"""
+    with _stores_lock:
+        store = _stores.get(name)
+        if store is None:
+            if collect is None:
+                from src.utils.trend_collector import trend_collector
+                collect = trend_collector.collect_all_trends
+            store = TrendSnapshotStore(
+                collect,
+                store_dir=os.path.join(os.getenv('TREND_SNAPSHOT_DIR', './data/trend_snapshots'), name),
+                max_age=float(os.getenv('TREND_SNAPSHOT_MAX_AGE', 900)),
+                history_limit=int(os.getenv('TREND_SNAPSHOT_HISTORY', 96)),
+            )
+            _stores[name] = store
+        return store
@@ -348,12 +348,9 @@ class TrendingTopicManager:
         """트렌딩 캐시 업데이트"""
         current_time = datetime.now()
         
-        # 캐시 만료 체크
-        if not force_update:
-            for site in self.site_configs:
-                last_update = self.last_update.get(site, datetime.min)
-                if (current_time - last_update).seconds < self.cache_expiry:
-                    continue
+        # 캐시 만료 체크 - 모든 사이트 캐시가 유효하면 수집하지 않음
+        if not force_update and not any(self._is_cache_expired(site, current_time) for site in self.site_configs):
+            return False
         
         # 실시간 트렌드 수집
         realtime_trends = self.fetch_realtime_trends()
@@ -377,6 +374,13 @@ class TrendingTopicManager:
         print(f"[TRENDING] 캐시 업데이트 완료: {current_time}")
         return True
     
+    def _is_cache_expired(self, site: str, current_time: datetime = None) -> bool:
+        """사이트 캐시가 없거나 만료 시간(초)을 넘었는지 확인"""
+        if site not in self.trending_cache or site not in self.last_update:
+            return True
+        elapsed = ((current_time or datetime.now()) - self.last_update[site]).total_seconds()
+        return elapsed >= self.cache_expiry
+    
     def add_trending_topic(self, site: str, category: str, topic: str, keywords: List[str] = None):
         """실시간 트렌딩 주제 추가"""
         if site not in self.site_configs:
@@ -407,9 +411,7 @@ class TrendingTopicManager:
             return []
         
         # 캐시가 비어있거나 만료된 경우 업데이트
-        if (site not in self.trending_cache or 
-            site not in self.last_update or 
-            (datetime.now() - self.last_update[site]).seconds > self.cache_expiry):
+        if self._is_cache_expired(site):
             self.update_trending_cache()
             
         site_cache = self.trending_cache.get(site, {})
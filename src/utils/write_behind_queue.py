@@ -0,0 +1,255 @@
+"""
+비동기 배치 쓰기(write-behind) 큐
+- 호출 스레드는 메모리 큐에 넣기만 하고 즉시 반환
+- 백그라운드 스레드가 개수/시간 조건에 따라 묶어서 flush 함수로 기록
+- DB에 쓸 수 없으면 로컬 JSONL 파일로 내보내고(spill), 재연결 시 다시 기록(replay)
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindQueue:
+    """크기 제한이 있는 메모리 큐 + 백그라운드 배치 flusher"""
+
+    def __init__(self, flush_func: Callable[[List[Dict[str, Any]]], None],
+                 spill_path: str, name: str = 'write_behind',
+                 max_queue_size: int = 1000, batch_size: int = 50,
+                 flush_interval: float = 5.0, retry_backoff: float = 30.0):
+        """
+        Args:
+            flush_func: 행 목록을 한 번에 기록하는 함수 (실패 시 예외 발생)
+            spill_path: DB 장애 시 행을 보관할 JSONL 파일 경로
+            name: 백그라운드 스레드/로그용 이름
+            max_queue_size: 메모리 큐 최대 길이 (초과분은 바로 파일로 보관)
+            batch_size: 이 개수 이상 쌓이면 즉시 flush
+            flush_interval: 개수와 무관하게 flush하는 주기(초)
+            retry_backoff: 기록 실패 후 보관 파일 재기록을 미루는 시간(초)
+        """
+        self.flush_func = flush_func
+        self.spill_path = Path(spill_path)
+        self.name = name
+        self.max_queue_size = max_queue_size
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.retry_backoff = retry_backoff
+        self._retry_after = 0.0
+
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()   # flush/replay 직렬화
+        self._spill_lock = threading.Lock()
+        self._thread = None
+        self._stopping = False
+        self._in_flight = 0
+
+        self._metrics = {
+            'enqueued': 0,
+            'flushed_rows': 0,
+            'flushed_batches': 0,
+            'flush_failures': 0,
+            'spilled_rows': 0,
+            'replayed_rows': 0,
+            'last_flush_ms': 0.0,
+        }
+
+        atexit.register(self.close)
+
+        if self._has_spilled_rows():
+            # 이전 실행에서 남은 보관 파일 - 새 기록을 기다리지 않고 바로 재기록 시작
+            self._ensure_worker()
+
+    # ------------------------------------------------------------------
+    # 생산자 API
+    # ------------------------------------------------------------------
+
+    def put(self, row: Dict[str, Any]):
+        """행 추가 - 블로킹 없이 즉시 반환"""
+        with self._cond:
+            if self._stopping:
+                overflow = True
+            elif len(self._queue) >= self.max_queue_size:
+                overflow = True
+            else:
+                overflow = False
+                self._queue.append(row)
+                self._metrics['enqueued'] += 1
+                if len(self._queue) >= self.batch_size:
+                    self._cond.notify()
+        if overflow:
+            # 큐가 가득 찼거나 종료 중이면 유실 대신 파일로 보관
+            self._spill([row])
+            return
+        self._ensure_worker()
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """큐에 쌓인 행을 지금 기록 - 모두 처리되면 True"""
+        deadline = time.monotonic() + timeout
+        while True:
+            self._drain_once()
+            with self._cond:
+                if not self._queue and not self._in_flight:
+                    return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+
+    def close(self, timeout: float = 10.0):
+        """백그라운드 스레드 종료 후 남은 행 기록 (실패분은 파일로 보관)"""
+        with self._cond:
+            if self._stopping:
+                return
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._drain_once()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            metrics = dict(self._metrics)
+            metrics['queue_depth'] = len(self._queue)
+        metrics['spill_pending'] = self._has_spilled_rows()
+        return metrics
+
+    # ------------------------------------------------------------------
+    # 백그라운드 처리
+    # ------------------------------------------------------------------
+
+    def _ensure_worker(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._cond:
+            if self._stopping or (self._thread is not None and self._thread.is_alive()):
+                return
+            self._thread = threading.Thread(target=self._run, name=f"{self.name}-flusher", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        if self._has_spilled_rows():
+            with self._flush_lock:
+                self._replay_spilled()
+        while True:
+            with self._cond:
+                if not self._stopping and len(self._queue) < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                if self._stopping:
+                    return
+            try:
+                self._drain_once()
+            except Exception as e:
+                logger.error(f"[{self.name}] flush 루프 오류: {e}")
+
+    def _drain_once(self):
+        """큐를 배치 단위로 비우고, 성공하면 보관 파일도 재기록"""
+        with self._flush_lock:
+            while True:
+                with self._cond:
+                    if not self._queue:
+                        break
+                    batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                    self._in_flight = len(batch)
+                try:
+                    if not self._write(batch):
+                        # DB 불가 - 이번 배치와 남은 큐를 모두 파일로 보관
+                        with self._cond:
+                            batch.extend(self._queue)
+                            self._queue.clear()
+                        self._spill(batch)
+                        return
+                finally:
+                    with self._cond:
+                        self._in_flight = 0
+            self._replay_spilled()
+
+    def _write(self, batch: List[Dict[str, Any]]) -> bool:
+        started = time.monotonic()
+        try:
+            self.flush_func(batch)
+        except Exception as e:
+            with self._cond:
+                self._metrics['flush_failures'] += 1
+            self._retry_after = time.monotonic() + self.retry_backoff
+            logger.warning(f"[{self.name}] 배치 기록 실패 ({len(batch)}건), 로컬 파일로 보관: {e}")
+            return False
+        with self._cond:
+            self._metrics['flushed_rows'] += len(batch)
+            self._metrics['flushed_batches'] += 1
+            self._metrics['last_flush_ms'] = (time.monotonic() - started) * 1000
+        return True
+
+    # ------------------------------------------------------------------
+    # spill / replay
+    # ------------------------------------------------------------------
+
+    def _spill(self, rows: List[Dict[str, Any]]):
+        with self._spill_lock:
+            try:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.spill_path, 'a', encoding='utf-8') as f:
+                    for row in rows:
+                        f.write(json.dumps(row, ensure_ascii=False, default=str) + '\n')
+                with self._cond:
+                    self._metrics['spilled_rows'] += len(rows)
+            except Exception as e:
+                logger.error(f"[{self.name}] 로컬 보관 실패 - {len(rows)}건 유실: {e}")
+
+    def _has_spilled_rows(self) -> bool:
+        """보관 파일(또는 중단된 재기록 파일)에 남은 행이 있는지"""
+        replay_path = self.spill_path.with_suffix(self.spill_path.suffix + '.replaying')
+        return any(path.exists() and path.stat().st_size > 0 for path in (self.spill_path, replay_path))
+
+    def _replay_spilled(self):
+        """보관 파일의 행을 다시 기록 (_flush_lock 보유 상태에서 호출)"""
+        if time.monotonic() < self._retry_after:
+            return
+
+        replay_path = self.spill_path.with_suffix(self.spill_path.suffix + '.replaying')
+        with self._spill_lock:
+            if self.spill_path.exists():
+                if replay_path.exists():
+                    # 이전 재기록이 중단된 경우 - 기존 파일 뒤에 이어 붙임
+                    with open(replay_path, 'a', encoding='utf-8') as dst, \
+                            open(self.spill_path, 'r', encoding='utf-8') as src:
+                        dst.write(src.read())
+                    self.spill_path.unlink()
+                else:
+                    os.replace(self.spill_path, replay_path)
+            if not replay_path.exists():
+                return
+
+        rows = []
+        with open(replay_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        rows.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logger.warning(f"[{self.name}] 손상된 보관 행 무시: {line[:100]}")
+
+        replayed = 0
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start:start + self.batch_size]
+            if not self._write(batch):
+                # 아직 DB 불가 - 남은 행을 다시 보관 (spilled 카운트에는 포함하지 않음)
+                with self._spill_lock, open(self.spill_path, 'a', encoding='utf-8') as f:
+                    for row in rows[start:]:
+                        f.write(json.dumps(row, ensure_ascii=False, default=str) + '\n')
+                break
+            replayed += len(batch)
+
+        replay_path.unlink(missing_ok=True)
+        if replayed:
+            with self._cond:
+                self._metrics['replayed_rows'] += replayed
+            logger.info(f"[{self.name}] 보관된 행 {replayed}건 재기록 완료")
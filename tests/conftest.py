@@ -0,0 +1,45 @@
+"""
+공용 테스트 픽스처
+"""
+
+import os
+import sys
+import tempfile
+from unittest.mock import MagicMock
+
+import pytest
+
+# 수집 단계에서 import되어 만들어지는 공용 api_tracker도 data/api_usage_spill.jsonl을 건드리지 않도록
+os.environ['API_USAGE_SPILL_PATH'] = os.path.join(tempfile.mkdtemp(prefix='api_usage_'), 'spill.jsonl')
+
+from src.utils.postgresql_database import PostgreSQLDatabase
+
+
+@pytest.fixture
+def mock_db():
+    """풀 없이 커서만 흉내낸 DB 인스턴스와 그 커서 (테이블/인덱스 준비 단계는 건너뜀)
+
+    connection() 블록 안의 cursor() 블록이 돌려주는 커서가 항상 같은 MagicMock이므로
+    테스트에서 fetchone/fetchall 반환값을 정하고 execute 호출을 검사한다.
+    """
+    db = PostgreSQLDatabase.__new__(PostgreSQLDatabase)
+    db.schema = 'blog_automation'
+    db._daily_metrics_ready = True
+    db.connection = MagicMock()
+    cursor = db.connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    return db, cursor
+
+
+@pytest.fixture(autouse=True)
+def api_usage_spill(tmp_path, monkeypatch):
+    """API 사용량 보관(spill) 파일을 테스트별 임시 경로로 바꿈
+
+    이미 만들어진 공용 api_tracker의 큐도 같은 경로를 쓰게 해서 DB 없이 기록된 사용량이
+    저장소의 data/ 아래에 쌓이지 않게 한다.
+    """
+    spill_path = tmp_path / 'api_usage_spill.jsonl'
+    monkeypatch.setenv('API_USAGE_SPILL_PATH', str(spill_path))
+    tracker_module = sys.modules.get('src.utils.api_tracker')
+    if tracker_module is not None:
+        monkeypatch.setattr(tracker_module.api_tracker._write_queue, 'spill_path', spill_path)
+    return spill_path
@@ -0,0 +1,111 @@
+"""
+일괄 내보내기 테스트
+"""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.generators.tistory_content_exporter import TistoryContentExporter
+from src.generators.wordpress_content_exporter import WordPressContentExporter
+from src.utils.batch_export import atomic_file, atomic_write_json, atomic_write_text, map_exports
+
+
+def _fail_on_negative(value):
+    if value < 0:
+        raise ValueError(f"음수: {value}")
+    return value * 2
+
+
+class TestAtomicWrite:
+    def test_write_replaces_target(self, tmp_path):
+        """쓰기가 끝나면 대상 파일만 남고 임시 파일은 없음"""
+        target = tmp_path / 'post.json'
+        target.write_text('old', encoding='utf-8')
+
+        atomic_write_json(target, {'title': '한글'})
+
+        assert json.loads(target.read_text(encoding='utf-8')) == {'title': '한글'}
+        assert [p.name for p in tmp_path.iterdir()] == ['post.json']
+
+    def test_failed_write_keeps_original(self, tmp_path):
+        """쓰는 도중 예외가 나면 기존 파일 유지, 임시 파일 삭제"""
+        target = tmp_path / 'post.html'
+        target.write_text('old', encoding='utf-8')
+
+        with pytest.raises(RuntimeError):
+            with atomic_file(target) as f:
+                f.write('half')
+                raise RuntimeError('렌더링 실패')
+
+        assert target.read_text(encoding='utf-8') == 'old'
+        assert [p.name for p in tmp_path.iterdir()] == ['post.html']
+
+    def test_concurrent_writes_use_separate_temp_files(self, tmp_path):
+        """같은 파일을 여러 스레드가 동시에 써도 임시 파일이 겹치지 않음"""
+        target = tmp_path / 'index.html'
+        errors = []
+
+        def write(n):
+            try:
+                atomic_write_text(target, f'버전 {n}\n' * 1000)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert len(set(target.read_text(encoding='utf-8').splitlines())) == 1
+        assert [p.name for p in tmp_path.iterdir()] == ['index.html']
+
+
+class TestMapExports:
+    def test_serial_keeps_order_and_errors(self):
+        """workers=1이면 현재 프로세스에서 처리, 실패 항목은 예외 객체로 자리 유지"""
+        results = map_exports(_fail_on_negative, [(1,), (-1,), (3,)], workers=1)
+
+        assert results[0] == 2 and results[2] == 6
+        assert isinstance(results[1], ValueError)
+
+    def test_process_pool_keeps_order(self):
+        """프로세스 풀에서도 입력 순서대로 결과 반환"""
+        assert map_exports(_fail_on_negative, [(i,) for i in range(5)], workers=2) == [0, 2, 4, 6, 8]
+
+
+class TestExporterBatch:
+    def setup_method(self):
+        """테스트 초기화 - 같은 제목의 글 두 개"""
+        self.contents = [
+            {'title': '같은 <제목>', 'introduction': '소개', 'sections': [{'heading': '본문', 'content': '내용'}]},
+            {'title': '같은 <제목>', 'introduction': '소개', 'sections': [{'heading': '본문', 'content': '내용'}]},
+        ]
+
+    def test_wordpress_manifest(self, tmp_path):
+        """같은 제목도 파일이 겹치지 않고 목록·인덱스 파일이 생성됨"""
+        exporter = WordPressContentExporter(str(tmp_path))
+
+        manifest = exporter.export_batch('unpre', self.contents + [{}], workers=1)
+
+        assert manifest['count'] == 2 and manifest['failed'] == 1
+        assert manifest['errors'][0]['index'] == 2
+        files = [Path(entry['file']) for entry in manifest['files']]
+        assert len(set(files)) == 2 and all(p.exists() for p in files)
+        batch_dir = Path(manifest['batch_dir'])
+        assert json.loads((batch_dir / 'manifest.json').read_text(encoding='utf-8')) == manifest
+        assert '같은 &lt;제목&gt;' in (batch_dir / 'index.html').read_text(encoding='utf-8')
+
+    def test_tistory_create_batch_export_returns_dir(self, tmp_path):
+        """기존 create_batch_export는 배치 디렉토리 경로를 그대로 반환"""
+        exporter = TistoryContentExporter(str(tmp_path))
+
+        batch_dir = Path(exporter.create_batch_export(self.contents))
+
+        manifest = json.loads((batch_dir / 'manifest.json').read_text(encoding='utf-8'))
+        assert manifest['count'] == 2
+        assert all(Path(entry['metadata']).exists() for entry in manifest['files'])
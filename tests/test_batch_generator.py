@@ -0,0 +1,129 @@
+"""
+배치 사전 생성 파이프라인 테스트
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, Mock, patch
+from src.generators.batch_generator import BatchPreGenerator, LocalBatchBackend
+
+
+class TestBatchPreGenerator:
+    def setup_method(self):
+        """테스트 초기화"""
+        self.client = Mock()
+        self.client.messages.create.side_effect = lambda **params: Mock(
+            content=[Mock(text=f'{{"title": "{params["messages"][0]["content"]}"}}')],
+            usage=Mock(input_tokens=100, output_tokens=200,
+                       cache_creation_input_tokens=0, cache_read_input_tokens=50)
+        )
+        self.generator = Mock()
+        self.generator.build_message_request.side_effect = lambda site_config, topic, category, **kwargs: {
+            'model': 'test', 'messages': [{'role': 'user', 'content': topic}]
+        }
+        self.generator.parse_generated_content.side_effect = lambda text, site_config: {'title': text}
+        self.db = MagicMock()
+        self.db.add_content_file.return_value = 42
+        self.target_date = date(2025, 3, 3)
+        self.topics = [
+            {'site': 'unpre', 'date': self.target_date, 'category_type': 'primary',
+             'topic': '주제A', 'category': '프로그래밍'},
+            {'site': 'unpre', 'date': self.target_date, 'category_type': 'secondary',
+             'topic': '주제B', 'category': '기술'},
+        ]
+
+    def make_pregenerator(self, tmp_path):
+        return BatchPreGenerator(
+            lambda site, topic_info, category_type: {'name': f'{site}-{category_type}'},
+            db=self.db, generator=self.generator, backend=LocalBatchBackend(self.client),
+            drafts_dir=str(tmp_path / 'drafts'), state_path=str(tmp_path / 'batch_jobs.json')
+        )
+
+    @patch('src.generators.batch_generator.api_tracker')
+    def test_submit_collect_and_use_draft(self, mock_tracker, tmp_path):
+        """제출 → 수집 → 초안 사용 후 정리"""
+        pregenerator = self.make_pregenerator(tmp_path)
+
+        batch_id = pregenerator.submit(self.topics)
+        assert batch_id.startswith('local_')
+        assert pregenerator.collect_ready_batches() == {'saved': 2, 'failed': 0, 'pending_batches': 0}
+        assert mock_tracker.track_usage.call_args.kwargs['batch'] is True
+
+        draft = pregenerator.get_ready_draft('unpre', self.target_date, 'primary', '주제A')
+        assert draft['file_id'] == 42
+        assert draft['content']['title'] == '{"title": "주제A"}'
+        assert self.db.add_content_file.call_args.kwargs['metadata']['status'] == 'draft'
+
+        pregenerator.mark_draft_published(draft)
+        self.db.delete_content_file.assert_called_once_with(42)
+        self.db.update_file_status.assert_not_called()
+        assert pregenerator.get_ready_draft('unpre', self.target_date, 'primary') is None
+
+    @patch('src.generators.batch_generator.api_tracker')
+    def test_skips_existing_drafts_and_changed_topics(self, mock_tracker, tmp_path):
+        """초안이 있으면 다시 제출하지 않고, 계획표 주제가 바뀐 초안은 사용하지 않음"""
+        pregenerator = self.make_pregenerator(tmp_path)
+        pregenerator.submit(self.topics)
+        pregenerator.collect_ready_batches()
+
+        assert pregenerator.submit(self.topics) is None
+        assert self.client.messages.create.call_count == 2
+        assert pregenerator.get_ready_draft('unpre', self.target_date, 'secondary', '바뀐 주제') is None
+
+    def test_pending_batches_survive_in_state_file(self, tmp_path):
+        """완료 전 배치는 상태 파일에 남아 다음 수집에서 다시 확인"""
+        backend = Mock()
+        backend.submit.return_value = 'msgbatch_1'
+        backend.status.return_value = 'in_progress'
+        pregenerator = self.make_pregenerator(tmp_path)
+        pregenerator.backend = backend
+
+        pregenerator.submit(self.topics[:1])
+        assert pregenerator.collect_ready_batches()['pending_batches'] == 1
+
+        reloaded = self.make_pregenerator(tmp_path)
+        reloaded.backend = backend
+        assert 'msgbatch_1' in reloaded._load_state()
+
+    def test_status_error_keeps_batch(self, tmp_path):
+        """상태 조회가 한 번 실패해도 제출한 배치는 목록에 남아 다음 수집에서 재시도"""
+        backend = Mock()
+        backend.submit.return_value = 'msgbatch_1'
+        backend.status.side_effect = ConnectionError('네트워크 오류')
+        pregenerator = self.make_pregenerator(tmp_path)
+        pregenerator.backend = backend
+
+        pregenerator.submit(self.topics[:1])
+        assert pregenerator.collect_ready_batches()['pending_batches'] == 1
+        assert pregenerator._load_state()['msgbatch_1']['status_errors'] == 1
+
+    @patch('src.generators.batch_generator.api_tracker')
+    def test_interrupted_collection_does_not_save_twice(self, mock_tracker, tmp_path):
+        """결과 수집이 중간에 실패해도 이미 저장한 초안은 다시 저장·집계하지 않음"""
+        pregenerator = self.make_pregenerator(tmp_path)
+        batch_id = pregenerator.submit(self.topics)
+        results = list(pregenerator.backend.results(batch_id))
+
+        def interrupted(_):
+            yield results[0]
+            raise ConnectionError('결과 스트림 끊김')
+        backend = Mock(status=Mock(return_value='ended'), results=Mock(side_effect=interrupted))
+        pregenerator.backend = backend
+        assert pregenerator.collect_ready_batches() == {'saved': 1, 'failed': 0, 'pending_batches': 1}
+
+        backend.results.side_effect = lambda _: iter(results)
+        assert pregenerator.collect_ready_batches() == {'saved': 1, 'failed': 0, 'pending_batches': 0}
+        assert self.db.add_content_file.call_count == 2
+        assert mock_tracker.track_usage.call_count == 2
+        assert pregenerator._load_state() == {}
+
+    @patch('src.generators.batch_generator.api_tracker')
+    def test_cleanup_stale_drafts(self, mock_tracker, tmp_path):
+        """날짜가 지난 미사용 초안은 파일과 draft DB 행을 함께 정리"""
+        pregenerator = self.make_pregenerator(tmp_path)
+        pregenerator.submit(self.topics)
+        pregenerator.collect_ready_batches()
+
+        assert pregenerator.cleanup_stale_drafts(today=self.target_date) == 0
+        assert pregenerator.cleanup_stale_drafts(today=date(2025, 3, 4)) == 2
+        assert self.db.delete_content_file.call_count == 2
+        assert pregenerator.get_ready_draft('unpre', self.target_date, 'primary') is None
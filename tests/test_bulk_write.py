@@ -0,0 +1,87 @@
+"""
+일괄 쓰기 도구 테스트
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from src.utils.bulk_write import bulk_update, bulk_upsert
+
+COLUMNS = ('year', 'month', 'day', 'site', 'topic_category', 'specific_topic')
+KEY = ('year', 'month', 'day', 'site', 'topic_category')
+
+
+class TestBulkUpsert:
+    def setup_method(self):
+        """테스트 초기화 - 같은 자연키가 두 번 들어간 행"""
+        self.cursor = MagicMock()
+        self.rows = [
+            (2025, 8, 1, 'unpre', 'AI', '첫 주제'),
+            (2025, 8, 1, 'untab', 'AI', '다른 사이트'),
+            (2025, 8, 1, 'unpre', 'AI', '바뀐 주제'),
+        ]
+
+    @patch('src.utils.bulk_write.psycopg2.extras.execute_values')
+    def test_single_statement_with_upsert(self, execute_values):
+        """모든 행을 한 번에 보내고 중복 키는 마지막 값만 남김"""
+        sent = bulk_upsert(self.cursor, 'unble.monthly_publishing_schedule', COLUMNS, self.rows,
+                           conflict=KEY, update=('specific_topic',))
+
+        assert sent == 2 and execute_values.call_count == 1
+        _, sql, rows = execute_values.call_args[0]
+        assert execute_values.call_args[1]['page_size'] == 2
+        assert 'ON CONFLICT (year, month, day, site, topic_category) DO UPDATE SET' in sql
+        assert 'specific_topic = EXCLUDED.specific_topic, updated_at = CURRENT_TIMESTAMP' in sql
+        assert rows == [(2025, 8, 1, 'unpre', 'AI', '바뀐 주제'), (2025, 8, 1, 'untab', 'AI', '다른 사이트')]
+
+    @patch('src.utils.bulk_write.psycopg2.extras.execute_values')
+    def test_do_nothing_without_update_columns(self, execute_values):
+        """갱신 컬럼이 없으면 충돌 행은 건너뜀"""
+        bulk_upsert(self.cursor, 'topic_pool', COLUMNS, self.rows, conflict=KEY)
+
+        assert 'ON CONFLICT (year, month, day, site, topic_category) DO NOTHING' in execute_values.call_args[0][1]
+
+    @patch('src.utils.bulk_write.psycopg2.extras.execute_values')
+    def test_empty_rows_skip_round_trip(self, execute_values):
+        """보낼 행이 없으면 DB를 호출하지 않음"""
+        assert bulk_upsert(self.cursor, 'topic_pool', COLUMNS, []) == 0
+        assert bulk_update(self.cursor, 'publishing_schedule', 'id', ('specific_topic',), []) == 0
+        execute_values.assert_not_called()
+
+
+class TestBulkUpdate:
+    @patch('src.utils.bulk_write.psycopg2.extras.execute_values')
+    def test_update_from_values(self, execute_values):
+        """키 컬럼으로 VALUES 목록과 조인해 한 문장에 갱신"""
+        rows = [(1, '주제', ['a']), (2, '주제2', [])]
+
+        bulk_update(MagicMock(), 'publishing_schedule', 'id', ('specific_topic', 'keywords'), rows,
+                    template='(%s, %s, %s::text[])')
+
+        _, sql, sent = execute_values.call_args[0]
+        assert 'FROM (VALUES %s) AS v (id, specific_topic, keywords)' in sql
+        assert 'WHERE t.id = v.id' in sql
+        assert sent == rows
+        assert execute_values.call_args[1]['template'] == '(%s, %s, %s::text[])'
+
+
+class TestScheduleWriters:
+    @patch('src.utils.schedule_manager.bulk_upsert')
+    def test_dual_category_week_sent_at_once(self, bulk_upsert_mock):
+        """2개 카테고리 주간 스케줄은 한 번의 UPSERT로 저장"""
+        from src.utils.schedule_manager import ScheduleManager
+
+        manager = ScheduleManager.__new__(ScheduleManager)
+        manager.db = MagicMock()
+        manager.trending_manager = MagicMock()
+        manager.trending_manager.get_daily_topics.side_effect = lambda site, day: (
+            {'category': 'A', 'topic': f'{site}-{day}-1', 'keywords': [], 'length': 'medium'},
+            {'category': 'B', 'topic': f'{site}-{day}-2', 'keywords': [], 'length': 'medium'},
+        )
+
+        with patch('src.utils.schedule_manager.invalidate_responses'):
+            assert manager.create_dual_category_weekly_schedule(date(2025, 8, 4))
+
+        bulk_upsert_mock.assert_called_once()
+        rows = bulk_upsert_mock.call_args[0][3]
+        assert len(rows) == 4 * 7 * 2
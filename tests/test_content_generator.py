@@ -5,8 +5,9 @@
 import pytest
 import json
 import os
-from unittest.mock import Mock, patch
-from src.generators.content_generator import ContentGenerator
+from unittest.mock import MagicMock, Mock, patch
+from src.generators.content_generator import ContentGenerator, get_shared_generator
+from src.utils.generation_cache import GenerationCache
 from config.sites_config import SITE_CONFIGS
 
 
@@ -242,4 +243,97 @@ class TestContentGenerator:
                 site_config=SITE_CONFIGS["unpre"],
                 topic="테스트",
                 category="개발"
-            )
\ No newline at end of file
+            )
+    
+    def test_system_prompt_cache_blocks(self):
+        """공통 지침/사이트 정보 블록에 캐시 지점 설정"""
+        blocks = self.generator._build_system(SITE_CONFIGS["unpre"])
+        
+        assert len(blocks) == 2
+        assert all(block["cache_control"] == {"type": "ephemeral"} for block in blocks)
+        assert SITE_CONFIGS["unpre"]["name"] in blocks[1]["text"]
+        # 주제는 캐시 블록이 아닌 사용자 메시지에만 포함
+        assert "테스트 주제" not in blocks[0]["text"] + blocks[1]["text"]
+        
+        self.generator.prompt_cache_enabled = False
+        assert all("cache_control" not in block for block in self.generator._build_system())
+    
+    @patch('src.generators.content_generator.api_tracker')
+    def test_cache_usage_reported(self, mock_tracker):
+        """응답의 캐시 생성/적중 토큰을 사용량 추적에 전달"""
+        mock_client = Mock()
+        mock_client.messages.create.return_value = Mock(
+            content=[Mock(text='{"title": "제목"}')],
+            usage=Mock(input_tokens=100, output_tokens=50,
+                       cache_creation_input_tokens=0, cache_read_input_tokens=1500)
+        )
+        self.generator.anthropic_client = mock_client
+        
+        self.generator._generate_with_claude("prompt", "unpre", site_config=SITE_CONFIGS["unpre"])
+        
+        assert isinstance(mock_client.messages.create.call_args.kwargs["system"], list)
+        kwargs = mock_tracker.track_usage.call_args.kwargs
+        assert kwargs["cache_read_input_tokens"] == 1500
+        assert kwargs["cache_creation_input_tokens"] == 0
+    
+    def test_shared_generator_reused(self):
+        """공용 생성기는 한 번만 생성되어 재사용"""
+        assert get_shared_generator() is get_shared_generator()
+    
+    @patch('src.generators.content_generator.api_tracker')
+    def test_streaming_aborts_non_json_and_retries(self, mock_tracker):
+        """스트리밍 중 코드 응답은 조기 중단 후 재시도, 섹션 진행 상황 전달"""
+        valid = json.dumps({
+            "title": "스트리밍 제목",
+            "sections": [{"heading": "섹션1", "content": "내용"}]
+        }, ensure_ascii=False)
+        
+        def make_stream(chunks):
+            stream = MagicMock()
+            stream.text_stream = iter(chunks)
+            stream.get_final_message.return_value = Mock(
+                content=[Mock(text=''.join(chunks))],
+                usage=Mock(input_tokens=10, output_tokens=20,
+                           cache_creation_input_tokens=0, cache_read_input_tokens=0)
+            )
+            manager = MagicMock()
+            manager.__enter__.return_value = stream
+            return manager
+        
+        code_stream = make_stream(["const x", " = 1;", " never read"])
+        mock_client = Mock()
+        mock_client.messages.stream.side_effect = [code_stream, make_stream([valid[:20], valid[20:]])]
+        self.generator.anthropic_client = mock_client
+        events = []
+        
+        result = self.generator._generate_with_claude("prompt", "unpre", stream=True,
+                                                      on_progress=events.append)
+        
+        assert result == valid
+        assert mock_client.messages.stream.call_count == 2
+        assert [e['type'] for e in events] == ['aborted', 'retry', 'field', 'section']
+        assert mock_tracker.track_usage.call_args_list[0].kwargs['purpose'] == 'content_generation_aborted'
+    
+    @patch('src.generators.content_generator.api_tracker')
+    def test_generation_cache_hit_and_bypass(self, mock_tracker, tmp_path):
+        """같은 요청은 캐시에서 반환, bypass_cache면 다시 생성"""
+        mock_client = Mock()
+        mock_client.messages.create.return_value = Mock(
+            content=[Mock(text=self.mock_claude_response["content"][0]["text"])],
+            usage=Mock(input_tokens=10, output_tokens=20,
+                       cache_creation_input_tokens=0, cache_read_input_tokens=0)
+        )
+        self.generator.anthropic_client = mock_client
+        self.generator.streaming_enabled = False
+        self.generator.generation_cache = GenerationCache(str(tmp_path))
+        args = dict(site_config=SITE_CONFIGS["unpre"], topic="Python 프로그래밍 기초", category="개발")
+        
+        first = self.generator.generate_content(**args)
+        second = self.generator.generate_content(**args)
+        assert mock_client.messages.create.call_count == 1
+        assert second["title"] == first["title"]
+        
+        self.generator.generate_content(**args, bypass_cache=True)
+        assert mock_client.messages.create.call_count == 2
+        metrics = self.generator.generation_cache.get_metrics()
+        assert (metrics["hits"], metrics["bypassed"]) == (1, 1)
@@ -0,0 +1,64 @@
+"""
+콘텐츠 목록 키셋 페이지네이션/단건 조회 테스트
+"""
+
+from datetime import datetime, timezone
+import pytest
+from src.utils.postgresql_database import decode_page_cursor, encode_page_cursor
+
+
+class TestContentPagination:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_db):
+        """테스트 초기화 - 풀 없이 커서만 흉내낸 DB 인스턴스"""
+        self.db, self.cursor = mock_db
+        self.rows = [
+            {'id': 10 - i, 'site': 'unpre', 'title': f'글 {i}', 'status': 'published',
+             'created_at': datetime(2025, 1, 10 - i, tzinfo=timezone.utc)}
+            for i in range(3)
+        ]
+
+    def test_cursor_round_trip(self):
+        """커서는 (created_at, id)를 그대로 복원하고 잘못된 값은 ValueError"""
+        created_at = datetime(2025, 1, 1, 12, 30, tzinfo=timezone.utc)
+        assert decode_page_cursor(encode_page_cursor(created_at, 42)) == (created_at, 42)
+        with pytest.raises(ValueError):
+            decode_page_cursor('not-a-cursor')
+
+    def test_page_uses_keyset_and_returns_next_cursor(self):
+        """limit+1행을 읽어 다음 페이지 여부를 판단하고, 커서는 (created_at, id) 비교로 이어감"""
+        self.cursor.fetchall.return_value = self.rows
+        self.cursor.fetchone.return_value = ([{'Plan': {'Plan Rows': 1234}}],)
+
+        cursor = encode_page_cursor(datetime(2025, 1, 11, tzinfo=timezone.utc), 11)
+        page = self.db.list_content_files(site='unpre', status='published', cursor=cursor, limit=2)
+
+        sql, params = self.cursor.execute.call_args_list[0].args
+        assert '(created_at, id) < (%s, %s)' in sql and 'OFFSET' not in sql
+        assert 'ORDER BY created_at DESC, id DESC' in sql
+        assert params[-1] == 3
+        assert [item['id'] for item in page['items']] == [10, 9]
+        assert decode_page_cursor(page['next_cursor']) == (self.rows[1]['created_at'], 9)
+        assert page['total_estimate'] == 1234
+
+    def test_single_page_counts_exactly(self):
+        """첫 페이지에 다 들어오면 추정 쿼리 없이 실제 건수 반환"""
+        self.cursor.fetchall.return_value = self.rows
+
+        page = self.db.list_content_files(limit=50)
+
+        assert page['next_cursor'] is None
+        assert page['total_estimate'] == 3
+        assert self.cursor.execute.call_count == 1
+
+    def test_get_content_file_by_primary_key(self):
+        """단건 조회는 id 조건 한 번"""
+        self.cursor.fetchone.return_value = {'id': 7, 'title': '글', 'tags': '["a"]',
+                                             'created_at': datetime(2025, 1, 1, tzinfo=timezone.utc)}
+
+        result = self.db.get_content_file(7)
+
+        sql, params = self.cursor.execute.call_args.args
+        assert 'WHERE id = %s' in sql and params == (7,)
+        assert result['tags'] == ['a']
+        assert result['created_at'] == '2025-01-01 09:00:00'
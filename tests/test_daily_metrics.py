@@ -0,0 +1,119 @@
+"""
+일별 지표 롤업(daily_metrics) 테스트
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+import pytest
+from src.utils import daily_metrics
+from src.utils.api_tracker import APITracker
+
+
+class TestDailyMetricsHelpers:
+    def test_metric_date_uses_kst_buckets(self):
+        """UTC 시각은 한국 시간 기준 날짜로 버킷팅"""
+        assert daily_metrics.metric_date('2025-01-01T16:00:00+00:00') == date(2025, 1, 2)
+        assert daily_metrics.metric_date('2025-01-01T14:59:59+00:00') == date(2025, 1, 1)
+        assert daily_metrics.metric_date(date(2025, 3, 1)) == date(2025, 3, 1)
+
+    def test_aggregate_deltas_merges_same_key(self):
+        """같은 (날짜, 사이트, 종류) 증분은 한 행으로 합산 (사이트 없음은 '')"""
+        day = date(2025, 1, 1)
+        rows = daily_metrics.aggregate_deltas([
+            {'date': day, 'site': 'unpre', 'kind': 'api', 'count': 1, 'total_tokens': 10, 'cost_usd': 0.5},
+            {'date': day, 'site': 'unpre', 'kind': 'api', 'count': 1, 'total_tokens': 5, 'cost_usd': 0.25},
+            {'date': day, 'site': None, 'kind': 'api', 'count': 1},
+        ])
+        assert len(rows) == 2
+        assert rows[0] == (day, 'unpre', 'api', 2, 0, 0, 15, 0, 0, 0.75)
+        assert rows[1][:4] == (day, '', 'api', 1)
+
+    def test_month_range_handles_december(self):
+        """12월은 다음 해 1월 직전까지"""
+        assert daily_metrics.month_range(2024, 12) == (date(2024, 12, 1), date(2024, 12, 31))
+        assert daily_metrics.month_range(2024, 2) == (date(2024, 2, 1), date(2024, 2, 29))
+
+
+class TestRollupWrites:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_db):
+        """테스트 초기화 - 풀 없이 커서만 흉내낸 DB 인스턴스"""
+        self.db, self.cursor = mock_db
+
+    @patch('src.utils.postgresql_database.daily_metrics.apply_deltas')
+    def test_publish_counted_only_on_transition(self, apply_deltas):
+        """처음 published로 바뀔 때만 발행 건수 증가"""
+        self.cursor.fetchone.return_value = ('unpre', 'processing', '2025-01-01T16:00:00+00:00')
+        self.db.update_content_file_status(1, 'published', '2025-01-01T16:00:00+00:00')
+
+        deltas = apply_deltas.call_args.args[2]
+        assert deltas == [{'date': date(2025, 1, 2), 'site': 'unpre', 'kind': 'published', 'count': 1}]
+        assert "COALESCE(%(published_at)s, c.published_at, CURRENT_TIMESTAMP)" in self.cursor.execute.call_args.args[0]
+
+        apply_deltas.reset_mock()
+        self.cursor.fetchone.return_value = ('unpre', 'published', '2025-01-01T16:00:00+00:00')
+        self.db.update_content_file_status(1, 'published', '2025-01-01T16:00:00+00:00')
+        apply_deltas.assert_not_called()
+
+    @patch('src.utils.postgresql_database.daily_metrics.apply_deltas')
+    def test_insert_as_published_counts_publish(self, apply_deltas):
+        """published 상태로 바로 추가한 글은 생성과 발행을 함께 집계"""
+        self.cursor.fetchone.return_value = (9, datetime(2025, 1, 3, 10, 0))
+        self.db.add_content_file('unpre', '제목', '/tmp/a.html', 'wordpress', {'status': 'published'})
+
+        kinds = {(d['kind'], d['count']) for d in apply_deltas.call_args.args[2]}
+        published = [d for d in apply_deltas.call_args.args[2] if d['kind'] == 'published']
+        assert kinds == {('content', 1), ('published', 1)}
+        assert published[0]['date'] == date(2025, 1, 3)
+
+    @patch('src.utils.postgresql_database.daily_metrics.apply_deltas')
+    def test_delete_subtracts_created_and_published(self, apply_deltas):
+        """삭제한 행만큼 생성/발행 건수 차감"""
+        self.cursor.fetchall.return_value = [('untab', date(2025, 1, 1), 'published', date(2025, 1, 3))]
+        assert self.db.delete_content_file(7) is True
+
+        kinds = {(d['kind'], d['date'], d['count']) for d in apply_deltas.call_args.args[2]}
+        assert kinds == {('content', date(2025, 1, 1), -1), ('published', date(2025, 1, 3), -1)}
+
+    @patch('src.utils.postgresql_database.daily_metrics.apply_deltas')
+    def test_missing_table_skips_rollup_without_ddl(self, apply_deltas):
+        """롤업 테이블이 없으면 쓰기 트랜잭션 안에서 만들지 않고 증분만 건너뜀 (준비 플래그도 그대로)"""
+        self.db._daily_metrics_ready = False
+        self.cursor.fetchone.return_value = (None,)
+        self.cursor.fetchall.return_value = [('untab', date(2025, 1, 1), 'draft', None)]
+        assert self.db.delete_content_file(7) is True
+
+        apply_deltas.assert_not_called()
+        assert not any('CREATE' in c.args[0] for c in self.cursor.execute.call_args_list)
+        assert self.db._daily_metrics_ready is False
+
+        self.cursor.fetchone.return_value = ('blog_automation.daily_metrics',)
+        assert self.db.delete_content_file(7) is True
+        apply_deltas.assert_called_once()
+        assert self.db._daily_metrics_ready is True
+
+
+class TestUsageFromRollup:
+    def setup_method(self):
+        """테스트 초기화 - DB 없이 롤업 조회만 흉내"""
+        self.tracker = APITracker.__new__(APITracker)
+        self.tracker.db = MagicMock()
+        self.tracker.db.get_daily_metrics.return_value = [
+            {'date': date(2025, 1, 1), 'site': 'unpre', 'count': 3, 'input_tokens': 100,
+             'output_tokens': 50, 'total_tokens': 150, 'cache_creation_tokens': 0,
+             'cache_read_tokens': 0, 'cost_usd': Decimal('0.120000')},
+            {'date': date(2025, 1, 2), 'site': 'untab', 'count': 2, 'input_tokens': 10,
+             'output_tokens': 5, 'total_tokens': 15, 'cache_creation_tokens': 0,
+             'cache_read_tokens': 0, 'cost_usd': Decimal('0.030000')},
+        ]
+
+    def test_monthly_usage_sums_daily_rows(self):
+        """월별 사용량은 해당 월 롤업 행 합계"""
+        usage = self.tracker.get_monthly_usage(2025, 1)
+
+        self.tracker.db.get_daily_metrics.assert_called_once_with(
+            'api', date(2025, 1, 1), date(2025, 1, 31), site=None)
+        assert usage['total_requests'] == 5
+        assert usage['total_tokens'] == 165
+        assert usage['total_cost_usd'] == 0.15
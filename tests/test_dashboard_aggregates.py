@@ -0,0 +1,55 @@
+"""
+대시보드 콘텐츠 집계 쿼리 테스트
+"""
+
+from datetime import datetime, timedelta
+import pytest
+import pytz
+
+
+class TestContentAggregates:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_db):
+        """테스트 초기화 - 풀 없이 커서만 흉내낸 DB 인스턴스"""
+        self.db, self.cursor = mock_db
+        self.today = datetime.now(pytz.timezone('Asia/Seoul')).date()
+
+    def test_single_query_builds_chart_and_totals(self):
+        """GROUPING SETS 결과 한 번으로 일별 차트와 전체 통계 구성"""
+        yesterday = self.today - timedelta(days=1)
+        self.cursor.fetchall.return_value = [
+            (self.today, 'unpre', None, None, 2, 3),
+            (yesterday, 'untab', None, None, 1, 3),
+            (None, 'unpre', None, None, 5, 3),       # 창 밖 행 (day NULL)
+            (None, 'unpre', None, None, 7, 11),
+            (None, 'untab', None, None, 3, 11),
+            (None, None, 'json', None, 10, 13),
+            (None, None, None, 'published', 4, 14),
+            (None, None, None, None, 10, 15),
+        ]
+
+        aggregates = self.db.get_content_aggregates(days=30)
+
+        assert self.cursor.execute.call_count == 1
+        assert len(aggregates['daily']) == 30
+        assert aggregates['daily'][0] == {'date': self.today.strftime('%Y-%m-%d'), 'count': 2, 'by_site': {'unpre': 2}}
+        assert aggregates['daily'][1]['count'] == 1
+        assert all(d['count'] == 0 for d in aggregates['daily'][2:])
+        assert aggregates['window_by_site'] == {'unpre': 2, 'untab': 1}
+        assert aggregates['by_site'] == {'unpre': 7, 'untab': 3}
+        assert aggregates['by_file_type'] == {'json': 10}
+        assert aggregates['by_status'] == {'published': 4}
+        assert aggregates['total'] == 10
+
+    def test_window_only_query_uses_range_predicate(self):
+        """전체 통계가 필요 없으면 created_at 범위 조건으로 창만 조회"""
+        self.cursor.fetchall.return_value = [(self.today, 'skewese', None, None, 3, 3)]
+
+        aggregates = self.db.get_content_aggregates(days=90, include_totals=False)
+
+        sql, params = self.cursor.execute.call_args.args
+        assert 'WHERE created_at >= %s' in sql and 'DATE(created_at)' not in sql
+        assert params[1] == pytz.timezone('Asia/Seoul').localize(
+            datetime.combine(self.today - timedelta(days=89), datetime.min.time()))
+        assert aggregates['daily'][0]['count'] == 3
+        assert len(aggregates['daily']) == 90
@@ -0,0 +1,147 @@
+"""
+PostgreSQL 커넥션 풀 테스트
+"""
+
+import threading
+import pytest
+import psycopg2.extensions
+import psycopg2.pool
+from unittest.mock import MagicMock, patch
+from src.utils.db_pool import PostgreSQLConnectionPool
+
+
+def make_fake_connection():
+    """psycopg2 연결을 흉내내는 MagicMock 생성"""
+    conn = MagicMock()
+    conn.closed = 0
+    conn.get_transaction_status.return_value = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def close():
+        conn.closed = 1
+    conn.close.side_effect = close
+    return conn
+
+
+class TestPostgreSQLConnectionPool:
+    def setup_method(self):
+        """테스트 초기화"""
+        self.patcher = patch('psycopg2.connect', side_effect=lambda **kwargs: make_fake_connection())
+        self.mock_connect = self.patcher.start()
+        self.pool = PostgreSQLConnectionPool(
+            {'host': 'localhost'}, schema='blog_automation',
+            min_size=1, max_size=2, max_overflow=1, timeout=0.2
+        )
+
+    def teardown_method(self):
+        """테스트 후 정리"""
+        self.pool.closeall()
+        self.patcher.stop()
+
+    def test_checkout_reuses_returned_connection(self):
+        """반납된 연결 재사용 테스트"""
+        conn = self.pool.checkout()
+        self.pool.checkin(conn)
+
+        assert self.pool.checkout() is conn
+        assert self.mock_connect.call_count == 1
+
+    def test_overflow_and_exhaustion(self):
+        """최대 크기 + 오버플로 초과 시 대기 후 PoolError"""
+        conns = [self.pool.checkout() for _ in range(3)]
+        metrics = self.pool.get_metrics()
+        assert metrics['in_use'] == 3
+        assert metrics['overflow_in_use'] == 1
+
+        with pytest.raises(psycopg2.pool.PoolError):
+            self.pool.checkout()
+        assert self.pool.get_metrics()['timeouts'] == 1
+
+        # 오버플로 연결은 반납 시 종료됨
+        self.pool.checkin(conns[2])
+        assert conns[2].closed
+        assert self.pool.get_metrics()['overflow_in_use'] == 0
+
+    def test_waiter_gets_connection_on_checkin(self):
+        """대기 중인 스레드가 반납된 연결을 받음"""
+        conns = [self.pool.checkout() for _ in range(3)]
+        self.pool.timeout = 2
+        result = {}
+
+        def waiter():
+            result['conn'] = self.pool.checkout()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        self.pool.checkin(conns[0])
+        thread.join(timeout=2)
+
+        assert result['conn'] is conns[0]
+        assert self.pool.get_metrics()['waits'] == 1
+
+    def test_health_check_only_on_long_idle(self):
+        """오래 유휴였던 연결만 헬스 체크"""
+        conn = self.pool.checkout()
+        self.pool.checkin(conn)
+        self.pool.checkout()
+        assert self.pool.get_metrics()['health_checks'] == 0
+
+        self.pool.checkin(conn)
+        self.pool.health_check_after = 0
+        conn.cursor.return_value.__enter__.return_value.execute.side_effect = psycopg2.OperationalError()
+        replacement = self.pool.checkout()
+
+        assert replacement is not conn
+        assert self.pool.get_metrics()['health_check_failures'] == 1
+
+    def test_connection_context_rolls_back_and_shares_within_thread(self):
+        """스레드 범위 연결 - 중첩 시 같은 연결, 예외 시 롤백"""
+        with self.pool.connection() as outer:
+            with self.pool.connection() as inner:
+                assert inner is outer
+        assert self.pool.get_metrics()['in_use'] == 0
+
+        with pytest.raises(ValueError):
+            with self.pool.connection() as conn:
+                raise ValueError("boom")
+        conn.rollback.assert_called()
+
+    def test_bound_connection_reclaimed_from_dead_thread(self):
+        """종료된 스레드에 바인딩된 연결 회수"""
+        self.pool.max_overflow = 0
+
+        def worker():
+            self.pool.bind_thread()
+            self.pool.bind_thread()
+
+        for _ in range(2):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        conn = self.pool.checkout()
+        assert conn is not None
+        assert self.pool.get_metrics()['reclaimed_from_dead_threads'] >= 1
+
+    def test_checkin_rolls_back_outside_lock(self):
+        """반납 시 롤백은 풀 락을 잡지 않은 상태에서 수행"""
+        conn = self.pool.checkout()
+        conn.get_transaction_status.return_value = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+        held = []
+        conn.rollback.side_effect = lambda: held.append(self.pool._cond._is_owned())
+
+        self.pool.checkin(conn)
+
+        assert held == [False]
+        assert self.pool.checkout() is conn
+
+    def test_pooled_connection_close_returns_to_pool(self):
+        """acquire()로 빌린 연결은 close() 시 풀로 반납"""
+        self.pool.reset_thread_stats()
+        proxy = self.pool.acquire()
+        raw = proxy._conn
+        proxy.close()
+
+        assert not raw.closed
+        assert proxy.closed
+        assert self.pool.checkout() is raw
+        assert self.pool.get_thread_stats() == {'opened': 1, 'checkouts': 2}
@@ -0,0 +1,94 @@
+"""
+대시보드 SSE 이벤트 스트림 테스트
+"""
+
+import json
+import threading
+import time
+from src.utils.event_stream import ChangeNotifier, PublishStatus, parse_event_id, stream_events
+from src.utils.log_buffer import LogRingBuffer
+
+
+def _events(chunks):
+    """SSE 문자열 목록 → (id, event, data) 목록 (주석/retry 제외)"""
+    parsed = []
+    for chunk in chunks:
+        fields = dict(line.split(': ', 1) for line in chunk.strip().split('\n') if ': ' in line)
+        if 'event' in fields:
+            parsed.append((fields.get('id'), fields['event'], json.loads(fields['data'])))
+    return parsed
+
+
+class TestEventStream:
+    def setup_method(self):
+        """테스트 초기화"""
+        self.notifier = ChangeNotifier()
+        self.status = PublishStatus(self.notifier, in_progress=False, progress=0, results=[])
+        self.logs = LogRingBuffer(capacity=10, notifier=self.notifier)
+
+    def test_status_changes_bump_version_and_notify(self):
+        """update/항목 설정/mutate 모두 버전을 올리고 대기자를 깨움"""
+        seen = self.notifier.counter
+        self.status.update(in_progress=True)
+        self.status['progress'] = 50
+        self.status.mutate(lambda status: status['results'].append({'site': 'unpre'}))
+
+        assert self.status.version == 3
+        assert self.notifier.wait(seen, timeout=0) == seen + 3
+        version, data = self.status.snapshot()
+        data['results'].clear()
+        assert self.status['results'] == [{'site': 'unpre'}]
+
+    def test_mutate_is_safe_during_snapshot(self):
+        """다른 스레드가 mutate()로 안쪽 객체를 바꾸는 동안에도 snapshot()은 실패하지 않음"""
+        def toggle(status, key):
+            jobs = status.setdefault('jobs', {})
+            if jobs.pop(key, None) is None:
+                jobs[key] = {'stage': 'running'}
+
+        def writer(prefix):
+            for n in range(500):
+                self.status.mutate(lambda status: toggle(status, f'{prefix}{n % 20}'))
+
+        threads = [threading.Thread(target=writer, args=(p,)) for p in 'ab']
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            self.status.snapshot()
+        for thread in threads:
+            thread.join()
+
+        assert self.status.version == 1000
+
+    def test_first_connect_sends_status_then_new_logs_only(self):
+        """첫 연결은 현재 상태 + 이후 로그만, 변경 즉시 전송"""
+        self.logs.append({'message': '이전 로그'})
+        stream = stream_events(self.status, self.logs, self.notifier,
+                               heartbeat=5, max_duration=2)
+
+        assert next(stream) == "retry: 1000\n\n"
+        first = _events([next(stream)])
+        assert first == [('0:1', 'publish_status', {'in_progress': False, 'progress': 0, 'results': []})]
+
+        threading.Timer(0.05, lambda: self.logs.append({'message': '새 로그'})).start()
+        started = time.monotonic()
+        (event_id, event, data), = _events([next(stream)])
+        assert time.monotonic() - started < 1
+        assert event == 'logs' and event_id == '0:2'
+        assert [log['message'] for log in data['logs']] == ['새 로그']
+
+    def test_reconnect_resumes_from_last_event_id(self):
+        """Last-Event-ID 이후 변경만 다시 전송하고 max_duration 후 종료"""
+        for i in range(3):
+            self.logs.append({'message': f'로그 {i}'})
+        self.status.update(progress=10)
+
+        chunks = list(stream_events(self.status, self.logs, self.notifier,
+                                    last_event_id=f"{self.status.version}:1",
+                                    heartbeat=0.01, max_duration=0.05))
+        events = _events(chunks)
+
+        assert [e[1] for e in events] == ['logs']
+        assert [log['seq'] for log in events[0][2]['logs']] == [2, 3]
+        assert ": keepalive\n\n" in chunks
+        assert parse_event_id('garbage') == (-1, 0)
@@ -0,0 +1,56 @@
+"""
+콘텐츠 생성 결과 디스크 캐시 테스트
+"""
+
+import os
+import time
+from src.utils.generation_cache import GenerationCache
+
+
+class TestGenerationCache:
+    def setup_method(self):
+        """테스트 초기화"""
+        self.request = {'model': 'claude', 'messages': [{'role': 'user', 'content': '주제'}]}
+
+    def test_key_depends_on_request_and_version(self):
+        """요청 내용이나 프롬프트 버전이 다르면 다른 키"""
+        key = GenerationCache.make_key(self.request, version='1')
+
+        assert key == GenerationCache.make_key(dict(self.request), version='1')
+        assert key != GenerationCache.make_key(self.request, version='2')
+        assert key != GenerationCache.make_key({**self.request, 'temperature': 0.5}, version='1')
+
+    def test_hit_miss_and_ttl(self, tmp_path):
+        """저장 후 적중, TTL 지나면 만료"""
+        cache = GenerationCache(str(tmp_path), ttl=60)
+        key = GenerationCache.make_key(self.request)
+
+        assert cache.get(key) is None
+        cache.set(key, {'title': '제목'})
+        hit = cache.get(key)
+        hit['title'] = '수정됨'  # 반환값 수정이 캐시에 영향 없음
+        assert cache.get(key) == {'title': '제목'}
+
+        cache.ttl = 0
+        time.sleep(0.01)
+        assert cache.get(key) is None
+
+        metrics = cache.get_metrics()
+        assert (metrics['hits'], metrics['misses'], metrics['expired']) == (2, 2, 1)
+        assert metrics['entries'] == 0
+
+    def test_lru_eviction(self, tmp_path):
+        """최대 개수 초과 시 가장 오래 쓰지 않은 항목 제거"""
+        cache = GenerationCache(str(tmp_path), max_entries=2)
+        cache.set('a', {'v': 1})
+        cache.set('b', {'v': 2})
+        # 'a'를 최근 사용으로 만들기 위해 'b'를 더 오래된 시각으로 설정
+        past = time.time() - 100
+        os.utime(tmp_path / 'b.json', (past, past))
+        cache.get('a')
+
+        cache.set('c', {'v': 3})
+
+        assert cache.get('b') is None
+        assert cache.get('a') == {'v': 1}
+        assert cache.get_metrics()['evictions'] == 1
@@ -0,0 +1,50 @@
+"""
+내보내기 HTML 템플릿 테스트
+"""
+
+from pathlib import Path
+from src.generators.wordpress_content_exporter import WordPressContentExporter
+from src.utils.html_templates import get_environment, inline_stylesheets, render
+from src.utils.markdown_renderer import DASHBOARD_THEME
+
+
+class TestExportTemplates:
+    def setup_method(self):
+        """테스트 초기화 - 예시 글"""
+        self.content = {
+            'title': 'Python & 자동화 가이드',
+            'meta_description': '"따옴표" 설명',
+            'keywords': ['Python', '자동화'],
+            'tags': ['개발'],
+            'introduction': '**소개** 문단',
+            'sections': [{'heading': '시작', 'content': 'Python 설치\n\n- pip 사용'}],
+            'conclusion': '정리'
+        }
+
+    def test_preview_streams_file_with_shared_css(self, tmp_path):
+        """미리보기 파일은 공통 CSS를 링크하고 사이트 색상만 인라인, 제목은 이스케이프"""
+        exporter = WordPressContentExporter(str(tmp_path))
+
+        html = Path(exporter.export_content('untab', self.content)).read_text(encoding='utf-8')
+
+        assert '<link rel="stylesheet" href="/static/css/wordpress_preview.css" data-export-css>' in html
+        assert '--primary: #388e3c;' in html and '.content-container {' not in html
+        assert '<title>Python &amp; 자동화 가이드 - untab.co.kr</title>' in html
+        assert '<span class="highlight">Python</span> 설치' in html
+        assert '<div class="intro"><p><strong>소개</strong> 문단</p></div>' in html
+
+    def test_template_compiled_once(self):
+        """같은 템플릿은 캐시된 컴파일 결과를 재사용"""
+        env = get_environment()
+        assert env.get_template('beautiful_post.html') is env.get_template('beautiful_post.html')
+
+    def test_inline_stylesheets_for_download(self):
+        """다운로드용으로 링크된 CSS를 <style>로 치환"""
+        html = render('beautiful_post.html', content=self.content, site_name='untab',
+                      published_date='2025년 01월 06일', markdown_theme=DASHBOARD_THEME)
+
+        standalone = inline_stylesheets(html)
+
+        assert 'post_beautiful.css' in html and '<style>' not in html
+        assert 'post_beautiful.css' not in standalone
+        assert '<style>\n/* 수동발행 Tistory 글' in standalone
@@ -0,0 +1,72 @@
+"""
+공유 HTTP 세션/재시도 테스트
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock
+import pytest
+import requests
+from src.utils import http_client
+
+
+def make_response(status_code, headers=None):
+    return Mock(status_code=status_code, headers=headers or {})
+
+
+class TestHttpClient:
+    def setup_method(self):
+        """테스트 초기화 - 세션 대역과 대기 기록"""
+        http_client.http_metrics.reset()
+        self.session = Mock()
+        self.sleeps = []
+
+    def call(self, method, **kwargs):
+        return http_client.request(method, 'https://unpre.co.kr/wp-json/wp/v2/posts',
+                                   session=self.session, sleep=self.sleeps.append, **kwargs)
+
+    def test_session_shared_per_host(self):
+        """같은 호스트는 같은 세션, 다른 호스트는 별도 세션"""
+        try:
+            first = http_client.get_session('https://unpre.co.kr/wp-json/wp/v2/posts')
+            assert http_client.get_session('https://UNPRE.co.kr/wp-json/wp/v2/categories') is first
+            assert http_client.get_session('https://untab.co.kr/') is not first
+        finally:
+            http_client.close_sessions()
+
+    def test_retry_after_honored_on_429(self):
+        """429는 Retry-After만큼 기다린 뒤 재시도하고 지표에 기록"""
+        self.session.request.side_effect = [make_response(429, {'Retry-After': '7'}), make_response(201)]
+
+        response = self.call('POST', json={'title': 't'})
+
+        assert response.status_code == 201
+        assert self.sleeps == [7.0]
+        stats = http_client.get_http_metrics()['unpre.co.kr']
+        assert stats['requests'] == 2 and stats['retries'] == 1 and stats['errors'] == 1
+
+    def test_post_not_retried_on_500(self):
+        """POST는 처리 여부가 불확실한 500을 재시도하지 않음 (GET은 재시도)"""
+        self.session.request.return_value = make_response(500)
+        assert self.call('POST').status_code == 500
+        assert self.session.request.call_count == 1
+
+        self.session.request.side_effect = [make_response(502), make_response(200)]
+        assert self.call('GET').status_code == 200
+        assert len(self.sleeps) == 1
+
+    def test_connection_error_exhausts_retries(self):
+        """연결 오류는 max_retries까지 재시도 후 예외 전달"""
+        self.session.request.side_effect = requests.ConnectionError('reset')
+
+        with pytest.raises(requests.ConnectionError):
+            self.call('GET', max_retries=2)
+
+        assert self.session.request.call_count == 3
+        assert len(self.sleeps) == 2
+
+    def test_retry_after_http_date_and_jitter(self):
+        """HTTP 날짜 형식 Retry-After와 백오프 상한"""
+        now = datetime(2025, 1, 6, 12, 0, 0, tzinfo=timezone.utc)
+        assert http_client.retry_after_seconds('Mon, 06 Jan 2025 12:00:30 GMT', now) == 30
+        assert http_client.retry_after_seconds('soon') is None
+        assert http_client.backoff_delay(10, base=1, cap=30, rand=lambda low, high: high) == 30
@@ -0,0 +1,64 @@
+"""
+스트리밍 응답용 증분 JSON 파서 테스트
+"""
+
+import json
+import pytest
+from src.generators.incremental_json_parser import IncrementalJSONParser, NonJSONOutputError
+
+
+def feed_in_chunks(parser, text, size=7):
+    """응답을 작은 조각으로 나눠 넣고 이벤트 전체 반환"""
+    events = []
+    for start in range(0, len(text), size):
+        events.extend(parser.feed(text[start:start + size]))
+    return events
+
+
+class TestIncrementalJSONParser:
+    def setup_method(self):
+        """테스트 초기화"""
+        self.parser = IncrementalJSONParser(probe_chars=50)
+        self.document = {
+            "title": "파이썬 {기초} 가이드",
+            "introduction": "서론에 \"따옴표\"와 [괄호]가 포함됨",
+            "sections": [
+                {"heading": "첫 번째", "content": "내용, 쉼표 포함"},
+                {"heading": "두 번째", "content": "중첩 {\"a\": [1, 2]}"}
+            ],
+            "tags": ["파이썬", "기초"]
+        }
+
+    def test_emits_fields_and_sections_in_order(self):
+        """필드와 섹션이 완성되는 순서대로 이벤트 발생"""
+        text = "```json\n" + json.dumps(self.document, ensure_ascii=False) + "\n```"
+        events = feed_in_chunks(self.parser, text)
+
+        assert [(kind, key) for kind, key, _ in events] == [
+            ('field', 'title'), ('field', 'introduction'),
+            ('item', 'sections'), ('item', 'sections'),
+            ('field', 'sections'), ('field', 'tags'),
+        ]
+        assert events[2][2]['heading'] == "첫 번째"
+        assert self.parser.done
+        assert self.parser.result == self.document
+
+    def test_section_emitted_before_response_completes(self):
+        """응답이 끝나기 전에 완성된 섹션부터 전달"""
+        text = json.dumps(self.document, ensure_ascii=False)
+        cut = text.index('"두 번째"')
+        events = self.parser.feed(text[:cut])
+
+        assert ('field', 'title', self.document['title']) in events
+        assert sum(1 for kind, _, _ in events if kind == 'item') == 1
+        assert not self.parser.done
+
+    @pytest.mark.parametrize("text", [
+        "const post = { title: 'x' };",
+        "```python\nprint('hello')\n```",
+        "설명 문장입니다. " * 10,
+    ])
+    def test_aborts_on_non_json_prefix(self, text):
+        """코드/장문 텍스트로 시작하면 조기 중단"""
+        with pytest.raises(NonJSONOutputError):
+            feed_in_chunks(self.parser, text)
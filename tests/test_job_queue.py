@@ -0,0 +1,127 @@
+"""
+영속 발행 작업 큐 테스트
+"""
+
+from datetime import date
+from unittest.mock import MagicMock
+from src.utils.job_queue import (Job, JobQueue, JobWorkerPool, idempotency_key,
+                                 STATE_FAILED, STATE_QUEUED, STATE_SUCCEEDED)
+
+
+def make_row(**values):
+    row = {'id': 1, 'kind': 'quick_publish', 'site': 'unpre',
+           'idempotency_key': 'quick_publish:unpre:2025-01-06:programming',
+           'payload': {}, 'state': STATE_QUEUED, 'attempts': 0, 'max_attempts': 3}
+    row.update(values)
+    return row
+
+
+class TestJobQueue:
+    def setup_method(self):
+        """테스트 초기화 - 커서만 흉내낸 DB"""
+        self.db = MagicMock()
+        self.db.schema = 'blog_automation'
+        self.cursor = self.db.connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        self.queue = JobQueue(self.db, lease_seconds=60, retry_base=10, retry_max=100)
+        self.queue._table_ready = True
+
+    def test_idempotency_key(self):
+        """종류/사이트/날짜/카테고리로 키 구성 (카테고리 없으면 '-')"""
+        assert idempotency_key('quick_publish', 'unpre', date(2025, 1, 6), 'programming') == \
+            'quick_publish:unpre:2025-01-06:programming'
+        assert idempotency_key('scheduled_publish', 'untab', date(2025, 1, 6)) == \
+            'scheduled_publish:untab:2025-01-06:-'
+
+    def test_enqueue_duplicate_returns_existing_job(self):
+        """같은 멱등 키는 새로 넣지 않고 기존 작업 반환"""
+        existing = make_row(id=7, state=STATE_SUCCEEDED, result={'success': True})
+        self.cursor.fetchone.side_effect = [None, existing]
+
+        job, created = self.queue.enqueue('quick_publish', 'unpre', existing['idempotency_key'])
+
+        assert created is False
+        assert job.id == 7 and job.state == STATE_SUCCEEDED
+        insert_sql = self.cursor.execute.call_args_list[0].args[0]
+        assert "WHERE publish_jobs.state = 'failed'" in insert_sql
+
+    def test_enqueue_requeues_failed_job(self):
+        """실패로 끝난 작업은 같은 키로 다시 넣으면 새로 대기"""
+        self.cursor.fetchone.return_value = make_row(id=7, state=STATE_QUEUED, attempts=0)
+
+        job, created = self.queue.enqueue('quick_publish', 'unpre', 'quick_publish:unpre:2025-01-06:programming')
+
+        assert created is True and job.id == 7 and job.state == STATE_QUEUED
+        assert "state = 'queued', attempts = 0" in self.cursor.execute.call_args.args[0]
+
+    def test_claim_uses_skip_locked_and_lease(self):
+        """대기 작업 또는 리스 만료 작업을 SKIP LOCKED로 1건 획득"""
+        self.cursor.fetchone.return_value = make_row(state='running', attempts=1)
+
+        job = self.queue.claim('worker-0', ['quick_publish'])
+
+        sql, params = self.cursor.execute.call_args.args
+        assert 'FOR UPDATE SKIP LOCKED' in sql and 'lease_expires_at < CURRENT_TIMESTAMP' in sql
+        assert params == ['worker-0', 60, ['quick_publish']]
+        assert job.attempts == 1
+
+    def test_fail_requeues_with_backoff_then_fails(self):
+        """시도 횟수가 남으면 지수 백오프로 재대기, 다 쓰면 failed"""
+        job = Job.from_row(make_row(attempts=2))
+        assert self.queue.fail(job, 'worker-0', 'timeout') == STATE_QUEUED
+        params = self.cursor.execute.call_args.args[1]
+        assert params[0] == STATE_QUEUED and params[2] == 20
+
+        job.attempts = 3
+        assert self.queue.fail(job, 'worker-0', 'timeout') == STATE_FAILED
+        assert self.queue.retry_delay(10) == 100
+
+
+class TestJobWorkerPool:
+    def setup_method(self):
+        """테스트 초기화 - 큐 대역"""
+        self.queue = MagicMock()
+        self.queue.lease_seconds = 60
+        self.queue.fail.return_value = STATE_QUEUED
+        self.finished = []
+        self.job = Job.from_row(make_row(attempts=1))
+
+    def make_pool(self, handler):
+        return JobWorkerPool(self.queue, {'quick_publish': handler},
+                             on_finish=lambda job, state, result: self.finished.append((state, result)))
+
+    def test_success_result_completes_job(self):
+        """처리 함수 결과를 기록하고 콜백 호출 ('success': False는 재시도 없이 실패)"""
+        pool = self.make_pool(lambda job: {'site': job.site, 'success': False})
+
+        pool.run_job(self.job, 'worker-0')
+
+        self.queue.complete.assert_called_once_with(self.job, 'worker-0',
+                                                    {'site': 'unpre', 'success': False}, success=False)
+        assert self.finished == [(STATE_FAILED, {'site': 'unpre', 'success': False})]
+        assert pool.get_metrics()['failed'] == 1
+
+    def test_exception_schedules_retry(self):
+        """처리 중 예외는 fail()로 넘겨 재시도 대기"""
+        def handler(job):
+            raise RuntimeError('WordPress 응답 없음')
+
+        pool = self.make_pool(handler)
+        pool.run_job(self.job, 'worker-0')
+
+        self.queue.fail.assert_called_once_with(self.job, 'worker-0', 'WordPress 응답 없음')
+        self.queue.complete.assert_not_called()
+        assert self.finished[0][0] == STATE_QUEUED
+        assert pool.get_metrics()['retried'] == 1
+        # 처리 함수가 스레드에 묶은 연결은 작업마다 반납
+        self.queue.db.release_connection.assert_called_once()
+
+    def test_retryable_failure_result_schedules_retry(self):
+        """'retryable': True 실패 결과는 예외와 같이 fail()로 넘겨 백오프 재시도"""
+        pool = self.make_pool(lambda job: {'site': job.site, 'success': False, 'retryable': True,
+                                           'message': 'unpre 콘텐츠 생성 실패'})
+
+        pool.run_job(self.job, 'worker-0')
+
+        self.queue.fail.assert_called_once_with(self.job, 'worker-0', 'unpre 콘텐츠 생성 실패')
+        self.queue.complete.assert_not_called()
+        assert self.finished[0][0] == STATE_QUEUED
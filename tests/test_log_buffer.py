@@ -0,0 +1,69 @@
+"""
+로그 링 버퍼/파일 tail 테스트
+"""
+
+import threading
+from src.utils.log_buffer import LogRingBuffer, tail_lines
+
+
+class TestLogRingBuffer:
+    def setup_method(self):
+        """테스트 초기화"""
+        self.buffer = LogRingBuffer(capacity=5)
+
+    def test_since_returns_only_new_entries(self):
+        """since 이후 항목만 오래된 순으로 반환"""
+        for i in range(3):
+            self.buffer.append({'message': f'log {i}'})
+
+        logs, last_seq, truncated = self.buffer.since(1)
+        assert [log['seq'] for log in logs] == [2, 3]
+        assert last_seq == 3 and truncated is False
+        assert self.buffer.since(3) == ([], 3, False)
+
+    def test_capacity_and_truncation(self):
+        """용량 초과분은 밀려나고, 놓친 구간이 있으면 truncated"""
+        for i in range(8):
+            self.buffer.append({'message': f'log {i}'})
+
+        assert len(self.buffer) == 5
+        logs, last_seq, truncated = self.buffer.since(1)
+        assert [log['seq'] for log in logs] == [4, 5, 6, 7, 8]
+        assert truncated is True
+
+    def test_limit_returns_oldest_and_resumes(self):
+        """limit이면 가장 오래된 항목부터 반환하고, 반환한 마지막 seq로 이어서 조회"""
+        for i in range(5):
+            self.buffer.append({'message': f'log {i}'})
+
+        logs, last_seq, truncated = self.buffer.since(0, limit=2)
+        assert [log['seq'] for log in logs] == [1, 2]
+        assert last_seq == 2 and truncated is False
+
+        logs, last_seq, _ = self.buffer.since(last_seq, limit=0)
+        assert [log['seq'] for log in logs] == [3] and last_seq == 3
+        assert [log['seq'] for log in self.buffer.since(last_seq, limit=10)[0]] == [4, 5]
+
+    def test_concurrent_appends_get_unique_seq(self):
+        """여러 스레드가 동시에 추가해도 seq 중복 없음"""
+        buffer = LogRingBuffer(capacity=1000)
+        threads = [threading.Thread(target=lambda: [buffer.append({}) for _ in range(100)])
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        seqs = [log['seq'] for log in buffer.snapshot()]
+        assert buffer.last_seq == 800
+        assert seqs == list(range(1, 801))[-len(seqs):]
+
+
+class TestTailLines:
+    def test_reads_last_lines_across_blocks(self, tmp_path):
+        """블록 경계와 관계없이 마지막 N줄 반환"""
+        path = tmp_path / 'app.log'
+        path.write_text(''.join(f'라인 {i}\n' for i in range(1000)), encoding='utf-8')
+
+        assert tail_lines(str(path), 3, block_size=16) == ['라인 997', '라인 998', '라인 999']
+        assert tail_lines(str(path), 2000) == [f'라인 {i}' for i in range(1000)]
@@ -0,0 +1,63 @@
+"""
+단일 패스 Markdown 렌더러 테스트
+"""
+
+from src.utils.markdown_renderer import (render_markdown, DASHBOARD_THEME, PLAIN_THEME,
+                                         TISTORY_THEME, WORDPRESS_THEME)
+
+
+class TestMarkdownRenderer:
+    def test_inline_formatting(self):
+        """굵게/기울임/인라인 코드 (코드 안은 이스케이프, 서식 미적용)"""
+        html = render_markdown('**굵게** 와 *기울임* 그리고 `a**b**<c`', PLAIN_THEME)
+
+        assert html == ('<p><strong>굵게</strong> 와 <em>기울임</em> 그리고 '
+                        '<code>a**b**&lt;c</code></p>')
+
+    def test_table_duplicate_rows_and_header(self):
+        """헤더는 구분선 바로 위 행만, 같은 내용의 행이 반복돼도 각각 td"""
+        text = '| 항목 | 값 |\n|---|---|\n| A | 1 |\n| A | 1 |'
+
+        html = render_markdown(text, DASHBOARD_THEME)
+
+        assert html == ('<div class="table-container"><table><tr><th>항목</th><th>값</th></tr>'
+                        '<tr><td>A</td><td>1</td></tr><tr><td>A</td><td>1</td></tr></table></div>')
+
+    def test_lists_code_block_and_paragraphs(self):
+        """목록 종류 전환, 코드 블록, 빈 줄 문단 구분과 줄바꿈"""
+        text = '- 하나\n- 둘\n1. 첫째\n\n```python\nif a < b:\n    pass\n```\n첫 줄\n둘째 줄'
+
+        html = render_markdown(text, PLAIN_THEME)
+
+        assert html == ('<ul><li>하나</li><li>둘</li></ul>\n'
+                        '<ol><li>첫째</li></ol>\n'
+                        '<div><pre><code>if a &lt; b:\n    pass</code></pre></div>\n'
+                        '<p>첫 줄<br>둘째 줄</p>')
+
+    def test_theme_styles_injected(self):
+        """WordPress 테마: 인라인 스타일, 원문 HTML 표 태그 스타일, 강조 박스"""
+        text = '<table><tr><th>x</th><td>y</td></tr></table>\n\n💡 핵심 팁\n---'
+
+        html = render_markdown(text, WORDPRESS_THEME)
+
+        assert '<th style="background: linear-gradient' in html
+        assert '<td style="padding: 12px 15px;' in html
+        assert '<div style="background: linear-gradient(135deg, #ffeaa7' in html
+        assert '💡 핵심 팁</strong></div>' in html
+        assert html.endswith('<hr style="border: none; border-top: 2px solid #ecf0f1; margin: 20px 0;">')
+
+    def test_keyword_highlight_once_per_paragraph(self):
+        """키워드는 문단마다 첫 등장만 강조"""
+        html = render_markdown('Python 그리고 Python\n\nPython 다시', TISTORY_THEME, highlight=['Python'])
+
+        assert html == ('<p><span class="highlight">Python</span> 그리고 Python</p>\n'
+                        '<p><span class="highlight">Python</span> 다시</p>')
+
+    def test_long_input_renders_every_row(self):
+        """긴 표도 행 수만큼 정확히 렌더링"""
+        rows = '\n'.join(f'| {i} | 값 |' for i in range(2000))
+
+        html = render_markdown('| 번호 | 값 |\n|---|---|\n' + rows, PLAIN_THEME)
+
+        assert html.count('<tr>') == 2001
+        assert html.count('<th>') == 2
@@ -0,0 +1,66 @@
+"""
+월 캘린더 캐시 테스트
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils.monthly_schedule_manager import MonthlyScheduleCalendar, MonthlyScheduleManager
+from src.utils.response_cache import invalidate_responses
+
+ROWS = [
+    (1, 'unpre', 'AI', 'AI 주제', ['ai'], 'pending'),
+    (1, 'unpre', '교육', '교육 주제', None, 'pending'),
+    (1, 'untab', '재정', '재정 주제', [], 'published'),
+    (2, 'unpre', 'AI', '둘째 날 주제', [], 'pending'),
+]
+
+
+class TestMonthlyScheduleCalendar:
+    def setup_method(self):
+        """테스트 초기화 - 모의 로더를 쓰는 매니저"""
+        self.loader = MagicMock(return_value=ROWS)
+        self.manager = MonthlyScheduleManager.__new__(MonthlyScheduleManager)
+        self.manager.calendar = MonthlyScheduleCalendar(ttl=300)
+        self.manager._load_month = self.loader
+
+    def test_month_loaded_once_for_all_lookups(self):
+        """같은 달 조회는 사이트·날짜가 달라도 한 번만 로드"""
+        with patch('src.utils.monthly_schedule_manager.date') as mock_date:
+            mock_date.today.return_value = date(2025, 8, 1)
+            primary, secondary = self.manager.get_today_dual_topics('unpre')
+            single, none = self.manager.get_today_dual_topics('untab')
+
+        by_date = self.manager.get_topics_by_date(date(2025, 8, 1))
+        month = self.manager.get_month_schedule(2025, 8)
+
+        self.loader.assert_called_once_with(2025, 8)
+        assert (primary['topic'], secondary['keywords']) == ('AI 주제', [])
+        assert single['category'] == '재정' and none is None
+        assert [t['site'] for t in by_date] == ['unpre', 'unpre', 'untab']
+        assert list(month[1]) == ['unpre', 'untab'] and month[2]['unpre'][0]['topic'] == '둘째 날 주제'
+
+    def test_schedule_invalidation_reloads(self):
+        """쓰기 경로의 'schedule' 무효화 후에는 다시 로드"""
+        self.manager.get_topics_by_date(date(2025, 8, 1), 'unpre')
+        invalidate_responses('schedule')
+        self.manager.get_topics_by_date(date(2025, 8, 2), 'unpre')
+
+        assert self.loader.call_count == 2
+
+    def test_returned_topics_do_not_mutate_cache(self):
+        """호출자가 결과를 바꿔도 캐시된 항목은 그대로"""
+        topics = self.manager.get_topics_by_date(date(2025, 8, 1), 'unpre')
+        topics[0]['keywords'].append('변경')
+
+        assert self.manager.get_topics_by_date(date(2025, 8, 1), 'unpre')[0]['keywords'] == ['ai']
+
+    def test_load_failure_stops_auto_publish(self):
+        """DB 로드 실패 시 오늘 주제 조회는 예외로 중단 (기본 주제로 발행하지 않음)"""
+        self.loader.side_effect = RuntimeError('연결 실패')
+
+        with pytest.raises(Exception, match='unpre 자동발행 불가'):
+            self.manager.get_today_dual_topics('unpre')
+        assert self.manager.get_topics_by_date(date(2025, 8, 1)) == []
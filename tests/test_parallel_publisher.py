@@ -0,0 +1,70 @@
+"""
+병렬 발행 실행기 테스트
+"""
+
+import threading
+import time
+from src.utils.parallel_publisher import ParallelPublishExecutor, PublishTask
+
+
+class TestParallelPublishExecutor:
+    def setup_method(self):
+        """테스트 초기화"""
+        self.sites = ['unpre', 'untab', 'skewese', 'tistory']
+        self.tasks = [
+            PublishTask(site=site, topic_info={'topic': f'{site} {kind}'}, category_type=kind)
+            for site in self.sites for kind in ('primary', 'secondary')
+        ]
+        self.lock = threading.Lock()
+        self.active_total = 0
+        self.active_by_site = {}
+        self.max_total = 0
+        self.max_by_site = {}
+
+    def _track(self, task, timer):
+        with self.lock:
+            self.active_total += 1
+            self.active_by_site[task.site] = self.active_by_site.get(task.site, 0) + 1
+            self.max_total = max(self.max_total, self.active_total)
+            self.max_by_site[task.site] = max(self.max_by_site.get(task.site, 0), self.active_by_site[task.site])
+        with timer.stage('generate'):
+            time.sleep(0.05)
+        with self.lock:
+            self.active_total -= 1
+            self.active_by_site[task.site] -= 1
+        return True
+
+    def test_respects_global_and_per_site_limits(self):
+        """전역/사이트별 동시 실행 한도 준수"""
+        executor = ParallelPublishExecutor(max_workers=3, per_site_limit=1)
+        results = executor.run(self.tasks, self._track)
+
+        assert all(r.success for r in results)
+        assert self.max_total <= 3
+        assert all(count == 1 for count in self.max_by_site.values())
+        assert all('generate' in r.stage_timings for r in results)
+
+    def test_runs_sites_concurrently(self):
+        """사이트 간 작업이 겹쳐서 실행됨"""
+        executor = ParallelPublishExecutor(max_workers=4, per_site_limit=1)
+        started = time.monotonic()
+        executor.run(self.tasks, self._track)
+        elapsed = time.monotonic() - started
+
+        # 순차 실행 시 8 * 0.05초, 병렬 시 가장 느린 사이트(2 * 0.05초) 수준
+        assert self.max_total == 4
+        assert elapsed < 0.3
+
+    def test_failures_are_isolated(self):
+        """한 사이트의 예외가 다른 사이트에 영향 없음"""
+        def func(task, timer):
+            if task.site == 'untab':
+                raise RuntimeError("WordPress 500")
+            return True
+
+        results = ParallelPublishExecutor(max_workers=4).run(self.tasks, func)
+
+        assert [r.task.site for r in results] == [t.site for t in self.tasks]
+        failed = [r for r in results if not r.success]
+        assert {r.task.site for r in failed} == {'untab'}
+        assert all(r.error == "WordPress 500" for r in failed)
@@ -0,0 +1,72 @@
+"""
+대시보드 API 응답 캐시 테스트
+"""
+
+from flask import Flask, jsonify
+from src.utils.response_cache import ResponseCache, cached_response, skip_response_cache
+import src.utils.response_cache as response_cache_module
+
+
+class TestResponseCache:
+    def setup_method(self):
+        """테스트 초기화 - 전역 캐시를 테스트용 인스턴스로 교체"""
+        self.cache = ResponseCache()
+        self._original = response_cache_module.response_cache
+        response_cache_module.response_cache = self.cache
+        self.calls = {'stats': 0, 'mock': 0}
+
+        app = Flask(__name__)
+
+        @app.route('/stats')
+        @cached_response(ttl=60, tags=['content'])
+        def stats():
+            self.calls['stats'] += 1
+            return jsonify({'total': self.calls['stats']})
+
+        @app.route('/mock')
+        @cached_response(ttl=60, tags=['content'])
+        def mock():
+            self.calls['mock'] += 1
+            skip_response_cache()
+            return jsonify({'mock': True})
+
+        self.client = app.test_client()
+
+    def teardown_method(self):
+        response_cache_module.response_cache = self._original
+
+    def test_hit_and_etag_not_modified(self):
+        """두 번째 요청은 뷰를 실행하지 않고, ETag가 같으면 304"""
+        first = self.client.get('/stats')
+        second = self.client.get('/stats')
+
+        assert self.calls['stats'] == 1
+        assert first.headers['X-Response-Cache'] == 'MISS'
+        assert second.headers['X-Response-Cache'] == 'HIT'
+        assert second.get_json() == {'total': 1}
+
+        not_modified = self.client.get('/stats', headers={'If-None-Match': first.headers['ETag']})
+        assert not_modified.status_code == 304
+        assert self.cache.get_metrics()['not_modified'] == 1
+
+    def test_invalidate_by_tag(self):
+        """태그 무효화 후에는 다시 계산하고 ETag도 바뀜"""
+        first = self.client.get('/stats')
+        self.cache.invalidate('schedule')
+        assert self.client.get('/stats').headers['X-Response-Cache'] == 'HIT'
+
+        self.cache.invalidate('content')
+        after = self.client.get('/stats')
+        assert self.calls['stats'] == 2
+        assert after.headers['ETag'] != first.headers['ETag']
+
+    def test_skip_and_stale_versions_not_stored(self):
+        """목업 응답이나 계산 중 무효화된 결과는 저장하지 않음"""
+        self.client.get('/mock')
+        self.client.get('/mock')
+        assert self.calls['mock'] == 2
+
+        versions = self.cache.tag_versions(['content'])
+        self.cache.invalidate('content')
+        self.cache.set('/x?', b'{}', 'application/json', 60, ('content',), versions)
+        assert self.cache.get('/x?') is None
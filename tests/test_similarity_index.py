@@ -0,0 +1,81 @@
+"""
+MinHash/LSH 유사 제목 인덱스 테스트
+"""
+
+import threading
+
+import pytest
+
+from src.utils.postgresql_database import PostgreSQLDatabase
+from src.utils.similarity_index import MinHashLSHIndex, jaccard, make_shingles
+
+
+class TestMinHashLSHIndex:
+    def setup_method(self):
+        """테스트 초기화"""
+        self.index = MinHashLSHIndex()
+        self.index.add(1, "파이썬 비동기 프로그래밍 완벽 가이드", site='unpre')
+        self.index.add(2, "부동산 청약 가점 계산 방법", site='skewese')
+        self.index.add(3, "파이썬 비동기 프로그래밍 입문", site='untab')
+
+    def test_shingles_ignore_spacing_and_symbols(self):
+        """띄어쓰기/기호만 다른 한국어 제목은 같은 shingle 집합"""
+        a = make_shingles("파이썬 비동기 프로그래밍 완벽 가이드")
+        b = make_shingles("파이썬비동기 프로그래밍: 완벽가이드!")
+        assert jaccard(a, b) == 1.0
+
+    def test_find_duplicate_respects_site_and_threshold(self):
+        """같은 사이트의 유사 제목만 중복으로 판단"""
+        match = self.index.find_duplicate("파이썬 비동기프로그래밍 완벽가이드", site='unpre')
+        assert match.doc_id == 1 and match.score == 1.0
+
+        assert self.index.find_duplicate("파이썬 비동기 프로그래밍 완벽 가이드", site='skewese') is None
+        assert self.index.find_duplicate("주식 배당금 세금 정리", site='unpre') is None
+
+    def test_query_ranks_by_score(self):
+        """사이트 지정 없이 검색하면 유사도 순으로 반환"""
+        matches = self.index.query("파이썬 비동기 프로그래밍 완벽 가이드 입문", k=2)
+        assert [m.doc_id for m in matches] == [1, 3]
+        assert matches[0].score >= matches[1].score
+
+    def test_incremental_add_remove_and_batch(self):
+        """증분 추가/삭제 및 배치 내부 중복 검사"""
+        self.index.add(4, "주식 배당금 세금 정리", site='unpre')
+        assert self.index.find_duplicate("주식 배당금 세금 정리", site='unpre').doc_id == 4
+        self.index.remove(4)
+        assert self.index.find_duplicate("주식 배당금 세금 정리", site='unpre') is None
+        assert len(self.index) == 3
+
+        results = self.index.check_batch([
+            {'site': 'unpre', 'title': "파이썬 비동기 프로그래밍 완벽 가이드"},
+            {'site': 'unpre', 'title': "도커 컨테이너 네트워크 설정"},
+            {'site': 'unpre', 'title': "도커 컨테이너 네트워크 설정법"},
+        ])
+        assert results[0].doc_id == 1
+        assert results[1] is None
+        assert results[2].doc_id == ('batch', 1)
+
+
+class TestTitleIndexRefresh:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_db):
+        """테스트 초기화 - 풀 없이 커서만 흉내낸 DB 인스턴스"""
+        self.db, self.cursor = mock_db
+        self.db._title_index = None
+        self.db._title_index_lock = threading.Lock()
+        self.db._title_index_max_id = 0
+        self.db._title_index_checked_at = 0.0
+
+    def test_refresh_reads_only_rows_after_max_id(self):
+        """주기가 지나면 마지막 id 이후 행만 읽어 다른 프로세스의 이력을 반영"""
+        self.cursor.__iter__.return_value = iter([(1, 'unpre', "파이썬 비동기 프로그래밍 완벽 가이드")])
+        index = self.db.get_title_index()
+        assert self.db.get_title_index() is index and self.cursor.execute.call_count == 1
+
+        self.db._title_index_checked_at -= PostgreSQLDatabase.TITLE_INDEX_REFRESH_INTERVAL
+        self.cursor.__iter__.return_value = iter([(7, 'unpre', "도커 컨테이너 네트워크 설정")])
+        assert self.db.get_title_index() is index
+
+        assert self.cursor.execute.call_args[0][1] == (1,)
+        assert len(index) == 2 and self.db._title_index_max_id == 7
+        assert self.db.check_duplicate_title('unpre', "도커 컨테이너 네트워크 설정")
@@ -0,0 +1,61 @@
+"""
+트렌드 동시 수집 테스트
+"""
+
+import time
+from src.utils.trend_collector import TREND_SOURCES, TrendCollector, TrendItem
+
+
+class TestTrendCollector:
+    def setup_method(self):
+        """테스트 초기화 - 모든 소스를 즉시 응답하는 가짜 수집으로 교체"""
+        self.collector = TrendCollector(deadline=1.0)
+        for _, method_name, _ in TREND_SOURCES:
+            setattr(self.collector, method_name,
+                    lambda name=method_name: [TrendItem(title=name, source=name, category='테스트', score=1)])
+
+    def test_collects_sources_concurrently(self):
+        """각 소스가 느려도 순차 합계가 아닌 가장 느린 소스 시간만큼 걸림"""
+        def slow(name):
+            def collect():
+                time.sleep(0.2)
+                return [TrendItem(title=name, source=name, category='테스트', score=1)]
+            return collect
+
+        for _, method_name, _ in TREND_SOURCES:
+            setattr(self.collector, method_name, slow(method_name))
+
+        started = time.monotonic()
+        trends = self.collector.collect_all_trends()
+
+        assert time.monotonic() - started < 0.2 * len(TREND_SOURCES) / 2
+        assert len(trends) == len(TREND_SOURCES)
+
+    def test_deadline_returns_partial_results(self):
+        """마감 시간을 넘긴 소스는 제외하고 도착한 결과에 중복 제거/정렬 적용"""
+        self.collector.get_reddit_trending = lambda: time.sleep(2) or []
+        self.collector.get_naver_realtime = lambda: [
+            TrendItem(title='AI', source='네이버', category='검색', score=90),
+            TrendItem(title='ai ', source='네이버', category='검색', score=80),
+        ]
+
+        started = time.monotonic()
+        trends = self.collector.collect_all_trends(deadline=0.3)
+
+        assert time.monotonic() - started < 1.0
+        assert trends[0].title == 'AI'
+        assert 'get_reddit_trending' not in [t.title for t in trends]
+        assert len([t for t in trends if t.title.strip().lower() == 'ai']) == 1
+        assert self.collector.get_source_metrics()['Reddit 트렌드']['timeouts'] == 1
+
+    def test_source_errors_are_counted(self):
+        """예외가 난 소스는 빈 결과로 처리하고 오류 카운터 증가"""
+        def broken():
+            raise RuntimeError('boom')
+        self.collector.get_github_trending = broken
+
+        trends = self.collector.collect_all_trends()
+
+        metrics = self.collector.get_source_metrics()['GitHub Trending']
+        assert (metrics['calls'], metrics['errors'], metrics['last_error']) == (1, 1, 'boom')
+        assert len(trends) == len(TREND_SOURCES) - 1
@@ -0,0 +1,116 @@
+"""
+트렌드 스냅샷 저장소 테스트
+"""
+
+import threading
+import time
+from datetime import timedelta
+from unittest.mock import patch
+from src.utils.trend_collector import TrendItem
+from src.utils.trend_snapshot_store import TrendSnapshotStore
+from src.utils.trending_topic_manager import TrendingTopicManager
+
+
+class TestTrendSnapshotStore:
+    def setup_method(self):
+        """테스트 초기화"""
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+        self.score = 50
+
+    def collect(self):
+        self.calls += 1
+        self.release.wait(2)
+        return [TrendItem(title='AI 반도체', source='테스트', category='기술', score=self.score)]
+
+    def make_store(self, tmp_path, **kwargs):
+        return TrendSnapshotStore(self.collect, str(tmp_path), **kwargs)
+
+    def test_concurrent_refresh_is_single_flight(self, tmp_path):
+        """동시에 여러 요청이 와도 수집은 한 번"""
+        store = self.make_store(tmp_path)
+        self.release.clear()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(store.get())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+
+        assert self.calls == 1
+        assert all(r is results[0] for r in results)
+
+    def test_stale_snapshot_served_while_revalidating(self, tmp_path):
+        """오래된 스냅샷은 즉시 반환하고 갱신은 백그라운드에서"""
+        store = self.make_store(tmp_path, max_age=60)
+        first = store.refresh()
+        first.collected_at -= timedelta(minutes=5)
+
+        self.release.clear()
+        started = time.monotonic()
+        assert store.get() is first
+        assert time.monotonic() - started < 0.5
+        assert store.is_refreshing
+
+        self.release.set()
+        fresh = store.refresh()
+        assert fresh is not first and self.calls == 2
+
+        # 새 인스턴스도 디스크의 최신 스냅샷을 그대로 사용
+        reloaded = self.make_store(tmp_path, max_age=60).get()
+        assert reloaded.collected_at == fresh.collected_at
+        assert reloaded.trends[0].title == 'AI 반도체'
+        assert self.calls == 2
+
+    def test_failed_refresh_returns_none_and_keeps_latest(self, tmp_path):
+        """수집 실패 시 refresh()는 이전 스냅샷 대신 None을 반환하고 최신 스냅샷은 유지"""
+        store = self.make_store(tmp_path)
+        first = store.refresh()
+
+        with patch.object(store, 'collect', side_effect=RuntimeError('수집 오류')):
+            assert store.refresh() is None
+        assert store.latest() is first
+        assert not store.is_refreshing
+
+    def test_history_limit_and_velocity(self, tmp_path):
+        """이력은 보관 개수만큼 유지하고 점수 상승 속도 계산에 사용"""
+        store = self.make_store(tmp_path, history_limit=2)
+        for score in (10, 20, 40):
+            self.score = score
+            store.refresh()
+
+        history = store.history()
+        assert [s.trends[0].score for s in history] == [20, 40]
+        assert store.velocity_scores()['ai 반도체'] > 0
+
+    def test_velocity_stored_with_snapshot(self, tmp_path):
+        """상승 속도는 저장 시 계산되어 스냅샷과 함께 기록되고, 조회 시에는 이력을 읽지 않음"""
+        store = self.make_store(tmp_path)
+        for score in (10, 40):
+            self.score = score
+            store.refresh()
+
+        reloaded = self.make_store(tmp_path)
+        with patch.object(reloaded, 'history', side_effect=AssertionError('이력 재계산')):
+            velocity = reloaded.velocity_scores()
+        assert velocity == store.latest().velocity and velocity['ai 반도체'] > 0
+
+
+class TestTrendingTopicManagerCache:
+    def test_cache_not_refetched_until_expired(self):
+        """캐시가 유효하면 다시 수집하지 않음 (총 경과 시간 기준)"""
+        manager = TrendingTopicManager()
+        with patch.object(manager, 'fetch_realtime_trends', return_value=['AI 트렌드']) as fetch:
+            assert manager.update_trending_cache() is True
+            assert manager.update_trending_cache() is False
+            manager.get_trending_topics('unpre', '기술/디지털')
+            assert fetch.call_count == 1
+
+            # 하루 이상 지난 캐시는 (timedelta.seconds로는 0에 가까워도) 만료
+            for site in manager.last_update:
+                manager.last_update[site] -= timedelta(days=1, seconds=10)
+            manager.get_trending_topics('unpre', '기술/디지털')
+            assert fetch.call_count == 2
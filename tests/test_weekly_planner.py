@@ -0,0 +1,80 @@
+"""
+주간계획 메모/조회 테스트
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+import auto_weekly_planner
+from auto_weekly_planner import PLAN_VERSION, ProfitWeeklyPlanner, invalidate_weekly_plan_memo
+
+
+class TestWeeklyPlanMemo:
+    def setup_method(self):
+        """테스트 초기화"""
+        invalidate_weekly_plan_memo()
+        today = datetime.now().date()
+        self.week_start = today - timedelta(days=today.weekday())
+        self.today_str = today.strftime('%Y-%m-%d')
+        self.plan = {
+            'week_start': self.week_start.strftime('%Y-%m-%d'),
+            'week_end': (self.week_start + timedelta(days=6)).strftime('%Y-%m-%d'),
+            'generated_at': datetime.now().isoformat(),
+            'plan_version': PLAN_VERSION,
+            'plans': [
+                {'date': self.today_str, 'site': 'unpre', 'title': '오늘 주제', 'profit_score': 90},
+                {'date': '2000-01-01', 'site': 'untab', 'title': '다른 날 주제'},
+            ]
+        }
+
+        self.db = MagicMock()
+        self.cursor = self.db.connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        self.cursor.fetchone.return_value = None
+        with patch.object(auto_weekly_planner, 'get_shared_database', return_value=self.db), \
+             patch.object(auto_weekly_planner, 'get_shared_generator'):
+            self.planner = ProfitWeeklyPlanner()
+        self.planner.generate_weekly_plan = MagicMock(return_value=self.plan)
+        self.planner.save_weekly_plan = MagicMock(return_value=True)
+
+    def teardown_method(self):
+        invalidate_weekly_plan_memo()
+
+    def test_today_topics_generated_once_per_week(self):
+        """같은 주에는 계획을 한 번만 생성하고 오늘 주제는 날짜 인덱스로 조회"""
+        first = self.planner.get_today_profit_topics()
+        second = self.planner.get_today_profit_topics()
+
+        assert first == second == [{
+            'site': 'unpre', 'title': '오늘 주제', 'category': 'profit_optimized',
+            'keywords': [], 'trend_score': 90
+        }]
+        self.planner.generate_weekly_plan.assert_called_once()
+        self.planner.save_weekly_plan.assert_called_once()
+        # 다른 인스턴스도 프로세스 메모를 공유
+        with patch.object(auto_weekly_planner, 'get_shared_database', return_value=self.db), \
+             patch.object(auto_weekly_planner, 'get_shared_generator'):
+            assert ProfitWeeklyPlanner().get_weekly_plan(self.week_start) is self.plan
+
+    def test_stored_plan_used_only_for_current_version(self):
+        """DB 저장본은 버전이 같을 때만 사용"""
+        self.cursor.fetchone.return_value = (dict(self.plan, title='저장본'),)
+        assert self.planner.get_weekly_plan(self.week_start)['title'] == '저장본'
+        self.planner.generate_weekly_plan.assert_not_called()
+
+        invalidate_weekly_plan_memo()
+        self.cursor.fetchone.return_value = (dict(self.plan, plan_version='old'),)
+        assert self.planner.get_weekly_plan(self.week_start) is self.plan
+        self.planner.generate_weekly_plan.assert_called_once()
+
+    def test_stored_plan_without_version_is_kept(self):
+        """버전 도입 전 저장본(plan_version 없음)은 주중에 다시 생성하지 않음"""
+        legacy = {k: v for k, v in self.plan.items() if k != 'plan_version'}
+        self.cursor.fetchone.return_value = (dict(legacy, title='기존 계획'),)
+
+        assert self.planner.get_weekly_plan(self.week_start)['title'] == '기존 계획'
+        self.planner.generate_weekly_plan.assert_not_called()
+
+    def test_regenerate_bypasses_memo(self):
+        """regenerate=True면 메모가 있어도 다시 생성"""
+        self.planner.get_weekly_plan(self.week_start + timedelta(days=3))
+        self.planner.get_weekly_plan(self.week_start, regenerate=True)
+        assert self.planner.generate_weekly_plan.call_count == 2
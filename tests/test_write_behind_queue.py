@@ -0,0 +1,95 @@
+"""
+비동기 배치 쓰기 큐 테스트
+"""
+
+import json
+import shutil
+import tempfile
+import os
+import time
+from src.utils.write_behind_queue import WriteBehindQueue
+
+
+class TestWriteBehindQueue:
+    def setup_method(self):
+        """테스트 초기화"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.spill_path = os.path.join(self.temp_dir, "spill.jsonl")
+        self.batches = []
+        self.fail = False
+
+        def flush_func(rows):
+            if self.fail:
+                raise ConnectionError("db down")
+            self.batches.append(list(rows))
+
+        self.queue = WriteBehindQueue(
+            flush_func, self.spill_path, name='test',
+            max_queue_size=10, batch_size=3, flush_interval=60
+        )
+
+    def teardown_method(self):
+        """테스트 후 정리"""
+        self.queue.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_put_is_batched(self):
+        """행이 배치 단위로 기록됨"""
+        for i in range(7):
+            self.queue.put({'n': i})
+        assert self.queue.flush(timeout=5)
+
+        assert sum(len(b) for b in self.batches) == 7
+        assert all(len(b) <= 3 for b in self.batches)
+        assert self.queue.get_metrics()['queue_depth'] == 0
+
+    def test_spill_on_failure_and_replay(self):
+        """DB 장애 시 파일로 보관하고 복구 후 재기록"""
+        self.fail = True
+        for i in range(4):
+            self.queue.put({'n': i})
+        self.queue.flush(timeout=5)
+
+        with open(self.spill_path, encoding='utf-8') as f:
+            assert [json.loads(line)['n'] for line in f] == [0, 1, 2, 3]
+        assert self.batches == []
+
+        self.fail = False
+        self.queue._retry_after = 0
+        self.queue.put({'n': 4})
+        self.queue.flush(timeout=5)
+
+        written = sorted(row['n'] for batch in self.batches for row in batch)
+        assert written == [0, 1, 2, 3, 4]
+        assert self.queue.get_metrics()['replayed_rows'] == 4
+        assert not self.queue.get_metrics()['spill_pending']
+
+    def test_leftover_spill_replayed_on_start(self):
+        """이전 실행에서 남은 보관 파일은 새 기록 없이도 생성 직후 재기록"""
+        with open(self.spill_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'n': 0}) + '\n' + json.dumps({'n': 1}) + '\n')
+
+        queue = WriteBehindQueue(lambda rows: self.batches.append(list(rows)), self.spill_path,
+                                 name='restart', batch_size=3, flush_interval=60)
+        deadline = time.monotonic() + 5
+        while queue.get_metrics()['replayed_rows'] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert self.batches == [[{'n': 0}, {'n': 1}]]
+        assert not queue.get_metrics()['spill_pending']
+        queue.close()
+
+    def test_overflow_spills_instead_of_blocking(self):
+        """큐가 가득 차면 블로킹 없이 파일로 보관"""
+        self.queue.batch_size = 100
+        for i in range(12):
+            self.queue.put({'n': i})
+
+        assert self.queue.get_metrics()['spilled_rows'] == 2
+
+    def test_close_flushes_remaining_rows(self):
+        """종료 시 남은 행 기록"""
+        self.queue.put({'n': 1})
+        self.queue.close()
+
+        assert self.batches == [[{'n': 1}]]
@@ -5,7 +5,6 @@
 
 import os
 import sys
-from datetime import datetime
 from pathlib import Path
 from flask import Flask, render_template, jsonify, request
 from flask_cors import CORS
@@ -16,6 +15,7 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from src.utils.trend_collector import trend_collector
+from src.utils.trend_snapshot_store import get_trend_store
 from src.utils.keyword_research import keyword_researcher
 
 app = Flask(__name__, 
@@ -39,12 +39,28 @@ def trends_dashboard():
 
 @app.route('/api/trends/realtime')
 def get_realtime_trends():
-    """실시간 트렌드 데이터 수집"""
+    """실시간 트렌드 데이터 (최신 스냅샷 즉시 반환, 오래됐으면 백그라운드 갱신)"""
     try:
-        logger.info("실시간 트렌드 데이터 수집 시작...")
+        store = get_trend_store()
+        snapshot = store.get(wait_if_empty=False)
+        if snapshot is None:
+            # 첫 수집 전 (콜드 스타트): 갱신은 이미 시작됐으므로 빈 목록과 함께 갱신 중임을 알림
+            return jsonify({
+                'success': True,
+                'trends': {},
+                'stats': {
+                    'totalTrends': 0,
+                    'totalSources': 0,
+                    'categories': [],
+                    'lastUpdate': None,
+                    'ageSeconds': None,
+                    'refreshing': True
+                }
+            })
         
-        # 카테고리별 트렌드 수집
-        categorized_trends = trend_collector.get_categorized_trends()
+        # 카테고리별 분류
+        categorized_trends = trend_collector.get_categorized_trends(snapshot.trends)
+        velocity = snapshot.velocity
         
         # 데이터를 JSON 직렬화 가능한 형태로 변환
         json_trends = {}
@@ -62,7 +78,8 @@ def get_realtime_trends():
                     'url': trend.url,
                     'description': trend.description,
                     'timestamp': trend.timestamp.isoformat() if trend.timestamp else None,
-                    'tags': trend.tags or []
+                    'tags': trend.tags or [],
+                    'velocity': velocity.get(trend.title.lower().strip(), 0.0)
                 }
                 json_trends[category].append(trend_dict)
                 sources.add(trend.source)
@@ -73,11 +90,11 @@ def get_realtime_trends():
             'totalTrends': total_trends,
             'totalSources': len(sources),
             'categories': list(json_trends.keys()),
-            'lastUpdate': datetime.now().isoformat()
+            'lastUpdate': snapshot.collected_at.isoformat(),
+            'ageSeconds': round(snapshot.age),
+            'refreshing': store.is_refreshing
         }
         
-        logger.info(f"트렌드 수집 완료: {total_trends}개 트렌드, {len(sources)}개 소스")
-        
         return jsonify({
             'success': True,
             'trends': json_trends,
@@ -149,14 +166,25 @@ def refresh_trends():
     try:
         logger.info("트렌드 데이터 강제 새로고침 요청")
         
-        # 새로운 트렌드 수집 (캐시 무시)
-        all_trends = trend_collector.collect_all_trends()
+        # 새 스냅샷 수집 (이미 갱신 중이면 그 결과를 기다림)
+        store = get_trend_store()
+        snapshot = store.refresh()
+        if snapshot is None:
+            # 수집 실패 - 이전 스냅샷은 그대로 두고 새로 수집하지 못했음을 알림
+            previous = store.latest()
+            return jsonify({
+                'success': False,
+                'refreshed': False,
+                'error': '트렌드 수집 실패 - 이전 스냅샷을 유지합니다',
+                'timestamp': previous.collected_at.isoformat() if previous else None
+            }), 502
         
         return jsonify({
             'success': True,
-            'message': f'{len(all_trends)}개의 새로운 트렌드를 수집했습니다.',
-            'count': len(all_trends),
-            'timestamp': datetime.now().isoformat()
+            'refreshed': True,
+            'message': f'{len(snapshot.trends)}개의 새로운 트렌드를 수집했습니다.',
+            'count': len(snapshot.trends),
+            'timestamp': snapshot.collected_at.isoformat()
         })
         
     except Exception as e:
@@ -314,4 +342,7 @@ if __name__ == '__main__':
     logger.info("📊 접속 URL: http://localhost:8000")
     logger.info("🔄 1분마다 자동 새로고침")
     
+    # 트렌드 스냅샷 백그라운드 갱신
+    get_trend_store().start_refresher()
+    
     app.run(debug=False, host='0.0.0.0', port=8000)
\ No newline at end of file